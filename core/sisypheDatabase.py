@@ -3,8 +3,11 @@ External packages/modules
 -------------------------
 
     - PyQt5, Qt GUI, https://www.riverbankcomputing.com/software/pyqt/
+    - sqlite3, SQLite database, https://docs.python.org/3/library/sqlite3.html
 """
 
+from __future__ import annotations
+
 from os import mkdir
 from os import remove
 
@@ -28,6 +31,10 @@ from time import strftime
 
 from glob import glob
 
+from sqlite3 import connect
+from sqlite3 import Error as SQLiteError
+from sqlite3 import DatabaseError
+
 from PyQt5.QtWidgets import QApplication
 
 from Sisyphe.core.sisypheVolume import SisypheVolume
@@ -45,13 +52,15 @@ from Sisyphe.core.sisypheXml import XmlROI
 from Sisyphe.core.sisypheTools import ToolWidgetCollection
 from Sisyphe.gui.dialogWait import DialogWait
 
-__all__ = ['SisypheDatabase']
+__all__ = ['SisypheDatabase',
+           'SisypheDatabaseIndex']
 
 """
 Class hierarchy
 ~~~~~~~~~~~~~~~
 
     - object -> SisypheDatabase
+             -> SisypheDatabaseIndex
 """
 
 class SisypheDatabase(object):
@@ -65,7 +74,8 @@ class SisypheDatabase(object):
 
     - container-like methods to access to patient folder
     - Get/set/remove volumes/ROIs/meshes to patient folder
-    - search volume/ROI/mesh in database
+    - search volume/ROI/mesh in database, searches are processed with a persistent SQLite index
+      (Sisyphe.core.sisypheDatabase.SisypheDatabaseIndex)
     - database backup
 
     Inheritance
@@ -76,7 +86,7 @@ class SisypheDatabase(object):
     Creation: 27/09/2022
     Last revision: 10/12/2023
     """
-    __slots__ = ['_dbpath']
+    __slots__ = ['_dbpath', '_index']
 
     # Class methods
 
@@ -241,6 +251,7 @@ class SisypheDatabase(object):
     Private attributes
     
     _dbpath : str
+    _index : SisypheDatabaseIndex | None
     """
 
     def __init__(self) -> None:
@@ -249,6 +260,7 @@ class SisypheDatabase(object):
         """
         super().__init__()
         self._dbpath = ''
+        self._index = None
 
     def __repr__(self) -> str:
         """
@@ -327,6 +339,17 @@ class SisypheDatabase(object):
             return self.hasPatient(key)
         else: raise TypeError('parameter type {} is not SisypheVolume or SisypheIdentity.'.format(type(key)))
 
+    # Private method
+
+    def _openIndex(self) -> None:
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        if self.hasDatabasePath():
+            try: self._index = SisypheDatabaseIndex(self._dbpath)
+            # no index (i.e. read-only database folder), searches are processed from files
+            except (SQLiteError, OSError): self._index = None
+
     # Public methods
 
     def getAbsFolderFromIdentity(self, identity: SisypheVolume | SisypheIdentity) -> str:
@@ -362,6 +385,7 @@ class SisypheDatabase(object):
         path = abspath(path)
         if exists(path): self._dbpath = path
         else: mkdir(path)
+        self._openIndex()
 
     def setDatabasePathFromSettings(self) -> None:
         """
@@ -402,6 +426,17 @@ class SisypheDatabase(object):
         """
         return self._dbpath != '' and exists(self._dbpath)
 
+    def getIndex(self) -> SisypheDatabaseIndex | None:
+        """
+        Get the SQLite index of the PySisyphe database.
+
+        Returns
+        -------
+        SisypheDatabaseIndex | None
+            database index, None if index file can not be opened
+        """
+        return self._index
+
     def getPatientCount(self) -> int:
         """
         Get patient count in PySisyphe database.
@@ -432,6 +467,9 @@ class SisypheDatabase(object):
         """
         r = []
         if self.hasDatabasePath():
+            if self._index is not None:
+                self._index.update()
+                return self._index.getPatients(flt)
             filt = join(self._dbpath, flt)
             folders = glob(filt)
             if len(folders) > 0:
@@ -469,6 +507,9 @@ class SisypheDatabase(object):
             if fltfirstname != '*':
                 fltfirstname = ' '.join([ch[0].title() + ch[1:] for ch in fltfirstname.split(' ')])
                 fltfirstname = '{}*'.format(fltfirstname)
+            if self._index is not None:
+                self._index.update()
+                return self._index.getPatients('_'.join([fltlastname, fltfirstname, fltdate]))
             flt = join(self._dbpath, '_'.join([fltlastname, fltfirstname, fltdate]))
             folders = glob(flt)
             for folder in folders:
@@ -619,6 +660,7 @@ class SisypheDatabase(object):
                 if self.hasDatabasePath():
                     folder = self.getAbsFolderFromIdentity(identity)
                     if not exists(folder): mkdir(folder)
+                    if self._index is not None: self._index.addPatient(folder)
                     if QApplication.instance() is not None: QApplication.processEvents()
             else: raise TypeError('parameter type {} is not SisypheVolume or SisypheIdentity.'.format(type(identity)))
         else: raise ValueError('Database folder is not defined or is empty.')
@@ -654,6 +696,7 @@ class SisypheDatabase(object):
             if isinstance(identity, SisypheIdentity):
                 folder = self.getAbsFolderFromIdentity(identity)
                 if exists(folder): rmtree(folder, ignore_errors=True)
+                if self._index is not None: self._index.removePatient(folder)
                 if QApplication.instance() is not None: QApplication.processEvents()
             else: raise TypeError('parameter type {} is not SisypheVolume or SisypheIdentity.'.format(type(identity)))
         else: raise ValueError('Database is not defined or is empty.')
@@ -682,6 +725,7 @@ class SisypheDatabase(object):
             for folder in folders:
                 rmtree(folder, ignore_errors=True)
                 if QApplication.instance() is not None: QApplication.processEvents()
+            if self._index is not None: self._index.clear()
 
     def copyFileToPatient(self, filename: str, identity: SisypheVolume | SisypheIdentity) -> None:
         """
@@ -703,6 +747,7 @@ class SisypheDatabase(object):
                     if not exists(folder): self.createPatient(identity)
                     dbname = join(folder, basename(filename))
                     copy(filename, dbname)
+                    if self._index is not None: self._index.updateFile(dbname)
                     if QApplication.instance() is not None: QApplication.processEvents()
                 else: raise TypeError('parameter type {} is not SisypheVolume or SisypheIdentity.'.format(type(identity)))
             else: raise FileNotFoundError('no such file {}.'.format(basename(filename)))
@@ -746,6 +791,7 @@ class SisypheDatabase(object):
                         if dirname(filename) != folder: filename = join(folder, basename(filename))
                         if exists(filename):
                             remove(filename)
+                            if self._index is not None: self._index.removeFile(filename)
                             if splitext(filename)[1] == SisypheVolume.getFileExt():
                                 # remove raw
                                 filename = splitext(filename)[0] + '.raw'
@@ -804,6 +850,7 @@ class SisypheDatabase(object):
                     filename = basename(splitext(filename)[0]) + SisypheVolume.getFileExt()
                     filename = join(self.getAbsFolderFromIdentity(identity), filename)
                     vol.saveAs(filename)
+                    if self._index is not None: self._index.updateFile(filename)
                     if QApplication.instance() is not None: QApplication.processEvents()
                 else: raise TypeError('parameter type {} is not str.'.format(type(filename)))
             else: raise TypeError('parameter type {} is not SisypheVolume'.format(type(vol)))
@@ -877,6 +924,7 @@ class SisypheDatabase(object):
                         filename = basename(splitext(filename)[0]) + SisypheROI.getFileExt()
                         filename = join(self.getAbsFolderFromIdentity(identity), filename)
                         roi.saveAs(filename)
+                        if self._index is not None: self._index.updateFile(filename)
                         if QApplication.instance() is not None: QApplication.processEvents()
                     else: raise TypeError('parameter type {} is not str.'.format(type(filename)))
                 else: raise TypeError('parameter type {} is not SisypheIdentity'.format(type(identity)))
@@ -948,6 +996,7 @@ class SisypheDatabase(object):
                         filename = basename(splitext(filename)[0]) + SisypheMesh.getFileExt()
                         filename = join(self.getAbsFolderFromIdentity(identity), filename)
                         mesh.saveAs(filename)
+                        if self._index is not None: self._index.updateFile(filename)
                         if QApplication.instance() is not None: QApplication.processEvents()
                     else: raise TypeError('parameter type {} is not str.'.format(type(filename)))
                 else: raise TypeError('parameter type {} is not SisypheIdentity'.format(type(identity)))
@@ -1090,6 +1139,7 @@ class SisypheDatabase(object):
                     filename = join(folder, basename(vol.getFilename()))
                     # remove xvol
                     if exists(filename): remove(filename)
+                    if self._index is not None: self._index.removeFile(filename)
                     # remove raw
                     filename = splitext(filename)[0] + '.raw'
                     if exists(filename): remove(filename)
@@ -1126,6 +1176,7 @@ class SisypheDatabase(object):
                         # remove xroi
                         filename = join(folder, basename(roi.getFilename()))
                         if exists(filename): remove(filename)
+                        if self._index is not None: self._index.removeFile(filename)
                         # remove raw
                         filename = splitext(filename)[0] + '.raw'
                         if exists(filename): remove(filename)
@@ -1153,6 +1204,7 @@ class SisypheDatabase(object):
                         folder = self.getAbsFolderFromIdentity(identity)
                         filename = join(folder, basename(mesh.getFilename()))
                         if exists(filename): remove(filename)
+                        if self._index is not None: self._index.removeFile(filename)
                         if QApplication.instance() is not None: QApplication.processEvents()
                     else: raise ValueError('SisypheMesh parameter does not have filename.')
                 else: raise TypeError('parameter type {} is not SisypheIdentity.'.format(type(identity)))
@@ -1280,6 +1332,12 @@ class SisypheDatabase(object):
             if isinstance(identity, SisypheVolume): identity = identity.getIdentity()
             if isinstance(identity, SisypheIdentity):
                 if self.hasDatabasePath():
+                    if self._index is not None:
+                        folder = self.getAbsFolderFromIdentity(identity)
+                        self._index.updatePatient(folder)
+                        r = self._index.searchFiles(folder, SisypheVolume.getFileExt(), ID=ID)
+                        if len(r) > 0: return r[0]
+                        else: return None
                     r = None
                     filenames = self.getPatientVolumes(identity)
                     if len(filenames) > 0:
@@ -1322,6 +1380,10 @@ class SisypheDatabase(object):
             if isinstance(identity, SisypheVolume): identity = identity.getIdentity()
             if isinstance(identity, SisypheIdentity):
                 if self.hasDatabasePath():
+                    if self._index is not None:
+                        folder = self.getAbsFolderFromIdentity(identity)
+                        self._index.updatePatient(folder)
+                        return self._index.searchFiles(folder, SisypheROI.getFileExt(), referenceID=ID)
                     r = list()
                     filenames = self.getPatientROIs(identity)
                     if len(filenames) > 0:
@@ -1363,6 +1425,10 @@ class SisypheDatabase(object):
             if isinstance(identity, SisypheVolume): identity = identity.getIdentity()
             if isinstance(identity, SisypheIdentity):
                 if self.hasDatabasePath():
+                    if self._index is not None:
+                        folder = self.getAbsFolderFromIdentity(identity)
+                        self._index.updatePatient(folder)
+                        return self._index.searchFiles(folder, SisypheMesh.getFileExt(), referenceID=ID)
                     r = list()
                     filenames = self.getPatientMeshes(identity)
                     if len(filenames) > 0:
@@ -1377,3 +1443,316 @@ class SisypheDatabase(object):
             else: raise TypeError('parameter identity type {} is not SisypheIdentity or SisypheVolume.'.format(identity))
         else: raise TypeError('parameter ID type {} is not str, SisypheVolume, SisypheROI '
                               'SisypheTransforms or ToolWidgetCollection'.format(type(id)))
+
+
+class SisypheDatabaseIndex(object):
+    """
+    Description
+    ~~~~~~~~~~~
+
+    Class used to manage a persistent SQLite index of a patient database. The index stores patient folders and
+    volume (.xvol), ROI (.xroi) and mesh (.xmesh) files of patient folders, with their ID, reference ID, modality
+    and sequence attributes. The index file is saved in the database root folder.
+
+    Index is revalidated incrementally:
+
+    - patient folders are scanned again only when the last modified date of the database root folder changes,
+    - patient files are parsed again only when their last modified date changes.
+
+    Inheritance
+    ~~~~~~~~~~~
+
+    object -> SisypheDatabaseIndex
+
+    Creation: 16/10/2026
+    """
+    __slots__ = ['_dbpath', '_connection']
+
+    # Class constants
+
+    _FILENAME = '.index.db'
+    _SCHEMA = ('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL)',
+               'CREATE TABLE IF NOT EXISTS patients (folder TEXT PRIMARY KEY, '
+               'lastname TEXT, firstname TEXT, birthdate TEXT)',
+               'CREATE TABLE IF NOT EXISTS files (folder TEXT NOT NULL, filename TEXT NOT NULL, ext TEXT NOT NULL, '
+               'id TEXT, referenceid TEXT, modality TEXT, sequence TEXT, mtime REAL, '
+               'PRIMARY KEY (folder, filename))',
+               'CREATE INDEX IF NOT EXISTS files_id ON files (folder, ext, id)',
+               'CREATE INDEX IF NOT EXISTS files_referenceid ON files (folder, ext, referenceid)')
+
+    # Class method
+
+    @classmethod
+    def getIndexFilename(cls) -> str:
+        """
+        Get index file name, saved in the database root folder.
+
+        Returns
+        -------
+        str
+            index file name
+        """
+        return cls._FILENAME
+
+    # Special methods
+
+    """
+    Private attributes
+
+    _dbpath : str
+    _connection : sqlite3.Connection
+    """
+
+    def __init__(self, dbpath: str) -> None:
+        """
+        SisypheDatabaseIndex instance constructor. Opens (or creates) the index file of a database folder.
+
+        Parameters
+        ----------
+        dbpath : str
+            database root folder
+        """
+        super().__init__()
+        self._connection = None
+        self._dbpath = abspath(dbpath)
+        filename = join(self._dbpath, self._FILENAME)
+        try: self._open(filename)
+        except DatabaseError:
+            # corrupted index file is rebuilt
+            if exists(filename): remove(filename)
+            self._open(filename)
+
+    def __repr__(self) -> str:
+        """
+        Special overloaded method called by the built-in repr() python function.
+
+        Returns
+        -------
+        str
+            SisypheDatabaseIndex instance representation
+        """
+        return 'SisypheDatabaseIndex instance at <{}>\n'.format(str(id(self)))
+
+    def __del__(self) -> None:
+        """
+        SisypheDatabaseIndex instance finalizer. Closes the index file.
+        """
+        self.close()
+
+    # Private methods
+
+    def _open(self, filename: str) -> None:
+        self._connection = connect(filename)
+        # no journal file in the database root folder, root folder last modified date is not updated by commits
+        self._connection.execute('PRAGMA journal_mode = MEMORY')
+        for sql in self._SCHEMA:
+            self._connection.execute(sql)
+        self._connection.commit()
+
+    @classmethod
+    def _getFileAttributes(cls, filename: str) -> tuple[str, str, str, str] | None:
+        ext = splitext(filename)[1]
+        try:
+            if ext == SisypheVolume.getFileExt():
+                xml = XmlVolume(filename)
+                return xml.getID(), '', xml.getModality(), xml.getSequence()
+            elif ext == SisypheROI.getFileExt():
+                xml = XmlROI(filename)
+                return '', xml.getID(), '', ''
+            elif ext == SisypheMesh.getFileExt():
+                mesh = SisypheMesh()
+                mesh.load(filename)
+                return '', mesh.getReferenceID(), '', ''
+            else: return None
+        except Exception: return None
+
+    def _updateFile(self, folder: str, filename: str, mtime: float) -> None:
+        attr = self._getFileAttributes(join(self._dbpath, folder, filename))
+        if attr is not None:
+            self._connection.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                                     (folder, filename, splitext(filename)[1]) + attr + (mtime,))
+        else: self._connection.execute('DELETE FROM files WHERE folder = ? AND filename = ?', (folder, filename))
+
+    def _addPatient(self, folder: str) -> None:
+        fields = folder.split('_')
+        if len(fields) == 3:
+            self._connection.execute('INSERT OR IGNORE INTO patients VALUES (?, ?, ?, ?)', [folder] + fields)
+
+    # Public methods
+
+    def close(self) -> None:
+        """
+        Close the index file.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def getDatabasePath(self) -> str:
+        """
+        Get the database root folder of the current SisypheDatabaseIndex instance.
+
+        Returns
+        -------
+        str
+            database root folder
+        """
+        return self._dbpath
+
+    def update(self) -> None:
+        """
+        Update patient folders of the index if the database root folder has been modified since the last update.
+        """
+        mtime = getmtime(self._dbpath)
+        row = self._connection.execute("SELECT value FROM meta WHERE key = 'mtime'").fetchone()
+        if row is None or row[0] != mtime:
+            folders = set([basename(f) for f in glob(join(self._dbpath, '*_*_*')) if isdir(f)])
+            indexed = set([r[0] for r in self._connection.execute('SELECT folder FROM patients')])
+            for folder in indexed - folders:
+                self._connection.execute('DELETE FROM files WHERE folder = ?', (folder,))
+                self._connection.execute('DELETE FROM patients WHERE folder = ?', (folder,))
+            for folder in folders - indexed:
+                self._addPatient(folder)
+            self._connection.execute("INSERT OR REPLACE INTO meta VALUES ('mtime', ?)", (mtime,))
+            self._connection.commit()
+
+    def updatePatient(self, folder: str) -> None:
+        """
+        Update files of a patient folder in the index. Only new files or files whose last modified date has changed
+        since the last update are parsed.
+
+        Parameters
+        ----------
+        folder : str
+            patient folder name
+        """
+        folder = basename(folder)
+        files = SisypheDatabase.getFilesLastModifiedDate(join(self._dbpath, folder))
+        files = {basename(f): files[f] for f in files}
+        indexed = dict(self._connection.execute('SELECT filename, mtime FROM files WHERE folder = ?', (folder,)))
+        for filename in indexed:
+            if filename not in files:
+                self._connection.execute('DELETE FROM files WHERE folder = ? AND filename = ?', (folder, filename))
+        exts = (SisypheVolume.getFileExt(), SisypheROI.getFileExt(), SisypheMesh.getFileExt())
+        for filename in files:
+            if splitext(filename)[1] in exts and indexed.get(filename) != files[filename]:
+                self._updateFile(folder, filename, files[filename])
+        if len(files) > 0: self._addPatient(folder)
+        self._connection.commit()
+
+    def addPatient(self, folder: str) -> None:
+        """
+        Add a patient folder to the index.
+
+        Parameters
+        ----------
+        folder : str
+            patient folder name
+        """
+        self._addPatient(basename(folder))
+        self._connection.commit()
+
+    def removePatient(self, folder: str) -> None:
+        """
+        Remove a patient folder and its files from the index.
+
+        Parameters
+        ----------
+        folder : str
+            patient folder name
+        """
+        folder = basename(folder)
+        self._connection.execute('DELETE FROM files WHERE folder = ?', (folder,))
+        self._connection.execute('DELETE FROM patients WHERE folder = ?', (folder,))
+        self._connection.commit()
+
+    def updateFile(self, filename: str) -> None:
+        """
+        Add or update a patient file in the index. Files that are not volumes, ROIs or meshes are ignored.
+
+        Parameters
+        ----------
+        filename : str
+            file name in a patient folder
+        """
+        if exists(filename) and splitext(filename)[1] in (SisypheVolume.getFileExt(),
+                                                           SisypheROI.getFileExt(),
+                                                           SisypheMesh.getFileExt()):
+            folder = basename(dirname(abspath(filename)))
+            self._addPatient(folder)
+            self._updateFile(folder, basename(filename), getmtime(filename))
+            self._connection.commit()
+
+    def removeFile(self, filename: str) -> None:
+        """
+        Remove a patient file from the index.
+
+        Parameters
+        ----------
+        filename : str
+            file name in a patient folder
+        """
+        folder = basename(dirname(abspath(filename)))
+        self._connection.execute('DELETE FROM files WHERE folder = ? AND filename = ?', (folder, basename(filename)))
+        self._connection.commit()
+
+    def clear(self) -> None:
+        """
+        Remove all patients and files from the index.
+        """
+        self._connection.execute('DELETE FROM files')
+        self._connection.execute('DELETE FROM patients')
+        self._connection.execute('DELETE FROM meta')
+        self._connection.commit()
+
+    def getPatients(self, flt: str = '*_*_*') -> list[str]:
+        """
+        Get a list of patient folder names from a search filter string. Index should be updated before (see update
+        method).
+
+        Parameters
+        ----------
+        flt : str
+            filter format is '{lastname}_{firstname}_{birthdate}', lastname, firstname, birthdate could be
+            replaced by '*' wildcard char. default is '*_*_*' to get all patient folder names
+
+        Returns
+        -------
+        list[str]
+            patient folder names (absolute path)
+        """
+        rows = self._connection.execute('SELECT folder FROM patients WHERE folder GLOB ? ORDER BY folder', (flt,))
+        return [join(self._dbpath, r[0]) for r in rows]
+
+    def searchFiles(self, folder: str, ext: str, ID: str = '', referenceID: str = '') -> list[str]:
+        """
+        Search files of a patient folder from ID or reference ID. Patient should be updated before (see updatePatient
+        method).
+
+        Parameters
+        ----------
+        folder : str
+            patient folder name
+        ext : str
+            file extension, SisypheVolume.getFileExt(), SisypheROI.getFileExt() or SisypheMesh.getFileExt()
+        ID : str
+            volume ID to search, ignored if empty
+        referenceID : str
+            reference ID of ROI or mesh to search, ignored if empty
+
+        Returns
+        -------
+        list[str]
+            file names (absolute path)
+        """
+        folder = basename(folder)
+        if ID != '':
+            rows = self._connection.execute('SELECT filename FROM files WHERE folder = ? AND ext = ? AND id = ?',
+                                            (folder, ext, ID))
+        elif referenceID != '':
+            rows = self._connection.execute('SELECT filename FROM files '
+                                            'WHERE folder = ? AND ext = ? AND referenceid = ?',
+                                            (folder, ext, referenceID))
+        else: rows = self._connection.execute('SELECT filename FROM files WHERE folder = ? AND ext = ?',
+                                              (folder, ext))
+        return [join(self._dbpath, folder, r[0]) for r in rows]
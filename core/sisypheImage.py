@@ -290,9 +290,9 @@ class SisypheImage(object):
     object -> SisypheImage
 
     Creation: 12/01/2021
-    Last revision: 13/06/2025
+    Last revision: 16/10/2026
     """
-    __slots__ = ['_sitk_image', '_itk_image', '_vtk_image', '_numpy_array', '_attr']
+    __slots__ = ['_sitk_image', '_itk_image', '_vtk_image', '_numpy_array', '_attr', '_version']
 
     # Special methods
 
@@ -300,9 +300,10 @@ class SisypheImage(object):
     Private attributes
 
     _sitk_image     sitkImage
-    _vtk_image      vtkImageData
-    _itk_image      itkImage
+    _vtk_image      vtkImageData, created at first getVTKImage() call
+    _itk_image      itkImage, created at first getITKImage() call
     _numpy_array    ndarray
+    _version        int, incremented each time the image buffer is replaced
     """
 
     def __init__(self,
@@ -331,6 +332,7 @@ class SisypheImage(object):
         # < Revision 17/11/2024
         self._attr = dict()
         # Revision 17/11/2024 >
+        self._version = 0
 
         # Init from image (filename, sitkImage, vtkImage, ANTSImage, numpy)
 
@@ -942,8 +944,14 @@ class SisypheImage(object):
 
     def _updateImages(self) -> None:
         self._updateNumpyFromSITKImage()
-        self._updateITKImageFromNumpy()
-        self._updateVTKImageFromNumpy()
+        # < Revision 16/10/2026
+        # ITK and VTK views are created at first getITKImage() and getVTKImage() calls
+        # self._updateITKImageFromNumpy()
+        # self._updateVTKImageFromNumpy()
+        self._itk_image = None
+        self._vtk_image = None
+        self._version += 1
+        # Revision 16/10/2026 >
 
     def _updateNumpyFromSITKImage(self) -> None:
         # GetArrayViewFromImage() return default numpy array shape (z, y, x)
@@ -999,7 +1007,28 @@ class SisypheImage(object):
         bool
             True if itk.Image attribute is available (not None)
         """
-        return self._itk_image is not None
+        # < Revision 16/10/2026
+        # ITK view is created at first getITKImage() call
+        # return self._itk_image is not None
+        if self.isEmpty(): return False
+        return isITKSupportedStdType(self.getDatatype()) and self.getNumberOfComponentsPerPixel() == 1
+        # Revision 16/10/2026 >
+
+    # < Revision 16/10/2026
+    # add getVersion method
+    def getVersion(self) -> int:
+        """
+        Get the version of the image buffer. Version is incremented each time the image buffer is replaced (copyFrom
+        and setSITKImage methods, filters and operators), it can be used to invalidate caches derived from the image.
+        In-place modifications of the numpy view do not change the version.
+
+        Returns
+        -------
+        int
+            image buffer version
+        """
+        return self._version
+    # Revision 16/10/2026 >
 
     def allocate(self, matrix: vectorInt3, datatype: str) -> None:
         """
@@ -1188,7 +1217,7 @@ class SisypheImage(object):
         """
         if not self.isEmpty():
             buff = vtkImageData()
-            buff.DeepCopy(self._vtk_image)
+            buff.DeepCopy(self.getVTKImage())
             return buff
         else: raise ValueError('SisypheImage array is empty.')
 
@@ -1442,7 +1471,12 @@ class SisypheImage(object):
         vtk.vtkImageData
             shallow copy of image
         """
-        if not self.isEmpty(): return self._vtk_image
+        if not self.isEmpty():
+            # < Revision 16/10/2026
+            # VTK view is created at first call
+            if self._vtk_image is None: self._updateVTKImageFromNumpy()
+            # Revision 16/10/2026 >
+            return self._vtk_image
         else: raise ValueError('SisypheImage array is empty.')
 
     def getITKImage(self) -> itkImage:
@@ -1455,7 +1489,12 @@ class SisypheImage(object):
         itk.Image
             shallow copy of image
         """
-        if not self.isEmpty(): return self._itk_image
+        if not self.isEmpty():
+            # < Revision 16/10/2026
+            # ITK view is created at first call, None if datatype is not supported by ITK
+            if self._itk_image is None: self._updateITKImageFromNumpy()
+            # Revision 16/10/2026 >
+            return self._itk_image
         else: raise ValueError('SisypheImage array is empty.')
 
     def getNumpy(self, defaultshape: bool = True) -> ndarray:
@@ -1637,9 +1676,15 @@ class SisypheImage(object):
             voxel spacing in x
         """
         self._sitk_image.SetSpacing((sx, sy, sz))
-        self._vtk_image.SetSpacing(sx, sy, sz)
-        if self.hasITKImage():
+        # < Revision 16/10/2026
+        # update only ITK and VTK views already created
+        # self._vtk_image.SetSpacing(sx, sy, sz)
+        # if self.hasITKImage():
+        if self._vtk_image is not None:
+            self._vtk_image.SetSpacing(sx, sy, sz)
+        if self._itk_image is not None:
             self._itk_image.SetSpacing((sx, sy, sz))
+        # Revision 16/10/2026 >
 
     def getVoxelVolume(self) -> float:
         """
@@ -2226,7 +2271,11 @@ class SisypheImage(object):
         """
         if not self.isEmpty():
             self._sitk_image.SetDirection(direction)
-            if self.hasITKImage():
+            # < Revision 16/10/2026
+            # update only ITK view already created
+            # if self.hasITKImage():
+            if self._itk_image is not None:
+            # Revision 16/10/2026 >
                 d = array(self._sitk_image.GetDirection())
                 if d.size == 4: d = d.reshape(2, 2)
                 elif d.size == 9: d = d.reshape(3, 3)
@@ -2282,7 +2331,11 @@ class SisypheImage(object):
             self._sitk_image.SetOrigin(origin)
             # < Revision 15/04/2023
             # self._vtk_image.SetOrigin(origin)
-            if self.hasITKImage():
+            # < Revision 16/10/2026
+            # update only ITK view already created
+            # if self.hasITKImage():
+            if self._itk_image is not None:
+            # Revision 16/10/2026 >
                 self._itk_image.SetOrigin(origin)
             # Revision 15/04/2023 >
 
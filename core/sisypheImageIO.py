@@ -18,7 +18,15 @@ from os.path import splitext
 
 from struct import unpack
 
+from zlib import compress
+from zlib import decompress
+
+from concurrent.futures import ThreadPoolExecutor
+
 from numpy import load
+from numpy import empty
+from numpy import ndarray
+from numpy import ascontiguousarray
 from numpy import save
 from numpy import frombuffer
 from numpy import asanyarray
@@ -107,7 +115,9 @@ __all__ = ['isDicom',
            'writeToMINC',
            'writeToJSON',
            'writeToVTK',
-           'writeToNumpy']
+           'writeToNumpy',
+           'compressArrayToChunks',
+           'decompressArrayFromChunks']
 
 """
 Functions
@@ -148,7 +158,13 @@ IO functions
     - writeToJSON(img: SimpleITK.Image, filename: str)
     - writeToNumpy(img: SimpleITK.Image, filename: str)
 
-    Last revision: 30/04/2024
+Chunked compression codec functions
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    - compressArrayToChunks(img: numpy.ndarray, chunksize: int = 4194304, workers: int | None = None) -> tuple[int, list[int], list[bytes]]
+    - decompressArrayFromChunks(buff: bytes, step: int, offsets: list[int], shape: tuple[int, ...], dtype: str, first: int = 0, last: int | None = None, workers: int | None = None) -> numpy.ndarray
+
+    Last revision: 16/10/2026
 """
 
 
@@ -1189,3 +1205,108 @@ def writeToNumpy(img: sitkImage, filename: str) -> None:
         # GetArrayViewFromImage return array with default shape (z, y, x)
         save(filename, sitkGetArrayViewFromImage(img))
     else: raise IOError('parameter image type {} is not sitkImage.'.format(type(img)))
+
+
+"""
+Chunked compression codec of the binary part of PySisyphe volume (.xvol) and ROI (.xroi) files.
+The array is split along its first axis (z-slabs of a single component volume, components of a multicomponent volume)
+in independently compressed chunks. Chunks are compressed and decompressed in a thread pool (zlib releases the GIL).
+"""
+
+def compressArrayToChunks(img: ndarray,
+                          chunksize: int = 4194304,
+                          workers: int | None = None) -> tuple[int, list[int], list[bytes]]:
+    """
+    Split a numpy array along its first axis in independently zlib compressed chunks.
+
+    Parameters
+    ----------
+    img : numpy.ndarray
+        array to compress, default shape (z, y, x) or (n, z, y, x) if multicomponent
+    chunksize : int
+        approximate uncompressed chunk size in bytes (default 4 MB), a chunk contains at least one element of the first
+        axis (i.e. a slice or a component)
+    workers : int | None
+        number of threads, default None (min(32, os.cpu_count() + 4))
+
+    Returns
+    -------
+    tuple[int, list[int], list[bytes]]
+        - int, step, number of elements of the first axis in each chunk
+        - list[int], chunk offsets in the compressed buffer, last offset is the compressed buffer size
+        - list[bytes], compressed chunks
+    """
+    if isinstance(img, ndarray):
+        n = img.shape[0]
+        step = max(1, chunksize // max(1, img[0].nbytes))
+        # ascontiguousarray() copies only the current chunk if img is not C-contiguous (multicomponent view)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(lambda i: compress(ascontiguousarray(img[i:i + step])), range(0, n, step)))
+        offsets = [0]
+        for chunk in chunks:
+            offsets.append(offsets[-1] + len(chunk))
+        return step, offsets, chunks
+    else: raise TypeError('parameter type {} is not numpy ndarray.'.format(type(img)))
+
+
+def decompressArrayFromChunks(buff: bytes,
+                              step: int,
+                              offsets: list[int],
+                              shape: tuple[int, ...],
+                              dtype: str,
+                              first: int = 0,
+                              last: int | None = None,
+                              workers: int | None = None) -> ndarray:
+    """
+    Decompress a numpy array from independently zlib compressed chunks. Only the chunks overlapping the [first, last[
+    range of the first axis are decompressed.
+
+    Parameters
+    ----------
+    buff : bytes
+        compressed buffer, or only the compressed chunks of the [first, last[ range if buff size is lower than
+        offsets[-1] (buff must start at the first required chunk offset)
+    step : int
+        number of elements of the first axis in each chunk
+    offsets : list[int]
+        chunk offsets in the compressed buffer, last offset is the compressed buffer size
+    shape : tuple[int, ...]
+        array shape, default shape (z, y, x) or (n, z, y, x) if multicomponent
+    dtype : str
+        numpy datatype
+    first : int
+        index of the first element of the first axis to decompress (default 0)
+    last : int | None
+        index + 1 of the last element of the first axis to decompress, default None (shape[0])
+    workers : int | None
+        number of threads, default None (min(32, os.cpu_count() + 4))
+
+    Returns
+    -------
+    numpy.ndarray
+        decompressed array, shape (last - first, ...)
+    """
+    if last is None: last = shape[0]
+    if 0 <= first < last <= shape[0]:
+        c0 = first // step
+        c1 = (last - 1) // step + 1
+        # memoryview to avoid chunk copies
+        buff = memoryview(buff)
+        # offset of buff in the compressed buffer
+        if len(buff) < offsets[-1]: base = offsets[c0]
+        else: base = 0
+        r = empty((last - first,) + tuple(shape[1:]), dtype=dtype)
+
+        def _decompress(c):
+            i0 = c * step
+            i1 = min(i0 + step, shape[0])
+            chunk = frombuffer(decompress(buff[offsets[c] - base:offsets[c + 1] - base]), dtype=dtype)
+            chunk = chunk.reshape((i1 - i0,) + tuple(shape[1:]))
+            j0 = max(i0, first)
+            j1 = min(i1, last)
+            r[j0 - first:j1 - first] = chunk[j0 - i0:j1 - i0]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_decompress, range(c0, c1)))
+        return r
+    else: raise ValueError('invalid range [{}, {}[.'.format(first, last))
@@ -18,6 +18,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from os import getcwd
+from os import cpu_count
 from os.path import exists
 from os.path import join
 from os.path import split
@@ -38,9 +39,17 @@ from zlib import decompress
 
 from collections import deque
 
+from multiprocessing import Pool
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from sys import platform
+from sys import version_info
+
 from numpy import uint8
 from numpy import array
 from numpy import zeros
+from numpy import ones
 from numpy import frombuffer
 from numpy import histogram
 from numpy import median
@@ -52,6 +61,24 @@ from numpy import invert
 from numpy import ndarray
 from numpy import where
 from numpy import max
+from numpy import add as npadd
+from numpy import minimum as npminimum
+from numpy import maximum as npmaximum
+from numpy import empty
+from numpy import arange
+from numpy import argsort
+from numpy import lexsort
+from numpy import unique
+from numpy import repeat
+from numpy import cumsum
+from numpy import bincount
+from numpy import concatenate
+from numpy import flatnonzero
+from numpy import unravel_index
+from numpy import errstate
+from numpy import packbits
+from numpy import unpackbits
+from numpy import ravel_multi_index
 
 from scipy import sparse
 from scipy.stats import describe
@@ -155,6 +182,8 @@ from Sisyphe.core.sisypheVolume import SisypheVolume
 # Revision 30/07/2024 >
 from Sisyphe.core.sisypheImageIO import readFromSisypheROI
 from Sisyphe.core.sisypheImageIO import flipImageToVTKDirectionConvention
+from Sisyphe.core.sisypheImageIO import compressArrayToChunks
+from Sisyphe.core.sisypheImageIO import decompressArrayFromChunks
 from Sisyphe.core.sisypheConstants import getRegularDirections
 from Sisyphe.core.sisypheConstants import getLibraryDataType
 from Sisyphe.core.sisypheImage import SisypheImage
@@ -175,7 +204,8 @@ __all__ = ['SisypheROI',
            'SisypheROICollection',
            'SisypheROIDraw',
            'SisypheROIFeatures',
-           'SisypheROIHistogram']
+           'SisypheROIHistogram',
+           'SisypheLabelStatistics']
 
 """
 Class hierarchy
@@ -186,6 +216,7 @@ Class hierarchy
              -> SisypheROIDraw
              -> SisypheROIFeatures
              -> SisypheROIHistogram
+             -> SisypheLabelStatistics
 """
 
 listImages = sitkImage | ndarray | SisypheImage
@@ -197,6 +228,32 @@ vectorInt3 = list[int] | tupleInt3
 tupleFloat3 = tuple[float, float, float]
 vectorFloat3 = list[float] | tupleFloat3
 
+# < Revision 16/10/2026
+# compact mask storage, bounding box [xmin, xmax, ymin, ymax, zmin, zmax] of non-zero voxels (max bounds excluded)
+# and mask cropped to this bounding box, bit-packed in numpy default shape order (z, y, x)
+
+def _getMaskBoundingBox(img: ndarray) -> list[int]:
+    # img, numpy default shape (z, y, x)
+    z = flatnonzero(img.any(axis=(1, 2)))
+    if len(z) == 0: return [0, 0, 0, 0, 0, 0]
+    buff = img[z[0]:z[-1] + 1]
+    y = flatnonzero(buff.any(axis=(0, 2)))
+    x = flatnonzero(buff[:, y[0]:y[-1] + 1].any(axis=(0, 1)))
+    return [int(x[0]), int(x[-1]) + 1, int(y[0]), int(y[-1]) + 1, int(z[0]), int(z[-1]) + 1]
+
+
+def _packMask(img: ndarray) -> tuple[list[int], ndarray]:
+    bbox = _getMaskBoundingBox(img)
+    crop = img[bbox[4]:bbox[5], bbox[2]:bbox[3], bbox[0]:bbox[1]] != 0
+    return bbox, packbits(crop, axis=None)
+
+
+def _unpackMask(bbox: list[int] | ndarray, bits: ndarray) -> ndarray:
+    # returns uint8 mask cropped to bounding box, numpy default shape (z, y, x)
+    shape = (bbox[5] - bbox[4], bbox[3] - bbox[2], bbox[1] - bbox[0])
+    return unpackbits(bits, count=shape[0] * shape[1] * shape[2]).reshape(shape)
+# Revision 16/10/2026 >
+
 
 class SisypheROI(SisypheBinaryImage):
     """
@@ -215,19 +272,27 @@ class SisypheROI(SisypheBinaryImage):
         - 2D shape drawing (line, disk, ellipse, square, rectangle, polygon),
         - 3D shape drawing (cube, Parallelepiped, sphere),
         - mesh conversion,
+        - compact storage (bounding box and bit-packed mask),
         - IO methods (native format and BrainVoyager VOI format),
         - methods inherited from the SisypheImage class.
 
+    Compact storage: the mask is stored as the bounding box of its non-zero voxels and a bit-packed copy of the mask
+    cropped to this bounding box (see compact() method). Dense SimpleITK image and numpy array are released, and
+    materialised at first access (getSITKImage, getVTKImage, getNumpy, drawing and processing methods...). Geometry
+    getters, non-zero count, copy, set operators of the SisypheROICollection class and IO methods work directly on
+    the compact form.
+
     Inheritance
     ~~~~~~~~~~~
 
     object -> SisypheImage -> SisypheBinaryImage -> SisypheROI
 
     Creation: 08/09/2022
-    Last revision: 21/09/2024
+    Last revision: 16/10/2026
     """
 
-    __slots__ = ['_filename', '_referenceID', '_compression', '_name', '_color', '_alpha', '_visibility', '_lut']
+    __slots__ = ['_filename', '_referenceID', '_compression', '_name', '_color', '_alpha', '_visibility', '_lut',
+                 '_compact']
     _counter: int = 0
 
     # Class constants
@@ -327,6 +392,7 @@ class SisypheROI(SisypheBinaryImage):
     _compressed     bool
     _filename       str
     _lut            SisypheLut
+    _compact        dict | None, compact storage (keys 'size', 'spacing', 'origin', 'directions', 'bbox', 'bits')
     """
 
     def __init__(self,
@@ -350,6 +416,9 @@ class SisypheROI(SisypheBinaryImage):
             - direction : tuple[float * 9] | list[float * 9]
         """
         self.addInstance()
+        # < Revision 16/10/2026
+        self._compact: dict | None = None
+        # Revision 16/10/2026 >
         self._referenceID: str = ''
         # Copy SisypheVolume ID to reference ID
         if isinstance(image, SisypheVolume):
@@ -628,6 +697,65 @@ class SisypheROI(SisypheBinaryImage):
                                self._color[2],
                                self._alpha)
 
+    # < Revision 16/10/2026
+    # add _sitk_image and _numpy_array properties, _setCompact and _materializeCompact private methods
+    # _sitk_image and _numpy_array properties override SisypheImage slots, dense images are materialised at first
+    # access in compact storage mode, including direct accesses from methods inherited from the SisypheImage class
+    @property
+    def _sitk_image(self) -> sitkImage | None:
+        if self._compact is not None: self._materializeCompact()
+        return SisypheImage._sitk_image.__get__(self)
+
+    @_sitk_image.setter
+    def _sitk_image(self, img: sitkImage | None) -> None:
+        # SimpleITK image replaces compact storage
+        self._compact = None
+        SisypheImage._sitk_image.__set__(self, img)
+
+    @property
+    def _numpy_array(self) -> ndarray | None:
+        if self._compact is not None: self._materializeCompact()
+        return SisypheImage._numpy_array.__get__(self)
+
+    @_numpy_array.setter
+    def _numpy_array(self, img: ndarray | None) -> None:
+        SisypheImage._numpy_array.__set__(self, img)
+
+    def _setCompact(self,
+                    size: vectorInt3,
+                    spacing: vectorFloat3,
+                    bbox: list[int],
+                    bits: ndarray,
+                    origin: vectorFloat3 = (0.0, 0.0, 0.0),
+                    direction: tuple | list = tuple(getRegularDirections())) -> None:
+        # release dense images
+        self._sitk_image = None
+        self._numpy_array = None
+        self._itk_image = None
+        self._vtk_image = None
+        self._compact = {'size': tuple([int(i) for i in size]),
+                         'spacing': tuple([float(i) for i in spacing]),
+                         'origin': tuple(origin),
+                         'directions': tuple(direction),
+                         'bbox': [int(i) for i in bbox],
+                         'bits': bits}
+
+    def _materializeCompact(self) -> None:
+        if self._compact is not None:
+            c = self._compact
+            # compact storage is released before copyFromNumpyArray() call to avoid recursive materialisation
+            self._compact = None
+            size = c['size']
+            b = c['bbox']
+            img = zeros((size[2], size[1], size[0]), dtype='uint8')
+            img[b[4]:b[5], b[2]:b[3], b[0]:b[1]] = _unpackMask(b, c['bits'])
+            self.copyFromNumpyArray(img,
+                                    spacing=c['spacing'],
+                                    origin=c['origin'],
+                                    direction=c['directions'],
+                                    defaultshape=True)
+    # Revision 16/10/2026 >
+
     # Public methods
 
     # < Revision 20/10/2024
@@ -666,7 +794,7 @@ class SisypheROI(SisypheBinaryImage):
 
     def copy(self) -> SisypheROI:
         """
-        SisypheROI copy of the current SisypheROI instance.
+        SisypheROI copy of the current SisypheROI instance. The copy of a compact ROI is also compact.
 
         Returns
         -------
@@ -674,7 +802,15 @@ class SisypheROI(SisypheBinaryImage):
             roi copy
         """
         if not self.isEmpty():
-            roi = SisypheROI(self.getSITKImage())
+            # < Revision 16/10/2026
+            # copy of compact storage
+            # roi = SisypheROI(self.getSITKImage())
+            if self._compact is not None:
+                c = self._compact
+                roi = SisypheROI()
+                roi._setCompact(c['size'], c['spacing'], c['bbox'], c['bits'].copy(), c['origin'], c['directions'])
+            else: roi = SisypheROI(self.getSITKImage())
+            # Revision 16/10/2026 >
             self.copyAttributesTo(roi)
             return roi
         else: raise ValueError('SisypheROI is empty.')
@@ -1227,6 +1363,268 @@ class SisypheROI(SisypheBinaryImage):
         self._sitk_image = sitkGetImageFromArray(img.T)
         self._updateImages()
 
+    # < Revision 16/10/2026
+    # add compact storage methods
+    def toFlatIndexes(self) -> ndarray:
+        """
+        Get flat indexes of the non-zero voxels, i.e. indexes in the flattened numpy array with default shape (z, y, x).
+        Dense image is not materialised if the current SisypheROI instance is compact.
+
+        Returns
+        -------
+        numpy.ndarray
+            flat indexes, sorted in ascending order
+        """
+        if self._compact is not None:
+            b = self._compact['bbox']
+            size = self._compact['size']
+            z, y, x = _unpackMask(b, self._compact['bits']).nonzero()
+            return ravel_multi_index((z + b[4], y + b[2], x + b[0]), (size[2], size[1], size[0]))
+        else: return flatnonzero(self.getNumpy())
+
+    def fromFlatIndexes(self,
+                        idx: list[int] | ndarray,
+                        size: vectorInt3 | None = None,
+                        spacing: vectorFloat3 | None = None,
+                        origin: vectorFloat3 | None = None,
+                        directions: tuple | list | None = None) -> None:
+        """
+        Set the current SisypheROI instance in compact storage mode from flat indexes of the non-zero voxels, i.e.
+        indexes in the flattened numpy array with default shape (z, y, x). Dense image is not allocated.
+
+        Parameters
+        ----------
+        idx : list[int] | numpy.ndarray
+            flat indexes of the non-zero voxels
+        size : tuple[int, int, int] | list[int, int, int] | None
+            image size in x, y, z dimensions (default None, size of the current SisypheROI instance)
+        spacing : tuple[float, float, float] | list[float, float, float] | None
+            voxel size in x, y, z dimensions (default None, spacing of the current SisypheROI instance)
+        origin : tuple[float, float, float] | list[float, float, float] | None
+            origin coordinates (default None, origin of the current SisypheROI instance)
+        directions : tuple | list | None
+            9 elements, vectors of image axes (default None, directions of the current SisypheROI instance)
+        """
+        if size is None:
+            if self.isEmpty(): raise ValueError('SisypheROI is empty.')
+            size = self.getSize()
+        if self.isEmpty():
+            if spacing is None: spacing = (1.0, 1.0, 1.0)
+            if origin is None: origin = (0.0, 0.0, 0.0)
+            if directions is None: directions = tuple(getRegularDirections())
+        else:
+            if spacing is None: spacing = self.getSpacing()
+            if origin is None: origin = self.getOrigin()
+            if directions is None: directions = self.getDirections()
+        if len(idx) > 0:
+            z, y, x = unravel_index(idx, (size[2], size[1], size[0]))
+            bbox = [int(x.min()), int(x.max()) + 1, int(y.min()), int(y.max()) + 1, int(z.min()), int(z.max()) + 1]
+            crop = zeros((bbox[5] - bbox[4], bbox[3] - bbox[2], bbox[1] - bbox[0]), dtype=bool)
+            crop[z - bbox[4], y - bbox[2], x - bbox[0]] = True
+            bits = packbits(crop, axis=None)
+        else:
+            bbox = [0, 0, 0, 0, 0, 0]
+            bits = zeros(0, dtype='uint8')
+        self._setCompact(size, spacing, bbox, bits, origin, directions)
+
+    def getBoundingBoxMask(self) -> tuple[ndarray, ndarray]:
+        """
+        Get the bounding box of the non-zero voxels and the mask cropped to this bounding box. Dense image is not
+        materialised if the current SisypheROI instance is compact.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            - first ndarray, bounding box, 6 elements: xmin, xmax, ymin, ymax, zmin, zmax (max bounds excluded),
+            all elements are 0 if the ROI is empty
+            - second ndarray, bool mask cropped to the bounding box, numpy default shape (z, y, x)
+        """
+        if self._compact is not None:
+            b = self._compact['bbox']
+            return array(b), _unpackMask(b, self._compact['bits']).astype(bool)
+        else:
+            img = self.getNumpy()
+            b = _getMaskBoundingBox(img)
+            return array(b), img[b[4]:b[5], b[2]:b[3], b[0]:b[1]] != 0
+
+    def setBoundingBoxMask(self, bbox: list[int] | ndarray, mask: ndarray, size: vectorInt3 | None = None) -> None:
+        """
+        Set the current SisypheROI instance in compact storage mode from a mask cropped to a bounding box. Dense
+        image is not allocated.
+
+        Parameters
+        ----------
+        bbox : list[int] | numpy.ndarray
+            bounding box, 6 elements: xmin, xmax, ymin, ymax, zmin, zmax (max bounds excluded)
+        mask : numpy.ndarray
+            mask cropped to the bounding box, numpy default shape (z, y, x)
+        size : tuple[int, int, int] | list[int, int, int] | None
+            image size in x, y, z dimensions (default None, size of the current SisypheROI instance)
+        """
+        if size is None:
+            if self.isEmpty(): raise ValueError('SisypheROI is empty.')
+            size = self.getSize()
+        if self.isEmpty():
+            spacing = (1.0, 1.0, 1.0)
+            origin = (0.0, 0.0, 0.0)
+            directions = tuple(getRegularDirections())
+        else:
+            spacing = self.getSpacing()
+            origin = self.getOrigin()
+            directions = self.getDirections()
+        if tuple(mask.shape) != (bbox[5] - bbox[4], bbox[3] - bbox[2], bbox[1] - bbox[0]):
+            raise ValueError('mask shape {} is not compatible with bounding box {}.'.format(mask.shape, list(bbox)))
+        if bbox[0] < 0 or bbox[2] < 0 or bbox[4] < 0 or \
+                bbox[1] > size[0] or bbox[3] > size[1] or bbox[5] > size[2]:
+            raise ValueError('bounding box {} is out of image size {}.'.format(list(bbox), list(size)))
+        # bounding box is shrunk to the non-zero voxels
+        b = _getMaskBoundingBox(mask)
+        bits = packbits(mask[b[4]:b[5], b[2]:b[3], b[0]:b[1]] != 0, axis=None)
+        if b[1] > 0:
+            b = [b[0] + bbox[0], b[1] + bbox[0], b[2] + bbox[2], b[3] + bbox[2], b[4] + bbox[4], b[5] + bbox[4]]
+        self._setCompact(size, spacing, b, bits, origin, directions)
+
+    def compact(self) -> None:
+        """
+        Convert the current SisypheROI instance to compact storage mode: bounding box of the non-zero voxels and
+        bit-packed mask cropped to this bounding box. SimpleITK, VTK, ITK images and numpy array are released and
+        materialised again at first access, previously returned views are no longer shared with the current
+        SisypheROI instance.
+        """
+        if self._compact is None and not self.isEmpty():
+            bbox, bits = _packMask(self.getNumpy())
+            self._setCompact(self.getSize(), self.getSpacing(), bbox, bits, self.getOrigin(), self.getDirections())
+
+    def isCompact(self) -> bool:
+        """
+        Check whether the current SisypheROI instance is in compact storage mode (see compact() method).
+
+        Returns
+        -------
+        bool
+            True if compact
+        """
+        return self._compact is not None
+
+    def isEmpty(self) -> bool:
+        """
+        Check whether image buffer is allocated. A compact SisypheROI instance is not empty.
+
+        Returns
+        -------
+        bool
+            True if image buffer is allocated
+        """
+        return self._compact is None and super().isEmpty()
+
+    def isEmptyArray(self) -> bool:
+        """
+        Check whether ROI is empty i.e. all scalar values in the ROI array are 0.
+
+        Returns
+        -------
+        bool
+            True if ROI is empty
+        """
+        if self._compact is not None: return not self._compact['bits'].any()
+        else: return super().isEmptyArray()
+
+    def getSize(self) -> vectorInt3:
+        """
+        Get image size, i.e. voxel count in each dimension.
+
+        Returns
+        -------
+        tuple[int, int, int]
+            image size in x, y, z dimensions
+        """
+        if self._compact is not None: return self._compact['size']
+        else: return super().getSize()
+
+    def getSpacing(self) -> vectorFloat3:
+        """
+        Get voxel size (mm) in each dimension.
+
+        Returns
+        -------
+        tuple[float, float, float]
+            voxel spacing in x, y, z
+        """
+        if self._compact is not None: return self._compact['spacing']
+        else: return super().getSpacing()
+
+    def setSpacing(self, sx: float, sy: float, sz: float) -> None:
+        """
+        Set voxel size (mm) in each dimension.
+
+        Parameters
+        ----------
+        sx : float
+            voxel spacing in x
+        sy : float
+            voxel spacing in y
+        sz : float
+            voxel spacing in x
+        """
+        if self._compact is not None: self._compact['spacing'] = (float(sx), float(sy), float(sz))
+        else: super().setSpacing(sx, sy, sz)
+
+    def getOrigin(self) -> vectorFloat3:
+        """
+        Get geometrical reference origin coordinates.
+
+        Returns
+        -------
+        tuple[float, float, float]
+            origin coordinates
+        """
+        if self._compact is not None: return self._compact['origin']
+        else: return super().getOrigin()
+
+    def getDirections(self) -> tuple[float, ...]:
+        """
+        Get vectors of image axes in RAS+ coordinates system.
+
+        Returns
+        -------
+        tuple[float, ...]
+            9 elements, vectors of image axes
+        """
+        if self._compact is not None: return self._compact['directions']
+        else: return super().getDirections()
+
+    def getDatatype(self) -> str:
+        """
+        Get image datatype as numpy datatype.
+
+        Returns
+        -------
+        str
+            numpy datatype, 'uint8'
+        """
+        if self._compact is not None: return 'uint8'
+        else: return super().getDatatype()
+
+    def getNumberOfNonZero(self, c: int = 0) -> int:
+        """
+        Get number of non-zero voxels in ROI. Dense image is not materialised if the current SisypheROI instance is
+        compact.
+
+        Parameters
+        ----------
+        c : int
+            component index, not used
+
+        Returns
+        -------
+        int
+            number of non-zero voxels
+        """
+        # padding bits of the last byte are 0
+        if self._compact is not None: return int(unpackbits(self._compact['bits']).sum())
+        else: return super().getNumberOfNonZero(c)
+    # Revision 16/10/2026 >
+
     # Processing
 
     def flip(self, fx: bool = False, fy: bool = False, fz: bool = False) -> None:
@@ -2275,7 +2673,11 @@ class SisypheROI(SisypheBinaryImage):
             else: raise IOError('parameter and filename attribute are empty.')
         else: raise ValueError('Voxel data array is empty.')
 
-    def createXML(self, doc: minidom.Document, single: bool = True) -> None:
+    def createXML(self,
+                  doc: minidom.Document,
+                  single: bool = True,
+                  chunks: tuple[int, list[int]] | None = None,
+                  bbox: list[int] | None = None) -> None:
         """
         Write the current SisypheROI instance attributes to xml instance. This method is called by save() and saveAs()
         methods, it is not recommended for use.
@@ -2287,6 +2689,10 @@ class SisypheROI(SisypheBinaryImage):
         single : bool
             - if True, saved in a single file (xml part + binary part)
             - if False, The xml part is saved in .xroi file and the binary part in .raw file
+        chunks : tuple[int, list[int]] | None
+            step (number of slices in each chunk) and offsets of compressed chunks, default None
+        bbox : list[int] | None
+            bounding box of the bit-packed binary part (compact storage), default None
         """
         if isinstance(doc, minidom.Document):
             root = doc.documentElement
@@ -2300,6 +2706,21 @@ class SisypheROI(SisypheBinaryImage):
             root.appendChild(node)
             txt = doc.createTextNode(str(self._compression))
             node.appendChild(txt)
+            # < Revision 16/10/2026
+            # Chunk offsets of compressed binary part
+            if chunks is not None:
+                node = doc.createElement('chunks')
+                node.setAttribute('step', str(chunks[0]))
+                root.appendChild(node)
+                txt = doc.createTextNode(' '.join([str(i) for i in chunks[1]]))
+                node.appendChild(txt)
+            # Bounding box of bit-packed binary part
+            if bbox is not None:
+                node = doc.createElement('bbox')
+                root.appendChild(node)
+                txt = doc.createTextNode(' '.join([str(i) for i in bbox]))
+                node.appendChild(txt)
+            # Revision 16/10/2026 >
             # Name node
             node = doc.createElement('name')
             root.appendChild(node)
@@ -2337,7 +2758,8 @@ class SisypheROI(SisypheBinaryImage):
 
     def saveAs(self, filename: str, single: bool = True) -> None:
         """
-        Save the current SisypheROI instance to PySisyphe ROI (.xroi) file.
+        Save the current SisypheROI instance to PySisyphe ROI (.xroi) file. A compact SisypheROI instance is saved with
+        its bounding box and bit-packed binary part (version 1.3).
 
         Parameters
         ----------
@@ -2357,22 +2779,39 @@ class SisypheROI(SisypheBinaryImage):
             root.setAttribute('version', '1.1')
             doc.appendChild(root)
             self.setFilename(filename)
-            self.createXML(doc, single)
+            # < Revision 16/10/2026
+            # chunked multi-threaded compression, version 1.2
+            # self.createXML(doc, single)
+            # buffxml = doc.toprettyxml().encode()  # Convert utf-8 to binary
+            # buffarray = self.getNumpy().tobytes()
+            # if self._compression: buffarray = compress(buffarray)
+            # compact storage, bounding box and bit-packed mask, version 1.3
+            if self._compact is not None:
+                buffarray = [self._compact['bits'].tobytes()]
+                if self._compression: buffarray = [compress(buffarray[0])]
+                root.setAttribute('version', '1.3')
+                self.createXML(doc, single, bbox=self._compact['bbox'])
+            elif self._compression:
+                step, offsets, buffarray = compressArrayToChunks(self.getNumpy())
+                root.setAttribute('version', '1.2')
+                self.createXML(doc, single, (step, offsets))
+            else:
+                buffarray = [self.getNumpy().tobytes()]
+                self.createXML(doc, single)
             buffxml = doc.toprettyxml().encode()  # Convert utf-8 to binary
-            buffarray = self.getNumpy().tobytes()
-            if self._compression: buffarray = compress(buffarray)
             with open(filename, 'wb') as f:
                 # Save XML part
                 f.write(buffxml)
                 # Binary array part
                 if single is True:
                     # Write in same file after XML part
-                    f.write(buffarray)
+                    for buff in buffarray: f.write(buff)
                 else:
                     # Write in other file *.raw
                     afilename = '{}.raw'.format(path)
                     with open(afilename, 'wb') as fa:
-                        fa.write(buffarray)
+                        for buff in buffarray: fa.write(buff)
+            # Revision 16/10/2026 >
         else: raise AttributeError('Data Array is empty.')
 
     # noinspection PyTypeChecker
@@ -2393,9 +2832,16 @@ class SisypheROI(SisypheBinaryImage):
         - 'size', list[int], image size in each axis
         - 'spacing', list[float], voxel size in each axis
         - 'array', bytes, array image
+        - 'chunks', tuple[int, list[int]], step and offsets of compressed chunks (version 1.2)
+        - 'bbox', list[int], bounding box of bit-packed binary part (version 1.3)
         """
         root = doc.documentElement
-        if root.nodeName == self._FILEEXT[1:] and root.getAttribute('version') <= '1.1':
+        # < Revision 16/10/2026
+        # version 1.2, chunked compressed binary part
+        # version 1.3, bounding box and bit-packed binary part
+        # if root.nodeName == self._FILEEXT[1:] and root.getAttribute('version') <= '1.1':
+        if root.nodeName == self._FILEEXT[1:] and root.getAttribute('version') <= '1.3':
+        # Revision 16/10/2026 >
             attr = dict()
             node = root.firstChild
             while node:
@@ -2406,6 +2852,15 @@ class SisypheROI(SisypheBinaryImage):
                 # Compressed
                 elif node.nodeName == 'compressed':
                     self._compression = node.firstChild.data == 'True'
+                # < Revision 16/10/2026
+                # Chunk offsets of compressed binary part, version 1.2
+                elif node.nodeName == 'chunks':
+                    attr['chunks'] = (int(node.getAttribute('step')),
+                                      [int(i) for i in node.firstChild.data.split(' ')])
+                # Bounding box of bit-packed binary part, version 1.3
+                elif node.nodeName == 'bbox':
+                    attr['bbox'] = [int(i) for i in node.firstChild.data.split(' ')]
+                # Revision 16/10/2026 >
                 elif node.nodeName == 'name':
                     self._name = node.firstChild.data
                 elif node.nodeName == 'color':
@@ -2431,7 +2886,8 @@ class SisypheROI(SisypheBinaryImage):
 
     def load(self, filename: str) -> None:
         """
-        Load the current SisypheROI instance from a PySisyphe ROI (.xroi) file.
+        Load the current SisypheROI instance from a PySisyphe ROI (.xroi) file. A file with bit-packed binary part
+        (version 1.3) is loaded in compact storage mode.
 
         Parameters
         ----------
@@ -2467,11 +2923,23 @@ class SisypheROI(SisypheBinaryImage):
                         with open(rawname, 'rb') as fa:
                             buff = fa.read()
             if buff is not None:
-                if self._compression: buff = decompress(buff)
-                img = frombuffer(buff, dtype='uint8')
                 size = attr['size']
-                img = img.reshape((size[2], size[1], size[0]))
-                self.copyFromNumpyArray(img, spacing=attr['spacing'], defaultshape=True)
+                # < Revision 16/10/2026
+                # compact storage, bit-packed binary part, version 1.3
+                if 'bbox' in attr:
+                    if self._compression: buff = decompress(buff)
+                    self._setCompact(size, attr['spacing'], attr['bbox'], frombuffer(buff, dtype='uint8'))
+                else:
+                    # chunked compressed binary part, version 1.2
+                    if 'chunks' in attr:
+                        step, offsets = attr['chunks']
+                        img = decompressArrayFromChunks(buff, step, offsets, (size[2], size[1], size[0]), 'uint8')
+                    else:
+                        if self._compression: buff = decompress(buff)
+                        img = frombuffer(buff, dtype='uint8')
+                        img = img.reshape((size[2], size[1], size[0]))
+                    self.copyFromNumpyArray(img, spacing=attr['spacing'], defaultshape=True)
+                # Revision 16/10/2026 >
             else: raise IOError('no such file : {}.'.format(rawname))
         else: raise IOError('no such file : {}'.format(filename))
 
@@ -2583,7 +3051,7 @@ class SisypheROICollection(object):
     object -> SisypheROICollection
 
     Creation: 08/09/2022
-    Last revision: 23/05/2024
+    Last revision: 16/10/2026
     """
 
     __slots__ = ['_rois', '_index', '_referenceID']
@@ -2605,6 +3073,26 @@ class SisypheROICollection(object):
             else: self.setReferenceID(roi.getReferenceID())
         else: raise TypeError('parameter type {} is not SisypheROI or SisypheROICollection.'.format(type(roi)))
 
+    # < Revision 16/10/2026
+    # add _getBoundingBoxMasks and _newCompactROI private methods, used by set operators
+    def _getBoundingBoxMasks(self) -> list[tuple[ndarray, ndarray]]:
+        size = tuple(self[0].getSize())
+        r = list()
+        for roi in self._rois:
+            if tuple(roi.getSize()) != size:
+                raise ValueError('ROI {} size is not same as first ROI.'.format(roi.getName()))
+            r.append(roi.getBoundingBoxMask())
+        return r
+
+    def _newCompactROI(self, bbox: list[int], mask: ndarray) -> SisypheROI:
+        roi = SisypheROI()
+        roi.setBoundingBoxMask(bbox, mask, self[0].getSize())
+        s = self[0].getSpacing()
+        roi.setSpacing(s[0], s[1], s[2])
+        roi.setReferenceID(self[0].getReferenceID())
+        return roi
+    # Revision 16/10/2026 >
+
     # Special methods
 
     """
@@ -3137,7 +3625,8 @@ class SisypheROICollection(object):
     def toLabelVolume(self) -> SisypheVolume:
         """
         Convert the current SisypheROICollection instance into a SisypheVolume instance of labels. The label value of
-        each ROI in the SisypheVolume instance is its int index in the SisypheROICollection container.
+        each ROI in the SisypheVolume instance is its int index in the SisypheROICollection container + 1 (0 is the
+        background). Voxels shared by several ROIs take the label of the last one.
 
         Returns
         -------
@@ -3146,14 +3635,32 @@ class SisypheROICollection(object):
         """
         if not self.isEmpty():
             self.sort()
-            roi = self[0].getSITKImage()
+            # < Revision 16/10/2026
+            # bounding box cropped masks are pasted in label array, without dense ROI materialisation
+            # label of ROI index i is i + 1, voxels shared by several ROIs take the label of the last one
+            # roi = self[0].getSITKImage()
+            # i: cython.int
+            # for i in range(1, self.count()):
+            #     roi = roi + self[i].getSITKImage() * i
+            # roi = sitkCast(roi, getLibraryDataType('uint8', 'sitk'))
+            # rvol = SisypheVolume()
+            # rvol.setSITKImage(roi)
+            size = self[0].getSize()
+            img = zeros((size[2], size[1], size[0]), dtype='uint8')
             # noinspection PyUnresolvedReferences
             i: cython.int
-            for i in range(1, self.count()):
-                roi = roi + self[i].getSITKImage() * i
-            roi = sitkCast(roi, getLibraryDataType('uint8', 'sitk'))
+            for i in range(self.count()):
+                if tuple(self[i].getSize()) != tuple(size):
+                    raise ValueError('ROI {} size is not same as first ROI.'.format(self[i].getName()))
+                b, m = self[i].getBoundingBoxMask()
+                img[b[4]:b[5], b[2]:b[3], b[0]:b[1]][m] = i + 1
             rvol = SisypheVolume()
-            rvol.setSITKImage(roi)
+            rvol.copyFromNumpyArray(img,
+                                    spacing=self[0].getSpacing(),
+                                    origin=self[0].getOrigin(),
+                                    direction=self[0].getDirections(),
+                                    defaultshape=True)
+            # Revision 16/10/2026 >
             rvol.acquisition.setModalityToLB()
             rvol.setID(self[0].getReferenceID())
             # noinspection PyUnresolvedReferences
@@ -3179,20 +3686,26 @@ class SisypheROICollection(object):
         if isinstance(v, SisypheVolume):
             if v.acquisition.isLB():
                 self.clear()
-                img = v.getSITKImage()
-                # noinspection PyUnresolvedReferences
-                i: cython.int
-                for i in range(1, 256):
-                    # noinspection PyTypeChecker
-                    r: sitkImage = (img == i)
-                    if sitkGetArrayViewFromImage(r).sum() > 0:
-                        roi = SisypheROI(r)
-                        name = v.acquisition.getLabel(i)
-                        if name == '': name = 'ROI#{}'.format(i)
-                        roi.setName(name)
-                        roi.setReferenceID(v.getID())
-                        roi.setFilename(join(v.getDirname(), name + roi.getFileExt()))
+                # < Revision 16/10/2026
+                # voxels are grouped by label in a single pass
+                # img = v.getSITKImage()
+                # i: cython.int
+                # for i in range(1, 256):
+                #    r: sitkImage = (img == i)
+                #    if sitkGetArrayViewFromImage(r).sum() > 0:
+                #        roi = SisypheROI(r)
+                #        name = v.acquisition.getLabel(i)
+                #        if name == '': name = 'ROI#{}'.format(i)
+                #        roi.setName(name)
+                #        roi.setReferenceID(v.getID())
+                #        roi.setFilename(join(v.getDirname(), name + roi.getFileExt()))
+                #        self.append(roi)
+                stats = SisypheLabelStatistics(v)
+                if not stats.isEmpty():
+                    for roi in stats.getROIs(list(range(1, 256))):
+                        roi.setFilename(join(v.getDirname(), roi.getName() + roi.getFileExt()))
                         self.append(roi)
+                # Revision 16/10/2026 >
             else: raise ValueError('SisypheVolume {} parameter is not label.'.format(v.getBasename()))
         else: raise TypeError('parameter type {} is not SisypheVolume.'.format(type(v)))
 
@@ -3201,6 +3714,7 @@ class SisypheROICollection(object):
     def union(self) -> SisypheROI:
         """
         Apply union operator between sisypheROI instances in the current SisypheROICollection instance container.
+        Union is processed on bounding box cropped masks, processed roi is compact.
 
         Returns
         -------
@@ -3212,16 +3726,31 @@ class SisypheROICollection(object):
             n: cython.int = self.count()
             roi = self[0]
             if n > 1:
-                # noinspection PyUnresolvedReferences
-                i: cython.int
-                for i in range(1, n):
-                    roi = roi | self[i]
+                # < Revision 16/10/2026
+                # union of bounding box cropped masks, without dense ROI materialisation
+                # i: cython.int
+                # for i in range(1, n):
+                #     roi = roi | self[i]
+                masks = self._getBoundingBoxMasks()
+                masks = [(b, m) for b, m in masks if m.size > 0]
+                if len(masks) > 0:
+                    bb = array([b for b, m in masks])
+                    box = [bb[:, 0].min(), bb[:, 1].max(), bb[:, 2].min(), bb[:, 3].max(), bb[:, 4].min(), bb[:, 5].max()]
+                    crop = zeros((box[5] - box[4], box[3] - box[2], box[1] - box[0]), dtype=bool)
+                    for b, m in masks:
+                        crop[b[4] - box[4]:b[5] - box[4], b[2] - box[2]:b[3] - box[2], b[0] - box[0]:b[1] - box[0]] |= m
+                else:
+                    box = [0, 0, 0, 0, 0, 0]
+                    crop = zeros((0, 0, 0), dtype=bool)
+                roi = self._newCompactROI(box, crop)
+                # Revision 16/10/2026 >
             return roi
         else: raise AttributeError('Collection is empty.')
 
     def intersection(self) -> SisypheROI:
         """
         Apply intersection operator between sisypheROI instances in the current SisypheROICollection instance container.
+        Intersection is processed on bounding box cropped masks, processed roi is compact.
 
         Returns
         -------
@@ -3233,10 +3762,23 @@ class SisypheROICollection(object):
             n: cython.int = self.count()
             roi = self[0]
             if n > 1:
-                # noinspection PyUnresolvedReferences
-                i: cython.int
-                for i in range(1, n):
-                    roi = roi & self[i]
+                # < Revision 16/10/2026
+                # intersection of bounding box cropped masks, without dense ROI materialisation
+                # i: cython.int
+                # for i in range(1, n):
+                #     roi = roi & self[i]
+                masks = self._getBoundingBoxMasks()
+                bb = array([b for b, m in masks])
+                box = [bb[:, 0].max(), bb[:, 1].min(), bb[:, 2].max(), bb[:, 3].min(), bb[:, 4].max(), bb[:, 5].min()]
+                if all([m.size > 0 for b, m in masks]) and box[0] < box[1] and box[2] < box[3] and box[4] < box[5]:
+                    crop = ones((box[5] - box[4], box[3] - box[2], box[1] - box[0]), dtype=bool)
+                    for b, m in masks:
+                        crop &= m[box[4] - b[4]:box[5] - b[4], box[2] - b[2]:box[3] - b[2], box[0] - b[0]:box[1] - b[0]]
+                else:
+                    box = [0, 0, 0, 0, 0, 0]
+                    crop = zeros((0, 0, 0), dtype=bool)
+                roi = self._newCompactROI(box, crop)
+                # Revision 16/10/2026 >
             return roi
         else: raise AttributeError('Collection is empty.')
 
@@ -3921,13 +4463,13 @@ class SisypheROIDraw(object):
     object -> SisypheROIDraw
 
     Creation: 08/09/2022
-    Last revision: 24/03/2025
+    Last revision: 16/10/2026
     """
 
     __slots__ = {'_volume', '_gradient', '_mask', '_brush', '_vbrush', '_roi', '_undo', '_undolifo', '_redolifo',
                  '_radius', '_morphradius', '_thickness', '_brushtype', '_struct', '_thresholdmin', '_thresholdmax',
                  '_ccsigma', '_cciter', '_acradius', '_acrms', '_acsigma', '_accurv', '_acadvec', '_acpropag',
-                 '_aciter', '_acalgo', '_acthresholds', '_acfactor', '_clipboard'}
+                 '_aciter', '_acalgo', '_acthresholds', '_acfactor', '_clipboard', '_dirty'}
 
     # Class constants
 
@@ -3974,6 +4516,8 @@ class SisypheROIDraw(object):
     _acfactor       float, factor used to process thresholds in seed region (mean +/- factor * sigma)
     _acthresholds   tuple[float, float] | None, active contour thresholds inf. and sup.
     _clipboard      sitkImage
+    _dirty          list[int] | None, bounding box [xmin, xmax, ymin, ymax, zmin, zmax] of the voxels modified since
+                    last popDirtyBoundingBox() call (max bounds excluded), None if ROI is not modified
     """
 
     def __init__(self) -> None:
@@ -4024,6 +4568,7 @@ class SisypheROIDraw(object):
         self._acfactor: cython.double = 2.0
         self._acthresholds: tuple[float, float] | None = None
         self._clipboard = None
+        self._dirty = None
         self._calcBrush()
 
     def __str__(self) -> str:
@@ -4103,6 +4648,9 @@ class SisypheROIDraw(object):
 
     def _updateRoiFromNumpy(self, img: ndarray, replace: bool = True) -> None:
         if not replace: img = self._roi.getNumpy() | img
+        # < Revision 16/10/2026
+        self._addDirtyRegion(_getMaskBoundingBox(self._roi.getNumpy() != img))
+        # Revision 16/10/2026 >
         self._roi.getNumpy()[:] = img[:]
 
     def _updateSliceFromNumpy(self, img: ndarray, sindex: int, dim: int, replace: bool = True):
@@ -4110,19 +4658,79 @@ class SisypheROIDraw(object):
         if dim == 0:
             if 0 <= sindex < dz:
                 if not replace: img = self._roi.getNumpy()[sindex, :, :] | img
+                # < Revision 16/10/2026
+                self._addDirtySlice(img, sindex, dim)
+                # Revision 16/10/2026 >
                 self._roi.getNumpy()[sindex, :, :] = img[:]  # numpy z, y, x
             else: raise IndexError('slice index is out of range.')
         elif dim == 1:
             if 0 <= sindex < dy:
                 if not replace: img = self._roi.getNumpy()[:, sindex, :] | img
+                # < Revision 16/10/2026
+                self._addDirtySlice(img, sindex, dim)
+                # Revision 16/10/2026 >
                 self._roi.getNumpy()[:, sindex, :] = img[:]  # numpy z, y, x
             else: raise IndexError('slice index is out of range.')
         else:
             if 0 <= sindex < dx:
                 if not replace: img = self._roi.getNumpy()[:, :, sindex] | img
+                # < Revision 16/10/2026
+                self._addDirtySlice(img, sindex, dim)
+                # Revision 16/10/2026 >
                 self._roi.getNumpy()[:, :, sindex] = img[:]  # numpy z, y, x
             else: raise IndexError('slice index is out of range.')
 
+    # < Revision 16/10/2026
+    # add _pasteMaskToROI private method, copy (bounding box, bit-packed mask) undo/redo element to ROI
+    def _pasteMaskToROI(self, buff: tuple[list[int], ndarray]) -> None:
+        b, bits = buff
+        img = self._roi.getNumpy()
+        self._addDirtyRegion(_getMaskBoundingBox(img))
+        self._addDirtyRegion(b)
+        img.fill(0)
+        img[b[4]:b[5], b[2]:b[3], b[0]:b[1]] = _unpackMask(b, bits)
+    # Revision 16/10/2026 >
+
+    # < Revision 16/10/2026
+    # add _addDirtyRegion, _addDirtySlice and _addDirtyBrush private methods, dirty bounding box update
+    def _addDirtyRegion(self, bbox: list[int] | ndarray) -> None:
+        # bbox [xmin, xmax, ymin, ymax, zmin, zmax], max bounds excluded
+        bbox = array(bbox, dtype='int64')
+        if (bbox[0::2] < bbox[1::2]).all():
+            if self._dirty is None: self._dirty = [int(v) for v in bbox]
+            else:
+                bbox[0::2] = npminimum(bbox[0::2], self._dirty[0::2])
+                bbox[1::2] = npmaximum(bbox[1::2], self._dirty[1::2])
+                self._dirty = [int(v) for v in bbox]
+
+    def _addDirtySlice(self, img: ndarray, sindex: int, dim: int) -> None:
+        # img, new slice array, numpy default shape
+        if dim == 0: diff = (self._roi.getNumpy()[sindex, :, :] != img)[None, :, :]
+        elif dim == 1: diff = (self._roi.getNumpy()[:, sindex, :] != img)[:, None, :]
+        else: diff = (self._roi.getNumpy()[:, :, sindex] != img)[:, :, None]
+        bbox = _getMaskBoundingBox(diff)
+        if bbox[1] > bbox[0]:
+            # noinspection PyUnresolvedReferences
+            k: cython.int = 4 - 2 * dim
+            bbox[k] += sindex
+            bbox[k + 1] += sindex
+            self._addDirtyRegion(bbox)
+
+    def _addDirtyBrush(self, x: int, y: int, z: int, dim: int | None = None) -> None:
+        # brush footprint, disk in dim slice orientation or ball if dim is None
+        # noinspection PyUnresolvedReferences
+        r: cython.int = self._radius - 1 if self._radius > 1 else 0
+        bbox = array([x - r, x + r + 1, y - r, y + r + 1, z - r, z + r + 1], dtype='int64')
+        if dim is not None:
+            # noinspection PyUnresolvedReferences
+            k: cython.int = 4 - 2 * dim
+            bbox[k] += r
+            bbox[k + 1] -= r
+        bbox[0::2] = npmaximum(bbox[0::2], 0)
+        bbox[1::2] = npminimum(bbox[1::2], self._roi.getSize())
+        self._addDirtyRegion(bbox)
+    # Revision 16/10/2026 >
+
     def _extractSITKSlice(self, sindex: int, dim: int, roi: bool = True) -> sitkImage:
         dz, dy, dx = self._roi.getNumpy().shape
         if dim == 0:
@@ -4202,6 +4810,7 @@ class SisypheROIDraw(object):
                     self._roi = roi
                     self._roi.setOrigin(self._volume.getOrigin())
                     self._roi.setDirections(self._volume.getDirections())
+                    self._dirty = None
                     if self._undo: self.clearLIFO()
                 else: raise ValueError('SisypheROI ID conflicting with SisypheVolume ID.')
             else: raise ValueError('SisypheVolume attribute is empty.')
@@ -4236,8 +4845,46 @@ class SisypheROIDraw(object):
         Remove the SisypheROI attribute to the current SisypheROIDraw instance.
         """
         self._roi = None
+        self._dirty = None
         self.clearLIFO()
 
+    # < Revision 16/10/2026
+    # add getDirtyBoundingBox, resetDirtyBoundingBox and popDirtyBoundingBox methods
+    def getDirtyBoundingBox(self) -> list[int] | None:
+        """
+        Get the bounding box of the SisypheROI voxels modified (brushes, slice and 3D processing, undo/redo) since the
+        last resetDirtyBoundingBox() or popDirtyBoundingBox() call. Display widgets use this dirty region to update
+        only views where the ROI has changed.
+
+        Returns
+        -------
+        list[int] | None
+            [xmin, xmax, ymin, ymax, zmin, zmax] voxel bounds, max bounds excluded, None if SisypheROI is not modified
+        """
+        if self._dirty is None: return None
+        else: return list(self._dirty)
+
+    def resetDirtyBoundingBox(self) -> None:
+        """
+        Reset the bounding box of the modified SisypheROI voxels.
+        """
+        self._dirty = None
+
+    def popDirtyBoundingBox(self) -> list[int] | None:
+        """
+        Get and reset the bounding box of the SisypheROI voxels modified since the last resetDirtyBoundingBox() or
+        popDirtyBoundingBox() call.
+
+        Returns
+        -------
+        list[int] | None
+            [xmin, xmax, ymin, ymax, zmin, zmax] voxel bounds, max bounds excluded, None if SisypheROI is not modified
+        """
+        r = self._dirty
+        self._dirty = None
+        return r
+    # Revision 16/10/2026 >
+
     def getBrushType(self) -> str:
         """
         Get the brush type, as str name, used to hand-draw in the SisypheROI image.
@@ -5066,7 +5713,11 @@ class SisypheROIDraw(object):
             0 addBundle to LIFO undo stack, 1 addBundle to LIFO redo stack
         """
         if self._undo and self.hasROI():
-            buff = sparse.csr_matrix(self._roi.getNumpy().copy().flatten())
+            # < Revision 16/10/2026
+            # whole volume is stored as bounding box and bit-packed mask
+            # buff = sparse.csr_matrix(self._roi.getNumpy().copy().flatten())
+            buff = _packMask(self._roi.getNumpy())
+            # Revision 16/10/2026 >
             if pile == self._UNDO: self._undolifo.append((self._DV, None, buff))
             else: self._redolifo.append((self._DV, None, buff))
 
@@ -5081,20 +5732,32 @@ class SisypheROIDraw(object):
             sx, sy, sz = self._roi.getSize()
             if item[0] == self._DV:
                 self.appendVolumeToLIFO(pile=self._REDO)
-                buff = item[2].toarray().reshape(sz, sy, sx)
-                self._roi.getNumpy()[:, :, :] = buff
+                # < Revision 16/10/2026
+                # buff = item[2].toarray().reshape(sz, sy, sx)
+                # self._roi.getNumpy()[:, :, :] = buff
+                self._pasteMaskToROI(item[2])
+                # Revision 16/10/2026 >
             elif item[0] == self._DSZ:
                 self.appendZSliceToLIFO(item[1], pile=self._REDO)
                 buff = item[2].toarray().reshape(sy, sx)
-                self._roi.getNumpy()[item[1], :, :] = buff
+                # < Revision 16/10/2026
+                # self._roi.getNumpy()[item[1], :, :] = buff
+                self._updateSliceFromNumpy(buff, item[1], 0)
+                # Revision 16/10/2026 >
             elif item[0] == self._DSY:
                 self.appendYSliceToLIFO(item[1], pile=self._REDO)
                 buff = item[2].toarray().reshape(sz, sx)
-                self._roi.getNumpy()[:, item[1], :] = buff
+                # < Revision 16/10/2026
+                # self._roi.getNumpy()[:, item[1], :] = buff
+                self._updateSliceFromNumpy(buff, item[1], 1)
+                # Revision 16/10/2026 >
             elif item[0] == self._DSX:
                 self.appendXSliceToLIFO(item[1], pile=self._REDO)
                 buff = item[2].toarray().reshape(sz, sy)
-                self._roi.getNumpy()[:, :, item[1]] = buff
+                # < Revision 16/10/2026
+                # self._roi.getNumpy()[:, :, item[1]] = buff
+                self._updateSliceFromNumpy(buff, item[1], 2)
+                # Revision 16/10/2026 >
 
     def popRedoLIFO(self) -> None:
         """
@@ -5106,20 +5769,32 @@ class SisypheROIDraw(object):
             sx, sy, sz = self._roi.getSize()
             if item[0] == self._DV:
                 self.appendVolumeToLIFO(pile=self._UNDO)
-                buff = item[2].toarray().reshape(sz, sy, sx)
-                self._roi.getNumpy()[:, :, :] = buff
+                # < Revision 16/10/2026
+                # buff = item[2].toarray().reshape(sz, sy, sx)
+                # self._roi.getNumpy()[:, :, :] = buff
+                self._pasteMaskToROI(item[2])
+                # Revision 16/10/2026 >
             elif item[0] == self._DSZ:
                 self.appendZSliceToLIFO(item[1], pile=self._UNDO)
                 buff = item[2].toarray().reshape(sy, sx)
-                self._roi.getNumpy()[item[1], :, :] = buff
+                # < Revision 16/10/2026
+                # self._roi.getNumpy()[item[1], :, :] = buff
+                self._updateSliceFromNumpy(buff, item[1], 0)
+                # Revision 16/10/2026 >
             elif item[0] == self._DSY:
                 self.appendYSliceToLIFO(item[1], pile=self._UNDO)
                 buff = item[2].toarray().reshape(sz, sx)
-                self._roi.getNumpy()[:, item[1], :] = buff
+                # < Revision 16/10/2026
+                # self._roi.getNumpy()[:, item[1], :] = buff
+                self._updateSliceFromNumpy(buff, item[1], 1)
+                # Revision 16/10/2026 >
             elif item[0] == self._DSX:
                 self.appendXSliceToLIFO(item[1], pile=self._UNDO)
                 buff = item[2].toarray().reshape(sz, sy)
-                self._roi.getNumpy[:, :, item[1]] = buff
+                # < Revision 16/10/2026
+                # self._roi.getNumpy[:, :, item[1]] = buff
+                self._updateSliceFromNumpy(buff, item[1], 2)
+                # Revision 16/10/2026 >
 
     def clearLIFO(self) -> None:
         """
@@ -5200,6 +5875,9 @@ class SisypheROIDraw(object):
                 - 1 y-axis slice (coronal),
                 - 2 x-axis slice (sagittal)
         """
+        # < Revision 16/10/2026
+        self._addDirtyBrush(x, y, z, dim)
+        # Revision 16/10/2026 >
         if self._radius in (0, 1):
             self._roi.getSITKImage()[x, y, z] = c
         else:
@@ -5308,6 +5986,9 @@ class SisypheROIDraw(object):
         """
         if not self.hasThresholds(): self.solidBrush(x, y, z, 1, dim)
         else:
+            # < Revision 16/10/2026
+            self._addDirtyBrush(x, y, z, dim)
+            # Revision 16/10/2026 >
             if self._radius in (0, 1):
                 if self._thresholdmin <= self._volume.getSITKImage()[x, y, z] <= self._thresholdmax:
                     self._roi.getSITKImage()[x, y, z] = 1
@@ -5411,6 +6092,9 @@ class SisypheROIDraw(object):
         c : int
             0 (erase) or 1 (draw)
         """
+        # < Revision 16/10/2026
+        self._addDirtyBrush(x, y, z)
+        # Revision 16/10/2026 >
         if self._radius in (0, 1):
             self._roi.getSITKImage()[x, y, z] = c
         else:
@@ -5468,6 +6152,9 @@ class SisypheROIDraw(object):
         """
         if not self.hasThresholds(): self.solid3DBrush(x, y, z, 1)
         else:
+            # < Revision 16/10/2026
+            self._addDirtyBrush(x, y, z)
+            # Revision 16/10/2026 >
             if self._radius in (0, 1):
                 if self._thresholdmin <= self._volume.getSITKImage()[x, y, z] <= self._thresholdmax:
                     self._roi.getSITKImage()[x, y, z] = 1
@@ -8737,6 +9424,80 @@ class SisypheROIDraw(object):
         return stats
 
 
+# < Revision 16/10/2026
+# ROI features calculation jobs (ROI x feature class), processed in a process pool
+
+# padding (voxels) added to ROI bounding box, same as pyradiomics feature extractor default padDistance
+_ROIPADDING = 5
+# feature classes, in DataFrame column order
+_ROIFEATURES = {'fo': 'first-order statistics',
+                'sh': 'shape statistics',
+                'glcm': 'gray level co-occurrence matrix features',
+                'glszm': 'gray level Size zone matrix features',
+                'glrlm': 'gray level run length matrix features',
+                'ngtdm': 'neighbouring gray tone difference matrix features',
+                'gldm': 'gray level dependence matrix features'}
+# worker process image (shared memory view), attached once per worker
+_featuresWorker = dict()
+
+
+def _calcROIFeatures(img: ndarray,
+                     spacing: vectorFloat3,
+                     bbox: ndarray,
+                     mask: ndarray,
+                     feature: str) -> tuple[list[str], list]:
+    # img, whole volume array, numpy default shape (z, y, x)
+    # mask, bool mask cropped to bbox (xmin, xmax, ymin, ymax, zmin, zmax)
+    # image and mask are cropped to the padded bounding box
+    b = [int(npmaximum(bbox[0] - _ROIPADDING, 0)), int(npminimum(bbox[1] + _ROIPADDING, img.shape[2])),
+         int(npmaximum(bbox[2] - _ROIPADDING, 0)), int(npminimum(bbox[3] + _ROIPADDING, img.shape[1])),
+         int(npmaximum(bbox[4] - _ROIPADDING, 0)), int(npminimum(bbox[5] + _ROIPADDING, img.shape[0]))]
+    buff = zeros((b[5] - b[4], b[3] - b[2], b[1] - b[0]), dtype='uint8')
+    buff[bbox[4] - b[4]:bbox[5] - b[4], bbox[2] - b[2]:bbox[3] - b[2], bbox[0] - b[0]:bbox[1] - b[0]] = mask
+    vol = sitkGetImageFromArray(img[b[4]:b[5], b[2]:b[3], b[0]:b[1]])
+    vol.SetSpacing(spacing)
+    roi = sitkGetImageFromArray(buff)
+    roi.SetSpacing(spacing)
+    if feature == 'fo': flt = RadiomicsFirstOrder(vol, roi)
+    elif feature == 'sh':
+        # Shape features of main connected component
+        roi2 = sitkConnectedComponent(roi)
+        if sitkGetArrayViewFromImage(roi2).max() > 1:
+            roi2 = sitkRelabelComponent(roi2)
+            roi2 = (roi2 == 1)
+        else: roi2 = roi
+        flt = RadiomicsShape(vol, roi2)
+    elif feature == 'glcm': flt = RadiomicsGLCM(vol, roi)
+    elif feature == 'glszm': flt = RadiomicsGLSZM(vol, roi)
+    elif feature == 'glrlm': flt = RadiomicsGLRLM(vol, roi)
+    elif feature == 'ngtdm': flt = RadiomicsNGTDM(vol, roi)
+    else: flt = RadiomicsGLDM(vol, roi)
+    r = flt.execute()
+    return list(r.keys()), list(r.values())
+
+
+def _initROIFeaturesWorker(shared: tuple[str, tuple[int, ...], str], spacing: vectorFloat3) -> None:
+    if version_info >= (3, 13): shm = SharedMemory(name=shared[0], track=False)
+    else:
+        # attachment is unregistered only if it started a resource tracker owned by the worker,
+        # pool workers share the resource tracker of the parent process that unlinks shared memory
+        # noinspection PyProtectedMember
+        owned = platform != 'win32' and resource_tracker._resource_tracker._fd is None
+        shm = SharedMemory(name=shared[0])
+        # noinspection PyProtectedMember
+        if owned: resource_tracker.unregister(shm._name, 'shared_memory')
+    _featuresWorker['shm'] = shm
+    _featuresWorker['img'] = ndarray(shared[1], dtype=shared[2], buffer=shm.buf)
+    _featuresWorker['spacing'] = spacing
+
+
+def _roiFeaturesWorker(job: tuple[int, str, ndarray, ndarray]) -> tuple[int, str, list[str], list]:
+    i, feature, bbox, mask = job
+    keys, values = _calcROIFeatures(_featuresWorker['img'], _featuresWorker['spacing'], bbox, mask, feature)
+    return i, feature, keys, values
+# Revision 16/10/2026 >
+
+
 class SisypheROIFeatures(object):
     """
     Description
@@ -8744,13 +9505,16 @@ class SisypheROIFeatures(object):
 
     Extract features (descriptive statistics, shape, texture) from SisypheROI and SisypheVolume instance(s).
 
+    Image and mask are cropped to the padded bounding box of each ROI. Features calculation jobs (ROI x feature class)
+    are processed in a process pool, volume image is shared between processes (shared memory).
+
     Inheritance
     ~~~~~~~~~~~
 
     object -> SisypheROIFeatures
 
     Creation: 08/09/2022
-    Last revision: 15/12/2023
+    Last revision: 16/10/2026
     """
 
     __slots__ = ['_volume', '_rois', '_foTag', '_shTag', '_glcmTag',
@@ -9181,7 +9945,7 @@ class SisypheROIFeatures(object):
         self._gldmTag = True
 
     # noinspection PyArgumentList
-    def execute(self, progress: DialogWait | None = None) -> None:
+    def execute(self, progress: DialogWait | None = None, workers: int = 0) -> None:
         """
         Execute features calculation.
 
@@ -9200,6 +9964,8 @@ class SisypheROIFeatures(object):
         ----------
         progress : Sisyphe.gui.dialogWait.DialogWait | None
             progress bar dialog (optional)
+        workers : int
+            number of worker processes (default 0, number of cpu)
         """
         if self.hasVolume() and self.hasROICollection():
             from Sisyphe.gui.dialogWait import DialogWait
@@ -9207,80 +9973,68 @@ class SisypheROIFeatures(object):
             # noinspection PyUnresolvedReferences
             n: cython.int = len(self._rois)
             if n > 0:
-                img = self._volume.getSITKImage()
+                # < Revision 16/10/2026
+                # image and mask are cropped to the padded bounding box of each ROI, ROI x feature class jobs are
+                # processed in a process pool, volume image is in shared memory
+                features = list()
+                if self._foTag: features.append('fo')
+                if self._shTag: features.append('sh')
+                if self._glcmTag: features.append('glcm')
+                if self._glszmTag: features.append('glszm')
+                if self._glrlmTag: features.append('glrlm')
+                if self._ngtdmTag: features.append('ngtdm')
+                if self._gldmTag: features.append('gldm')
+                img = self._volume.getNumpy()
+                spacing = tuple(self._volume.getSpacing())
+                jobs = list()
+                # noinspection PyUnresolvedReferences
+                i: cython.int
+                for i in range(n):
+                    # compact ROIs are not materialised
+                    bbox, mask = self._rois[i].getBoundingBoxMask()
+                    for f in features: jobs.append((i, f, bbox, mask))
+                if progress is not None:
+                    progress.setProgressRange(0, len(jobs))
+                    progress.setCurrentProgressValue(0)
+                    progress.progressVisibilityOn()
+                if workers <= 0: workers = cpu_count()
+                results = dict()
+                if workers == 1 or len(jobs) < 2:
+                    for i, f, bbox, mask in jobs:
+                        if progress is not None:
+                            progress.setInformationText('{} {}.'.format(self._rois[i].getName(), _ROIFEATURES[f]))
+                        results[(i, f)] = _calcROIFeatures(img, spacing, bbox, mask, f)
+                        if progress is not None: progress.incCurrentProgressValue()
+                else:
+                    shm = SharedMemory(create=True, size=img.nbytes)
+                    try:
+                        buff = ndarray(img.shape, dtype=img.dtype, buffer=shm.buf)
+                        buff[...] = img
+                        with Pool(processes=min(workers, len(jobs)),
+                                  initializer=_initROIFeaturesWorker,
+                                  initargs=((shm.name, img.shape, img.dtype.str), spacing)) as pool:
+                            for i, f, keys, values in pool.imap_unordered(_roiFeaturesWorker, jobs):
+                                results[(i, f)] = (keys, values)
+                                if progress is not None:
+                                    progress.setInformationText('{} {}.'.format(self._rois[i].getName(),
+                                                                                _ROIFEATURES[f]))
+                                    progress.incCurrentProgressValue()
+                        del buff
+                    finally:
+                        shm.close()
+                        shm.unlink()
+                if progress is not None: progress.progressVisibilityOff()
+                # same row and column order as sequential processing
                 rows = self._rois.keys()
                 cols = list()
+                for f in features: cols += results[(0, f)][0]
                 df = list()
-                # noinspection PyUnresolvedReferences
-                i: cython.int
                 for i in range(n):
                     item = list()
-                    mask = self._rois[i].getSITKImage()
-                    name = self._rois[i].getName()
-                    # First-order features
-                    if self._foTag:
-                        if progress is not None:
-                            progress.setInformationText('{} first-order statistics.'.format(name))
-                        flt = RadiomicsFirstOrder(img, mask)
-                        r = flt.execute()
-                        if i == 0: cols += r.keys()
-                        item += r.values()
-                    # Shape features of main connected component
-                    if self._shTag:
-                        if progress is not None:
-                            progress.setInformationText('{} shape statistics.'.format(name))
-                        mask2 = sitkConnectedComponent(mask)
-                        if sitkGetArrayViewFromImage(mask2).max() > 1:
-                            mask2 = sitkRelabelComponent(mask2)
-                            mask2 = (mask2 == 1)
-                        else: mask2 = mask
-                        flt = RadiomicsShape(img, mask2)
-                        r = flt.execute()
-                        if i == 0: cols += r.keys()
-                        item += r.values()
-                    # Gray level co-occurrence matrix features
-                    if self._glcmTag:
-                        if progress is not None:
-                            progress.setInformationText('{} gray level co-occurrence matrix features.'.format(name))
-                        flt = RadiomicsGLCM(img, mask)
-                        r = flt.execute()
-                        if i == 0: cols += r.keys()
-                        item += r.values()
-                    # Gray level Size zone matrix features
-                    if self._glszmTag:
-                        if progress is not None:
-                            progress.setInformationText('{} gray level Size zone matrix features.'.format(name))
-                        flt = RadiomicsGLSZM(img, mask)
-                        r = flt.execute()
-                        if i == 0: cols += r.keys()
-                        item += r.values()
-                    # Gray level run length matrix features
-                    if self._glrlmTag:
-                        if progress is not None:
-                            progress.setInformationText('{} gray level run length matrix features.'.format(name))
-                        flt = RadiomicsGLRLM(img, mask)
-                        r = flt.execute()
-                        if i == 0: cols += r.keys()
-                        item += r.values()
-                    # Neighbouring gray tone difference matrix features
-                    if self._ngtdmTag:
-                        if progress is not None:
-                            progress.setInformationText('{} neighbouring gray tone difference matrix features.'
-                                                        .format(name))
-                        flt = RadiomicsNGTDM(img, mask)
-                        r = flt.execute()
-                        if i == 0: cols += r.keys()
-                        item += r.values()
-                    # Gray level dependence matrix matrix features
-                    if self._gldmTag:
-                        if progress is not None:
-                            progress.setInformationText('{} gray level dependence matrix features.'.format(name))
-                        flt = RadiomicsGLDM(img, mask)
-                        r = flt.execute()
-                        if i == 0: cols += r.keys()
-                        item += r.values()
+                    for f in features: item += results[(i, f)][1]
                     df.append(item)
                 self._df = DataFrame(df, index=rows, columns=cols)
+                # Revision 16/10/2026 >
             else: raise AttributeError('ROI collection is empty.')
         else: raise AttributeError('Undefined volume or ROICollection.')
 
@@ -9651,3 +10405,483 @@ class SisypheROIHistogram(object):
                 self._df.to_excel(filename)
             else: raise TypeError('parameter type {} is not str'.format(type(filename)))
         else: raise AttributeError('Dataframe is empty.')
+
+
+class SisypheLabelStatistics(object):
+    """
+    Description
+    ~~~~~~~~~~~
+
+    One-pass statistics engine for label volumes (atlases) and SisypheROICollection instances.
+
+    Labelled voxels are grouped once by label (sort of the labelled voxel indices). Then, for each scalar volume,
+    descriptive statistics (count, mean, median, min, max, percentiles, variance, standard deviation, skewness,
+    kurtosis) and histograms of all labels are calculated in a single vectorized pass, whatever the number of labels.
+    Voxel counts, centroids and bounding boxes only depend on labels. ROIs of a SisypheROICollection may overlap,
+    empty ROIs are ignored.
+
+    Inheritance
+    ~~~~~~~~~~~
+
+    object -> SisypheLabelStatistics
+
+    Creation: 16/10/2026
+    """
+
+    __slots__ = ['_shape', '_spacing', '_origin', '_directions', '_refID', '_labels', '_names', '_colors',
+                 '_voxels', '_counts', '_bins']
+
+    # Special methods
+
+    """
+    Private attributes
+
+    _shape      tuple[int, int, int], array shape (z, y, x)
+    _spacing    tuple[float, float, float], voxel size (x, y, z)
+    _origin     tuple[float, float, float], origin coordinates
+    _directions tuple[float, ...], 9 elements, vectors of image axes
+    _refID      str, reference volume ID
+    _labels     ndarray, label values
+    _names      list[str], label names
+    _colors     list[list[float]] | None, ROI colors
+    _voxels     ndarray, flat voxel indices grouped by label
+    _counts     ndarray, number of voxels of each label
+    _bins       int, histogram bins
+    """
+
+    def __init__(self, v: SisypheVolume | SisypheROICollection | None = None) -> None:
+        """
+        SisypheLabelStatistics instance constructor.
+
+        Parameters
+        ----------
+        v : Sisyphe.core.sisypheVolume.SisypheVolume | SisypheROICollection | None
+            label volume or ROI collection (default None)
+        """
+        super().__init__()
+        self._shape = None
+        self._spacing = None
+        self._origin = None
+        self._directions = None
+        self._refID = ''
+        self._labels = None
+        self._names = list()
+        self._colors = None
+        self._voxels = None
+        self._counts = None
+        # noinspection PyUnresolvedReferences
+        self._bins: cython.int = 100
+        if isinstance(v, SisypheVolume): self.setLabelVolume(v)
+        elif isinstance(v, SisypheROICollection): self.setROICollection(v)
+
+    def __str__(self) -> str:
+        """
+        Special overloaded method called by the built-in str() python function.
+
+        Returns
+        -------
+        str
+            conversion of SisypheLabelStatistics instance to str
+        """
+        buff = 'Number of labels: {}\n'.format(self.getNumberOfLabels())
+        buff += 'Bins: {}\n'.format(self._bins)
+        return buff
+
+    def __repr__(self) -> str:
+        """
+        Special overloaded method called by the built-in repr() python function.
+
+        Returns
+        -------
+        str
+            SisypheLabelStatistics instance representation
+        """
+        return 'SisypheLabelStatistics instance at <{}>\n'.format(str(id(self))) + self.__str__()
+
+    # Private methods
+
+    def _getStarts(self) -> ndarray:
+        # first position of each label in the grouped voxel indices
+        return concatenate(([0], cumsum(self._counts)[:-1]))
+
+    def _getSortedValues(self, vol: SisypheVolume) -> ndarray:
+        # scalar values grouped by label and sorted within each label
+        if self.isEmpty(): raise AttributeError('No label.')
+        if not isinstance(vol, SisypheVolume): raise TypeError('parameter type {} is not SisypheVolume.'.format(type(vol)))
+        if tuple(vol.getNumpy().shape) != self._shape:
+            raise ValueError('SisypheVolume {} size is not same as labels.'.format(vol.getBasename()))
+        v = vol.getNumpy().ravel()[self._voxels].astype('float64')
+        ids = repeat(arange(len(self._counts)), self._counts)
+        return v[lexsort((v, ids))]
+
+    # Public methods
+
+    def setLabelVolume(self, v: SisypheVolume) -> None:
+        """
+        Set labels from a label volume. Each non-zero scalar value of the label volume is a label. Voxels are grouped
+        by label in a single pass.
+
+        Parameters
+        ----------
+        v : Sisyphe.core.sisypheVolume.SisypheVolume
+            label volume
+        """
+        if isinstance(v, SisypheVolume):
+            if v.getNumberOfComponentsPerPixel() == 1:
+                lbl = v.getNumpy().ravel()
+                nz = flatnonzero(lbl)
+                lv = lbl[nz]
+                order = argsort(lv, kind='stable')
+                self._voxels = nz[order]
+                self._labels, self._counts = unique(lv, return_counts=True)
+                self._shape = tuple(v.getNumpy().shape)
+                self._spacing = tuple(v.getSpacing())
+                self._origin = tuple(v.getOrigin())
+                self._directions = tuple(v.getDirections())
+                self._refID = v.getID()
+                self._colors = None
+                self._names = list()
+                for i in self._labels:
+                    name = ''
+                    if v.acquisition.isLB(): name = v.acquisition.getLabel(int(i))
+                    if name == '': name = 'ROI#{}'.format(i)
+                    self._names.append(name)
+            else: raise ValueError('SisypheVolume {} is multi-component.'.format(v.getBasename()))
+        else: raise TypeError('parameter type {} is not SisypheVolume.'.format(type(v)))
+
+    def setROICollection(self, rois: SisypheROICollection) -> None:
+        """
+        Set labels from a SisypheROICollection instance. Each non-empty ROI is a label, label values are ROI indices
+        + 1. ROIs may overlap.
+
+        Parameters
+        ----------
+        rois : SisypheROICollection
+            ROI collection
+        """
+        if isinstance(rois, SisypheROICollection):
+            if len(rois) > 0:
+                voxels = list()
+                labels = list()
+                self._names = list()
+                self._colors = list()
+                # compact ROIs are not materialised
+                self._shape = tuple(rois[0].getSize())[::-1]
+                self._spacing = tuple(rois[0].getSpacing())
+                self._origin = tuple(rois[0].getOrigin())
+                self._directions = tuple(rois[0].getDirections())
+                self._refID = rois[0].getReferenceID()
+                # noinspection PyUnresolvedReferences
+                i: cython.int
+                for i in range(len(rois)):
+                    roi = rois[i]
+                    if tuple(roi.getSize())[::-1] != self._shape:
+                        raise ValueError('ROI {} size is not same as first ROI.'.format(roi.getName()))
+                    nz = roi.toFlatIndexes()
+                    if len(nz) > 0:
+                        voxels.append(nz)
+                        labels.append(i + 1)
+                        self._names.append(roi.getName())
+                        self._colors.append(roi.getColor())
+                if len(voxels) > 0:
+                    self._voxels = concatenate(voxels)
+                    self._counts = array([len(nz) for nz in voxels])
+                    self._labels = array(labels)
+                else: raise ValueError('All ROIs are empty.')
+            else: raise ValueError('ROI collection is empty.')
+        else: raise TypeError('parameter type {} is not SisypheROICollection.'.format(type(rois)))
+
+    def isEmpty(self) -> bool:
+        """
+        Check whether labels of the current SisypheLabelStatistics instance are defined.
+
+        Returns
+        -------
+        bool
+            True if no label
+        """
+        return self._counts is None
+
+    def getNumberOfLabels(self) -> int:
+        """
+        Get the number of labels of the current SisypheLabelStatistics instance.
+
+        Returns
+        -------
+        int
+            number of labels
+        """
+        if self._counts is None: return 0
+        else: return len(self._counts)
+
+    def getLabels(self) -> list[int]:
+        """
+        Get the label values of the current SisypheLabelStatistics instance.
+
+        Returns
+        -------
+        list[int]
+            label values
+        """
+        if self._labels is None: return list()
+        else: return self._labels.tolist()
+
+    def getNames(self) -> list[str]:
+        """
+        Get the label names of the current SisypheLabelStatistics instance.
+
+        Returns
+        -------
+        list[str]
+            label names
+        """
+        return self._names
+
+    def setBins(self, v: int) -> None:
+        """
+        Set the histogram bins attribute of the current SisypheLabelStatistics instance.
+
+        Parameters
+        ----------
+        v : int
+            number of bins in the histograms
+        """
+        if isinstance(v, int):
+            if 2 <= v <= 1024: self._bins = v
+            else: raise ValueError('parameter value {} is not between 2 and 1024.'.format(v))
+        else: raise TypeError('parameter type {} is not int.'.format(type(v)))
+
+    def getBins(self) -> int:
+        """
+        Get the histogram bins attribute of the current SisypheLabelStatistics instance.
+
+        Returns
+        -------
+        int
+            number of bins in the histograms
+        """
+        return self._bins
+
+    def getCounts(self) -> ndarray:
+        """
+        Get the number of voxels of each label.
+
+        Returns
+        -------
+        numpy.ndarray
+            number of voxels, one element for each label
+        """
+        return self._counts
+
+    def getCentroids(self, ref: str = 'world') -> ndarray:
+        """
+        Get the centroid of each label.
+
+        Parameters
+        ----------
+        ref : str
+            reference of returned coordinates
+                - 'world' world coordinates (default)
+                - 'array' array coordinates
+
+        Returns
+        -------
+        numpy.ndarray
+            centroid x, y, z coordinates, one row for each label
+        """
+        if self.isEmpty(): raise AttributeError('No label.')
+        z, y, x = unravel_index(self._voxels, self._shape)
+        starts = self._getStarts()
+        r = empty((len(self._counts), 3))
+        for i, c in enumerate((x, y, z)):
+            r[:, i] = npadd.reduceat(c.astype('float64'), starts) / self._counts
+        # world = origin + directions x (array coordinates x spacing), same as SimpleITK TransformIndexToPhysicalPoint
+        if ref == 'world': r = (r * array(self._spacing)) @ array(self._directions).reshape(3, 3).T + array(self._origin)
+        return r
+
+    def getBoundingBoxes(self) -> ndarray:
+        """
+        Get the bounding box of each label.
+
+        Returns
+        -------
+        numpy.ndarray
+            xmin, xmax, ymin, ymax, zmin, zmax array indices (max indices are excluded), one row for each label
+        """
+        if self.isEmpty(): raise AttributeError('No label.')
+        z, y, x = unravel_index(self._voxels, self._shape)
+        starts = self._getStarts()
+        r = empty((len(self._counts), 6), dtype='int64')
+        for i, c in enumerate((x, y, z)):
+            r[:, 2 * i] = npminimum.reduceat(c, starts)
+            r[:, 2 * i + 1] = npmaximum.reduceat(c, starts) + 1
+        return r
+
+    def getIntensityStatistics(self,
+                               vol: SisypheVolume,
+                               perc: list[float] | None = None) -> dict[str, dict[str, float]]:
+        """
+        Get the descriptive statistics of scalar values of a volume in each label. Statistics of all labels are
+        calculated in a single pass.
+
+        Parameters
+        ----------
+        vol : Sisyphe.core.sisypheVolume.SisypheVolume
+            scalar volume, same size as labels
+        perc : list[float] | None
+            additional percentiles (default None), 'perc' + str(int(p)) keys
+
+        Returns
+        -------
+        dict[str, dict[str, float]]
+            label name keys, same dict values as SisypheROIDraw.getIntensityStatistics() method
+                - 'count'       number of voxels
+                - 'mean'        mean
+                - 'median'      median
+                - 'min'         minimum
+                - 'max'         maximum
+                - 'range'       maximum - minimum
+                - 'perc25'      first quartile
+                - 'perc75'      third quartile
+                - 'var'         variance
+                - 'std'         standard deviation
+                - 'skewness'    skewness
+                - 'kurtosis'    kurtosis
+        """
+        v = self._getSortedValues(vol)
+        n = self._counts
+        starts = self._getStarts()
+        last = starts + n - 1
+        mean = npadd.reduceat(v, starts) / n
+        d = v - repeat(mean, n)
+        d2 = d * d
+        m2 = npadd.reduceat(d2, starts) / n
+        m3 = npadd.reduceat(d2 * d, starts) / n
+        m4 = npadd.reduceat(d2 * d2, starts) / n
+        # unbiased variance, biased skewness and kurtosis (scipy.stats.describe defaults)
+        with errstate(divide='ignore', invalid='ignore'):
+            var = m2 * n / (n - 1)
+            skew = m3 / m2 ** 1.5
+            kurt = m4 / (m2 * m2) - 3.0
+
+        def pc(p):
+            # linear interpolation, same as numpy.percentile default method
+            pos = (n - 1) * p / 100
+            lo = pos.astype('int64')
+            hi = npminimum(lo + 1, n - 1)
+            f = pos - lo
+            return v[starts + lo] * (1 - f) + v[starts + hi] * f
+
+        cols = {'count': n,
+                'mean': mean,
+                'median': pc(50),
+                'min': v[starts],
+                'max': v[last],
+                'range': v[last] - v[starts],
+                'perc25': pc(25),
+                'perc75': pc(75),
+                'var': var,
+                'std': var ** 0.5,
+                'skewness': skew,
+                'kurtosis': kurt}
+        if perc is not None:
+            for p in perc: cols['perc{}'.format(int(p))] = pc(p)
+        r = dict()
+        # noinspection PyUnresolvedReferences
+        i: cython.int
+        for i, name in enumerate(self._names):
+            r[name] = {k: c[i].item() for k, c in cols.items()}
+        return r
+
+    def getDataFrame(self, vol: SisypheVolume, perc: list[float] | None = None) -> DataFrame:
+        """
+        Get the descriptive statistics of scalar values of a volume in each label as pandas.DataFrame (see
+        getIntensityStatistics() method).
+
+        Parameters
+        ----------
+        vol : Sisyphe.core.sisypheVolume.SisypheVolume
+            scalar volume, same size as labels
+        perc : list[float] | None
+            additional percentiles (default None)
+
+        Returns
+        -------
+        pandas.DataFrame
+            one row for each label, one column for each statistic
+        """
+        return DataFrame.from_dict(self.getIntensityStatistics(vol, perc), orient='index')
+
+    def getHistograms(self, vol: SisypheVolume, norm: bool = False) -> tuple[ndarray, ndarray]:
+        """
+        Get the histograms of scalar values of a volume in each label. Histogram range of each label is its minimum
+        and maximum values (same bins as numpy.histogram). Histograms of all labels are calculated in a single pass.
+
+        Parameters
+        ----------
+        vol : Sisyphe.core.sisypheVolume.SisypheVolume
+            scalar volume, same size as labels
+        norm : bool
+            histogram normalization if True (default False)
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            - histograms, shape (number of labels, bins)
+            - bin edges, shape (number of labels, bins + 1)
+        """
+        v = self._getSortedValues(vol)
+        n = self._counts
+        starts = self._getStarts()
+        lo = v[starts]
+        hi = v[starts + n - 1]
+        # same range as numpy.histogram if minimum = maximum
+        c = lo == hi
+        lo = where(c, lo - 0.5, lo)
+        hi = where(c, hi + 0.5, hi)
+        edges = lo[:, None] + (hi - lo)[:, None] * (arange(self._bins + 1) / self._bins)[None, :]
+        ids = repeat(arange(len(n)), n)
+        b = ((v - lo[ids]) * (self._bins / (hi - lo))[ids]).astype('int64')
+        b = npminimum(b, self._bins - 1)
+        # bin edge rounding corrections, as numpy.histogram
+        b[v < edges[ids, b]] -= 1
+        b[(v >= edges[ids, b + 1]) & (b != self._bins - 1)] += 1
+        h = bincount(ids * self._bins + b, minlength=len(n) * self._bins).reshape(len(n), self._bins)
+        if norm: h = h / n[:, None]
+        return h, edges
+
+    def getROIs(self, labels: list[int] | None = None) -> SisypheROICollection:
+        """
+        Split labels into SisypheROI instances. Each ROI is filled from the grouped voxel indices of its label, without
+        full volume comparison. ROIs are in compact storage mode (bounding box and bit-packed mask), dense images are
+        not allocated.
+
+        Parameters
+        ----------
+        labels : list[int] | None
+            label values to convert (default None, all labels)
+
+        Returns
+        -------
+        SisypheROICollection
+            ROI collection, one ROI for each label
+        """
+        if self.isEmpty(): raise AttributeError('No label.')
+        rois = SisypheROICollection()
+        starts = self._getStarts()
+        # noinspection PyUnresolvedReferences
+        i: cython.int
+        for i in range(len(self._counts)):
+            lbl = int(self._labels[i])
+            if labels is None or lbl in labels:
+                roi = SisypheROI()
+                roi.fromFlatIndexes(self._voxels[starts[i]:starts[i] + self._counts[i]],
+                                    size=self._shape[::-1],
+                                    spacing=self._spacing,
+                                    origin=self._origin,
+                                    directions=self._directions)
+                roi.setName(self._names[i])
+                if self._colors is not None: roi.setColor(rgb=list(self._colors[i]))
+                roi.setReferenceID(self._refID)
+                rois.append(roi)
+        return rois
@@ -13,6 +13,8 @@ from os.path import basename
 from os.path import dirname
 from os.path import splitext
 
+from tempfile import TemporaryFile
+
 from xml.dom import minidom
 
 from math import log
@@ -50,6 +52,12 @@ from numpy import count_nonzero
 from numpy import argmax
 from numpy import bincount
 from numpy import unravel_index
+from numpy import flatnonzero
+from numpy import empty
+from numpy import newaxis
+from numpy import sqrt as npsqrt
+from numpy import cumsum
+from numpy import memmap
 from numpy.linalg import matrix_rank
 from numpy.linalg import inv
 from numpy.linalg import pinv
@@ -65,10 +73,12 @@ from SimpleITK import RelabelComponentImageFilter
 from SimpleITK import LabelStatisticsImageFilter
 from SimpleITK import GetArrayViewFromImage
 from SimpleITK import Cast
+from SimpleITK import Image as sitkImage
+from SimpleITK import sitkFloat64
+from SimpleITK import sitkVectorFloat64
 
 from Sisyphe.core.sisypheVolume import SisypheVolume
 from Sisyphe.core.sisypheVolume import SisypheVolumeCollection
-from Sisyphe.core.sisypheVolume import multiComponentSisypheVolumeFromList
 from Sisyphe.core.sisypheConstants import addSuffixToFilename
 from Sisyphe.core.sisypheROI import SisypheROI
 from Sisyphe.gui.dialogWait import DialogWait
@@ -1221,13 +1231,13 @@ Maps functions
     - conjunctionMudholkar(list of SisypheVolume) -> SisypheVolume
     - conjunctionTippett(list of SisypheVolume) -> SisypheVolume
     - autocorrelationsEstimate(ndarray, ndarray, SisypheVolume) -> tuple[float, float, float]
-    - modelEstimate(list of SisypheVolume, SisypheVolume, ndarray) tuple[ndarray, ndarray, ndarray, ndarray]
+    - modelEstimate(list of SisypheVolume, SisypheVolume, ndarray, ndarray, bool, int) tuple[ndarray, ndarray, ndarray, ndarray]
     - tmapContrastEstimate(ndarray, ndarray, SisypheVolume, SisypheVolume, float, DialogWait | none) -> SisypheVolume
     - zmapContrastEstimate(ndarray, ndarray, SisypheVolume, SisypheVolume, float, DialogWait | None) -> SisypheVolume
     - thresholdMap(SisypheVolume, float, int) -> dict
 
 Creation: 29/11/2022
-Last revision: 06/12/2024
+Last revision: 16/10/2026
 """
 
 
@@ -1769,10 +1779,15 @@ def conjunctionTippett(maps: list[SisypheVolume] | SisypheVolumeCollection) -> S
 def autocorrelationsEstimate(error: ndarray,
                              design: ndarray,
                              mask: SisypheROI | SisypheVolume,
-                             wait: DialogWait | None = None) -> tuple[float, float, float]:
+                             wait: DialogWait | None = None,
+                             memory: int = 268435456) -> tuple[float, float, float]:
     """
     Estimating autocorrelations of residuals.
 
+    Finite differences of normalized residuals are computed with shifted array operations under the combined neighbour
+    mask, by chunks of slices streamed along the slowest axis of the flattened residuals (bounded memory). Per voxel
+    sums are accumulated in the same order as a voxel by voxel loop, results are identical.
+
     Reference:
     Robust smoothness estimation in statistical parametric maps using standardized residuals from the general
     linear model. SJ Kiebel, JB Poline, KJ Friston, AP Holmes, KJ Worsley. Neuroimage 1999 Dec;10(6):756-66.
@@ -1788,6 +1803,8 @@ def autocorrelationsEstimate(error: ndarray,
         statistical analysis mask
     wait : Sisyphe.gui.dialogWait.DialogWait
         progress bar
+    memory : int
+        memory budget in bytes of a chunk of slices (default 256 MB)
 
     Returns
     -------
@@ -1810,8 +1827,12 @@ def autocorrelationsEstimate(error: ndarray,
     """
     slc = sy * sz
     # Revision 06/06/2025 >
-    npmask = mask.getNumpy(defaultshape=False).flatten()
+    npmask = mask.getNumpy(defaultshape=False).flatten() > 0
     nb = len(npmask)
+    # < Revision 16/10/2026
+    # vectorised estimation, shifted array operations by chunks of slices
+    # chunk memory: residuals, 3 finite differences and temporary copies (8 x n float64 by voxel)
+    step = max(1, memory // (64 * error.shape[1] * slc)) * slc
     if wait is not None:
         wait.setInformationText('Estimation of spatial autocorrelations...')
         wait.setProgressRange(0, nb)
@@ -1819,47 +1840,21 @@ def autocorrelationsEstimate(error: ndarray,
     nbv = 0
     # noinspection PyUnresolvedReferences
     i: cython.int
-    # noinspection PyUnresolvedReferences
-    c: cython.int = 0
-    for i in range(slc, nb):
-        if wait is not None:
-            c += 1
-            if c == 100:
-                wait.setCurrentProgressValue(i + 1)
-                c = 0
-        # < Revision 06/06/2025
-        # bug fix, indexing of flattened numpy array
-        # error and npmask shape order (x, y, z)
-        # numpy is in c-order, last-index varies the fastest
-        # after flatten conversion :
-        # flatten array index - 1 -> non flatten array z - 1
-        # flatten array index - sizez -> non flatten array y - 1
-        # flatten array index - (sizey * sizez) -> non flatten array x - 1
-        """
-        if npmask[i] > 0 and npmask[i - 1] > 0 and npmask[i - sx] > 0 and npmask[i - slc] > 0:
-            verrorx = error[i, :] - error[i - 1, :]
-            verrory = error[i, :] - error[i - sx, :]
-            verrorz = error[i, :] - error[i - slc, :]
-            verrorx = (verrorx / vx) ** 2
-            verrory = (verrory / vy) ** 2
-            verrorz = (verrorz / vz) ** 2
-            buffx += verrorx.sum()
-            buffy += verrory.sum()
-            buffz += verrorz.sum()
-            nbv += 1
-        """
-        if npmask[i] > 0 and npmask[i - 1] > 0 and npmask[i - sz] > 0 and npmask[i - slc] > 0:
-            verrorz = error[i, :] - error[i - 1, :]
-            verrory = error[i, :] - error[i - sz, :]
-            verrorx = error[i, :] - error[i - slc, :]
-            verrorx = (verrorx / vx) ** 2
-            verrory = (verrory / vy) ** 2
-            verrorz = (verrorz / vz) ** 2
-            buffx += verrorx.sum()
-            buffy += verrory.sum()
-            buffz += verrorz.sum()
-            nbv += 1
-        # Revision 06/06/2025 >
+    for i in range(slc, nb, step):
+        j = min(i + step, nb)
+        # combined neighbour mask: current voxel, z - 1, y - 1 and x - 1 neighbours in mask
+        m = npmask[i:j] & npmask[i - 1:j - 1] & npmask[i - sz:j - sz] & npmask[i - slc:j - slc]
+        nbv += int(count_nonzero(m))
+        verror = error[i:j][m]
+        verrorz = (verror - error[i - 1:j - 1][m]) / vz
+        verrory = (verror - error[i - sz:j - sz][m]) / vy
+        verrorx = (verror - error[i - slc:j - slc][m]) / vx
+        # voxel sums accumulated sequentially with cumsum, same summation order as voxel by voxel loop
+        buffx = float(cumsum(append(buffx, (verrorx ** 2).sum(axis=1)))[-1])
+        buffy = float(cumsum(append(buffy, (verrory ** 2).sum(axis=1)))[-1])
+        buffz = float(cumsum(append(buffz, (verrorz ** 2).sum(axis=1)))[-1])
+        if wait is not None: wait.setCurrentProgressValue(j)
+    # Revision 16/10/2026 >
     df = getDOF(design)
     f1 = (df - 2) / ((df - 1) * nbv)
     f2 = 4.0 * log(2.0)
@@ -1873,7 +1868,9 @@ def modelEstimate(obs: list[SisypheVolume],
                   design: ndarray,
                   mask: SisypheROI | SisypheVolume,
                   scale: ndarray | None = None,
-                  wait: DialogWait | None = None) -> tuple[SisypheVolume, SisypheVolume, SisypheVolume, ndarray]:
+                  residuals: bool = True,
+                  memory: int = 268435456,
+                  wait: DialogWait | None = None) -> tuple[SisypheVolume, SisypheVolume, SisypheVolume | None, ndarray]:
     """
     Model estimation.
 
@@ -1882,6 +1879,15 @@ def modelEstimate(obs: list[SisypheVolume],
     residuals i.e. model errors = Y - X beta
     pooled variance = variance(residuals)
 
+    Observations are compressed to in-mask voxels and processed by blocks of voxels, each block is solved with a few
+    matrix products (one BLAS call for thousands of voxels). Block results are written directly into the beta,
+    variance and residuals volumes.
+
+    The memory budget parameter covers the temporary arrays of a block (observations, fitted values, residuals, beta)
+    and the normalized residuals used to estimate autocorrelations (voxels x observations). Normalized residuals
+    are written to a temporary memory-mapped file if they exceed the budget. The budget does not cover the returned
+    volumes and the observations compressed to in-mask voxels (in-mask voxels x observations).
+
     Reference:
     Statistical parametric maps in functional imaging: A general linear approach. KJ Friston, AP Holmes, KJ Worsley,
     JP Poline, CD Frith, RSJ Frackowiak. Human Brain Mapping 1995;2(4):189-210.
@@ -1900,12 +1906,16 @@ def modelEstimate(obs: list[SisypheVolume],
         design matrix X
     scale : numpy.ndarray
         signal normalization values
+    residuals : bool
+        returns residuals volume if True (default), None otherwise
+    memory : int
+        memory budget in bytes of the estimation temporaries (default 256 MB)
     wait : Sisyphe.gui.dialogWait.DialogWait
         progress bar
 
     Returns
     -------
-    tuple[sisyphe.core.sisypheVolume.SisypheVolume,sisyphe.core.sisypheVolume.SisypheVolume, sisyphe.core.sisypheVolume.SisypheVolume, ndarray]
+    tuple[sisyphe.core.sisypheVolume.SisypheVolume,sisyphe.core.sisypheVolume.SisypheVolume, sisyphe.core.sisypheVolume.SisypheVolume | None, ndarray]
         beta, pooled variance, residuals, autocorrelations
     """
     n = len(obs)
@@ -1913,22 +1923,29 @@ def modelEstimate(obs: list[SisypheVolume],
         """
         ndarray conversion
         
-        npobs, ndarray, matrix of observations, shape=(l, c)
-            - l, lines, number of observations (number of volumes)
-            - c, columns, number of voxels in observation volume (i.e. vector images)
+        npobs, ndarray, matrix of observations compressed to in-mask voxels, shape=(l, c)
+            - l, lines, number of in-mask voxels
+            - c, columns, number of observations (number of volumes)
         npmask, ndarray, analysis mask, shape(l, 1)
         """
-        # < Revision 06/12/2024
-        # lobs = list()
-        # for o in obs:
-        #    lobs.append(o.getNumpy().flatten())
-        # npobs = stack(lobs)
-        vobs = multiComponentSisypheVolumeFromList(obs)
-        # npobs = vobs.getNumpy()
-        # npmask = mask.getNumpy().flatten()
-        npobs = vobs.getNumpy(defaultshape=False)
+        # < Revision 16/10/2026
+        # compression to in-mask voxels, avoids multicomponent volume copy of all observations
+        # vobs = multiComponentSisypheVolumeFromList(obs)
+        # npobs = vobs.getNumpy(defaultshape=False)
         npmask = mask.getNumpy(defaultshape=False).flatten()
-        # Revision 06/12/2024 >
+        nb = len(npmask)
+        # in-mask voxel indices, flattened (x, y, z) order
+        idx = flatnonzero(npmask > 0)
+        nm = len(idx)
+        ix, iy, iz = unravel_index(idx, mask.getNumpy(defaultshape=False).shape)
+        npobs = empty([nm, n])
+        # noinspection PyUnresolvedReferences
+        j: cython.int
+        for j in range(n):
+            npobs[:, j] = obs[j].getNumpy(defaultshape=False)[ix, iy, iz]
+        # Proportional scaling if scale is not None
+        if scale is not None: npobs *= scale
+        # Revision 16/10/2026 >
         """
         ndarray results
         
@@ -1939,83 +1956,127 @@ def modelEstimate(obs: list[SisypheVolume],
             - l, lines = number of voxels in observation volume
             - c, columns = factors
         """
-        nb = len(npmask)
-        npobs = npobs.reshape((nb, n))
-        beta = zeros([nb, design.shape[1]])
+        # < Revision 16/10/2026
+        # beta = zeros([nb, design.shape[1]])
         # < Revision 03/12/2024
         # error = zeros([nb, design.shape[1]])
         # nerror = zeros([nb, design.shape[1]])
-        error = zeros([nb, n])
-        nerror = zeros([nb, n])
+        # if residuals: error = zeros([nb, n])
+        # else: error = None
+        # nerror = zeros([nb, n])
         # Revision 03/12/2024 >
-        variance = zeros([nb, ])
+        # variance = zeros([nb, ])
+        # block results are written in numpy views (x, y, z) of the output volumes, no intermediate dense array
+        size = obs[0].getSize()
+        spacing = obs[0].getSpacing()
+        img = sitkImage(size, sitkVectorFloat64, design.shape[1])
+        img.SetSpacing(spacing)
+        vbeta = SisypheVolume()
+        vbeta.setSITKImage(img)
+        beta = vbeta.getNumpy(defaultshape=False)
+        # single component, numpy view without component axis
+        if beta.ndim == 3: beta = beta[:, :, :, newaxis]
+        img = sitkImage(size, sitkFloat64)
+        img.SetSpacing(spacing)
+        vvariance = SisypheVolume()
+        vvariance.setSITKImage(img)
+        variance = vvariance.getNumpy(defaultshape=False)
+        if residuals:
+            img = sitkImage(size, sitkVectorFloat64, n)
+            img.SetSpacing(spacing)
+            verror = SisypheVolume()
+            verror.setSITKImage(img)
+            error = verror.getNumpy(defaultshape=False)
+            if error.ndim == 3: error = error[:, :, :, newaxis]
+        else:
+            verror = None
+            error = None
+        del img
+        # normalized residuals, flattened (x, y, z) order, memory-mapped temporary file if larger than memory budget
+        if 8 * nb * n > memory:
+            tmp = TemporaryFile()
+            nerror = memmap(tmp, dtype='float64', mode='w+', shape=(nb, n))
+        else:
+            tmp = None
+            nerror = zeros([nb, n])
         idesign = pinv(design)
+        # block-batched estimation, block of in-mask voxels processed by matrix products
+        # block memory: observations, fitted values, residuals (n columns) and beta (design.shape[1] columns)
+        block = max(1, memory // (8 * (3 * n + design.shape[1])))
         # noinspection PyUnresolvedReferences
         i: cython.int
-        # noinspection PyUnresolvedReferences
-        c: cython.int = 0
         # Main loop
         if wait is not None:
             wait.setInformationText('Model estimation...')
-            wait.setProgressRange(0, nb)
+            wait.setProgressRange(0, nm)
             wait.progressVisibilityOn()
-        for i in range(nb):
-            if wait is not None:
-                c += 1
-                if c == 100:
-                    wait.setCurrentProgressValue(i + 1)
-                    c = 0
-            if npmask[i] > 0:
-                # Proportional scaling if scale is not None
-                # Y vector (vobs) of observations at current voxel i
-                if scale is not None: vobs = npobs[i, :] * scale
-                else: vobs = npobs[i, :]
-                # beta = pinv(X) Y
-                vbeta = idesign @ vobs
-                beta[i, :] = vbeta
-                # Y' = X beta
-                vobsm = design @ vbeta
-                # errors, residuals E = Y - Y'
-                res = vobs - vobsm
-                error[i, :] = res
-                # Variance = sum of squared errors
-                res2 = res ** 2
-                variance[i] = res2.sum()
-                # Normalized error E / std (i.e. sqrt(Variance))
-                nerror[i, :] = res / sqrt(variance[i])
-        autocorr = array(autocorrelationsEstimate(nerror, design, mask, wait))
+        for i in range(0, nm, block):
+            # Y matrix (vobs) of observations, shape (block voxels, observations)
+            vobs = npobs[i:i + block]
+            vidx = idx[i:i + block]
+            # beta = pinv(X) Y
+            bbeta = vobs @ idesign.T
+            beta[ix[i:i + block], iy[i:i + block], iz[i:i + block]] = bbeta
+            # errors, residuals E = Y - Y', Y' = X beta
+            res = vobs - bbeta @ design.T
+            if residuals: error[ix[i:i + block], iy[i:i + block], iz[i:i + block]] = res
+            # Variance = sum of squared errors
+            bvariance = (res ** 2).sum(axis=1)
+            variance[ix[i:i + block], iy[i:i + block], iz[i:i + block]] = bvariance
+            # Normalized error E / std (i.e. sqrt(Variance))
+            nerror[vidx] = res / npsqrt(bvariance)[:, newaxis]
+            if wait is not None: wait.setCurrentProgressValue(min(i + block, nm))
+        del npobs
+        # array IDs of the output volumes, computed from estimated values
+        vbeta.updateArrayID()
+        vvariance.updateArrayID()
+        if residuals: verror.updateArrayID()
+        # Revision 16/10/2026 >
+        autocorr = array(autocorrelationsEstimate(nerror, design, mask, memory=memory, wait=wait))
+        # < Revision 16/10/2026
+        # release normalized residuals, temporary file is deleted when closed
+        del nerror
+        if tmp is not None: tmp.close()
+        # Revision 16/10/2026 >
         # < Revision 06/12/2024
         # SisypheVolume conversion
         dof = int(getDOF(design))
-        size = obs[0].getSize()
-        spacing = obs[0].getSpacing()
+        # < Revision 16/10/2026
+        # size = obs[0].getSize()
+        # spacing = obs[0].getSpacing()
         # beta volume
-        beta = beta.reshape((size[0], size[1], size[2], design.shape[1]))
-        vbeta = SisypheVolume()
-        vbeta.copyFromNumpyArray(beta, spacing=spacing, defaultshape=False)
+        # beta = beta.reshape((size[0], size[1], size[2], design.shape[1]))
+        # vbeta = SisypheVolume()
+        # vbeta.copyFromNumpyArray(beta, spacing=spacing, defaultshape=False)
+        # Revision 16/10/2026 >
         vbeta.copyAttributesFrom(obs[0], display=False)
         vbeta.acquisition.setDegreesOfFreedom(dof)
         vbeta.acquisition.setAutoCorrelations(autocorr)
         vbeta.acquisition.setModalityToOT()
         vbeta.acquisition.setSequence('Beta')
         # variance volume
-        variance = variance.reshape((size[0], size[1], size[2]))
-        vvariance = SisypheVolume()
-        vvariance.copyFromNumpyArray(variance, spacing=spacing, defaultshape=False)
+        # < Revision 16/10/2026
+        # variance = variance.reshape((size[0], size[1], size[2]))
+        # vvariance = SisypheVolume()
+        # vvariance.copyFromNumpyArray(variance, spacing=spacing, defaultshape=False)
+        # Revision 16/10/2026 >
         vvariance.copyAttributesFrom(obs[0], display=False)
         vvariance.acquisition.setDegreesOfFreedom(dof)
         vvariance.acquisition.setAutoCorrelations(autocorr)
         vvariance.acquisition.setModalityToOT()
         vvariance.acquisition.setSequence('Pooled variance')
         # error volume
-        error = error.reshape((size[0], size[1], size[2], n))
-        verror = SisypheVolume()
-        verror.copyFromNumpyArray(error, spacing=spacing, defaultshape=False)
-        verror.copyAttributesFrom(obs[0], display=False)
-        verror.acquisition.setDegreesOfFreedom(dof)
-        verror.acquisition.setAutoCorrelations(autocorr)
-        verror.acquisition.setModalityToOT()
-        verror.acquisition.setSequence('Residuals')
+        if residuals:
+            # < Revision 16/10/2026
+            # error = error.reshape((size[0], size[1], size[2], n))
+            # verror = SisypheVolume()
+            # verror.copyFromNumpyArray(error, spacing=spacing, defaultshape=False)
+            # Revision 16/10/2026 >
+            verror.copyAttributesFrom(obs[0], display=False)
+            verror.acquisition.setDegreesOfFreedom(dof)
+            verror.acquisition.setAutoCorrelations(autocorr)
+            verror.acquisition.setModalityToOT()
+            verror.acquisition.setSequence('Residuals')
         # Revision 06/12/2024 >
         if wait is not None: wait.progressVisibilityOff()
         return vbeta, vvariance, verror, autocorr
@@ -4156,11 +4217,15 @@ class SisypheDesign(object):
                         scale = None
                 else: scale = None
                 # Model estimation
+                # < Revision 16/10/2026
+                # residuals volume is not used
                 self._beta, self._variance, error, self._autocorr = modelEstimate(obs=obs,
                                                                                   design=self._design,
                                                                                   mask=mask,
                                                                                   scale=scale,
+                                                                                  residuals=False,
                                                                                   wait=wait)
+                # Revision 16/10/2026 >
                 # < Revision 22/11/2024
                 # set observations multicomponent volume,
                 # scaled if proportional scaling signal normalization
@@ -33,8 +33,14 @@ from math import sqrt
 from math import cos
 from math import radians
 
+from multiprocessing import Pool
+from multiprocessing import resource_tracker
 # noinspection PyProtectedMember
 from multiprocessing.managers import DictProxy
+from multiprocessing.shared_memory import SharedMemory
+
+from sys import platform
+from sys import version_info
 
 from xml.dom import minidom
 
@@ -78,14 +84,12 @@ from dipy.tracking.distances import bundles_distances_mdf
 from dipy.tracking.streamlinespeed import compress_streamlines
 from dipy.tracking.streamlinespeed import set_number_of_points
 from dipy.tracking.streamline import values_from_volume
-from dipy.tracking.streamline import unlist_streamlines
 from dipy.tracking.streamline import relist_streamlines
 from dipy.tracking.streamline import transform_streamlines
 from dipy.tracking.streamline import Streamlines
 from dipy.tracking.utils import density_map
 from dipy.tracking.utils import path_length
 from dipy.tracking.utils import connectivity_matrix
-from dipy.tracking.utils import streamline_near_roi
 from dipy.segment.bundles import qbx_and_merge
 from dipy.segment.bundles import cluster_bundle
 from dipy.segment.bundles import RecoBundles
@@ -136,7 +140,6 @@ from numpy import finfo
 from numpy import any
 from numpy import abs
 from numpy import sign
-from numpy import dot
 from numpy import sqrt
 from numpy import eye
 from numpy import ones
@@ -150,7 +153,37 @@ from numpy import frombuffer
 from numpy import median
 from numpy import histogram
 from numpy import percentile
+from numpy import arange
+from numpy import zeros
+from numpy import empty
+from numpy import where
+from numpy import rint
+from numpy import clip
+from numpy import repeat
+from numpy import cumsum
+from numpy import concatenate
+from numpy import diff
+from numpy import isin
+from numpy import searchsorted
+from numpy import argsort
+from numpy import unique
+from numpy import bincount
+from numpy import floor
+from numpy import ceil
+from numpy import mgrid
+from numpy import logical_or
+from numpy import savez
+from numpy import load as npload
+from numpy import union1d
+from numpy import intersect1d
+from numpy import setdiff1d
+from numpy import setxor1d
+from numpy import split
+from numpy import cross
+from numpy import memmap
+from numpy import dtype as npdtype
 from numpy.linalg import norm
+from numpy.linalg import inv
 
 from pandas import DataFrame
 
@@ -158,6 +191,8 @@ from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QApplication
 
 from scipy.stats import describe
+from scipy.spatial import cKDTree
+from scipy.ndimage import binary_dilation
 
 from vtk import vtkRenderer
 from vtk import vtkFloatArray
@@ -167,6 +202,11 @@ from vtk import vtkPolyLineSource
 from vtk import vtkLookupTable
 from vtk import vtkPolyData
 from vtk import vtkPolyDataMapper
+from vtk import vtkCellArray
+from vtk import vtkDataArray
+from vtk import vtkDataSetAttributes
+from vtkmodules.util.numpy_support import numpy_to_vtk
+from vtkmodules.util.numpy_support import numpy_to_vtkIdTypeArray
 from vtkmodules.util.numpy_support import vtk_to_numpy
 from vtkmodules.numpy_interface.dataset_adapter import numpyTovtkDataArray
 
@@ -190,10 +230,13 @@ if TYPE_CHECKING:
 
 
 __all__ = ['SisypheTract',
+           'SisypheBundleTract',
            'SisypheTractCollection',
            'SisypheBundle',
            'SisypheBundleCollection',
+           'SisypheStreamlinesIndex',
            'SisypheStreamlines',
+           'SisypheStreamlinesWriter',
            'SisypheDiffusionModel',
            'SisypheDTIModel',
            'SisypheDKIModel',
@@ -208,10 +251,13 @@ Class hierarchy
 ~~~~~~~~~~~~~~~
 
     - object -> SisypheTract
+             -> SisypheTract -> SisypheBundleTract
              -> SisypheTractCollection
              -> SisypheBundle
              -> SisypheBundleCollection
+             -> SisypheStreamlinesIndex
              -> SisypheStreamlines
+             -> SisypheStreamlinesWriter
              -> SisypheDiffusionModel
              -> SisypheDiffusionModel -> SisypheDTIModel
              -> SisypheDiffusionModel -> SisypheDKIModel
@@ -955,6 +1001,478 @@ class SisypheTract(object):
         self._actor.GetProperty().SetLineWidth(v)
 
 
+class SisypheBundleTract(SisypheTract):
+    """
+    Description
+    ~~~~~~~~~~~
+
+    Class to manage the display of a whole bundle of streamlines with a single vtkPolyData/vtkActor.
+
+    All the streamlines of the bundle are merged in a single polyline vtkPolyData (one cell per streamline), built in
+    a single vectorised pass from the streamline points. Display attributes (color representation, color, look-up
+    table colormap, line width, visibility, opacity) are inherited from SisypheTract and apply to the whole bundle.
+
+    This class also manages:
+
+        - Per-streamline visibility mask (cells hidden without rebuilding the polydata), used to preview selections
+        - Level of detail, subsampled polydata (one streamline out of n) displayed during interaction
+
+    Inheritance
+    ~~~~~~~~~~~
+
+    object -> SisypheTract -> SisypheBundleTract
+
+    Creation: 16/10/2026
+    """
+
+    __slots__ = ['_offsets', '_lengths', '_mask', '_lodpolydata', '_lodstep', '_lod']
+
+    # Special method
+
+    """
+    Private attributes
+
+    _offsets        ndarray, index of the first point of each streamline
+    _lengths        ndarray, number of points of each streamline
+    _mask           ndarray | None, bool streamline visibility mask
+    _lodpolydata    vtkPolyData | None, level of detail polydata
+    _lodstep        int, level of detail subsampling step
+    _lod            bool, level of detail polydata displayed
+    """
+
+    def __init__(self) -> None:
+        """
+        SisypheBundleTract instance constructor.
+        """
+        super().__init__()
+        self._actor.SetObjectName('streamline')
+        self._offsets: ndarray | None = None
+        self._lengths: ndarray | None = None
+        self._mask: ndarray | None = None
+        self._lodpolydata: vtkPolyData | None = None
+        self._lodstep: int = 10
+        self._lod: bool = False
+
+    def __str__(self) -> str:
+        """
+        Special overloaded method called by the built-in str() python function.
+
+        Returns
+        -------
+        str
+            conversion of SisypheBundleTract instance to str
+         """
+        buff = 'Streamlines count: {}\n'.format(self.count())
+        return buff + super().__str__()
+
+    def __repr__(self) -> str:
+        """
+        Special overloaded method called by the built-in repr() python function.
+
+        Returns
+        -------
+        str
+            SisypheBundleTract instance representation
+        """
+        return 'SisypheBundleTract instance at <{}>\n'.format(str(id(self))) + self.__str__()
+
+    # Private methods
+
+    @staticmethod
+    def _cellArray(offsets: ndarray, lengths: ndarray) -> vtkCellArray:
+        # vtkCellArray offsets/connectivity arrays, connectivity is the point index range of each cell
+        n = int(lengths.sum())
+        cellofs = zeros(len(lengths) + 1, dtype='int64')
+        cumsum(lengths, out=cellofs[1:])
+        conn = repeat(offsets.astype('int64') - cellofs[:-1], lengths) + arange(n, dtype='int64')
+        cells = vtkCellArray()
+        # noinspection PyArgumentList
+        cells.SetData(numpy_to_vtkIdTypeArray(cellofs, deep=True), numpy_to_vtkIdTypeArray(conn, deep=True))
+        return cells
+
+    @staticmethod
+    def _ghostArray(mask: ndarray) -> vtkDataArray:
+        # hidden cells (streamlines) are flagged in the vtk ghost array, skipped by the mapper
+        ghost = where(mask, 0, vtkDataSetAttributes.HIDDENCELL).astype('uint8')
+        ghost = numpy_to_vtk(ghost, deep=True)
+        ghost.SetName(vtkDataSetAttributes.GhostArrayName())
+        return ghost
+
+    def _updateLOD(self) -> None:
+        # the level of detail polydata shares points and point data with the full polydata
+        if self._lodpolydata is None:
+            idx = arange(0, len(self._lengths), self._lodstep)
+            self._lodpolydata = vtkPolyData()
+            self._lodpolydata.SetLines(self._cellArray(self._offsets[idx], self._lengths[idx]))
+            if self._mask is not None:
+                self._lodpolydata.GetCellData().AddArray(self._ghostArray(self._mask[idx]))
+        self._lodpolydata.SetPoints(self._polydata.GetPoints())
+        self._lodpolydata.GetPointData().ShallowCopy(self._polydata.GetPointData())
+
+    def _rebuild(self, sl: list[ndarray], mask: ndarray | None, volume: ndarray | None) -> None:
+        # polydata rebuilt from streamlines, display attributes, visibility mask and volume scalars are restored
+        r = self.getColorRepresentation()
+        self.setStreamlines(sl)
+        if self._polydata is not None:
+            if volume is not None:
+                scalars = numpy_to_vtk(volume, deep=True)
+                scalars.SetName('volume')
+                self._polydata.GetPointData().AddArray(scalars)
+                self._scalarnames['volume'] = r == self._CMAP
+                self._scalarnames['RGB'] = r != self._CMAP
+            if mask is not None: self.setTractVisibilityMask(mask)
+            self.setColorRepresentation(r)
+
+    # Public methods
+
+    def deepCopy(self) -> SisypheBundleTract:
+        """
+        Deep copy of the current SisypheBundleTract instance.
+
+        Returns
+        -------
+            SisypheBundleTract
+                deep copy of bundle
+        """
+        r = SisypheBundleTract()
+        if self._polydata is not None:
+            r._polydata = vtkPolyData()
+            r._polydata.DeepCopy(self._polydata)
+            r._offsets = self._offsets.copy()
+            r._lengths = self._lengths.copy()
+            if self._mask is not None: r._mask = self._mask.copy()
+            r._lodstep = self._lodstep
+            r._updatePolydata()
+            r._scalarnames = dict(self._scalarnames)
+            if self._lut is not None:
+                r._lut = self._lut.copy()
+                r._mapper.SetLookupTable(r._lut.getvtkLookupTable())
+            r.setColorRepresentation(self.getColorRepresentation())
+            r.setFloatColor(self.getFloatColor(), update=False)
+            r.setOpacity(self.getOpacity())
+            r.setLineWidth(self.getLineWidth())
+            r.setVisibility(self.getVisibility())
+        return r
+
+    def clear(self) -> None:
+        """
+        Clear the current SisypheBundleTract instance.
+        """
+        super().clear()
+        self._offsets = None
+        self._lengths = None
+        self._mask = None
+        self._lodpolydata = None
+        self._lod = False
+
+    def count(self) -> int:
+        """
+        Get the number of streamlines in the current SisypheBundleTract instance.
+
+        Returns
+        -------
+        int
+            number of streamlines
+        """
+        if self._lengths is None: return 0
+        else: return len(self._lengths)
+
+    def setPoints(self, sl: ndarray, reg: bool = True) -> None:
+        """
+        Set the points of a single streamline in the current SisypheBundleTract instance.
+
+        Parameters
+        ----------
+        sl : ndarray
+            streamline of n points, shape(n, 3)
+        reg : bool
+            unused, kept for SisypheTract compatibility
+        """
+        self.setStreamlines([sl])
+
+    def setStreamlines(self, sl: Streamlines | list[ndarray]) -> None:
+        """
+        Set the streamlines of the current SisypheBundleTract instance. All the streamlines are merged in a single
+        polyline vtkPolyData, one cell for each streamline. RGB colors are processed in a single vectorised pass (unit
+        vector directed to next point, x-axis component in red, y-axis component in green and z-axis component in
+        blue).
+
+        Parameters
+        ----------
+        sl : dipy.tracking.Streamlines | list[ndarray]
+            streamlines, ndarray shape(n, 3) for a streamline of n points
+        """
+        if len(sl) > 0:
+            # single pass copy of points in a contiguous array
+            if isinstance(sl, Streamlines):
+                points = asarray(sl.get_data(), dtype='float32')
+                # noinspection PyProtectedMember
+                lengths = asarray(sl._lengths, dtype='int64')
+            else:
+                points = asarray(concatenate(sl, axis=0), dtype='float32')
+                lengths = array([len(s) for s in sl], dtype='int64')
+            offsets = zeros(len(lengths), dtype='int64')
+            cumsum(lengths[:-1], out=offsets[1:])
+            # RGB scalars, vector directed to next point
+            s = empty(points.shape, dtype='float32')
+            s[:-1] = abs(points[1:] - points[:-1])
+            # last point of each streamline, vector from previous point
+            last = offsets + lengths - 1
+            single = lengths == 1
+            prev = where(single, last, last - 1)
+            s[last] = s[prev]
+            s[last[single]] = (1.0, 0.0, 0.0)
+            n = norm(s, axis=1)
+            n[n == 0.0] = 1.0
+            s /= n[:, None]
+            # direct scalars as unsigned char, 4x smaller than float and native mapper color format
+            s = rint(s * 255.0).astype('uint8')
+            vpoints = vtkPoints()
+            vpoints.SetData(numpy_to_vtk(points, deep=True))
+            self._polydata = vtkPolyData()
+            self._polydata.SetPoints(vpoints)
+            self._polydata.SetLines(self._cellArray(offsets, lengths))
+            scalars = numpy_to_vtk(s, deep=True)
+            scalars.SetName('RGB')
+            self._scalarnames = {'RGB': True, 'volume': False}
+            self._polydata.GetPointData().SetScalars(scalars)
+            self._polydata.GetPointData().SetActiveScalars('RGB')
+            self._offsets = offsets
+            self._lengths = lengths
+            self._mask = None
+            self._lodpolydata = None
+            self._lod = False
+            self._mapper.SetScalarModeToUsePointData()
+            self._mapper.SetColorModeToDirectScalars()
+            self._updatePolydata()
+        else: self.clear()
+
+    def setScalarsFromVolume(self, vol: SisypheVolume) -> None:
+        """
+        Set scalar values associated to each point of the current SisypheBundleTract instance from a
+        Sisyphe.core.sisypheVolume.SisypheVolume instance. The value associated with a point is the scalar value of
+        the SisypheVolume voxel at the coordinates of that point (nearest voxel, vectorised for all the points of the
+        bundle).
+
+        Parameters
+        ----------
+        vol : Sisyphe.core.sisypheVolume.SisypheVolume
+            reference volume
+        """
+        if self._polydata is not None:
+            # Remove previous scalars
+            if self._polydata.GetPointData().HasArray('volume'):
+                self._polydata.GetPointData().RemoveArray('volume')
+            # World to voxel coordinates, p = origin + D.diag(spacing).idx
+            p = vtk_to_numpy(self._polydata.GetPoints().GetData()).astype('float64')
+            m = array(vol.getDirections()).reshape(3, 3) @ diag(vol.getSpacing())
+            idx = rint((p - array(vol.getOrigin())) @ inv(m).T).astype('int64')
+            size = vol.getSize()
+            for i in range(3):
+                clip(idx[:, i], 0, size[i] - 1, out=idx[:, i])
+            # numpy array shape (z, y, x)
+            v = vol.getNumpy()[idx[:, 2], idx[:, 1], idx[:, 0]]
+            scalars = numpy_to_vtk(v.astype('float32'), deep=True)
+            scalars.SetName('volume')
+            for name in self._scalarnames:
+                self._scalarnames[name] = name == 'volume'
+            self._polydata.GetPointData().AddArray(scalars)
+            self._polydata.GetPointData().SetActiveScalars('volume')
+            self.setLut(vol.display.getLUT())
+            self._updatePolydata()
+
+    def setTractVisibilityMask(self, mask: ndarray | list[int] | None = None) -> None:
+        """
+        Set the visibility of each streamline of the current SisypheBundleTract instance. Hidden streamlines are
+        flagged in the vtk ghost cell array, the polydata is not rebuilt.
+
+        Parameters
+        ----------
+        mask : ndarray | list[int] | None
+            - bool ndarray, mask with one element for each streamline (True visible)
+            - int ndarray or list[int], indices of visible streamlines (i.e. SisypheBundle.getList())
+            - None, all streamlines are visible
+        """
+        if self._polydata is not None:
+            celldata = self._polydata.GetCellData()
+            name = vtkDataSetAttributes.GhostArrayName()
+            if celldata.HasArray(name): celldata.RemoveArray(name)
+            if mask is None: self._mask = None
+            else:
+                mask = asarray(mask)
+                if mask.dtype != 'bool':
+                    m = zeros(self.count(), dtype='bool')
+                    m[mask.astype('int64')] = True
+                    mask = m
+                if len(mask) == self.count():
+                    self._mask = mask
+                    celldata.AddArray(self._ghostArray(mask))
+                else: raise ValueError('mask size {} is not equal to streamlines count {}.'.format(len(mask),
+                                                                                                 self.count()))
+            self._polydata.Modified()
+            self._lodpolydata = None
+            if self._lod: self.levelOfDetailOn()
+            else: self._updatePolydata()
+
+    def getTractVisibilityMask(self) -> ndarray | None:
+        """
+        Get the visibility of each streamline of the current SisypheBundleTract instance.
+
+        Returns
+        -------
+        ndarray | None
+            bool mask, one element for each streamline (True visible), None if all streamlines are visible
+        """
+        return self._mask
+
+    def getTractPoints(self, index: int) -> ndarray:
+        """
+        Get the points of a streamline of the current SisypheBundleTract instance.
+
+        Parameters
+        ----------
+        index : int
+            streamline index
+
+        Returns
+        -------
+        ndarray
+            shape(n, 3), n points (copy)
+        """
+        if 0 <= index < self.count():
+            p = vtk_to_numpy(self._polydata.GetPoints().GetData())
+            return p[self._offsets[index]:self._offsets[index] + self._lengths[index]].copy()
+        else: raise IndexError('streamline index {} is out of range.'.format(index))
+
+    def getTract(self, index: int) -> SisypheTract:
+        """
+        Get a streamline of the current SisypheBundleTract instance as a new SisypheTract instance, with the display
+        attributes of the bundle. The returned SisypheTract instance is a copy, its actor is not displayed by the
+        renderer of the bundle (see setTract method to update a streamline of the bundle).
+
+        Parameters
+        ----------
+        index : int
+            streamline index
+
+        Returns
+        -------
+        SisypheTract
+            streamline copy
+        """
+        tract = SisypheTract()
+        tract.setPoints(self.getTractPoints(index).astype('float64'), reg=False)
+        if self._lut is not None: tract.setLut(self._lut.copy(), update=False)
+        tract.setFloatColor(self.getFloatColor(), update=False)
+        tract.setColorRepresentation(self.getColorRepresentation())
+        tract.setOpacity(self.getOpacity())
+        tract.setLineWidth(self.getLineWidth())
+        tract.setVisibility(self.getVisibility() and (self._mask is None or bool(self._mask[index])))
+        return tract
+
+    def setTract(self, index: int, sl: ndarray) -> None:
+        """
+        Replace the points of a streamline of the current SisypheBundleTract instance. The polydata is rebuilt,
+        display attributes and streamline visibility mask are preserved, volume scalar values are removed (see
+        setScalarsFromVolume method).
+
+        Parameters
+        ----------
+        index : int
+            streamline index
+        sl : ndarray
+            streamline of n points, shape(n, 3)
+        """
+        if 0 <= index < self.count():
+            p = vtk_to_numpy(self._polydata.GetPoints().GetData())
+            streamlines = split(p, self._offsets[1:])
+            streamlines[index] = asarray(sl, dtype='float32')
+            self._rebuild(streamlines, self._mask, None)
+        else: raise IndexError('streamline index {} is out of range.'.format(index))
+
+    def removeTract(self, index: int) -> None:
+        """
+        Remove a streamline from the current SisypheBundleTract instance. The polydata is rebuilt, display attributes,
+        streamline visibility mask and volume scalar values are preserved. The current SisypheBundleTract instance is
+        cleared if the last streamline is removed.
+
+        Parameters
+        ----------
+        index : int
+            streamline index
+        """
+        if 0 <= index < self.count():
+            keep = ones(self.count(), dtype='bool')
+            keep[index] = False
+            pkeep = repeat(keep, self._lengths)
+            p = vtk_to_numpy(self._polydata.GetPoints().GetData())
+            streamlines = [sl for sl, k in zip(split(p, self._offsets[1:]), keep) if k]
+            pointdata = self._polydata.GetPointData()
+            if pointdata.HasArray('volume'): volume = vtk_to_numpy(pointdata.GetArray('volume'))[pkeep]
+            else: volume = None
+            if self._mask is None: mask = None
+            else: mask = self._mask[keep]
+            self._rebuild(streamlines, mask, volume)
+        else: raise IndexError('streamline index {} is out of range.'.format(index))
+
+    def setLevelOfDetailStep(self, step: int) -> None:
+        """
+        Set the subsampling step of the level of detail polydata displayed during interaction (one streamline out of
+        step is displayed).
+
+        Parameters
+        ----------
+        step : int
+            subsampling step, default 10
+        """
+        step = max(1, int(step))
+        if step != self._lodstep:
+            self._lodstep = step
+            self._lodpolydata = None
+            if self._lod: self.levelOfDetailOn()
+
+    def getLevelOfDetailStep(self) -> int:
+        """
+        Get the subsampling step of the level of detail polydata displayed during interaction (one streamline out of
+        step is displayed).
+
+        Returns
+        -------
+        int
+            subsampling step
+        """
+        return self._lodstep
+
+    def levelOfDetailOn(self) -> None:
+        """
+        Display the subsampled level of detail polydata (one streamline out of step). Called at the beginning of an
+        interaction to keep frame rates up.
+        """
+        if self._polydata is not None and self._lodstep > 1:
+            self._updateLOD()
+            self._mapper.SetInputData(self._lodpolydata)
+            self._lod = True
+
+    def levelOfDetailOff(self) -> None:
+        """
+        Display the full polydata. Called at the end of an interaction.
+        """
+        if self._lod:
+            self._lod = False
+            self._updatePolydata()
+
+    def isLevelOfDetail(self) -> bool:
+        """
+        Check whether the level of detail polydata is displayed.
+
+        Returns
+        -------
+        bool
+            True if level of detail polydata is displayed
+        """
+        return self._lod
+
+
 class SisypheTractCollection(object):
     """
     Description
@@ -963,6 +1481,12 @@ class SisypheTractCollection(object):
     Named (bundel name) list container of SisypheTract instances.
     Container Key = tuple[str, int], str bundle name, int index of a SisypheTract in the bundle
 
+    In batch rendering mode (default), a bundle is displayed by a single SisypheBundleTract instance (one vtkPolyData
+    and one vtkActor for all the streamlines of the bundle), and the bundle list has only one element. Container keys
+    are then mapped to the streamlines of the SisypheBundleTract instance (getter returns a SisypheTract copy of the
+    streamline, setter and del rebuild the bundle polydata). Otherwise, each streamline of the bundle is displayed by
+    its own SisypheTract instance.
+
     This class manages display attributes of bundles:
 
         - Color representation
@@ -983,10 +1507,10 @@ class SisypheTractCollection(object):
     object -> SisypheTractCollection
 
     Creation: 26/10/2023
-    Last revision: 20/02/2025
+    Last revision: 16/10/2026
     """
 
-    __slots__ = ['_bundles', '_renderer']
+    __slots__ = ['_bundles', '_renderer', '_batch', '_lodstep']
 
     # Special methods
 
@@ -995,6 +1519,8 @@ class SisypheTractCollection(object):
     
     _bundles    dict[str, list[SisypheTract]]
     _renderer   vtkRenderer
+    _batch      bool, batch rendering mode, one SisypheBundleTract for each bundle
+    _lodstep    int, level of detail subsampling step of batched bundles
     """
 
     def __init__(self) -> None:
@@ -1003,6 +1529,8 @@ class SisypheTractCollection(object):
         """
         self._bundles: dict[str, list[SisypheTract]] = dict()
         self._renderer: vtkRenderer | None = None
+        self._batch: bool = True
+        self._lodstep: int = 10
 
     def __str__(self) -> str:
         """
@@ -1015,7 +1543,7 @@ class SisypheTractCollection(object):
         """
         buff = 'Bundle count: {}\n'.format(len(self._bundles))
         for bundle in self._bundles:
-            buff += 'Bundle {}: {} tracts\n'.format(bundle, len(self._bundles[bundle]))
+            buff += 'Bundle {}: {} tracts\n'.format(bundle, self._getTractCount(bundle))
         return buff
 
     def __repr__(self) -> str:
@@ -1033,7 +1561,8 @@ class SisypheTractCollection(object):
 
     def __getitem__(self, key: tuple[str, int]) -> SisypheTract:
         """
-        Special overloaded container getter method. Get a SisypheTract element from container.
+        Special overloaded container getter method. Get a SisypheTract element from container. In batch rendering
+        mode, returns a new SisypheTract instance, copy of the streamline of the SisypheBundleTract (not displayed).
 
         Parameters
         ----------
@@ -1049,15 +1578,22 @@ class SisypheTractCollection(object):
         index = key[1]
         if isinstance(bundle, str) and isinstance(index, int):
             if bundle in self._bundles:
-                if 0 <= index < len(self._bundles[bundle]):
-                    return self._bundles[bundle][index]
+                # < Revision 16/10/2026
+                # if 0 <= index < len(self._bundles[bundle]):
+                #     return self._bundles[bundle][index]
+                if 0 <= index < self._getTractCount(bundle):
+                    # batch rendering, tract index is the streamline index of the SisypheBundleTract
+                    if self._isBatched(bundle): return self._bundles[bundle][0].getTract(index)
+                    else: return self._bundles[bundle][index]
+                # Revision 16/10/2026 >
                 else: raise IndexError('tract index key is out of range.')
             else: raise IndexError('invalid bundle name key.')
         else: raise TypeError('key type ({}, {}) is not (str, int).'.format(type(bundle), type(index)))
 
     def __setitem__(self, key: tuple[str, int], value: SisypheTract) -> None:
         """
-        Special overloaded container setter method. Set a SisypheTract element in the container.
+        Special overloaded container setter method. Set a SisypheTract element in the container. In batch rendering
+        mode, the points of the SisypheTract replace the streamline of the SisypheBundleTract.
 
         Parameters
         ----------
@@ -1071,8 +1607,15 @@ class SisypheTractCollection(object):
             index = key[1]
             if isinstance(bundle, str) and isinstance(index, int):
                 if bundle in self._bundles:
-                    if 0 <= index < len(self._bundles[bundle]):
-                        self._bundles[bundle][index] = value
+                    # < Revision 16/10/2026
+                    # if 0 <= index < len(self._bundles[bundle]):
+                    #     self._bundles[bundle][index] = value
+                    if 0 <= index < self._getTractCount(bundle):
+                        if self._isBatched(bundle):
+                            p = vtk_to_numpy(value.getPolyData().GetPoints().GetData())
+                            self._bundles[bundle][0].setTract(index, p)
+                        else: self._bundles[bundle][index] = value
+                    # Revision 16/10/2026 >
                     else: raise IndexError('tract index key is out of range.')
                 else: raise IndexError('invalid bundle name key.')
             else: raise TypeError('key type ({}, {}) is not (str, int).'.format(type(bundle), type(index)))
@@ -1080,7 +1623,7 @@ class SisypheTractCollection(object):
     def __delitem__(self, key: tuple[str, int]) -> None:
         """
         Special overloaded method called by the built-in del() python function. Delete a SisypheTract element of the
-        container.
+        container. In batch rendering mode, the streamline is removed from the SisypheBundleTract.
 
         Parameters
         ----------
@@ -1091,8 +1634,19 @@ class SisypheTractCollection(object):
         index = key[1]
         if isinstance(bundle, str) and isinstance(index, int):
             if bundle in self._bundles:
-                if 0 <= index < len(self._bundles[bundle]):
-                    del self._bundles[bundle][index]
+                # < Revision 16/10/2026
+                # if 0 <= index < len(self._bundles[bundle]):
+                #     del self._bundles[bundle][index]
+                if 0 <= index < self._getTractCount(bundle):
+                    if self._isBatched(bundle):
+                        tract = self._bundles[bundle][0]
+                        if tract.count() > 1: tract.removeTract(index)
+                        else:
+                            # last streamline, bundle is empty
+                            if self._renderer is not None: self._renderer.RemoveActor(tract.getActor())
+                            self._bundles[bundle] = list()
+                    else: del self._bundles[bundle][index]
+                # Revision 16/10/2026 >
                 else: raise IndexError('tract index key is out of range.')
             else: raise IndexError('invalid bundle name key.')
         else: raise TypeError('key type ({}, {}) is not (str, int).'.format(type(bundle), type(index)))
@@ -1109,7 +1663,43 @@ class SisypheTractCollection(object):
         """
         return self.count()
 
-    # Private method
+    # Private methods
+
+    def _isBatched(self, bundle: str) -> bool:
+        tracts = self._bundles[bundle]
+        return len(tracts) > 0 and isinstance(tracts[0], SisypheBundleTract)
+
+    def _getTractCount(self, bundle: str) -> int:
+        if self._isBatched(bundle): return self._bundles[bundle][0].count()
+        else: return len(self._bundles[bundle])
+
+    def _newBundleTract(self,
+                        sl: SisypheStreamlines,
+                        bundle: str = 'all',
+                        ref: SisypheTract | None = None) -> SisypheBundleTract:
+        # display attributes are copied from ref if not None, otherwise from sl
+        tract = SisypheBundleTract()
+        tract.setStreamlines(sl.getStreamlines())
+        tract.setLevelOfDetailStep(self._lodstep)
+        if ref is None:
+            rep = sl.getColorRepresentation(bundle)
+            lut = sl.getLut(bundle)
+            c = sl.getFloatColor(bundle)
+            opacity = sl.getOpacity(bundle)
+            width = sl.getLineWidth(bundle)
+        else:
+            rep = ref.getColorRepresentation()
+            lut = ref.getLut()
+            c = ref.getFloatColor()
+            opacity = ref.getOpacity()
+            width = ref.getLineWidth()
+        if not tract.isEmpty():
+            tract.setLut(lut, update=False)
+            tract.setFloatColor(c, update=False)
+            tract.setColorRepresentation(rep)
+            tract.setOpacity(opacity)
+            tract.setLineWidth(width)
+        return tract
 
     def _getNewName(self, name: str) -> str:
         while name in self._bundles:
@@ -1136,7 +1726,10 @@ class SisypheTractCollection(object):
         n = 0
         if len(self._bundles) > 0:
             for bundle in self._bundles:
-                n += len(self._bundles[bundle])
+                # < Revision 16/10/2026
+                # n += len(self._bundles[bundle])
+                n += self._getTractCount(bundle)
+                # Revision 16/10/2026 >
         return n
 
     def bundleCount(self) -> int:
@@ -1167,7 +1760,10 @@ class SisypheTractCollection(object):
         if len(self._bundles) > 0:
             if bundle == '': return self.count()
             elif bundle in self._bundles:
-                return len(self._bundles[bundle])
+                # < Revision 16/10/2026
+                # return len(self._bundles[bundle])
+                return self._getTractCount(bundle)
+                # Revision 16/10/2026 >
             else: raise ValueError('{} invalid bundle name.'.format(bundle))
         else: raise AttributeError('{} is empty.'.format(self.__class__.__name__))
 
@@ -1267,6 +1863,17 @@ class SisypheTractCollection(object):
             sl.setName(bundle)
         if bundle not in self._bundles:
             if bundle != sl.getName(): sl = sl.getSisypheStreamlinesFromBundle(bundle)
+            # < Revision 16/10/2026
+            # batch rendering, single actor for all the streamlines of the bundle
+            if self._batch:
+                if wait is not None: wait.setProgressVisibility(False)
+                tract = self._newBundleTract(sl, bundle)
+                self._bundles[bundle] = [tract]
+                if self._renderer is not None:
+                    self._renderer.AddActor(tract.getActor())
+                    self._renderer.GetRenderWindow().Render()
+                return
+            # Revision 16/10/2026 >
             rep = sl.getColorRepresentation(bundle)
             lut = sl.getLut(bundle)
             c = sl.getFloatColor(bundle)
@@ -1322,7 +1929,19 @@ class SisypheTractCollection(object):
             if select is None or select.count() == sl.count(): r = SisypheStreamlines(sl=sl.getStreamlines())
             else: r = SisypheStreamlines(sl=sl.getStreamlines()[select.getList()])
             r.copyAttributesFrom(sl)
-            r.setName(select.getName())
+            # < Revision 16/10/2026
+            # r.setName(select.getName())
+            if select is None: r.setName(self._getNewName(bundle))
+            else: r.setName(select.getName())
+            # batch rendering, new single actor bundle built from selected streamlines
+            if self._isBatched(bundle):
+                tract = self._newBundleTract(r, ref=self._bundles[bundle][0])
+                self._bundles[r.getName()] = [tract]
+                if self._renderer is not None:
+                    self._renderer.AddActor(tract.getActor())
+                    self._renderer.GetRenderWindow().Render()
+                return r
+            # Revision 16/10/2026 >
             tracts = list()
             if select is None:
                 select = SisypheBundle()
@@ -1362,6 +1981,23 @@ class SisypheTractCollection(object):
         bundle = sl.getName()
         if bundle in self._bundles:
             if select.count() < sl.getBundle(0).count():
+                # < Revision 16/10/2026
+                # batch rendering, bundle polydata rebuilt from selected streamlines
+                if self._isBatched(bundle):
+                    r = SisypheStreamlines(sl=sl.getStreamlines()[select.getList()])
+                    r.copyAttributesFrom(sl)
+                    r.setWholeBrainStatus(False)
+                    old = self._bundles[bundle][0]
+                    tract = self._newBundleTract(r, ref=old)
+                    tract.setVisibility(old.getVisibility())
+                    self._bundles[bundle] = [tract]
+                    if self._renderer is not None:
+                        self._renderer.RemoveActor(old.getActor())
+                        self._renderer.AddActor(tract.getActor())
+                        self._renderer.GetRenderWindow().Render()
+                    del old
+                    return r
+                # Revision 16/10/2026 >
                 # noinspection PyUnresolvedReferences
                 i: cython.int
                 unselect = sl.getBundle(0) - select
@@ -1404,6 +2040,22 @@ class SisypheTractCollection(object):
         r.copyAttributesFrom(lsl[0])
         r.setName(bundle)
         r.setWholeBrainStatus(False)
+        # < Revision 16/10/2026
+        # batch rendering, union bundle built from the merged streamlines
+        for sl in lsl:
+            if sl.getName() not in self._bundles:
+                raise ValueError('invalid bundle name, {} not in current collection.'.format(sl.getName()))
+        if self._batch or any([self._isBatched(sl.getName()) for sl in lsl]):
+            if wait is not None: wait.setInformationText('{} bundle union...'.format(bundle))
+            for sl in lsl:
+                r.append(sl.getStreamlines())
+            tract = self._newBundleTract(r, ref=self._bundles[lsl[0].getName()][0])
+            self._bundles[bundle] = [tract]
+            if self._renderer is not None:
+                self._renderer.AddActor(tract.getActor())
+                self._renderer.GetRenderWindow().Render()
+            return r
+        # Revision 16/10/2026 >
         self._bundles[bundle] = list()
         for sl in lsl:
             if sl.getName() in self._bundles:
@@ -2150,21 +2802,146 @@ class SisypheTractCollection(object):
             else: raise ValueError('{} invalid bundle name.'.format(bundle))
         else: raise AttributeError('{} is empty.'.format(self.__class__.__name__))
 
+    # Batch rendering public methods
 
-class SisypheBundle(object):
-    """
-    Description
-    ~~~~~~~~~~~
+    def setBatchRendering(self, v: bool) -> None:
+        """
+        Set the batch rendering mode of the current SisypheTractCollection instance. In batch rendering mode, a bundle
+        is displayed by a single SisypheBundleTract instance (one vtkPolyData and one vtkActor for all the streamlines
+        of the bundle). Only applies to bundles appended afterward.
 
-    Container of tracts (streamlines) indices in an associated SisypheStreamlines instance belonging to a bundle. The
-    SisypheBundle instance is an attribute of the associated SisypheStreamlines instance.
+        Parameters
+        ----------
+        v : bool
+            True, batch rendering mode (default)
+        """
+        self._batch = bool(v)
 
-    Scope of methods:
+    def getBatchRendering(self) -> bool:
+        """
+        Get the batch rendering mode of the current SisypheTractCollection instance.
 
-        - set operators between SisypheBundle instances (union, intersection, difference, symmetric difference)
-        - logic operators between SisypheBundle instances (and, or, xor)
-        - addBundle and sub arithmetic operators between SisypheBundle instances
-        - Color representation
+        Returns
+        -------
+        bool
+            True, batch rendering mode
+        """
+        return self._batch
+
+    def isBatchedBundle(self, bundle: str = '') -> bool:
+        """
+        Check whether a bundle of the current SisypheTractCollection instance is displayed by a single
+        SisypheBundleTract instance.
+
+        Parameters
+        ----------
+        bundle : str
+            bundle name, if bundle name is empty, the first bundle is selected.
+
+        Returns
+        -------
+        bool
+            True if bundle is batched
+        """
+        if len(self._bundles) > 0:
+            if bundle == '': bundle = list(self._bundles.keys())[0]
+            if bundle in self._bundles: return self._isBatched(bundle)
+            else: raise ValueError('{} invalid bundle name.'.format(bundle))
+        else: raise AttributeError('{} is empty.'.format(self.__class__.__name__))
+
+    def setTractVisibilityMask(self, select: SisypheBundle | None = None, bundle: str = '') -> None:
+        """
+        Show only a selection of streamlines of a bundle in the current SisypheTractCollection instance, without
+        rebuilding the bundle display.
+
+        Parameters
+        ----------
+        select : SisypheBundle | None
+            visible streamlines. If None (default), all streamlines are visible
+        bundle : str
+            bundle name, if bundle name is empty, the first bundle is selected.
+        """
+        if len(self._bundles) > 0:
+            if bundle == '': bundle = list(self._bundles.keys())[0]
+            if bundle in self._bundles:
+                if self._isBatched(bundle):
+                    if select is None: self._bundles[bundle][0].setTractVisibilityMask(None)
+                    else: self._bundles[bundle][0].setTractVisibilityMask(select.getList())
+                else:
+                    n = len(self._bundles[bundle])
+                    if select is None: mask = [True] * n
+                    # < Revision 16/10/2026
+                    # else:
+                    #     mask = [False] * n
+                    #     for i in select.getList(): mask[i] = True
+                    else: mask = select.getMask(n).tolist()
+                    # Revision 16/10/2026 >
+                    for i, tract in enumerate(self._bundles[bundle]):
+                        tract.setVisibility(mask[i])
+                if self._renderer is not None:
+                    self._renderer.GetRenderWindow().Render()
+            else: raise ValueError('{} invalid bundle name.'.format(bundle))
+        else: raise AttributeError('{} is empty.'.format(self.__class__.__name__))
+
+    def setLevelOfDetailStep(self, step: int) -> None:
+        """
+        Set the subsampling step of the level of detail displayed during interaction (one streamline out of step is
+        displayed). Only applies to batched bundles.
+
+        Parameters
+        ----------
+        step : int
+            subsampling step, default 10, 1 to disable level of detail
+        """
+        self._lodstep = max(1, int(step))
+        for bundle in self._bundles:
+            if self._isBatched(bundle):
+                self._bundles[bundle][0].setLevelOfDetailStep(self._lodstep)
+
+    def getLevelOfDetailStep(self) -> int:
+        """
+        Get the subsampling step of the level of detail displayed during interaction (one streamline out of step is
+        displayed).
+
+        Returns
+        -------
+        int
+            subsampling step
+        """
+        return self._lodstep
+
+    def levelOfDetailOn(self) -> None:
+        """
+        Display subsampled batched bundles. Called at the beginning of an interaction (camera rotation, zoom...) to
+        keep frame rates up.
+        """
+        for bundle in self._bundles:
+            if self._isBatched(bundle):
+                self._bundles[bundle][0].levelOfDetailOn()
+
+    def levelOfDetailOff(self) -> None:
+        """
+        Display all the streamlines of batched bundles. Called at the end of an interaction.
+        """
+        for bundle in self._bundles:
+            if self._isBatched(bundle):
+                self._bundles[bundle][0].levelOfDetailOff()
+
+
+class SisypheBundle(object):
+    """
+    Description
+    ~~~~~~~~~~~
+
+    Container of tracts (streamlines) indices in an associated SisypheStreamlines instance belonging to a bundle. The
+    SisypheBundle instance is an attribute of the associated SisypheStreamlines instance.
+
+    Scope of methods:
+
+        - set operators between SisypheBundle instances (union, intersection, difference, symmetric difference)
+        - logic operators between SisypheBundle instances (and, or, xor)
+        - addBundle and sub arithmetic operators between SisypheBundle instances
+        - Color representation
 
             - RGB mode, colors derived from unit vector directed to next point of the tract
             - CMAP mode, colors derived from scalar values associated with points using the look-up table colormap
@@ -2182,8 +2959,10 @@ class SisypheBundle(object):
 
     object -> SisypheBundle
 
+    Tract indices are stored in a sorted numpy int32 array, set operators are vectorised.
+
     Creation: 26/10/2023
-    Last revision: 10/04/2025
+    Last revision: 16/10/2026
     """
 
     __slots__ = ['_index', '_name', '_color', '_lut', '_rep', '_width', '_opacity', '_list']
@@ -2205,7 +2984,7 @@ class SisypheBundle(object):
     _rep        int, bundle representation (0: RGB, 1: CMAP, 3: COLOR)
     _color      list[float, float, float], bundle color
     _lut        SisypheLut, bundle colormap
-    _list       list[int], bundle list
+    _list       ndarray, sorted unique tract indices (int32)
     """
 
     def __init__(self, s: int | vector3int | None = None) -> None:
@@ -2230,14 +3009,25 @@ class SisypheBundle(object):
         self._rep: int = self._RGB
         self._width = 1.0
         self._opacity = 1.0
+        # < Revision 16/10/2026
+        # sorted int32 array instead of list
+        # if s is not None:
+        #     if isinstance(s, int): self._list = list(range(s))
+        #     elif isinstance(s, (tuple, list)):
+        #         n = len(s)
+        #         if n == 1: self._list = list(range(s[0]))
+        #         elif n == 2: self._list = list(range(s[0], s[1]))
+        #         else: self._list = list(range(s[0], s[1], s[2]))
+        # else: self._list: list[int] = list()
+        self._list: ndarray = zeros(0, dtype='int32')
         if s is not None:
-            if isinstance(s, int): self._list = list(range(s))
+            if isinstance(s, int): self._list = arange(s, dtype='int32')
             elif isinstance(s, (tuple, list)):
                 n = len(s)
-                if n == 1: self._list = list(range(s[0]))
-                elif n == 2: self._list = list(range(s[0], s[1]))
-                else: self._list = list(range(s[0], s[1], s[2]))
-        else: self._list: list[int] = list()
+                if n == 1: self._list = arange(s[0], dtype='int32')
+                elif n == 2: self._list = arange(s[0], s[1], dtype='int32')
+                else: self._list = arange(s[0], s[1], s[2], dtype='int32')
+        # Revision 16/10/2026 >
 
     def __str__(self) -> str:
         """
@@ -2284,7 +3074,12 @@ class SisypheBundle(object):
         bool
             True if index in container
         """
-        return item in self._list
+        # < Revision 16/10/2026
+        # binary search in sorted array
+        # return item in self._list
+        i = searchsorted(self._list, item)
+        return i < len(self._list) and self._list[i] == item
+        # Revision 16/10/2026 >
 
     def __len__(self) -> int:
         """
@@ -2314,14 +3109,15 @@ class SisypheBundle(object):
         """
         # key is int index
         if isinstance(key, int):
-            if 0 <= key < len(self._list): return self._list[key]
+            if 0 <= key < len(self._list): return int(self._list[key])
             else: raise IndexError('parameter is out of range.')
         else: raise TypeError('parameter type {} is not int.'.format(type(key)))
 
     def __setitem__(self, key: int, value: int) -> None:
         """
         Special overloaded container getter method. Set an element (i.e. index of a tract (streamline) in the
-        associated SisypheStreamlines instance) in the container.
+        associated SisypheStreamlines instance) in the container. Container is sorted again, duplicated index is
+        removed.
 
         Parameters
         ----------
@@ -2332,7 +3128,11 @@ class SisypheBundle(object):
         """
         if isinstance(value, int):
             if isinstance(key, int):
-                if 0 <= key < len(self._list): self._list[key] = value
+                if 0 <= key < len(self._list):
+                    self._list[key] = value
+                    # < Revision 16/10/2026
+                    self._list = unique(self._list)
+                    # Revision 16/10/2026 >
                 else: raise IndexError('parameter is out of range.')
             else: raise TypeError('key parameter type {} is not int.'.format(type(key)))
         else: raise TypeError('value parameter type {} is not int.'.format(type(value)))
@@ -2358,7 +3158,7 @@ class SisypheBundle(object):
         if self._index < len(self._list):
             n = self._index
             self._index += 1
-            return self._list[n]
+            return int(self._list[n])
         else: raise StopIteration
 
     # Special logic operators
@@ -2377,12 +3177,14 @@ class SisypheBundle(object):
         SisypheBundle
             result = self & other
         """
-        r = set(self._list) & set(other._list)
+        # < Revision 16/10/2026
+        # vectorised set operator on sorted arrays
+        # r = set(self._list) & set(other._list)
+        # buff._list = list(r)
+        # if len(buff._list) > 0: buff._list.sort()
         buff = SisypheBundle()
-        buff._list = list(r)
-        # < Revision 10/04/2025
-        if len(buff._list) > 0: buff._list.sort()
-        # Revision 10/04/2025 >
+        buff._list = intersect1d(self._list, other._list, assume_unique=True).astype('int32')
+        # Revision 16/10/2026 >
         return buff
 
     def __or__(self, other: SisypheBundle) -> SisypheBundle:
@@ -2399,12 +3201,14 @@ class SisypheBundle(object):
         SisypheBundle
             result = self | other
         """
-        r = set(self._list) | set(other._list)
+        # < Revision 16/10/2026
+        # vectorised set operator on sorted arrays
+        # r = set(self._list) | set(other._list)
+        # buff._list = list(r)
+        # if len(buff._list) > 0: buff._list.sort()
         buff = SisypheBundle()
-        buff._list = list(r)
-        # < Revision 10/04/2025
-        if len(buff._list) > 0: buff._list.sort()
-        # Revision 10/04/2025 >
+        buff._list = union1d(self._list, other._list).astype('int32')
+        # Revision 16/10/2026 >
         return buff
 
     def __xor__(self, other: SisypheBundle) -> SisypheBundle:
@@ -2421,12 +3225,14 @@ class SisypheBundle(object):
         SisypheBundle
             result = self ^ other
         """
-        r = set(self._list) ^ set(other._list)
+        # < Revision 16/10/2026
+        # vectorised set operator on sorted arrays
+        # r = set(self._list) ^ set(other._list)
+        # buff._list = list(r)
+        # if len(buff._list) > 0: buff._list.sort()
         buff = SisypheBundle()
-        buff._list = list(r)
-        # < Revision 10/04/2025
-        if len(buff._list) > 0: buff._list.sort()
-        # Revision 10/04/2025 >
+        buff._list = setxor1d(self._list, other._list, assume_unique=True).astype('int32')
+        # Revision 16/10/2026 >
         return buff
 
     def __sub__(self, other: SisypheBundle) -> SisypheBundle:
@@ -2443,12 +3249,14 @@ class SisypheBundle(object):
         SisypheBundle
             result = self - other
         """
-        r = set(self._list) - set(other._list)
+        # < Revision 16/10/2026
+        # vectorised set operator on sorted arrays
+        # r = set(self._list) - set(other._list)
+        # buff._list = list(r)
+        # if len(buff._list) > 0: buff._list.sort()
         buff = SisypheBundle()
-        buff._list = list(r)
-        # < Revision 10/04/2025
-        if len(buff._list) > 0: buff._list.sort()
-        # Revision 10/04/2025 >
+        buff._list = setdiff1d(self._list, other._list, assume_unique=True).astype('int32')
+        # Revision 16/10/2026 >
         return buff
 
     def __add__(self, other: SisypheBundle) -> SisypheBundle:
@@ -2545,7 +3353,7 @@ class SisypheBundle(object):
         """
         Remove all the tract indices from the current SisypheBundle instance.
         """
-        self._list = list()
+        self._list = zeros(0, dtype='int32')
 
     def copy(self) -> SisypheBundle:
         """
@@ -2573,50 +3381,84 @@ class SisypheBundle(object):
         list[int]
             list copy of bundle
         """
-        return self._list.copy()
+        # < Revision 16/10/2026
+        # return self._list.copy()
+        return self._list.tolist()
+        # Revision 16/10/2026 >
 
-    def getList(self) -> list[int]:
+    def getList(self) -> ndarray:
         """
-        Get the list attribute of the current SisypheBundle instance container.
+        Get the tract indices of the current SisypheBundle instance container, without copy. Can be used directly to
+        index dipy.tracking.Streamlines.
 
         Returns
         -------
-        list[int]
-            list copy of bundle
+        ndarray
+            sorted tract indices (int32)
         """
         return self._list
 
-    def appendTracts(self, tracts: int | list[int] | tuple[int, ]) -> None:
+    def getMask(self, n: int) -> ndarray:
+        """
+        Get the current SisypheBundle instance as a bool mask.
+
+        Parameters
+        ----------
+        n : int
+            mask size, number of streamlines in the associated SisypheStreamlines instance
+
+        Returns
+        -------
+        ndarray
+            bool mask, True for tracts in bundle
+        """
+        r = zeros(n, dtype='bool')
+        r[self._list[self._list < n]] = True
+        return r
+
+    @staticmethod
+    def _toArray(tracts: int | list[int] | tuple[int, ] | ndarray) -> ndarray:
+        # sorted unique int32 array, bool ndarray is a mask
+        if isinstance(tracts, int): return array([tracts], dtype='int32')
+        tracts = asarray(tracts)
+        if tracts.dtype == 'bool': return tracts.nonzero()[0].astype('int32')
+        return unique(tracts.astype('int32'))
+
+    def appendTracts(self, tracts: int | list[int] | tuple[int, ] | ndarray) -> None:
         """
         Append element(s) (i.e. index of a tract (streamline) in the associated SisypheStreamlines instance) to the
         current SisypheBundle instance.
 
         Parameters
         ----------
-        tracts : int | list[int] | tuple[int, ]
-            tract indices in the associated SisypheStreamlines instance
+        tracts : int | list[int] | tuple[int, ] | ndarray
+            tract indices in the associated SisypheStreamlines instance, or bool mask
         """
-        if isinstance(tracts, int): tracts = [tracts]
-        self._list = list(set(self._list) | set(tracts))
-        # < Revision 10/04/2025
-        self._list.sort()
-        # Revision 10/04/2025 >
+        # < Revision 16/10/2026
+        # if isinstance(tracts, int): tracts = [tracts]
+        # self._list = list(set(self._list) | set(tracts))
+        # self._list.sort()
+        tracts = self._toArray(tracts)
+        if len(self._list) == 0: self._list = tracts
+        else: self._list = union1d(self._list, tracts).astype('int32')
+        # Revision 16/10/2026 >
 
-    def removeTracts(self, tracts: int | list[int] | tuple[int, ]) -> None:
+    def removeTracts(self, tracts: int | list[int] | tuple[int, ] | ndarray) -> None:
         """
         Remove element(s) (i.e. index of a tract (streamline) in the associated SisypheStreamlines instance) to the
         current SisypheBundle instance.
 
         Parameters
         ----------
-        tracts : int | list[int] | tuple[int, ]
-            tract indices in the associated SisypheStreamlines instance
+        tracts : int | list[int] | tuple[int, ] | ndarray
+            tract indices in the associated SisypheStreamlines instance, or bool mask
         """
-        if isinstance(tracts, int): tracts = [tracts]
-        self._list = list(set(self._list) - set(tracts))
-        # < Revision 10/04/2025
-        self._list.sort()
-        # Revision 10/04/2025 >
+        # < Revision 16/10/2026
+        # if isinstance(tracts, int): tracts = [tracts]
+        # self._list = list(set(self._list) - set(tracts))
+        # self._list.sort()
+        self._list = setdiff1d(self._list, self._toArray(tracts), assume_unique=True).astype('int32')
+        # Revision 16/10/2026 >
 
     def setFloatColor(self, c: vector3float) -> None:
         """
@@ -2908,7 +3750,10 @@ class SisypheBundle(object):
         other : SisypheBundle
             bundle used for union
         """
-        self._list = list(set(self._list) | set(other._list))
+        # < Revision 16/10/2026
+        # self._list = list(set(self._list) | set(other._list))
+        self._list = union1d(self._list, other._list).astype('int32')
+        # Revision 16/10/2026 >
 
     def intersection(self, other: SisypheBundle) -> None:
         """
@@ -2921,7 +3766,10 @@ class SisypheBundle(object):
             bundle used for intersection
         """
 
-        self._list = list(set(self._list) & set(other._list))
+        # < Revision 16/10/2026
+        # self._list = list(set(self._list) & set(other._list))
+        self._list = intersect1d(self._list, other._list, assume_unique=True).astype('int32')
+        # Revision 16/10/2026 >
 
     def difference(self, other: SisypheBundle) -> None:
         """
@@ -2934,7 +3782,10 @@ class SisypheBundle(object):
             second operand bundle for subtraction
         """
 
-        self._list = list(set(self._list) - set(other._list))
+        # < Revision 16/10/2026
+        # self._list = list(set(self._list) - set(other._list))
+        self._list = setdiff1d(self._list, other._list, assume_unique=True).astype('int32')
+        # Revision 16/10/2026 >
 
     def symDifference(self, other: SisypheBundle) -> None:
         """
@@ -2947,7 +3798,10 @@ class SisypheBundle(object):
             second operand bundle for Symmetric difference
         """
 
-        self._list = list(set(self._list) ^ set(other._list))
+        # < Revision 16/10/2026
+        # self._list = list(set(self._list) ^ set(other._list))
+        self._list = setxor1d(self._list, other._list, assume_unique=True).astype('int32')
+        # Revision 16/10/2026 >
 
 
 class SisypheBundleCollection(object):
@@ -2969,7 +3823,7 @@ class SisypheBundleCollection(object):
     object -> SisypheBundleCollection
 
     Creation: 26/10/2023
-    Last revision: 06/12/2023
+    Last revision: 16/10/2026
     """
 
     __slots__ = ['_index', '_list']
@@ -3142,269 +3996,764 @@ class SisypheBundleCollection(object):
         """
         return len(self._list)
 
-    def isEmpty(self) -> bool:
+    def isEmpty(self) -> bool:
+        """
+        Check whether the current SisypheBundleCollection instance is empty (no bundle).
+
+        Returns
+        -------
+        bool
+            True if container is empty
+        """
+        return len(self._list) == 0
+
+    def clear(self) -> None:
+        """
+        Remove all the SisypheBundle elements from the current SisypheBundleCollection instance.
+        """
+        self._list = list()
+
+    def remove(self, value: int | str | SisypheBundle) -> None:
+        """
+        Remove a SisypheBundle element from the current SisypheBundleCollection instance.
+
+        Parameters
+        ----------
+        value : int | str | SisypheBundle
+            index or bundle name or SisypheBundle instance to remove
+        """
+        # value is SisypheBundle
+        if isinstance(value, SisypheBundle): self._list.remove(value)
+        # value is str or int
+        elif isinstance(value, (str, int)): self.pop(self.index(value))
+        else: raise TypeError('parameter type {} is not int, str or SisypheBundle.'.format(type(value)))
+
+    def pop(self, key: int | str | SisypheBundle | None = None) -> SisypheBundle:
+        """
+        Remove a SisypheBundle elements from the current SisypheBundleCollection instance and return it. If key is
+        None, removes and returns the last element.
+
+        Parameters
+        ----------
+        key : int | str | SisypheBundle | None
+            index or bundle name or SisypheBundle to remove
+
+        Returns
+        -------
+        SisypheBundle
+            bundle removed from the container
+        """
+        if key is None: return self._list.pop()
+        # key is SisypheVolume arrayID str
+        if isinstance(key, (str, SisypheBundle)): key = self.index(key)
+        # key is int index
+        if isinstance(key, int): return self._list.pop(key)
+        else: raise TypeError('parameter type {} is not int or str.'.format(type(key)))
+
+    def keys(self) -> list[str]:
+        """
+        Get the list of keys in the current SisypheBundleCollection instance container.
+
+        Returns
+        -------
+        list[str]
+            list of keys in the container
+        """
+        return [k.getName() for k in self._list]
+
+    def index(self, value: str | SisypheBundle) -> int:
+        """
+         Index of a SisypheBundle element in the current SisypheBundleCollection instance container.
+
+        Parameters
+        ----------
+        value : str | SisypheBundle
+            bundle name or SisypheBundle
+
+        Returns
+        -------
+        int
+            index of bundle in the container
+        """
+        keys = [k.getName() for k in self._list]
+        # value is SisypheBundle
+        if isinstance(value, SisypheBundle): value = value.getName()
+        # value is str
+        if isinstance(value, str): return keys.index(value)
+        else: raise TypeError('parameter type {} is not str or SisypheBundle.'.format(type(value)))
+
+    def reverse(self) -> None:
+        """
+        Reverses the order of the elements in the current SisypheBundleCollection instance container.
+        """
+        self._list.reverse()
+
+    def append(self, value: SisypheBundle) -> None:
+        """
+        Append a SisypheBundle element in the current SisypheBundleCollection instance container.
+
+        Parameters
+        ----------
+        value :  SisypheBundle
+            bundle to append in the container
+        """
+        if isinstance(value, SisypheBundle):
+            if value.getName() not in self: self._list.append(value)
+        else: raise TypeError('parameter type {} is not SisypheBundle.'.format(type(value)))
+
+    def insert(self, key: int | str | SisypheBundle, value: SisypheBundle) -> None:
+        """
+         Insert a SisypheBundle element at the position given by the key in the current SisypheBundleCollection
+         instance container.
+
+        Parameters
+        ----------
+        key : int | str | SisypheBundle | None
+            index or bundle name or SisypheBundle
+        value : SisypheBundle
+            bundle to insert in the container
+        """
+        if isinstance(value, SisypheBundle):
+            # value is SisypheBundle
+            if isinstance(key, SisypheBundle): key = key.getName()
+            # value is str
+            if isinstance(key, str): key = self.index(key)
+            # key is int index
+            if isinstance(key, int):
+                if 0 <= key < len(self._list):
+                    if value.getName() not in self._list: self._list.insert(key, value)
+                else: raise IndexError('parameter is out of range.')
+            else: raise TypeError('parameter type {} is not int, str or SisypheBundle.'.format(type(key)))
+        else: raise TypeError('parameter type {} is not SisypheBundle.'.format(type(value)))
+
+    def copy(self) -> SisypheBundleCollection:
+        """
+        Copy the current SisypheBundleCollection instance container (Shallow copy of elements).
+
+        Returns
+        -------
+        SisypheBundleCollection
+            shallow copy of bundle
+        """
+        bundle = SisypheBundleCollection()
+        for item in self._list:
+            bundle.append(item)
+        return bundle
+
+    def copyToList(self) -> list[SisypheBundle]:
+        """
+        Copy the current SisypheBundleCollection instance container to a list (Shallow copy of elements).
+
+        Returns
+        -------
+        list[SisypheBundle]
+            shallow copy of bundle to list
+        """
+        return self._list.copy()
+
+    def getList(self) -> list[SisypheBundle]:
+        """
+        Get the list attribute of the current SisypheBundleCollection instance container (Shallow copy of the elements).
+
+        Returns
+        -------
+        list[SisypheBundle]
+            shallow copy of bundle to list
+        """
+        return self._list
+
+    def rename(self, old: str, new: str) -> None:
+        """
+        Rename a bundle of the current SisypheBundleCollection instance container.
+
+        Parameters
+        ----------
+        old : str
+            Old bundle name
+        new : str
+            New bundle name
+        """
+        if old in self:
+            idx = self.index(old)
+            self._list[idx].setName(new)
+        else: raise ValueError('{} is not a key of the current SisypheBundleCollection.'.format(old))
+
+    # Public set operators
+
+    def union(self, names: list[str, ], newname: str) -> None:
+        """
+        Union of SisypheBundle elements of the current SisypheBundleCollection. Bundles are selected by their name
+        attributes. The resulting SisypheBundle is appended to the container.
+
+        Parameters
+        ----------
+        names : list[str, ]
+            list of bundle names
+        newname :
+            name of the new bundle (union result)
+        """
+        if newname not in self:
+            # < Revision 16/10/2026
+            # copy first bundle, otherwise first bundle is modified in place
+            # r = self[names[0]]
+            # for name in names:
+            r = self[names[0]].copy()
+            for name in names[1:]:
+            # Revision 16/10/2026 >
+                r.union(self[name])
+            r.setName(newname)
+            self.append(r)
+        else: raise ValueError('parameter {} already exists.'.format(newname))
+
+    def intersection(self, names: list[str, ], newname: str) -> None:
+        """
+        Intersection of SisypheBundle elements of the current SisypheBundleCollection. Bundles are selected by their
+        name attributes. The resulting SisyphusBundle is appended to the container.
+
+        Parameters
+        ----------
+        names : list[str, ]
+            list of bundle names
+        newname :
+            name of the new bundle (intersection result)
+        """
+        if newname not in self:
+            # < Revision 16/10/2026
+            # copy first bundle, otherwise first bundle is modified in place
+            # r = self[names[0]]
+            # for name in names:
+            r = self[names[0]].copy()
+            for name in names[1:]:
+            # Revision 16/10/2026 >
+                r.intersection(self[name])
+            r.setName(newname)
+            self.append(r)
+        else: raise ValueError('parameter {} already exists.'.format(newname))
+
+    def difference(self, names: list[str, ], newname: str) -> None:
+        """
+        Difference of SisypheBundle elements of the current SisypheBundleCollection. Bundles are selected by their
+        name attributes. The resulting SisyphusBundle is appended to the container.
+
+        Parameters
+        ----------
+        names : list[str, ]
+            list of bundle names
+        newname :
+            name of the new bundle (difference result)
+        """
+        if newname not in self:
+            # < Revision 16/10/2026
+            # copy first bundle, otherwise first bundle is modified in place
+            # r = self[names[0]]
+            # for name in names:
+            r = self[names[0]].copy()
+            for name in names[1:]:
+            # Revision 16/10/2026 >
+                r.difference(self[name])
+            r.setName(newname)
+            self.append(r)
+        else: raise ValueError('parameter {} already exists.'.format(newname))
+
+    def symDifference(self, names: list[str, ], newname: str) -> None:
+        """
+        Symmetric difference of SisypheBundle elements of the current SisypheBundleCollection. Bundles are selected by
+        their name attributes. The resulting SisyphusBundle is appended to the container.
+
+        Parameters
+        ----------
+        names : list[str, ]
+            list of bundle names
+        newname :
+            name of the new bundle (symmetric difference result)
+        """
+        if newname not in self:
+            # < Revision 16/10/2026
+            # copy first bundle, otherwise first bundle is modified in place
+            # r = self[names[0]]
+            # for name in names:
+            r = self[names[0]].copy()
+            for name in names[1:]:
+            # Revision 16/10/2026 >
+                r.symDifference(self[name])
+            r.setName(newname)
+            self.append(r)
+        else: raise ValueError('parameter {} already exists.'.format(newname))
+
+
+class SisypheStreamlinesIndex(object):
+    """
+    Description
+    ~~~~~~~~~~~
+
+    Spatial inverted index of streamlines, from voxels (diffusion-weighted images grid) to streamline points.
+
+    The index is built once per tractogram in a single vectorised pass: streamline points are sorted by voxel, and
+    each voxel of the grid is associated with the range of its points in the sorted array. ROI, sphere and plane
+    selections only process the points of the voxels near the selection, instead of all the points of all the
+    streamlines. The index can be saved alongside the PySisyphe streamlines file (.xtracts).
+
+    Inheritance
+    ~~~~~~~~~~~
+
+    object -> SisypheStreamlinesIndex
+
+    Creation: 16/10/2026
+    """
+
+    __slots__ = ['_shape', '_spacing', '_fingerprint', '_voxels', '_starts', '_rows', '_offsets', '_lengths', '_data']
+
+    # Class constants
+
+    _FILEEXT = '.xsindex'
+
+    # Class methods
+
+    @classmethod
+    def getFileExt(cls) -> str:
+        """
+        Get SisypheStreamlinesIndex file extension.
+
+        Returns
+        -------
+        str
+            '.xsindex'
+        """
+        return cls._FILEEXT
+
+    @classmethod
+    def getCompactData(cls, sl: Streamlines) -> tuple[ndarray, ndarray, ndarray]:
+        """
+        Get points, offsets and lengths of streamlines as contiguous arrays, without copy if the streamline points
+        are already contiguous.
+
+        Parameters
+        ----------
+        sl : dipy.tracking.Streamlines
+            streamlines
+
+        Returns
+        -------
+        tuple[ndarray, ndarray, ndarray]
+            - points, shape(n, 3), n points
+            - offsets, index of the first point of each streamline
+            - lengths, number of points of each streamline
+        """
+        # noinspection PyProtectedMember
+        lengths = asarray(sl._lengths, dtype='int64')
+        offsets = zeros(len(lengths), dtype='int64')
+        if len(lengths) > 0: cumsum(lengths[:-1], out=offsets[1:])
+        # noinspection PyProtectedMember
+        data = sl._data
+        # noinspection PyProtectedMember
+        if len(data) == lengths.sum() and (asarray(sl._offsets) == offsets).all(): return data, offsets, lengths
+        else: return sl.get_data(), offsets, lengths
+
+    @classmethod
+    def getFingerprint(cls, points: ndarray, lengths: ndarray) -> str:
+        """
+        Get a fingerprint of streamlines, used to check that an index matches streamlines.
+
+        Parameters
+        ----------
+        points : ndarray
+            streamline points, shape(n, 3)
+        lengths : ndarray
+            number of points of each streamline
+
+        Returns
+        -------
+        str
+            md5 hexdigest of lengths and of a sample of points
+        """
+        step = max(1, len(points) // 65536)
+        h = md5(lengths.tobytes())
+        h.update(asarray(points[::step]).tobytes())
+        return h.hexdigest()
+
+    # Special methods
+
+    """
+    Private attributes
+
+    _shape          tuple[int, int, int], grid size (x, y, z)
+    _spacing        ndarray, grid spacing (x, y, z)
+    _fingerprint    str, md5 fingerprint of indexed streamlines
+    _voxels         ndarray, sorted linear indices of non-empty voxels (x * ny * nz + y * nz + z), out of grid = nx * ny * nz
+    _starts         ndarray, first position in _rows of each voxel of _voxels (+ end position)
+    _rows           ndarray, point indices sorted by voxel
+    _offsets        ndarray, index of the first point of each streamline
+    _lengths        ndarray, number of points of each streamline
+    _data           ndarray | None, streamline points, shape(n, 3)
+    """
+
+    def __init__(self,
+                 sl: Streamlines | None = None,
+                 shape: vector3int | None = None,
+                 spacing: vector3float | None = None) -> None:
+        """
+        SisypheStreamlinesIndex instance constructor.
+
+        Parameters
+        ----------
+        sl : dipy.tracking.Streamlines | None
+            streamlines to index (default None, empty index)
+        shape : tuple[int, int, int] | list[int, int, int] | None
+            grid size of diffusion-weighted images
+        spacing : tuple[float, float, float] | list[float, float, float] | None
+            grid spacing of diffusion-weighted images
+        """
+        self._shape: tuple[int, int, int] = (0, 0, 0)
+        self._spacing: ndarray = ones(3)
+        self._fingerprint: str = ''
+        self._voxels: ndarray | None = None
+        self._starts: ndarray | None = None
+        self._rows: ndarray | None = None
+        self._offsets: ndarray | None = None
+        self._lengths: ndarray | None = None
+        self._data: ndarray | None = None
+        if sl is not None and shape is not None and spacing is not None: self.build(sl, shape, spacing)
+
+    def __str__(self) -> str:
+        """
+        Special overloaded method called by the built-in str() python function.
+
+        Returns
+        -------
+        str
+            conversion of SisypheStreamlinesIndex instance to str
+        """
+        buff = 'Streamlines count: {}\n'.format(self.count())
+        buff += 'Grid size: {0[0]} {0[1]} {0[2]}\n'.format(self._shape)
+        buff += 'Grid spacing: {0[0]:.2f} {0[1]:.2f} {0[2]:.2f}\n'.format(self._spacing)
+        if self._voxels is not None: buff += 'Non-empty voxels: {}\n'.format(len(self._voxels))
+        return buff
+
+    def __repr__(self) -> str:
+        """
+        Special overloaded method called by the built-in repr() python function.
+
+        Returns
+        -------
+        str
+            SisypheStreamlinesIndex instance representation
+        """
+        return 'SisypheStreamlinesIndex instance at <{}>\n'.format(str(id(self))) + self.__str__()
+
+    # Private methods
+
+    def _getVoxels(self, points: ndarray) -> ndarray:
+        # linear voxel index (x, y, z) order, points outside grid -> out of grid voxel
+        idx = (points / self._spacing).astype('int64')
+        out = (points < 0).any(axis=1) | (idx >= array(self._shape)).any(axis=1)
+        idx[out] = 0
+        r = (idx[:, 0] * self._shape[1] + idx[:, 1]) * self._shape[2] + idx[:, 2]
+        r[out] = self._shape[0] * self._shape[1] * self._shape[2]
+        return r
+
+    def _getRows(self, ids: ndarray) -> ndarray:
+        # point indices of voxels ids
+        sel = ids[isin(ids, self._voxels, assume_unique=True)]
+        pos = searchsorted(self._voxels, sel)
+        starts = self._starts[pos]
+        counts = self._starts[pos + 1] - starts
+        if counts.sum() == 0: return zeros(0, dtype='int64')
+        # concatenated ranges [start, start + count) of each selected voxel
+        ofs = zeros(len(counts), dtype='int64')
+        cumsum(counts[:-1], out=ofs[1:])
+        return self._rows[repeat(starts - ofs, counts) + arange(counts.sum())]
+
+    def _getRowsFromMask(self, mask: ndarray) -> ndarray:
+        # point indices of voxels in mask, points of the out of grid voxel are always returned
+        ids = mask.flatten().nonzero()[0]
+        return self._getRows(concatenate([ids, [self._shape[0] * self._shape[1] * self._shape[2]]]))
+
+    def _getTractsFromRows(self, rows: ndarray) -> ndarray:
+        return searchsorted(self._offsets, rows, side='right') - 1
+
+    def _getDilatedMask(self, mask: ndarray, radius: float) -> ndarray:
+        # voxels with centers within radius from a voxel center of mask
+        r = ceil(radius / self._spacing).astype('int64')
+        o = mgrid[-r[0]:r[0] + 1, -r[1]:r[1] + 1, -r[2]:r[2] + 1].astype('float64')
+        d = sqrt((o[0] * self._spacing[0]) ** 2 + (o[1] * self._spacing[1]) ** 2 + (o[2] * self._spacing[2]) ** 2)
+        return binary_dilation(mask, structure=d <= radius)
+
+    def _checkData(self) -> None:
+        if self._data is None: raise AttributeError('streamline points are not defined, use setStreamlines() method.')
+
+    # Public methods
+
+    def hasPoints(self) -> bool:
         """
-        Check whether the current SisypheBundleCollection instance is empty (no bundle).
+        Check whether the streamline points of the current SisypheStreamlinesIndex instance are defined. Points are
+        not saved in index file, setStreamlines() method must be called after loading.
 
         Returns
         -------
         bool
-            True if container is empty
+            True if points are defined
         """
-        return len(self._list) == 0
+        return self._data is not None
 
-    def clear(self) -> None:
+    def build(self, sl: Streamlines, shape: vector3int, spacing: vector3float) -> None:
         """
-        Remove all the SisypheBundle elements from the current SisypheBundleCollection instance.
+        Build the index of streamlines.
+
+        Parameters
+        ----------
+        sl : dipy.tracking.Streamlines
+            streamlines
+        shape : tuple[int, int, int] | list[int, int, int]
+            grid size of diffusion-weighted images
+        spacing : tuple[float, float, float] | list[float, float, float]
+            grid spacing of diffusion-weighted images
         """
-        self._list = list()
+        self._shape = tuple([int(v) for v in shape])
+        self._spacing = array(spacing, dtype='float64')
+        self._data, self._offsets, self._lengths = self.getCompactData(sl)
+        self._fingerprint = self.getFingerprint(self._data, self._lengths)
+        voxels = self._getVoxels(self._data)
+        dtype = 'int32' if len(voxels) < iinfo('int32').max else 'int64'
+        self._rows = argsort(voxels).astype(dtype)
+        voxels = voxels[self._rows]
+        self._voxels, starts = unique(voxels, return_index=True)
+        self._starts = concatenate([starts, [len(voxels)]]).astype('int64')
 
-    def remove(self, value: int | str | SisypheBundle) -> None:
+    def setStreamlines(self, sl: Streamlines) -> None:
         """
-        Remove a SisypheBundle element from the current SisypheBundleCollection instance.
+        Set the streamline points used by the current SisypheStreamlinesIndex instance (after loading from file).
 
         Parameters
         ----------
-        value : int | str | SisypheBundle
-            index or bundle name or SisypheBundle instance to remove
+        sl : dipy.tracking.Streamlines
+            indexed streamlines
         """
-        # value is SisypheBundle
-        if isinstance(value, SisypheBundle): self._list.remove(value)
-        # value is str or int
-        elif isinstance(value, (str, int)): self.pop(self.index(value))
-        else: raise TypeError('parameter type {} is not int, str or SisypheBundle.'.format(type(value)))
+        if self.isValid(sl): self._data = self.getCompactData(sl)[0]
+        else: raise ValueError('streamlines do not match index.')
 
-    def pop(self, key: int | str | SisypheBundle | None = None) -> SisypheBundle:
+    def isValid(self, sl: Streamlines) -> bool:
         """
-        Remove a SisypheBundle elements from the current SisypheBundleCollection instance and return it. If key is
-        None, removes and returns the last element.
+        Check whether the current SisypheStreamlinesIndex instance matches streamlines.
 
         Parameters
         ----------
-        key : int | str | SisypheBundle | None
-            index or bundle name or SisypheBundle to remove
+        sl : dipy.tracking.Streamlines
+            streamlines
 
         Returns
         -------
-        SisypheBundle
-            bundle removed from the container
+        bool
+            True if index matches streamlines
         """
-        if key is None: return self._list.pop()
-        # key is SisypheVolume arrayID str
-        if isinstance(key, (str, SisypheBundle)): key = self.index(key)
-        # key is int index
-        if isinstance(key, int): return self._list.pop(key)
-        else: raise TypeError('parameter type {} is not int or str.'.format(type(key)))
+        if self.isEmpty() or len(sl) != self.count(): return False
+        points, _, lengths = self.getCompactData(sl)
+        return self.getFingerprint(points, lengths) == self._fingerprint
 
-    def keys(self) -> list[str]:
+    def isEmpty(self) -> bool:
         """
-        Get the list of keys in the current SisypheBundleCollection instance container.
+        Check whether the current SisypheStreamlinesIndex instance is empty.
 
         Returns
         -------
-        list[str]
-            list of keys in the container
+        bool
+            True if empty
         """
-        return [k.getName() for k in self._list]
+        return self._voxels is None
 
-    def index(self, value: str | SisypheBundle) -> int:
+    def count(self) -> int:
         """
-         Index of a SisypheBundle element in the current SisypheBundleCollection instance container.
-
-        Parameters
-        ----------
-        value : str | SisypheBundle
-            bundle name or SisypheBundle
+        Get the number of streamlines indexed by the current SisypheStreamlinesIndex instance.
 
         Returns
         -------
         int
-            index of bundle in the container
-        """
-        keys = [k.getName() for k in self._list]
-        # value is SisypheBundle
-        if isinstance(value, SisypheBundle): value = value.getName()
-        # value is str
-        if isinstance(value, str): return keys.index(value)
-        else: raise TypeError('parameter type {} is not str or SisypheBundle.'.format(type(value)))
-
-    def reverse(self) -> None:
-        """
-        Reverses the order of the elements in the current SisypheBundleCollection instance container.
+            number of streamlines
         """
-        self._list.reverse()
-
-    def append(self, value: SisypheBundle) -> None:
-        """
-        Append a SisypheBundle element in the current SisypheBundleCollection instance container.
-
-        Parameters
-        ----------
-        value :  SisypheBundle
-            bundle to append in the container
-        """
-        if isinstance(value, SisypheBundle):
-            if value.getName() not in self: self._list.append(value)
-        else: raise TypeError('parameter type {} is not SisypheBundle.'.format(type(value)))
-
-    def insert(self, key: int | str | SisypheBundle, value: SisypheBundle) -> None:
-        """
-         Insert a SisypheBundle element at the position given by the key in the current SisypheBundleCollection
-         instance container.
-
-        Parameters
-        ----------
-        key : int | str | SisypheBundle | None
-            index or bundle name or SisypheBundle
-        value : SisypheBundle
-            bundle to insert in the container
-        """
-        if isinstance(value, SisypheBundle):
-            # value is SisypheBundle
-            if isinstance(key, SisypheBundle): key = key.getName()
-            # value is str
-            if isinstance(key, str): key = self.index(key)
-            # key is int index
-            if isinstance(key, int):
-                if 0 <= key < len(self._list):
-                    if value.getName() not in self._list: self._list.insert(key, value)
-                else: raise IndexError('parameter is out of range.')
-            else: raise TypeError('parameter type {} is not int, str or SisypheBundle.'.format(type(key)))
-        else: raise TypeError('parameter type {} is not SisypheBundle.'.format(type(value)))
+        if self._lengths is None: return 0
+        else: return len(self._lengths)
 
-    def copy(self) -> SisypheBundleCollection:
+    def getShape(self) -> tuple[int, int, int]:
         """
-        Copy the current SisypheBundleCollection instance container (Shallow copy of elements).
+        Get the grid size of the current SisypheStreamlinesIndex instance.
 
         Returns
         -------
-        SisypheBundleCollection
-            shallow copy of bundle
+        tuple[int, int, int]
+            grid size (x, y, z)
         """
-        bundle = SisypheBundleCollection()
-        for item in self._list:
-            bundle.append(item)
-        return bundle
+        return self._shape
 
-    def copyToList(self) -> list[SisypheBundle]:
+    def getSpacing(self) -> tuple[float, float, float]:
         """
-        Copy the current SisypheBundleCollection instance container to a list (Shallow copy of elements).
+        Get the grid spacing of the current SisypheStreamlinesIndex instance.
 
         Returns
         -------
-        list[SisypheBundle]
-            shallow copy of bundle to list
+        tuple[float, float, float]
+            grid spacing (x, y, z)
         """
-        return self._list.copy()
+        return tuple(self._spacing)
 
-    def getList(self) -> list[SisypheBundle]:
+    def getTractsInVoxel(self, v: vector3int) -> ndarray:
         """
-        Get the list attribute of the current SisypheBundleCollection instance container (Shallow copy of the elements).
+        Get the indices of streamlines crossing a voxel.
+
+        Parameters
+        ----------
+        v : tuple[int, int, int] | list[int, int, int]
+            voxel coordinates (x, y, z)
 
         Returns
         -------
-        list[SisypheBundle]
-            shallow copy of bundle to list
+        ndarray
+            sorted streamline indices
         """
-        return self._list
+        if self.isEmpty(): return zeros(0, dtype='int64')
+        ids = array([(int(v[0]) * self._shape[1] + int(v[1])) * self._shape[2] + int(v[2])])
+        return unique(self._getTractsFromRows(self._getRows(ids)))
 
-    def rename(self, old: str, new: str) -> None:
+    def roiSelection(self, roi: ndarray, tol: float, mode: str = 'any') -> ndarray:
         """
-        Rename a bundle of the current SisypheBundleCollection instance container.
+        Select streamlines near a ROI. Only points of voxels within tol from the ROI are processed.
 
         Parameters
         ----------
-        old : str
-            Old bundle name
-        new : str
-            New bundle name
-        """
-        if old in self:
-            idx = self.index(old)
-            self._list[idx].setName(new)
-        else: raise ValueError('{} is not a key of the current SisypheBundleCollection.'.format(old))
+        roi : ndarray
+            ROI voxel coordinates (x, y, z), shape(n, 3)
+        tol : float
+            a streamline point is near the ROI if it is within this distance, in mm, from the center of any ROI voxel
+        mode : str
+            - 'any' : any streamline point is within tol from ROI (Default)
+            - 'all' : all streamline points are within tol from ROI
+            - 'end' or 'either_end' : either of the end-points is within tol from ROI
 
-    # Public set operators
+        Returns
+        -------
+        ndarray
+            bool mask, one element for each streamline (True selected)
+        """
+        self._checkData()
+        r = zeros(self.count(), dtype='bool')
+        if len(roi) == 0: return r
+        tree = cKDTree(asarray(roi) * self._spacing + self._spacing / 2)
+        bound = tol + 1e-6
+        if mode in ('end', 'either_end'):
+            # end points only, no index required
+            ends = concatenate([self._offsets, self._offsets + self._lengths - 1])
+            d, _ = tree.query(self._data[ends], k=1, distance_upper_bound=bound)
+            near = d <= tol
+            return near[:self.count()] | near[self.count():]
+        # candidate points, voxels whose centers are within tol + half voxel diagonal from ROI voxel centers
+        mask = zeros(self._shape, dtype='bool')
+        roi = clip(asarray(roi), 0, array(self._shape) - 1)
+        mask[roi[:, 0], roi[:, 1], roi[:, 2]] = True
+        mask = self._getDilatedMask(mask, tol + sqrt((self._spacing ** 2).sum()) / 2)
+        rows = self._getRowsFromMask(mask)
+        if len(rows) > 0:
+            d, _ = tree.query(self._data[rows], k=1, distance_upper_bound=bound)
+            tracts = self._getTractsFromRows(rows[d <= tol])
+            if mode == 'all': r = bincount(tracts, minlength=self.count()) == self._lengths
+            else: r[tracts] = True
+        return r
 
-    def union(self, names: list[str, ], newname: str) -> None:
+    def sphereSelection(self, p: vector3float, radius: float) -> ndarray:
         """
-        Union of SisypheBundle elements of the current SisypheBundleCollection. Bundles are selected by their name
-        attributes. The resulting SisypheBundle is appended to the container.
+        Select streamlines with at least one point inside a sphere. Only points of voxels near the sphere are
+        processed.
 
         Parameters
         ----------
-        names : list[str, ]
-            list of bundle names
-        newname :
-            name of the new bundle (union result)
-        """
-        if newname not in self:
-            r = self[names[0]]
-            for name in names:
-                r.union(self[name])
-            r.setName(newname)
-            self.append(r)
-        else: raise ValueError('parameter {} already exists.'.format(newname))
+        p : tuple[float, float, float] | list[float, float, float]
+            coordinates of sphere center
+        radius : float
+            sphere radius in mm
 
-    def intersection(self, names: list[str, ], newname: str) -> None:
+        Returns
+        -------
+        ndarray
+            bool mask, one element for each streamline (True selected)
+        """
+        self._checkData()
+        r = zeros(self.count(), dtype='bool')
+        p = array(p, dtype='float64')
+        # candidate voxels, bounding box of the sphere
+        lo = clip(floor((p - radius) / self._spacing).astype('int64'), 0, array(self._shape) - 1)
+        hi = clip(floor((p + radius) / self._spacing).astype('int64'), 0, array(self._shape) - 1)
+        mask = zeros(self._shape, dtype='bool')
+        mask[lo[0]:hi[0] + 1, lo[1]:hi[1] + 1, lo[2]:hi[2] + 1] = True
+        rows = self._getRowsFromMask(mask)
+        if len(rows) > 0:
+            d = norm(self._data[rows] - p, axis=1)
+            r[self._getTractsFromRows(rows[d <= radius])] = True
+        return r
+
+    def planeSelection(self, p: vector3float, planes: list[bool]) -> ndarray:
         """
-        Intersection of SisypheBundle elements of the current SisypheBundleCollection. Bundles are selected by their
-        name attributes. The resulting SisyphusBundle is appended to the container.
+        Select streamlines crossing planes, in a single vectorised pass over streamline points. A streamline crosses a
+        plane if one of its points is on the opposite side of the plane from its first point.
 
         Parameters
         ----------
-        names : list[str, ]
-            list of bundle names
-        newname :
-            name of the new bundle (intersection result)
+        p : tuple[float, float, float] | list[float, float, float]
+            coordinates of the planes intersection
+        planes : list[bool]
+            - first bool, x-axis plane
+            - second bool, y-axis plane
+            - third bool, z-axis plane
+
+        Returns
+        -------
+        ndarray
+            bool mask, one element for each streamline (True selected)
         """
-        if newname not in self:
-            r = self[names[0]]
-            for name in names:
-                r.intersection(self[name])
-            r.setName(newname)
-            self.append(r)
-        else: raise ValueError('parameter {} already exists.'.format(newname))
+        self._checkData()
+        if self.count() == 0: return zeros(0, dtype='bool')
+        s = sign(self._data - array(p))
+        s0 = repeat(s[self._offsets], self._lengths, axis=0)
+        cross = ((s != s0) & array(planes, dtype='bool')).any(axis=1)
+        return logical_or.reduceat(cross, self._offsets)
 
-    def difference(self, names: list[str, ], newname: str) -> None:
+    def saveAs(self, filename: str) -> None:
         """
-        Difference of SisypheBundle elements of the current SisypheBundleCollection. Bundles are selected by their
-        name attributes. The resulting SisyphusBundle is appended to the container.
+        Save the current SisypheStreamlinesIndex instance (.xsindex).
 
         Parameters
         ----------
-        names : list[str, ]
-            list of bundle names
-        newname :
-            name of the new bundle (difference result)
+        filename : str
+            index file name
         """
-        if newname not in self:
-            r = self[names[0]]
-            for name in names:
-                r.difference(self[name])
-            r.setName(newname)
-            self.append(r)
-        else: raise ValueError('parameter {} already exists.'.format(newname))
+        if not self.isEmpty():
+            filename = splitext(filename)[0] + self._FILEEXT
+            # file object, savez does not append .npz extension
+            with open(filename, 'wb') as f:
+                savez(f, shape=array(self._shape), spacing=self._spacing, fingerprint=array(self._fingerprint),
+                      voxels=self._voxels, starts=self._starts, rows=self._rows,
+                      offsets=self._offsets, lengths=self._lengths)
 
-    def symDifference(self, names: list[str, ], newname: str) -> None:
+    def load(self, filename: str) -> None:
         """
-        Symmetric difference of SisypheBundle elements of the current SisypheBundleCollection. Bundles are selected by
-        their name attributes. The resulting SisyphusBundle is appended to the container.
+        Load the current SisypheStreamlinesIndex instance (.xsindex). Streamline points are not saved in index file,
+        setStreamlines() method must be called before selections.
 
         Parameters
         ----------
-        names : list[str, ]
-            list of bundle names
-        newname :
-            name of the new bundle (symmetric difference result)
+        filename : str
+            index file name
         """
-        if newname not in self:
-            r = self[names[0]]
-            for name in names:
-                r.symDifference(self[name])
-            r.setName(newname)
-            self.append(r)
-        else: raise ValueError('parameter {} already exists.'.format(newname))
+        filename = splitext(filename)[0] + self._FILEEXT
+        if exists(filename):
+            with open(filename, 'rb') as f:
+                d = npload(f)
+                self._shape = tuple([int(v) for v in d['shape']])
+                self._spacing = d['spacing']
+                self._fingerprint = str(d['fingerprint'])
+                self._voxels = d['voxels']
+                self._starts = d['starts']
+                self._rows = d['rows']
+                self._offsets = d['offsets']
+                self._lengths = d['lengths']
+            self._data = None
+        else: raise IOError('No such file {}'.format(filename))
 
 
 class SisypheStreamlines(object):
@@ -3436,22 +4785,26 @@ class SisypheStreamlines(object):
         - maps processing (density, path length, connectivity)
         - IO methods to and from Tck, Trk, Vtk, Vtp, Fib, Dpy and numpy formats
 
+    PySisyphe Streamlines (.xtracts) files can be loaded memory-mapped, streamline points and offsets are then
+    numpy.memmap views of the file, and are read on demand.
+
     Inheritance
     ~~~~~~~~~~~
 
     object -> SisypheStreamlines
 
     Creation: 26/10/2023
-    Last Revision: 19/06/2025
+    Last Revision: 16/10/2026
     """
 
     __slots__ = ['_index', '_ID', '_shape', '_spacing', '_bundles', '_streamlines',
-                 '_regstep', '_dirname', '_trf', '_whole', '_centroid', '_atlas']
+                 '_regstep', '_dirname', '_trf', '_whole', '_centroid', '_atlas', '_spindex']
 
     # Class constants
 
     _DEFAULTNAME = 'tractogram'
     _FILEEXT = '.xtracts'
+    _CHUNKSIZE = 100000
     TRK, TCK, VTK, VTP, FIB, NPZ, DPY = '.trk', '.tck', '.vtk', '.vtp', '.fib', '.npz', '.dpy'
     _TRACTSEXT = [_FILEEXT, TRK, TCK, VTK, VTP, FIB, NPZ, DPY]
     _ATLASBDL = {'WHOLE': 'Whole Brain Tractogram',
@@ -3814,6 +5167,7 @@ class SisypheStreamlines(object):
     _whole          bool, True if whole brain streamlines
     _centroid       bool, True if bundle centroid streamline
     _atlas          bool, True if atlas streamlines
+    _spindex        SisypheStreamlinesIndex | None, spatial index (voxels to streamline points)
     _trf            ndarray | None, atlas to streamlines space affine transformation
     """
 
@@ -3842,6 +5196,7 @@ class SisypheStreamlines(object):
         self._centroid: bool = False
         self._atlas: bool = False
         self._trf: ndarray | None = None
+        self._spindex: SisypheStreamlinesIndex | None = None
         if sl is None or not isinstance(sl, (ndarray, Streamlines)):
             self._streamlines = Streamlines()
             bundle = SisypheBundle()
@@ -3974,6 +5329,76 @@ class SisypheStreamlines(object):
 
     # Private methods
 
+    # < Revision 16/10/2026
+    # vectorised metrics computed on flat point buffer of streamlines
+    @staticmethod
+    def _bufferSum(values: ndarray, lengths: ndarray) -> ndarray:
+        # sum of point values for each streamline
+        n = len(lengths)
+        ids = repeat(arange(n), lengths)
+        if values.ndim == 1: return bincount(ids, weights=values, minlength=n)
+        else: return stack([bincount(ids, weights=values[:, i], minlength=n) for i in range(values.shape[1])], axis=1)
+
+    @staticmethod
+    def _bufferGradient(values: ndarray, offsets: ndarray, lengths: ndarray) -> ndarray:
+        # numpy.gradient along axis 0, computed separately for each streamline
+        r = zeros(values.shape, dtype='float64')
+        r[1:-1] = (values[2:] - values[:-2]) / 2.0
+        first = offsets[lengths > 1]
+        last = first + lengths[lengths > 1] - 1
+        r[first] = values[first + 1] - values[first]
+        r[last] = values[last] - values[last - 1]
+        r[offsets[lengths == 1]] = 0.0
+        return r
+
+    @classmethod
+    def _bufferLengths(cls, points: ndarray, offsets: ndarray, lengths: ndarray) -> ndarray:
+        # arc length of each streamline, same as dipy.tracking.metrics.length
+        if len(points) < 2: return zeros(len(lengths), dtype='float64')
+        d = zeros(len(points), dtype='float64')
+        d[:-1] = norm(points[1:] - points[:-1], axis=1)
+        # segments between the last point of a streamline and the first point of the next one
+        b = offsets[1:] - 1
+        d[b[b >= 0]] = 0.0
+        return cls._bufferSum(d, lengths)
+
+    @classmethod
+    def _bufferMeanCurvatures(cls, points: ndarray, offsets: ndarray, lengths: ndarray) -> ndarray:
+        # mean curvature of each streamline, same as dipy.tracking.metrics.mean_curvature
+        d1 = cls._bufferGradient(points, offsets, lengths)
+        d2 = cls._bufferGradient(d1, offsets, lengths)
+        k = norm(cross(d1, d2), axis=1) / (norm(d1, axis=1) ** 3)
+        # single point streamline, curvature = 0.0
+        k[repeat(lengths < 2, lengths)] = 0.0
+        r = zeros(len(lengths), dtype='float64')
+        valid = lengths > 1
+        r[valid] = cls._bufferSum(k, lengths)[valid] / lengths[valid]
+        return r
+
+    def _getBundleBuffer(self, bundle: str) -> tuple[ndarray, ndarray, ndarray]:
+        # points, offsets and lengths of the streamlines of a bundle, as contiguous arrays
+        index = self._bundles[bundle].getList()
+        if len(index) == len(self._streamlines): return SisypheStreamlinesIndex.getCompactData(self._streamlines)
+        # noinspection PyProtectedMember
+        lengths = asarray(self._streamlines._lengths, dtype='int64')[index]
+        # noinspection PyProtectedMember
+        starts = asarray(self._streamlines._offsets, dtype='int64')[index]
+        offsets = zeros(len(lengths), dtype='int64')
+        if len(lengths) > 0: cumsum(lengths[:-1], out=offsets[1:])
+        # noinspection PyProtectedMember
+        points = self._streamlines._data[repeat(starts - offsets, lengths) + arange(lengths.sum())]
+        return points, offsets, lengths
+
+    def _getBundleScalarsFromVolume(self, vol: SisypheVolume, bundle: str) -> tuple[ndarray, ndarray]:
+        # scalar values of all bundle points in a single interpolation pass, and streamline lengths
+        points, offsets, lengths = self._getBundleBuffer(bundle)
+        img = vol.getNumpy(defaultshape=False)
+        affine = diag(list(vol.getSpacing()) + [1.0])
+        if len(points) > 0: values = asarray(values_from_volume(img, points[None, :, :], affine)).reshape(-1)
+        else: values = zeros(0, dtype='float64')
+        return values, lengths
+    # Revision 16/10/2026 >
+
     def _load(self, filename: str, loadfunc: Callable) -> None:
         if splitext(filename)[1] == '.trk': hdr = 'same'
         else:
@@ -3996,6 +5421,26 @@ class SisypheStreamlines(object):
         self._dirname = dirname(filename)
         if self._dirname == '': getcwd()
 
+    def _roiSelectionMask(self,
+                          rois: SisypheROICollection,
+                          include: list[bool],
+                          mode: str,
+                          tol: float,
+                          wait: DialogWait | None = None) -> ndarray:
+        # streamlines near all inclusion ROIs and not near any exclusion ROI, bool mask
+        index = self.getSpatialIndex()
+        if wait is not None:
+            wait.setProgressRange(0, rois.count())
+            wait.setCurrentProgressValue(0)
+            wait.progressVisibilityOn()
+        r = ones(self.count(), dtype='bool')
+        for i in range(rois.count()):
+            m = index.roiSelection(rois[i].toIndexes(numpy=True), tol, mode)
+            if include[i]: r &= m
+            else: r &= ~m
+            if wait is not None: wait.incCurrentProgressValue()
+        return r
+
     def _save(self, bundle: str, savefunc: Callable) -> None:
         if bundle == 'all': bundle = self._bundles[0].getName()
         filename = join(self._dirname, bundle)
@@ -5339,22 +6784,27 @@ class SisypheStreamlines(object):
         """
         if bundle == 'all': bundle = self._bundles[0].getName()
         if bundle in self._bundles:
-            # noinspection PyUnresolvedReferences
-            i: cython.int
-            # noinspection PyUnresolvedReferences,PyTypeHints
-            r: list[cython.int] = list()
+            # < Revision 16/10/2026
+            # voxels to streamline points index, only points near sphere are processed
+            # r: list[cython.int] = list()
+            # bundleout = SisypheBundle()
+            # if include:
+            #     for i in range(self._bundles[bundle].count()):
+            #         idx = self._bundles[bundle][i]
+            #         if inside_sphere(self._streamlines[idx], p, radius) > 0:
+            #             r.append(idx)
+            # else:
+            #     for i in range(self._bundles[bundle].count()):
+            #         idx = self._bundles[bundle][i]
+            #         if inside_sphere(self._streamlines[idx], p, radius) == 0:
+            #             r.append(idx)
+            # if len(r) > 0: bundleout.appendTracts(r)
+            mask = self.getSpatialIndex().sphereSelection(p, radius) == include
+            idx = array(self._bundles[bundle].getList(), dtype='int64')
+            r = idx[mask[idx]].tolist()
             bundleout = SisypheBundle()
-            if include:
-                for i in range(self._bundles[bundle].count()):
-                    idx = self._bundles[bundle][i]
-                    if inside_sphere(self._streamlines[idx], p, radius) > 0:
-                        r.append(idx)
-            else:
-                for i in range(self._bundles[bundle].count()):
-                    idx = self._bundles[bundle][i]
-                    if inside_sphere(self._streamlines[idx], p, radius) == 0:
-                        r.append(idx)
             if len(r) > 0: bundleout.appendTracts(r)
+            # Revision 16/10/2026 >
             if inplace:
                 bundleout.setName(bundle)
                 self._bundles[bundle] = bundleout
@@ -5396,34 +6846,30 @@ class SisypheStreamlines(object):
         """
         if bundle == 'all': bundle = self._bundles[0].getName()
         if bundle in self._bundles:
-            # noinspection PyUnresolvedReferences
-            i: cython.int
-            # noinspection PyUnresolvedReferences
-            j: cython.int
-            # noinspection PyUnresolvedReferences
-            k: cython.int
-            p = array(p)
-            planes = array(planes)[:3]
+            # < Revision 16/10/2026
+            # single vectorised pass over streamline points
+            # p = array(p)
+            # planes = array(planes)[:3]
+            # bundleout = SisypheBundle()
+            # r: list[cython.int] = list()
+            # for i in range(self._bundles[bundle].count()):
+            #     idx = self._bundles[bundle][i]
+            #     sl = self._streamlines[idx]
+            #     s0 = sign(sl[0] - p)
+            #     flag = not include
+            #     for j in range(len(sl)-1, 0, -1):
+            #         s = sign(sl[j] - p)
+            #         cross = s != s0
+            #         cross = cross & planes
+            #         if any(cross):
+            #             flag = include
+            #             break
+            #     if flag: r.append(idx)
+            mask = self.getSpatialIndex().planeSelection(p, list(planes)[:3]) == include
+            idx = self._bundles[bundle].getList()
             bundleout = SisypheBundle()
-            # noinspection PyUnresolvedReferences,PyTypeHints
-            r: list[cython.int] = list()
-            for i in range(self._bundles[bundle].count()):
-                idx = self._bundles[bundle][i]
-                sl = self._streamlines[idx]
-                s0 = sign(sl[0] - p)
-                flag = not include
-                for j in range(len(sl)-1, 0, -1):
-                    s = sign(sl[j] - p)
-                    cross = s != s0
-                    # < Revision 11/04/2025
-                    # buf fix, cross = cross and planes
-                    cross = cross & planes
-                    # Revision 11/04/2025 >
-                    if any(cross):
-                        flag = include
-                        break
-                if flag: r.append(idx)
-            bundleout.appendTracts(r)
+            bundleout.appendTracts(idx[mask[idx]])
+            # Revision 16/10/2026 >
             if inplace:
                 bundleout.setName(bundle)
                 self._bundles[bundle] = bundleout
@@ -5446,19 +6892,26 @@ class SisypheStreamlines(object):
         """
         if bundle == 'all': bundle = self._bundles[0].getName()
         if bundle in self._bundles:
-            # noinspection PyUnresolvedReferences
-            i: cython.int
-            r: list[float] = list()
+            # < Revision 16/10/2026
+            # vectorised on flat point buffer
+            # i: cython.int
+            # r: list[float] = list()
+            # reg, step = self.getStepSize(self._streamlines[0])
+            # if reg:
+            #     for i in range(self._bundles[bundle].count()):
+            #         index = self._bundles[bundle][i]
+            #         r.append(step * len(self._streamlines[index]))
+            # else:
+            #     for i in range(self._bundles[bundle].count()):
+            #         index = self._bundles[bundle][i]
+            #         r.append(length(self._streamlines[index]))
+            # return array(r)
             reg, step = self.getStepSize(self._streamlines[0])
             if reg:
-                for i in range(self._bundles[bundle].count()):
-                    index = self._bundles[bundle][i]
-                    r.append(step * len(self._streamlines[index]))
-            else:
-                for i in range(self._bundles[bundle].count()):
-                    index = self._bundles[bundle][i]
-                    r.append(length(self._streamlines[index]))
-            return array(r)
+                # noinspection PyProtectedMember
+                return step * asarray(self._streamlines._lengths, dtype='float64')[self._bundles[bundle].getList()]
+            else: return self._bufferLengths(*self._getBundleBuffer(bundle))
+            # Revision 16/10/2026 >
         else: raise ValueError('{} invalid bundle name.'.format(bundle))
 
     def bundleLengthStatistics(self, bundle: str = 'all') -> dict[str: float]:
@@ -5527,13 +6980,16 @@ class SisypheStreamlines(object):
         """
         if bundle == 'all': bundle = self._bundles[0].getName()
         if bundle in self._bundles:
-            # noinspection PyUnresolvedReferences
-            i: cython.int
-            r: list[float] = list()
-            for i in range(self._bundles[bundle].count()):
-                index = self._bundles[bundle][i]
-                r.append(self.streamlineMeanCurvature(index))
-            return array(r)
+            # < Revision 16/10/2026
+            # vectorised on flat point buffer
+            # i: cython.int
+            # r: list[float] = list()
+            # for i in range(self._bundles[bundle].count()):
+            #     index = self._bundles[bundle][i]
+            #     r.append(self.streamlineMeanCurvature(index))
+            # return array(r)
+            return self._bufferMeanCurvatures(*self._getBundleBuffer(bundle))
+            # Revision 16/10/2026 >
         else: raise ValueError('{} invalid bundle name.'.format(bundle))
 
     def bundleMeanCurvatureStatistics(self, bundle: str = 'all') -> dict[str: float]:
@@ -5708,13 +7164,18 @@ class SisypheStreamlines(object):
         """
         if bundle == 'all': bundle = self._bundles[0].getName()
         if bundle in self._bundles:
-            # noinspection PyUnresolvedReferences
-            i: cython.int
-            r: list[vector3float] = list()
-            for i in range(self._bundles[bundle].count()):
-                index = self._bundles[bundle][i]
-                r.append(self.streamlineCenterOfMass(index))
-            return r
+            # < Revision 16/10/2026
+            # vectorised on flat point buffer
+            # i: cython.int
+            # r: list[vector3float] = list()
+            # for i in range(self._bundles[bundle].count()):
+            #     index = self._bundles[bundle][i]
+            #     r.append(self.streamlineCenterOfMass(index))
+            # return r
+            points, offsets, lengths = self._getBundleBuffer(bundle)
+            r = self._bufferSum(points, lengths) / lengths.clip(min=1)[:, None]
+            return list(r)
+            # Revision 16/10/2026 >
         else: raise ValueError('{} invalid bundle name.'.format(bundle))
 
     def bundleCosineDistanceBetweenEndVectors(self, bundle: str = 'all') -> ndarray:
@@ -5734,19 +7195,30 @@ class SisypheStreamlines(object):
         """
         if bundle == 'all': bundle = self._bundles[0].getName()
         if bundle in self._bundles:
-            # noinspection PyUnresolvedReferences
-            i: cython.int
-            r: list[float] = list()
-            for i in range(self._bundles[bundle].count()):
-                index = self._bundles[bundle][i]
-                sl = self._streamlines[index]
-                if len(sl) > 3:
-                    s1 = sl[0] - sl[1]
-                    s2 = sl[-2] - sl[-1]
-                    c = dot(s1, s2) / (norm(s1) * norm(s2))
-                    r.append(c)
-                else: r.append(1.0)
-            return array(r)
+            # < Revision 16/10/2026
+            # vectorised on flat point buffer
+            # i: cython.int
+            # r: list[float] = list()
+            # for i in range(self._bundles[bundle].count()):
+            #     index = self._bundles[bundle][i]
+            #     sl = self._streamlines[index]
+            #     if len(sl) > 3:
+            #         s1 = sl[0] - sl[1]
+            #         s2 = sl[-2] - sl[-1]
+            #         c = dot(s1, s2) / (norm(s1) * norm(s2))
+            #         r.append(c)
+            #     else: r.append(1.0)
+            # return array(r)
+            points, offsets, lengths = self._getBundleBuffer(bundle)
+            r = ones(len(lengths), dtype='float64')
+            valid = lengths > 3
+            first = offsets[valid]
+            last = first + lengths[valid] - 1
+            s1 = points[first] - points[first + 1]
+            s2 = points[last - 1] - points[last]
+            r[valid] = (s1 * s2).sum(axis=1) / (norm(s1, axis=1) * norm(s2, axis=1))
+            return r
+            # Revision 16/10/2026 >
         else: raise ValueError('{} invalid bundle name.'.format(bundle))
 
     def bundleEuclideanDistanceBetweenEndPoints(self, bundle: str = 'all') -> ndarray:
@@ -5766,17 +7238,26 @@ class SisypheStreamlines(object):
         """
         if bundle == 'all': bundle = self._bundles[0].getName()
         if bundle in self._bundles:
-            # noinspection PyUnresolvedReferences
-            i: cython.int
-            r: list[float] = list()
-            for i in range(self._bundles[bundle].count()):
-                index = self._bundles[bundle][i]
-                sl = self._streamlines[index]
-                if len(sl) > 1:
-                    d = sqrt(((sl[0] - sl[-1]) ** 2).sum())
-                    r.append(d)
-                else: r.append(0.0)
-            return array(r)
+            # < Revision 16/10/2026
+            # vectorised on flat point buffer
+            # i: cython.int
+            # r: list[float] = list()
+            # for i in range(self._bundles[bundle].count()):
+            #     index = self._bundles[bundle][i]
+            #     sl = self._streamlines[index]
+            #     if len(sl) > 1:
+            #         d = sqrt(((sl[0] - sl[-1]) ** 2).sum())
+            #         r.append(d)
+            #     else: r.append(0.0)
+            # return array(r)
+            points, offsets, lengths = self._getBundleBuffer(bundle)
+            r = zeros(len(lengths), dtype='float64')
+            valid = lengths > 1
+            first = offsets[valid]
+            last = first + lengths[valid] - 1
+            r[valid] = norm(points[first] - points[last], axis=1)
+            return r
+            # Revision 16/10/2026 >
         else: raise ValueError('{} invalid bundle name.'.format(bundle))
 
     def bundleScalarsFromVolume(self, vol: SisypheVolume, bundle: str = 'all') -> list[ndarray]:
@@ -5797,10 +7278,15 @@ class SisypheStreamlines(object):
         """
         if bundle == 'all': bundle = self._bundles[0].getName()
         if bundle in self._bundles:
-            sl = self.getStreamlinesFromBundle(bundle)
-            img = vol.getNumpy(defaultshape=False)
-            affine = diag(list(vol.getSpacing()) + [1.0])
-            return values_from_volume(img, sl, affine)
+            # < Revision 16/10/2026
+            # one interpolation pass on flat point buffer
+            # sl = self.getStreamlinesFromBundle(bundle)
+            # img = vol.getNumpy(defaultshape=False)
+            # affine = diag(list(vol.getSpacing()) + [1.0])
+            # return values_from_volume(img, sl, affine)
+            values, lengths = self._getBundleScalarsFromVolume(vol, bundle)
+            return split(values, cumsum(lengths)[:-1])
+            # Revision 16/10/2026 >
         else: raise ValueError('{} invalid bundle name.'.format(bundle))
 
     def bundleScalarStatisticsFromVolume(self, vol: SisypheVolume, bundle: str = 'all') -> dict[str: float]:
@@ -5831,8 +7317,13 @@ class SisypheStreamlines(object):
                 - 'skewness', skewness
                 - 'kurtosis', kurtosis
         """
-        data = self.bundleScalarsFromVolume(vol, bundle)
-        data = array(data).flatten()
+        # < Revision 16/10/2026
+        # data = self.bundleScalarsFromVolume(vol, bundle)
+        # data = array(data).flatten()
+        if bundle == 'all': bundle = self._bundles[0].getName()
+        if bundle not in self._bundles: raise ValueError('{} invalid bundle name.'.format(bundle))
+        data = self._getBundleScalarsFromVolume(vol, bundle)[0]
+        # Revision 16/10/2026 >
         r = describe(data)
         stats = dict()
         # noinspection PyUnresolvedReferences
@@ -5875,8 +7366,11 @@ class SisypheStreamlines(object):
         """
         if bundle == 'all': bundle = self._bundles[0].getName()
         if bundle in self._bundles:
-            data = self.bundleScalarsFromVolume(vol, bundle)
-            data = array(data).flatten()
+            # < Revision 16/10/2026
+            # data = self.bundleScalarsFromVolume(vol, bundle)
+            # data = array(data).flatten()
+            data = self._getBundleScalarsFromVolume(vol, bundle)[0]
+            # Revision 16/10/2026 >
             # noinspection PyTypeChecker
             return histogram(data, bins)
         else: raise ValueError('{} invalid bundle name.'.format(bundle))
@@ -5957,11 +7451,15 @@ class SisypheStreamlines(object):
         """
         if bundle == 'all': bundle = self._bundles[0].getName()
         if bundle in self._bundles:
-            tracts = list()
-            for idx in self._bundles[bundle]:
-                if length(self._streamlines[idx]) >= l: tracts.append(idx)
+            # < Revision 16/10/2026
+            # tracts = list()
+            # for idx in self._bundles[bundle]:
+            #     if length(self._streamlines[idx]) >= l: tracts.append(idx)
+            # r.appendTracts(tracts)
+            lengths = self._bufferLengths(*self._getBundleBuffer(bundle))
             r = SisypheBundle()
-            r.appendTracts(tracts)
+            r.appendTracts(self._bundles[bundle].getList()[lengths >= l])
+            # Revision 16/10/2026 >
             return r
         else: raise ValueError('{} invalid bundle name.'.format(bundle))
 
@@ -5983,11 +7481,15 @@ class SisypheStreamlines(object):
         """
         if bundle == 'all': bundle = self._bundles[0].getName()
         if bundle in self._bundles:
-            tracts = list()
-            for idx in self._bundles[bundle]:
-                if length(self._streamlines[idx]) <= l: tracts.append(idx)
+            # < Revision 16/10/2026
+            # tracts = list()
+            # for idx in self._bundles[bundle]:
+            #     if length(self._streamlines[idx]) <= l: tracts.append(idx)
+            # r.appendTracts(tracts)
+            lengths = self._bufferLengths(*self._getBundleBuffer(bundle))
             r = SisypheBundle()
-            r.appendTracts(tracts)
+            r.appendTracts(self._bundles[bundle].getList()[lengths <= l])
+            # Revision 16/10/2026 >
             return r
         else: raise ValueError('{} invalid bundle name.'.format(bundle))
 
@@ -6034,37 +7536,38 @@ class SisypheStreamlines(object):
             mode = mode.lower()
             if mode not in ('any', 'all', 'end'): mode = 'any'
             elif mode == 'end': mode = 'either_end'
-            incl: list = list()
-            excl: list = list()
-            sp = array(self._spacing)
-            sp2 = sp / 2
-            for i in range(rois.count()):
-                roi = rois[i].toIndexes(numpy=True)
-                roi = (roi * sp) + sp2
-                if include[i]: incl.append(roi)
-                else: excl.append(roi)
-            tracts = list()
+            # < Revision 16/10/2026
+            # voxels to streamline points index, only points near ROIs are processed
+            # incl: list = list()
+            # excl: list = list()
+            # sp = array(self._spacing)
+            # sp2 = sp / 2
+            # for i in range(rois.count()):
+            #     roi = rois[i].toIndexes(numpy=True)
+            #     roi = (roi * sp) + sp2
+            #     if include[i]: incl.append(roi)
+            #     else: excl.append(roi)
+            # tracts = list()
+            # bundle = self._bundles[bundle].getList()
+            # for i in range(len(bundle)):
+            #     sl = self._streamlines[bundle[i]]
+            #     tag: bool = True
+            #     if len(excl) > 0:
+            #         for select in excl:
+            #             if streamline_near_roi(sl, select, tol, mode):
+            #                 tag = False
+            #                 break
+            #     if tag and len(incl) > 0:
+            #         for select in incl:
+            #             if not streamline_near_roi(sl, select, tol, mode):
+            #                 tag = False
+            #                 break
+            #         if tag: tracts.append(bundle[i])
+            mask = self._roiSelectionMask(rois, include, mode, tol)
             bundle = self._bundles[bundle].getList()
-            # noinspection PyUnresolvedReferences
-            i: cython.int
-            for i in range(len(bundle)):
-                sl = self._streamlines[bundle[i]]
-                tag: bool = True
-                if len(excl) > 0:
-                    for select in excl:
-                        if streamline_near_roi(sl, select, tol, mode):
-                            tag = False
-                            break
-                if tag and len(incl) > 0:
-                    for select in incl:
-                        if not streamline_near_roi(sl, select, tol, mode):
-                            tag = False
-                            break
-                    if tag: tracts.append(bundle[i])
-                # if len(list(select_by_rois([sl], affine, rois2, include, mode=mode, tol=tol))) > 0:
-                #    tracts.append(bundle[i])
             r = SisypheBundle()
-            r.appendTracts(tracts)
+            r.appendTracts(bundle[mask[bundle]])
+            # Revision 16/10/2026 >
             return r
         else: raise ValueError('{} invalid bundle name.'.format(bundle))
 
@@ -6649,6 +8152,86 @@ class SisypheStreamlines(object):
             tracts.appendBundle(self.getSisypheStreamlinesFromBundle(bundle), bundle)
         else: raise ValueError('{} invalid bundle name.'.format(bundle))
 
+    # Public spatial index methods
+
+    def buildSpatialIndex(self) -> SisypheStreamlinesIndex:
+        """
+        Build the spatial index (voxels to streamline points) of the current SisypheStreamlines instance. The index is
+        used by ROI, sphere and plane selection methods.
+
+        Returns
+        -------
+        SisypheStreamlinesIndex
+            spatial index
+        """
+        self._spindex = SisypheStreamlinesIndex(self._streamlines, self._shape, self._spacing)
+        return self._spindex
+
+    def getSpatialIndex(self) -> SisypheStreamlinesIndex:
+        """
+        Get the spatial index (voxels to streamline points) of the current SisypheStreamlines instance. The index is
+        built, or rebuilt if it no longer matches streamlines, DWI shape or spacing.
+
+        Returns
+        -------
+        SisypheStreamlinesIndex
+            spatial index
+        """
+        idx = self._spindex
+        if idx is None or list(idx.getShape()) != [int(v) for v in self._shape] or \
+                not allclose(idx.getSpacing(), self._spacing) or not idx.isValid(self._streamlines):
+            idx = self.buildSpatialIndex()
+        elif not idx.hasPoints():
+            # index loaded from file
+            idx.setStreamlines(self._streamlines)
+        return idx
+
+    def hasSpatialIndex(self) -> bool:
+        """
+        Check whether the spatial index of the current SisypheStreamlines instance is built.
+
+        Returns
+        -------
+        bool
+            True if spatial index is built
+        """
+        return self._spindex is not None and not self._spindex.isEmpty()
+
+    def clearSpatialIndex(self) -> None:
+        """
+        Clear the spatial index of the current SisypheStreamlines instance.
+        """
+        self._spindex = None
+
+    def saveSpatialIndex(self, filename: str = '') -> None:
+        """
+        Save the spatial index of the current SisypheStreamlines instance (.xsindex). If the filename parameter is
+        empty, the index is saved alongside the PySisyphe Streamlines (.xtracts) file.
+
+        Parameters
+        ----------
+        filename : str
+            index file name
+        """
+        if filename == '': filename = join(self.getDirname(), self.getName() + SisypheStreamlinesIndex.getFileExt())
+        self.getSpatialIndex().saveAs(filename)
+
+    def loadSpatialIndex(self, filename: str = '') -> None:
+        """
+        Load the spatial index of the current SisypheStreamlines instance (.xsindex). If the filename parameter is
+        empty, the index is loaded from the file saved alongside the PySisyphe Streamlines (.xtracts) file.
+
+        Parameters
+        ----------
+        filename : str
+            index file name
+        """
+        if filename == '': filename = join(self.getDirname(), self.getName() + SisypheStreamlinesIndex.getFileExt())
+        idx = SisypheStreamlinesIndex()
+        idx.load(filename)
+        idx.setStreamlines(self._streamlines)
+        self._spindex = idx
+
     # Public streamlines processing methods
 
     def getStreamlines(self) -> Streamlines:
@@ -6726,17 +8309,27 @@ class SisypheStreamlines(object):
         if bundle == 'all' or bundle == self._bundles[0].getName(): sl = self._streamlines
         elif bundle in self._bundles: sl = self._streamlines[self._bundles[bundle].getList()]
         if sl is not None:
-            slout = list()
+            # < Revision 16/10/2026
+            # vectorised length threshold on flat point buffer
+            # slout = list()
+            # reg, step = self.getStepSize(sl[0])
+            # if reg:
+            #     l = int(l / step)
+            #     for sli in sl:
+            #         if len(sli) >= l: slout.append(sli)
+            # else:
+            #     for sli in sl:
+            #         if length(sli) >= l: slout.append(sli)
+            # if len(slout) > 0:
+            #     sl = SisypheStreamlines(Streamlines(slout))
             reg, step = self.getStepSize(sl[0])
-            if reg:
-                l = int(l / step)
-                for sli in sl:
-                    if len(sli) >= l: slout.append(sli)
-            else:
-                for sli in sl:
-                    if length(sli) >= l: slout.append(sli)
+            # noinspection PyProtectedMember
+            if reg: mask = asarray(sl._lengths) >= int(l / step)
+            else: mask = self._bufferLengths(*SisypheStreamlinesIndex.getCompactData(sl)) >= l
+            slout = mask.nonzero()[0]
             if len(slout) > 0:
-                sl = SisypheStreamlines(Streamlines(slout))
+                sl = SisypheStreamlines(sl[slout].copy())
+            # Revision 16/10/2026 >
                 sl.copyAttributesFrom(self)
                 sl.setName(bundle)
                 return sl
@@ -6765,17 +8358,27 @@ class SisypheStreamlines(object):
         if bundle == 'all' or bundle == self._bundles[0].getName(): sl = self._streamlines
         elif bundle in self._bundles: sl = self._streamlines[self._bundles[bundle].getList()]
         if sl is not None:
-            slout = list()
+            # < Revision 16/10/2026
+            # vectorised length threshold on flat point buffer
+            # slout = list()
+            # reg, step = self.getStepSize(sl[0])
+            # if reg:
+            #     l = int(l / step)
+            #     for sli in sl:
+            #         if len(sli) >= l: slout.append(sli)
+            # else:
+            #     for sli in sl:
+            #         if length(sli) <= l: slout.append(sli)
+            # if len(slout) > 0:
+            #     sl = SisypheStreamlines(Streamlines(slout))
             reg, step = self.getStepSize(sl[0])
-            if reg:
-                l = int(l / step)
-                for sli in sl:
-                    if len(sli) >= l: slout.append(sli)
-            else:
-                for sli in sl:
-                    if length(sli) <= l: slout.append(sli)
+            # noinspection PyProtectedMember
+            if reg: mask = asarray(sl._lengths) <= int(l / step)
+            else: mask = self._bufferLengths(*SisypheStreamlinesIndex.getCompactData(sl)) <= l
+            slout = mask.nonzero()[0]
             if len(slout) > 0:
-                sl = SisypheStreamlines(Streamlines(slout))
+                sl = SisypheStreamlines(sl[slout].copy())
+            # Revision 16/10/2026 >
                 sl.copyAttributesFrom(self)
                 sl.setName(bundle)
                 return sl
@@ -7055,49 +8658,21 @@ class SisypheStreamlines(object):
         SisypheStreamlines
              selected streamlines
         """
-        if wait is not None:
-            wait.progressVisibilityOn()
-            wait.setProgressRange(0, self.count() // 100)
+        # < Revision 16/10/2026
+        # if wait is not None:
+        #     wait.progressVisibilityOn()
+        #     wait.setProgressRange(0, self.count() // 100)
         if mode == 'end': mode = 'either_end'
         elif mode not in ('any', 'all', 'end'): mode = 'any'
         if tol is None or tol == 0.0: tol = sqrt((array(self._spacing) ** 2).sum())
         if include is None: include = [True] * len(rois)
-        # < Revision 03/04/2025
-        incl: list = list()
-        excl: list = list()
-        sp = array(self._spacing)
-        sp2 = sp / 2
-        for i in range(rois.count()):
-            roi = rois[i].toIndexes(numpy=True)
-            roi = (roi * sp) + sp2
-            if include[i]: incl.append(roi)
-            else: excl.append(roi)
-        # noinspection PyUnresolvedReferences
-        c: cython.int = 0
-        r: list = list()
-        for sl in self._streamlines:
-            tag: bool = True
-            if len(excl) > 0:
-                for select in excl:
-                    if streamline_near_roi(sl, select, tol, mode=mode):
-                        tag = False
-                        break
-            if tag and len(incl) > 0:
-                for select in incl:
-                    if not streamline_near_roi(sl, select, tol, mode=mode):
-                        tag = False
-                        break
-            if tag: r.append(sl)
-            if c == 100:
-                c = 0
-                if wait is not None: wait.incCurrentProgressValue()
-            else: c += 1
-        if wait is not None: wait.setCurrentProgressValue(self.count() // 100)
-        sl = SisypheStreamlines(Streamlines(r))
+        # voxels to streamline points index, only points near ROIs are processed
+        mask = self._roiSelectionMask(rois, include, mode, tol, wait)
+        sl = SisypheStreamlines(self._streamlines[mask.nonzero()[0]].copy())
         sl.copyAttributesFrom(self)
         sl.setWholeBrainStatus(False)
         return sl
-        # Revision 03/04/2025 >
+        # Revision 16/10/2026 >
 
     def streamlinesSphereSelection(self,
                                    p: vector3float,
@@ -7122,13 +8697,16 @@ class SisypheStreamlines(object):
         SisypheStreamlines
              selected streamlines
         """
-        # noinspection PyUnresolvedReferences
-        i: cython.int
-        slout = list()
-        for i in range(self.count()):
-            r = inside_sphere(self._streamlines[i], p, radius)
-            if r == include: slout.append(self._streamlines[i])
-        sl = SisypheStreamlines(Streamlines(slout))
+        # < Revision 16/10/2026
+        # voxels to streamline points index, only points near sphere are processed
+        # slout = list()
+        # for i in range(self.count()):
+        #     r = inside_sphere(self._streamlines[i], p, radius)
+        #     if r == include: slout.append(self._streamlines[i])
+        # sl = SisypheStreamlines(Streamlines(slout))
+        mask = self.getSpatialIndex().sphereSelection(p, radius) == include
+        sl = SisypheStreamlines(self._streamlines[mask.nonzero()[0]].copy())
+        # Revision 16/10/2026 >
         sl.copyAttributesFrom(self)
         sl.setWholeBrainStatus(False)
         return sl
@@ -7160,28 +8738,27 @@ class SisypheStreamlines(object):
         SisypheStreamlines
              selected streamlines
         """
-        # noinspection PyUnresolvedReferences
-        i: cython.int
-        # noinspection PyUnresolvedReferences
-        j: cython.int
-        # noinspection PyUnresolvedReferences
-        k: cython.int
-        slout = list()
-        p = array(p)
-        planes = array(planes)
-        for i in range(self.count()):
-            sl = self._streamlines[i]
-            s0 = sign(sl[0] - p)
-            flag = not include
-            for j in range(len(sl) - 1, 0, -1):
-                s = sign(sl[j] - p)
-                cross = s != s0
-                cross = cross and planes
-                if any(cross):
-                    flag = include
-                    break
-            if flag: slout.append(sl)
-        r = SisypheStreamlines(Streamlines(slout))
+        # < Revision 16/10/2026
+        # single vectorised pass over streamline points
+        # slout = list()
+        # p = array(p)
+        # planes = array(planes)
+        # for i in range(self.count()):
+        #     sl = self._streamlines[i]
+        #     s0 = sign(sl[0] - p)
+        #     flag = not include
+        #     for j in range(len(sl) - 1, 0, -1):
+        #         s = sign(sl[j] - p)
+        #         cross = s != s0
+        #         cross = cross and planes
+        #         if any(cross):
+        #             flag = include
+        #             break
+        #     if flag: slout.append(sl)
+        # r = SisypheStreamlines(Streamlines(slout))
+        mask = self.getSpatialIndex().planeSelection(p, planes) == include
+        r = SisypheStreamlines(self._streamlines[mask.nonzero()[0]].copy())
+        # Revision 16/10/2026 >
         r.copyAttributesFrom(self)
         r.setWholeBrainStatus(False)
         return r
@@ -7559,34 +9136,46 @@ class SisypheStreamlines(object):
                     filename = join(self.getDirname(), bundle + self._FILEEXT)
                 elif splitext(filename)[1] != self._FILEEXT:
                     filename = splitext(filename)[0] + self._FILEEXT
-                doc = minidom.Document()
-                root = doc.createElement(self._FILEEXT[1:])
-                root.setAttribute('version', '1.0')
-                doc.appendChild(root)
-                self.createXML(doc, bundle)
+                # < Revision 16/10/2026
+                # streamlines written by chunks, whole unlist_streamlines buffer is not built in memory
+                # doc = minidom.Document()
+                # root = doc.createElement(self._FILEEXT[1:])
+                # root.setAttribute('version', '1.0')
+                # doc.appendChild(root)
+                # self.createXML(doc, bundle)
+                # sl = self.getStreamlinesFromBundle(bundle)
+                # data, offsets = unlist_streamlines(sl)
+                # bdata = data.tobytes()
+                # boffsets = offsets.tobytes()
+                # # Offsets
+                # buff = '{} {}'.format(str(len(bdata)), str(len(boffsets)))
+                # node = doc.createElement('offsets')
+                # root.appendChild(node)
+                # txt = doc.createTextNode(buff)
+                # node.appendChild(txt)
+                # # Datatypes
+                # buff = '{} {}'.format(str(data.dtype), str(offsets.dtype))
+                # node = doc.createElement('dtypes')
+                # root.appendChild(node)
+                # txt = doc.createTextNode(buff)
+                # node.appendChild(txt)
+                # buffxml = doc.toprettyxml().encode()  # Convert utf-8 to binary
+                # with open(filename, 'wb') as f:
+                #     # Write XML part
+                #     f.write(buffxml)
+                #     # Write Binary arrays
+                #     f.write(bdata)
+                #     f.write(boffsets)
                 sl = self.getStreamlinesFromBundle(bundle)
-                data, offsets = unlist_streamlines(sl)
-                bdata = data.tobytes()
-                boffsets = offsets.tobytes()
-                # Offsets
-                buff = '{} {}'.format(str(len(bdata)), str(len(boffsets)))
-                node = doc.createElement('offsets')
-                root.appendChild(node)
-                txt = doc.createTextNode(buff)
-                node.appendChild(txt)
-                # Datatypes
-                buff = '{} {}'.format(str(data.dtype), str(offsets.dtype))
-                node = doc.createElement('dtypes')
-                root.appendChild(node)
-                txt = doc.createTextNode(buff)
-                node.appendChild(txt)
-                buffxml = doc.toprettyxml().encode()  # Convert utf-8 to binary
-                with open(filename, 'wb') as f:
-                    # Write XML part
-                    f.write(buffxml)
-                    # Write Binary arrays
-                    f.write(bdata)
-                    f.write(boffsets)
+                # noinspection PyProtectedMember
+                with SisypheStreamlinesWriter(filename, self, bundle, str(sl._data.dtype)) as f:
+                    for i in range(0, len(sl), self._CHUNKSIZE):
+                        f.write(sl[i:i + self._CHUNKSIZE])
+                # Revision 16/10/2026 >
+                # < Revision 16/10/2026
+                # spatial index saved alongside, if built for saved streamlines
+                if self._spindex is not None and self._spindex.isValid(sl): self._spindex.saveAs(filename)
+                # Revision 16/10/2026 >
 
     def saveToNumpy(self, bundle: str = 'all') -> None:
         """
@@ -7760,7 +9349,7 @@ class SisypheStreamlines(object):
             return r
         else: raise IOError('Invalid xml file format.')
 
-    def load(self, filename: str) -> None:
+    def load(self, filename: str, mmap: bool = False) -> None:
         """
         Load the current SisypheStreamlines instance from a PySisyphe Streamlines (.xtracts) file.
 
@@ -7768,6 +9357,9 @@ class SisypheStreamlines(object):
         ----------
         filename : str
             PySisyphe Streamlines file name
+        mmap : bool
+            if True, streamline points and offsets are read-only numpy.memmap views of the file, points are read on
+            demand. Bundles can be filtered, counted and sampled without loading the whole tractogram (default False)
         """
         filename = splitext(filename)[0] + self.getFileExt()
         if exists(filename):
@@ -7780,14 +9372,41 @@ class SisypheStreamlines(object):
                     strdoc += line
                 doc = minidom.parseString(strdoc)
                 r = self.parseXML(doc)
+                # < Revision 16/10/2026
+                # memory-mapped binary part
                 # Read binary part
-                bdata = f.read(r['offsets'][0])
-                boffsets = f.read(r['offsets'][1])
-            data = frombuffer(bdata, dtype=r['dtypes'][0])
-            data = data.reshape((len(data) // 3, 3))
-            offsets = frombuffer(boffsets, dtype=r['dtypes'][1])
-            # noinspection PyTypeChecker
-            self._streamlines = Streamlines(relist_streamlines(data, offsets))
+                # bdata = f.read(r['offsets'][0])
+                # boffsets = f.read(r['offsets'][1])
+                mmap = mmap and r['offsets'][0] > 0 and r['offsets'][1] > 0
+                if mmap: pos = f.tell()
+                else:
+                    bdata = f.read(r['offsets'][0])
+                    boffsets = f.read(r['offsets'][1])
+            if mmap:
+                # noinspection PyUnboundLocalVariable
+                data = memmap(filename, dtype=r['dtypes'][0], mode='r', offset=pos,
+                              shape=(r['offsets'][0] // (3 * npdtype(r['dtypes'][0]).itemsize), 3))
+                offsets = memmap(filename, dtype=r['dtypes'][1], mode='r', offset=pos + r['offsets'][0],
+                                 shape=(r['offsets'][1] // npdtype(r['dtypes'][1]).itemsize,))
+                # saved offsets are end offsets of streamlines (dipy unlist_streamlines convention)
+                lengths = diff(concatenate([[0], offsets])).astype('int64')
+                # same as ArraySequence.load(), without copy of points
+                self._streamlines = Streamlines()
+                # noinspection PyProtectedMember
+                self._streamlines._data = data
+                # noinspection PyProtectedMember
+                self._streamlines._offsets = offsets.astype('int64') - lengths
+                # noinspection PyProtectedMember
+                self._streamlines._lengths = lengths
+            else:
+                # noinspection PyUnboundLocalVariable
+                data = frombuffer(bdata, dtype=r['dtypes'][0])
+                data = data.reshape((len(data) // 3, 3))
+                # noinspection PyUnboundLocalVariable
+                offsets = frombuffer(boffsets, dtype=r['dtypes'][1])
+                # noinspection PyTypeChecker
+                self._streamlines = Streamlines(relist_streamlines(data, offsets))
+            # Revision 16/10/2026 >
             bundle = SisypheBundle((0, len(self._streamlines), 1))
             r['name'] = r['name'].lower()
             if r['name'] in ('all', 'whole', self._DEFAULTNAME): r['name'] = splitext(basename(filename))[0]
@@ -7799,8 +9418,29 @@ class SisypheStreamlines(object):
             self.setOpacity(r['opacity'], r['name'])
             self.setLineWidth(r['width'], r['name'])
             self._dirname = dirname(filename)
+            # < Revision 16/10/2026
+            # spatial index saved alongside, validated at first use
+            self._spindex = None
+            filename = splitext(filename)[0] + SisypheStreamlinesIndex.getFileExt()
+            if exists(filename):
+                self._spindex = SisypheStreamlinesIndex()
+                self._spindex.load(filename)
+            # Revision 16/10/2026 >
         else: raise IOError('No such file {}'.format(filename))
 
+    def isMemoryMapped(self) -> bool:
+        """
+        Check whether streamlines of the current SisypheStreamlines instance are memory-mapped (see load() method).
+        Memory-mapped streamlines are read-only.
+
+        Returns
+        -------
+        bool
+            True if streamline points are a numpy.memmap view of a PySisyphe Streamlines (.xtracts) file
+        """
+        # noinspection PyProtectedMember
+        return isinstance(self._streamlines._data, memmap)
+
     def loadAtlasBundle(self, name: str = 'WHOLE'):
         """
         Load an atlas bundle.
@@ -7913,6 +9553,232 @@ class SisypheStreamlines(object):
         else: raise IOError('No such file {}'.format(filename))
 
 
+class SisypheStreamlinesWriter(object):
+    """
+    Description
+    ~~~~~~~~~~~
+
+    Streaming writer of PySisyphe Streamlines (.xtracts) files.
+
+    Streamlines are appended to the file chunk by chunk as they are produced (i.e. tracking batches), only the
+    offsets of the streamlines (one integer per streamline) are kept in memory. The xml header is written at opening
+    with fixed width data sizes, and rewritten in place at closing with the final sizes.
+
+    The resulting file can be opened with the SisypheStreamlines.load() method, optionally memory-mapped.
+
+    Inheritance
+    ~~~~~~~~~~~
+
+    object -> SisypheStreamlinesWriter
+
+    Creation: 16/10/2026
+    """
+
+    __slots__ = ['_filename', '_file', '_sl', '_bundle', '_dtype', '_offsets', '_npoints', '_count']
+
+    # Class constants
+
+    _SIZEFORMAT = '{:020d} {:020d}'
+
+    # Special method
+
+    """
+    Private attributes
+
+    _filename   str, PySisyphe Streamlines file name
+    _file       BufferedWriter | None, opened file
+    _sl         SisypheStreamlines, header attributes (reference ID, shape, spacing, display attributes...)
+    _bundle     str, bundle name saved in header
+    _dtype      str, numpy datatype of streamline points
+    _offsets    list[ndarray], end offsets of the streamlines of the written chunks
+    _npoints    int, number of written points
+    _count      int, number of written streamlines
+    """
+
+    def __init__(self,
+                 filename: str,
+                 sl: SisypheStreamlines | None = None,
+                 bundle: str = 'all',
+                 dtype: str = 'float32') -> None:
+        """
+        SisypheStreamlinesWriter instance constructor.
+
+        Parameters
+        ----------
+        filename : str
+            PySisyphe Streamlines file name
+        sl : SisypheStreamlines | None
+            header attributes (reference ID, shape, spacing, display attributes...) are copied from this instance,
+            its streamlines are not written. Default attributes if None.
+        bundle : str
+            bundle name of sl saved in header, or 'all' (default)
+        dtype : str
+            numpy datatype of streamline points (default 'float32')
+        """
+        if sl is None: sl = SisypheStreamlines()
+        if bundle == 'all': bundle = sl.getBundle(0).getName()
+        if bundle not in sl.getBundles(): raise ValueError('{} invalid bundle name.'.format(bundle))
+        self._filename = splitext(filename)[0] + SisypheStreamlines.getFileExt()
+        self._file = None
+        self._sl = sl
+        self._bundle = bundle
+        self._dtype = dtype
+        self._offsets: list[ndarray] = list()
+        self._npoints: int = 0
+        self._count: int = 0
+
+    def __str__(self) -> str:
+        """
+        Special overloaded method called by the built-in str() python function.
+
+        Returns
+        -------
+        str
+            instance representation
+        """
+        buff = 'Filename: {}\n'.format(self._filename)
+        buff += 'Opened: {}\n'.format(self.isOpened())
+        buff += 'Streamlines count: {}\n'.format(self._count)
+        buff += 'Points count: {}\n'.format(self._npoints)
+        return buff
+
+    def __repr__(self) -> str:
+        """
+        Special overloaded method called by the built-in repr() python function.
+
+        Returns
+        -------
+        str
+            instance representation
+        """
+        return 'SisypheStreamlinesWriter instance at <{}>\n'.format(str(id(self))) + self.__str__()
+
+    def __enter__(self) -> SisypheStreamlinesWriter:
+        """
+        Special overloaded method, opens the file at the beginning of a with statement.
+        """
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """
+        Special overloaded method, closes the file at the end of a with statement.
+        """
+        self.close()
+
+    def __del__(self) -> None:
+        """
+        SisypheStreamlinesWriter instance finalizer. Closes the file if it is still opened.
+        """
+        if self._file is not None: self.close()
+
+    # Private method
+
+    def _getHeader(self, datasize: int, offsetsize: int) -> bytes:
+        # same xml header as SisypheStreamlines.save(), data sizes with fixed width
+        doc = minidom.Document()
+        root = doc.createElement(SisypheStreamlines.getFileExt()[1:])
+        root.setAttribute('version', '1.0')
+        doc.appendChild(root)
+        self._sl.createXML(doc, self._bundle)
+        # Offsets
+        node = doc.createElement('offsets')
+        root.appendChild(node)
+        txt = doc.createTextNode(self._SIZEFORMAT.format(datasize, offsetsize))
+        node.appendChild(txt)
+        # Datatypes
+        node = doc.createElement('dtypes')
+        root.appendChild(node)
+        txt = doc.createTextNode('{} {}'.format(self._dtype, 'int64'))
+        node.appendChild(txt)
+        return doc.toprettyxml().encode()  # Convert utf-8 to binary
+
+    # Public methods
+
+    def getFilename(self) -> str:
+        """
+        Get the file name attribute of the current SisypheStreamlinesWriter instance.
+
+        Returns
+        -------
+        str
+            PySisyphe Streamlines file name
+        """
+        return self._filename
+
+    def isOpened(self) -> bool:
+        """
+        Check whether the file of the current SisypheStreamlinesWriter instance is opened.
+
+        Returns
+        -------
+        bool
+            True if file is opened
+        """
+        return self._file is not None
+
+    def count(self) -> int:
+        """
+        Get the number of streamlines written by the current SisypheStreamlinesWriter instance.
+
+        Returns
+        -------
+        int
+            number of streamlines
+        """
+        return self._count
+
+    def open(self) -> None:
+        """
+        Create the file of the current SisypheStreamlinesWriter instance and write the xml header.
+        """
+        if self._file is None:
+            self._offsets = list()
+            self._npoints = 0
+            self._count = 0
+            self._file = open(self._filename, 'wb')
+            self._file.write(self._getHeader(0, 0))
+
+    def write(self, sl: SisypheStreamlines | Streamlines | list[ndarray] | ndarray) -> None:
+        """
+        Append streamlines to the file of the current SisypheStreamlinesWriter instance.
+
+        Parameters
+        ----------
+        sl : SisypheStreamlines | dipy.tracking.Streamlines | list[ndarray] | ndarray
+            streamlines chunk, or a single streamline (ndarray of shape (n, 3))
+        """
+        if self._file is None: raise IOError('{} is not opened.'.format(self._filename))
+        if isinstance(sl, SisypheStreamlines): sl = sl.getStreamlines()
+        elif isinstance(sl, ndarray): sl = Streamlines([sl])
+        elif not isinstance(sl, Streamlines): sl = Streamlines(sl)
+        if len(sl) > 0:
+            points, offsets, lengths = SisypheStreamlinesIndex.getCompactData(sl)
+            self._file.write(points.astype(self._dtype, copy=False).tobytes())
+            # end offsets of streamlines, same as dipy unlist_streamlines
+            self._offsets.append(offsets + lengths + self._npoints)
+            self._npoints += len(points)
+            self._count += len(sl)
+
+    def close(self) -> None:
+        """
+        Write streamline offsets, update the xml header with the final data sizes and close the file of the current
+        SisypheStreamlinesWriter instance.
+        """
+        if self._file is not None:
+            if len(self._offsets) > 0: offsets = concatenate(self._offsets).astype('int64')
+            else: offsets = zeros(0, dtype='int64')
+            boffsets = offsets.tobytes()
+            self._file.write(boffsets)
+            # header rewritten in place, same length as data sizes have a fixed width
+            datasize = self._npoints * 3 * npdtype(self._dtype).itemsize
+            self._file.seek(0)
+            self._file.write(self._getHeader(datasize, len(boffsets)))
+            self._file.close()
+            self._file = None
+            self._offsets = list()
+
+
 class SisypheDiffusionModel(object):
     """
     Description
@@ -10652,11 +12518,11 @@ class SisypheTracking(object):
     object -> SisypheTracking
 
     Creation: 29/10/2023
-    Last revision: 03/07/2025
+    Last revision: 16/10/2026
     """
 
     __slots__ = ['_model', '_name', '_alg', '_density', '_seeds', '_stepsize', '_maxangle', '_npeaks',
-                 '_thresholdpeaks', '_anglepeaks', '_minlength', '_stopping']
+                 '_thresholdpeaks', '_anglepeaks', '_minlength', '_stopping', '_stoppingparams', '_workers']
 
     # Class constants
 
@@ -10673,6 +12539,10 @@ class SisypheTracking(object):
             _PBSD: 'Probabilistic Bootstrap direction',
             _PFOD: 'Probabilistic Fiber orientation distribution'}
 
+    # Worker process state, see _initTrackingWorker()
+
+    _worker = dict()
+
     # Special method
 
     """
@@ -10699,6 +12569,10 @@ class SisypheTracking(object):
     _minlength : float
         streamline minimum length (mm)
     _stopping : ActStoppingCriterion | BinaryStoppingCriterion | ThresholdStoppingCriterion | None
+    _stoppingparams : tuple[type, tuple] | None
+        stopping criterion class and constructor arguments, used to rebuild stopping criterion in worker processes
+    _workers : int
+        number of worker processes, 0 = number of CPU cores, 1 = single process
     """
 
     def __init__(self, model: SisypheDiffusionModel):
@@ -10726,6 +12600,8 @@ class SisypheTracking(object):
         self._anglepeaks: cython.double = 30
         self._minlength = 0.0
         self._stopping = None
+        self._stoppingparams = None
+        self._workers: int = 1
 
     def __str__(self) -> str:
         """
@@ -10975,6 +12851,7 @@ class SisypheTracking(object):
                 # noinspection PyUnresolvedReferences
                 FA = self._model.getGFA().copyToNumpyArray(defaultshape=False)
             self._stopping = ThresholdStoppingCriterion(FA, threshold)
+            self._stoppingparams = (ThresholdStoppingCriterion, (FA, threshold))
         else: raise ValueError('Invalid threshold.')
 
     def setStoppingCriterionToROI(self, roi: SisypheROI) -> None:
@@ -10987,7 +12864,9 @@ class SisypheTracking(object):
         roi : Sisyphe.core.sisypheROI.SisypheROI
             stopping criterion roi
         """
-        self._stopping = BinaryStoppingCriterion(roi.copyToNumpyArray(defaultshape=False))
+        mask = roi.copyToNumpyArray(defaultshape=False)
+        self._stopping = BinaryStoppingCriterion(mask)
+        self._stoppingparams = (BinaryStoppingCriterion, (mask,))
 
     def setStoppingCriterionToMaps(self,
                                    gm: SisypheVolume(),
@@ -11027,6 +12906,7 @@ class SisypheTracking(object):
         back[(include + wm + exclude) > 0] = 0
         include[back > 0] = 1
         self._stopping = ActStoppingCriterion(include, exclude)
+        self._stoppingparams = (ActStoppingCriterion, (include, exclude))
 
     def setSeedsFromRoi(self, roi: SisypheROI) -> None:
         """
@@ -11178,6 +13058,31 @@ class SisypheTracking(object):
         """
         return self._minlength
 
+    def setNumberOfWorkers(self, n: int = 0) -> None:
+        """
+        Set the number of worker processes attribute of the current SisypheTracking instance. Seed batches are
+        dispatched to a pool of worker processes if this number is not 1. Diffusion model arrays (ODF, SH
+        coefficients, DWI) and stopping criterion maps are shared once with workers through shared memory.
+
+        Parameters
+        ----------
+        n : int
+            number of worker processes, 0 = number of CPU cores, 1 = single process tracking (default 0)
+        """
+        if n >= 0: self._workers = n
+        else: raise ValueError('Invalid number of workers.')
+
+    def getNumberOfWorkers(self) -> int:
+        """
+        Get the number of worker processes attribute of the current SisypheTracking instance.
+
+        Returns
+        -------
+        int
+            number of worker processes, 0 = number of CPU cores, 1 = single process tracking
+        """
+        return self._workers
+
     # noinspection PyTypeChecker
     def computeTracking(self, wait: DialogWait | DictProxy | None = None) -> SisypheStreamlines:
         """
@@ -11202,42 +13107,16 @@ class SisypheTracking(object):
         if wait is not None:
             if isinstance(wait, DialogWait): wait.setInformationText('{} tracking...'.format(self.getTrackingAlgorithmAsString()))
             elif isinstance(wait, DictProxy): wait['msg'] = '{} tracking...'.format(self.getTrackingAlgorithmAsString())
-        # Deterministic Euler integration
-        if self._alg == self._DEUDX:
+        # Seed batches dispatched to a pool of worker processes
+        if self._workers != 1:
+            sl = self._computeParallelTracking(seeds, affine, l, wait)
+            if sl is not None: sls = SisypheStreamlines(sl)
             if wait is not None:
-                if isinstance(wait, DialogWait): wait.addInformationText('Peaks processing')
-                elif isinstance(wait, DictProxy): wait['msg'] = '{} tracking...\nPeaks processing'.format(self.getTrackingAlgorithmAsString())
-            if isinstance(self._model, (SisypheDTIModel, SisypheDKIModel)):
-                peaks = peaks_from_model(model=self._model.getModel(),
-                                         data=self._model.getDWI(),
-                                         sphere=small_sphere,
-                                         relative_peak_threshold=self._thresholdpeaks,
-                                         min_separation_angle=self._anglepeaks,
-                                         mask=self._model.getMask(),
-                                         sh_order_max=8,
-                                         sh_basis_type=None,
-                                         npeaks=2)
-            elif isinstance(self._model, (SisypheSHCSAModel, SisypheSHCSDModel)):
-                peaks = peaks_from_model(model=self._model.getModel(),
-                                         data=self._model.getDWI(),
-                                         sphere=small_sphere,
-                                         relative_peak_threshold=self._thresholdpeaks,
-                                         min_separation_angle=self._anglepeaks,
-                                         mask=self._model.getMask(),
-                                         sh_order_max=8,
-                                         sh_basis_type=None,
-                                         npeaks=self._npeaks)
-            elif isinstance(self._model, (SisypheDSIModel, SisypheDSIDModel)):
-                peaks = peaks_from_model(model=self._model.getModel(),
-                                         data=self._model.getDWI(),
-                                         sphere=default_sphere,
-                                         relative_peak_threshold=self._thresholdpeaks,
-                                         min_separation_angle=self._anglepeaks,
-                                         mask=self._model.getMask(),
-                                         sh_order_max=8,
-                                         sh_basis_type=None,
-                                         npeaks=self._npeaks)
-            else: raise TypeError('Invalid model type ({}).'.format(type(self._model)))
+                if isinstance(wait, DialogWait): wait.progressVisibilityOff()
+                elif isinstance(wait, DictProxy): wait['max'] = 0
+        # Deterministic Euler integration
+        elif self._alg == self._DEUDX:
+            peaks = self._computePeaks(wait)
             if peaks is not None:
                 if wait is None:
                     sl = Streamlines(eudx_tracking(seeds,
@@ -11302,7 +13181,7 @@ class SisypheTracking(object):
                     # Revision 03/07/2025 >
                 sls = SisypheStreamlines(sl)
         # Deterministic Fiber orientation distribution
-        if self._alg == self._DFOD:
+        elif self._alg == self._DFOD:
             if isinstance(self._model, (SisypheDTIModel, SisypheDKIModel)):
                 if wait is None:
                     sl = Streamlines(deterministic_tracking(seeds,
@@ -11499,7 +13378,7 @@ class SisypheTracking(object):
             else: raise TypeError('Invalid model type ({}).'.format(type(self._model)))
             if sl is not None: sls = SisypheStreamlines(sl)
         # Deterministic Parallel transport
-        if self._alg == self._DPT:
+        elif self._alg == self._DPT:
             if isinstance(self._model, (SisypheDTIModel, SisypheDKIModel)):
                 if wait is None:
                     sl = Streamlines(ptt_tracking(seeds,
@@ -11695,7 +13574,7 @@ class SisypheTracking(object):
             else: raise TypeError('Invalid model type ({}).'.format(type(self._model)))
             if sl is not None: sls = SisypheStreamlines(sl)
         # Deterministic Closest peak direction
-        if self._alg == self._DCPD:
+        elif self._alg == self._DCPD:
             if isinstance(self._model, (SisypheDTIModel, SisypheDKIModel)):
                 if wait is None:
                     sl = Streamlines(closestpeak_tracking(seeds,
@@ -11890,7 +13769,7 @@ class SisypheTracking(object):
             else: raise TypeError('Invalid model type ({}).'.format(type(self._model)))
             if sl is not None: sls = SisypheStreamlines(sl)
         # Probabilistic Bootstrap direction
-        if self._alg == self._PBSD:
+        elif self._alg == self._PBSD:
             if isinstance(self._model, (SisypheDTIModel, SisypheDKIModel, SisypheSHCSAModel, SisypheSHCSDModel)):
                 if wait is None:
                     sl = Streamlines(bootstrap_tracking(seeds,
@@ -12024,7 +13903,7 @@ class SisypheTracking(object):
             else: raise TypeError('Invalid model type ({}).'.format(type(self._model)))
             if sl is not None: sls = SisypheStreamlines(sl)
         # Probabilistic Fiber orientation distribution
-        if self._alg == self._PFOD:
+        elif self._alg == self._PFOD:
             if isinstance(self._model, (SisypheDTIModel, SisypheDKIModel)):
                 if wait is None:
                     sl = Streamlines(probabilistic_tracking(seeds,
@@ -12230,3 +14109,245 @@ class SisypheTracking(object):
             sls.setDWIShape(self._model.getShape())
             sls.setDWISpacing(self._model.getSpacing())
         return sls
+
+    # < Revision 16/10/2026
+    # add computeTrackingToFile method
+    def computeTrackingToFile(self,
+                              filename: str,
+                              wait: DialogWait | DictProxy | None = None) -> SisypheStreamlines | None:
+        """
+        Compute the fiber tracking according to the current SisypheTracking instance attributes, like
+        computeTracking() method, but seed batches are written to a PySisyphe Streamlines (.xtracts) file as they are
+        produced, instead of being accumulated in memory.
+
+        Parameters
+        ----------
+        filename : str
+            PySisyphe Streamlines file name
+        wait : DialogWait | multiprocessing.managers.DictProxy | None
+            optional progress dialog or multiprocessing shared dict (DictProxy)
+
+        Returns
+        -------
+        SisypheStreamlines | None
+            memory-mapped streamlines of the saved file, None if no streamline
+        """
+        affine = diag(list(self._model.getSpacing()) + [1.0])
+        seeds = seeds_from_mask(self._seeds, affine, density=self._density)
+        l = int(self._minlength / self._stepsize)
+        if l < 2: l = 2
+        # header attributes
+        sls = SisypheStreamlines()
+        sls.getBundle(0).setName(self._name)
+        sls.setReferenceID(self._model)
+        sls.setWholeBrainStatus(True)
+        sls.setDWIShape(self._model.getShape())
+        sls.setDWISpacing(self._model.getSpacing())
+        if wait is not None:
+            if isinstance(wait, DialogWait): wait.setInformationText('{} tracking...'.format(self.getTrackingAlgorithmAsString()))
+            elif isinstance(wait, DictProxy): wait['msg'] = '{} tracking...'.format(self.getTrackingAlgorithmAsString())
+        with SisypheStreamlinesWriter(filename, sls) as f:
+            if self._workers != 1: self._computeParallelTracking(seeds, affine, l, wait, f)
+            else:
+                # Seed batches computed in the current process
+                tracker, kwargs = self._getTracker(wait)
+                if tracker is not eudx_tracking or kwargs['pam'] is not None:
+                    kwargs['min_len'] = l
+                    n = seeds.shape[0] // 1000 + 1
+                    if wait is not None:
+                        if isinstance(wait, DialogWait):
+                            wait.progressVisibilityOn()
+                            wait.setProgressRange(0, n)
+                            wait.setCurrentProgressValue(0)
+                        elif isinstance(wait, DictProxy): wait['max'] = n
+                    for i in range(n):
+                        bseeds = seeds[i * 1000:(i + 1) * 1000, :]
+                        if len(bseeds) > 0: f.write(Streamlines(tracker(bseeds, self._stopping, affine, **kwargs)))
+                        if wait is not None:
+                            if isinstance(wait, DialogWait): wait.setCurrentProgressValue(i + 1)
+                            elif isinstance(wait, DictProxy): wait['value'] = i + 1
+            filename = f.getFilename()
+            n = f.count()
+        if wait is not None:
+            if isinstance(wait, DialogWait): wait.progressVisibilityOff()
+            elif isinstance(wait, DictProxy): wait['max'] = 0
+        if n > 0:
+            sls = SisypheStreamlines()
+            sls.load(filename, mmap=True)
+            return sls
+        else: return None
+    # Revision 16/10/2026 >
+
+    # Private methods
+
+    def _computePeaks(self, wait: DialogWait | DictProxy | None = None):
+        if wait is not None:
+            if isinstance(wait, DialogWait): wait.addInformationText('Peaks processing')
+            elif isinstance(wait, DictProxy): wait['msg'] = '{} tracking...\nPeaks processing'.format(self.getTrackingAlgorithmAsString())
+        if isinstance(self._model, (SisypheDTIModel, SisypheDKIModel)):
+            peaks = peaks_from_model(model=self._model.getModel(),
+                                     data=self._model.getDWI(),
+                                     sphere=small_sphere,
+                                     relative_peak_threshold=self._thresholdpeaks,
+                                     min_separation_angle=self._anglepeaks,
+                                     mask=self._model.getMask(),
+                                     sh_order_max=8,
+                                     sh_basis_type=None,
+                                     npeaks=2)
+        elif isinstance(self._model, (SisypheSHCSAModel, SisypheSHCSDModel)):
+            peaks = peaks_from_model(model=self._model.getModel(),
+                                     data=self._model.getDWI(),
+                                     sphere=small_sphere,
+                                     relative_peak_threshold=self._thresholdpeaks,
+                                     min_separation_angle=self._anglepeaks,
+                                     mask=self._model.getMask(),
+                                     sh_order_max=8,
+                                     sh_basis_type=None,
+                                     npeaks=self._npeaks)
+        elif isinstance(self._model, (SisypheDSIModel, SisypheDSIDModel)):
+            peaks = peaks_from_model(model=self._model.getModel(),
+                                     data=self._model.getDWI(),
+                                     sphere=default_sphere,
+                                     relative_peak_threshold=self._thresholdpeaks,
+                                     min_separation_angle=self._anglepeaks,
+                                     mask=self._model.getMask(),
+                                     sh_order_max=8,
+                                     sh_basis_type=None,
+                                     npeaks=self._npeaks)
+        else: raise TypeError('Invalid model type ({}).'.format(type(self._model)))
+        return peaks
+
+    def _getTracker(self, wait: DialogWait | DictProxy | None = None) -> tuple[Callable, dict]:
+        # Returns the dipy tracking function of the current algorithm and its keyword arguments
+        # (except seeds, stopping criterion, affine and minimum length)
+        dti = isinstance(self._model, (SisypheDTIModel, SisypheDKIModel))
+        sh = isinstance(self._model, (SisypheSHCSAModel, SisypheSHCSDModel))
+        dsi = isinstance(self._model, (SisypheDSIModel, SisypheDSIDModel))
+        if not (dti or sh or dsi): raise TypeError('Invalid model type ({}).'.format(type(self._model)))
+        kwargs = dict(max_angle=self._maxangle, step_size=self._stepsize)
+        if self._alg == self._DEUDX:
+            kwargs['max_angle'] = int(self._maxangle)
+            kwargs['pam'] = self._computePeaks(wait)
+            return eudx_tracking, kwargs
+        elif self._alg == self._PBSD:
+            kwargs['data'] = self._model.getDWI()
+            kwargs['model'] = self._model.getModel()
+            if dsi: kwargs['sphere'] = default_sphere
+            else: kwargs['sphere'] = small_sphere
+            return bootstrap_tracking, kwargs
+        else:
+            trackers = {self._DFOD: deterministic_tracking,
+                        self._DPT: ptt_tracking,
+                        self._DCPD: closestpeak_tracking,
+                        self._PFOD: probabilistic_tracking}
+            if dsi and self._alg != self._DFOD: sphere = default_sphere
+            elif sh and self._alg == self._DFOD: sphere = default_sphere
+            else: sphere = small_sphere
+            if sh and self._alg != self._DPT:
+                # noinspection PyUnresolvedReferences
+                kwargs['sh'] = self._model.getFittedModel().shm_coeff
+            else:
+                sf = self._model.getFittedModel().odf(sphere)
+                if self._alg == self._DCPD: sf = sf.clip(min=0)
+                kwargs['sf'] = sf
+            kwargs['sphere'] = sphere
+            return trackers[self._alg], kwargs
+
+    @staticmethod
+    def _initTrackingWorker(tracker: Callable, kwargs: dict, stopping: tuple | None, affine: ndarray) -> None:
+        # Worker process initialization, shared memory arrays are attached once per worker
+        w = SisypheTracking._worker
+        w['shm'] = list()
+
+        def attach(v):
+            if isinstance(v, dict):
+                if version_info >= (3, 13): shm = SharedMemory(name=v['name'], track=False)
+                else:
+                    # shared memory is owned and unlinked by the parent process. Pool workers inherit the resource
+                    # tracker of the parent process, in other cases, attachment starts a resource tracker owned by
+                    # the worker which would unlink shared memory at worker exit, attachment is then unregistered
+                    # noinspection PyProtectedMember
+                    owned = platform != 'win32' and resource_tracker._resource_tracker._fd is None
+                    shm = SharedMemory(name=v['name'])
+                    # noinspection PyProtectedMember
+                    if owned: resource_tracker.unregister(shm._name, 'shared_memory')
+                w['shm'].append(shm)
+                return ndarray(v['shape'], dtype=v['dtype'], buffer=shm.buf)
+            else: return v
+
+        w['tracker'] = tracker
+        w['kwargs'] = {k: attach(v) for k, v in kwargs.items()}
+        if stopping is None: w['stopping'] = None
+        else: w['stopping'] = stopping[0](*[attach(v) for v in stopping[1]])
+        w['affine'] = affine
+
+    @staticmethod
+    def _trackingWorkerBatch(bseeds: ndarray) -> Streamlines:
+        w = SisypheTracking._worker
+        return Streamlines(w['tracker'](bseeds, w['stopping'], w['affine'], **w['kwargs']))
+
+    def _computeParallelTracking(self,
+                                 seeds: ndarray,
+                                 affine: ndarray,
+                                 l: int,
+                                 wait: DialogWait | DictProxy | None = None,
+                                 writer: SisypheStreamlinesWriter | None = None) -> Streamlines | None:
+        # if writer is not None, batches are written to file instead of being accumulated in returned streamlines
+        tracker, kwargs = self._getTracker(wait)
+        if tracker is eudx_tracking and kwargs['pam'] is None: return None
+        kwargs['min_len'] = l
+        if self._workers > 0: workers = self._workers
+        else: workers = os.cpu_count()
+        shms = list()
+
+        def share(v):
+            if isinstance(v, ndarray):
+                shm = SharedMemory(create=True, size=max(v.nbytes, 1))
+                shms.append(shm)
+                buff = ndarray(v.shape, dtype=v.dtype, buffer=shm.buf)
+                buff[...] = v
+                return {'name': shm.name, 'shape': v.shape, 'dtype': v.dtype.str}
+            else: return v
+
+        try:
+            # ndarray arguments (ODF, SH coefficients, DWI, stopping maps) are copied once to shared memory
+            kwargs = {k: share(v) for k, v in kwargs.items()}
+            if self._stoppingparams is None: stopping = None
+            else: stopping = (self._stoppingparams[0], tuple([share(v) for v in self._stoppingparams[1]]))
+            batches = [seeds[i:i + 1000, :] for i in range(0, seeds.shape[0], 1000)]
+            n = len(batches)
+            if wait is not None:
+                if isinstance(wait, DialogWait):
+                    wait.addInformationText('')
+                    wait.progressVisibilityOn()
+                    wait.setProgressRange(0, n)
+                    wait.setCurrentProgressValue(0)
+                elif isinstance(wait, DictProxy):
+                    wait['msg'] = '{} tracking...'.format(self.getTrackingAlgorithmAsString())
+                    wait['max'] = n
+            sl = Streamlines()
+            t = datetime.now()
+            with Pool(processes=workers,
+                      initializer=SisypheTracking._initTrackingWorker,
+                      initargs=(tracker, kwargs, stopping, affine)) as pool:
+                # imap returns batches in seed order, whatever the order of completion
+                for i, bsl in enumerate(pool.imap(SisypheTracking._trackingWorkerBatch, batches)):
+                    if writer is None: sl.extend(bsl)
+                    else: writer.write(bsl)
+                    if wait is not None:
+                        delta = (datetime.now() - t) * ((n - i - 1) / (i + 1))
+                        m = delta.seconds // 60
+                        s = delta.seconds - (m * 60)
+                        if m == 0: msg = 'Estimated time remaining {} s.'.format(s)
+                        else: msg = 'Estimated time remaining {} min {} s.'.format(m, s)
+                        if isinstance(wait, DialogWait):
+                            wait.addInformationText(msg)
+                            wait.setCurrentProgressValue(i + 1)
+                        elif isinstance(wait, DictProxy):
+                            wait['msg'] = '{} tracking...\n{}'.format(self.getTrackingAlgorithmAsString(), msg)
+                            wait['value'] = i + 1
+        finally:
+            for shm in shms:
+                shm.close()
+                shm.unlink()
+        return sl
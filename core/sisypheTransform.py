@@ -33,6 +33,8 @@ from numpy import identity
 from numpy import matmul
 from numpy import diag
 from numpy import allclose
+from numpy import transpose
+from numpy import empty
 from numpy.linalg import inv
 
 from nibabel.quaternions import quat2angle_axis
@@ -71,6 +73,8 @@ from SimpleITK import DisplacementFieldTransform as sitkDisplacementFieldTransfo
 from SimpleITK import ReadTransform as sitkReadTransform
 from SimpleITK import TransformToDisplacementFieldFilter as sitkTransformToDisplacementFieldFilter
 from SimpleITK import ResampleImageFilter as sitkResampleImageFilter
+from SimpleITK import GetImageFromArray as sitkGetImageFromArray
+from SimpleITK import GetArrayViewFromImage as sitkGetArrayViewFromImage
 
 from ants.core.ants_transform import ANTsTransform
 from ants.core.ants_transform_io import read_transform
@@ -84,7 +88,6 @@ from Sisyphe.lib.bv.trf import read_trf
 from Sisyphe.core.sisypheImage import SisypheImage
 from Sisyphe.core.sisypheImage import SisypheBinaryImage
 from Sisyphe.core.sisypheVolume import SisypheVolume
-from Sisyphe.core.sisypheVolume import multiComponentSisypheVolumeFromList
 from Sisyphe.core.sisypheROI import SisypheROI
 from Sisyphe.core.sisypheMesh import SisypheMesh
 from Sisyphe.core.sisypheTracts import SisypheStreamlines
@@ -2411,9 +2414,9 @@ class SisypheApplyTransform(object):
     object -> SisypheApplyTransform
 
     Creation: 05/10/2021
-    Last revision: 22/05/2025
+    Last revision: 16/10/2026
     """
-    __slots__ = ['_moving', '_roi', '_mesh', '_sl', '_transform', '_resample']
+    __slots__ = ['_moving', '_roi', '_mesh', '_sl', '_transform', '_resample', '_memory']
 
     # Class constants
 
@@ -2488,6 +2491,7 @@ class SisypheApplyTransform(object):
     _sl         SisypheStreamlines to resample
     _transform  SisypheTransform, geometric transformation to apply
     _resample   sitkResampleImageFilter    
+    _memory     int, memory budget in bytes of multicomponent resampling (0 no limit)
     """
 
     def __init__(self) -> None:
@@ -2501,6 +2505,7 @@ class SisypheApplyTransform(object):
         self._transform = None
         self._resample = sitkResampleImageFilter()
         self._resample.SetInterpolator(sitkLinear)
+        self._memory = 0
 
     def __str__(self) -> str:
         """
@@ -2576,6 +2581,60 @@ class SisypheApplyTransform(object):
         """
         return self._resample.GetInterpolator()
 
+    # < Revision 16/10/2026
+    # add setNumberOfThreads, getNumberOfThreads, setMemoryBudget and getMemoryBudget methods
+    def setNumberOfThreads(self, n: int) -> None:
+        """
+        Set the number of threads used by the resampling filter of the current SisypheApplyTransform instance.
+
+        Parameters
+        ----------
+        n : int
+            number of threads
+        """
+        if isinstance(n, int):
+            if n > 0: self._resample.SetNumberOfThreads(n)
+            else: raise ValueError('parameter value {} is not strictly positive.'.format(n))
+        else: raise TypeError('parameter type {} is not int.'.format(type(n)))
+
+    def getNumberOfThreads(self) -> int:
+        """
+        Get the number of threads used by the resampling filter of the current SisypheApplyTransform instance.
+
+        Returns
+        -------
+        int
+            number of threads
+        """
+        return self._resample.GetNumberOfThreads()
+
+    def setMemoryBudget(self, v: int) -> None:
+        """
+        Set the memory budget of multicomponent volume resampling. All components are resampled in a single pass if
+        temporary buffers fit in this budget, otherwise components are resampled by chunks.
+
+        Parameters
+        ----------
+        v : int
+            memory budget in bytes (0, no limit, default)
+        """
+        if isinstance(v, int):
+            if v >= 0: self._memory = v
+            else: raise ValueError('parameter value {} is negative.'.format(v))
+        else: raise TypeError('parameter type {} is not int.'.format(type(v)))
+
+    def getMemoryBudget(self) -> int:
+        """
+        Get the memory budget of multicomponent volume resampling.
+
+        Returns
+        -------
+        int
+            memory budget in bytes (0, no limit)
+        """
+        return self._memory
+    # Revision 16/10/2026 >
+
     def setTransform(self, trf: SisypheTransform, center: bool = True) -> None:
         # < Revision 03/09/2024
         # setTransform(self, trf: SisypheTransform, center: bool = False) -> None:
@@ -3045,6 +3104,52 @@ class SisypheApplyTransform(object):
                 # Revision 03/09/2024 >
         else: raise AttributeError('No SisypheTransform or moving SisypheVolume.')
 
+    # < Revision 16/10/2026
+    # add _resampleMultiComponent private method
+    def _getComponentChunkSize(self) -> int:
+        n = self._moving.getNumberOfComponentsPerPixel()
+        if self._memory == 0: return n
+        # temporary buffers by component: moving chunk copy and resampled chunk
+        itemsize = self._moving.getNumpy().itemsize
+        sin = self._moving.getSize()
+        sout = self._resample.GetSize()
+        bytesize = (sin[0] * sin[1] * sin[2] + sout[0] * sout[1] * sout[2]) * itemsize
+        return min(n, max(1, self._memory // bytesize))
+
+    def _resampleMultiComponent(self, wait: DialogWait | None = None) -> SisypheVolume:
+        n = self._moving.getNumberOfComponentsPerPixel()
+        # all SimpleITK interpolators resample vector images
+        chunk = self._getComponentChunkSize()
+        resampled = SisypheVolume()
+        if chunk == n:
+            # all components in a single pass, sampling grid is computed once
+            if wait is not None: wait.setInformationText('{} components resampling...'.format(n))
+            resampled.setSITKImage(self._resample.Execute(self._moving.getSITKImage()))
+        else:
+            # numpy array shape (n, z, y, x)
+            src = self._moving.getNumpy()
+            dst = None
+            for i in range(0, n, chunk):
+                j = min(i + chunk, n)
+                if wait is not None:
+                    if j - i == 1: wait.setInformationText('Component {} resampling...'.format(i))
+                    else: wait.setInformationText('Components {} to {} resampling...'.format(i, j - 1))
+                moving = sitkGetImageFromArray(transpose(src[i:j], axes=(1, 2, 3, 0)), isVector=True)
+                moving.CopyInformation(self._moving.getSITKImage())
+                r = self._resample.Execute(moving)
+                buff = sitkGetArrayViewFromImage(r)
+                if dst is None:
+                    # resampled volume is allocated once, chunks are copied in place
+                    resampled.copyFromNumpyArray(empty((n,) + r.GetSize()[::-1], dtype=buff.dtype),
+                                                 spacing=r.GetSpacing(),
+                                                 origin=r.GetOrigin(),
+                                                 direction=r.GetDirection())
+                    dst = resampled.getNumpy()
+                if buff.ndim == 3: dst[i] = buff
+                else: dst[i:j] = transpose(buff, axes=(3, 0, 1, 2))
+        return resampled
+    # Revision 16/10/2026 >
+
     def resampleMoving(self,
                        fixed: SisypheVolume | None = None,
                        save: bool = True,
@@ -3114,16 +3219,20 @@ class SisypheApplyTransform(object):
                 else:
                     # < Revision 11/02/2025
                     # multicomponent resampling
-                    series = list()
-                    for i in range(self._moving.getNumberOfComponentsPerPixel()):
-                        if wait is not None:
-                            wait.setInformationText('Component {} resampling...'.format(i))
-                        moving = self._moving.copyComponent(i)
-                        r = SisypheVolume()
-                        r.setSITKImage(self._resample.Execute(moving.getSITKImage()))
-                        series.append(r)
-                    resampled = multiComponentSisypheVolumeFromList(series)
+                    # series = list()
+                    # for i in range(self._moving.getNumberOfComponentsPerPixel()):
+                    #    if wait is not None:
+                    #        wait.setInformationText('Component {} resampling...'.format(i))
+                    #    moving = self._moving.copyComponent(i)
+                    #    r = SisypheVolume()
+                    #    r.setSITKImage(self._resample.Execute(moving.getSITKImage()))
+                    #    series.append(r)
+                    # resampled = multiComponentSisypheVolumeFromList(series)
                     # Revision 11/02/2025 >
+                    # < Revision 16/10/2026
+                    # one-pass multicomponent resampling
+                    resampled = self._resampleMultiComponent(wait)
+                    # Revision 16/10/2026 >
                 # 4. Restore moving volume origin
                 self._moving.setOrigin(origin)
                 # < Revision 05/09/2024
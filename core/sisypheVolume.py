@@ -15,6 +15,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from os import remove
+from os import cpu_count
 
 from os.path import exists
 from os.path import join
@@ -33,22 +34,27 @@ from zlib import decompress
 
 from hashlib import md5
 
+from concurrent.futures import ThreadPoolExecutor
+
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 from numpy import stack
-from numpy import nanmean
-from numpy import nanmedian
 from numpy import nanpercentile
-from numpy import nanstd
-from numpy import nanmax
-from numpy import nanmin
-from numpy import nanargmin
-from numpy import nanargmax
 from numpy import frombuffer
+from numpy import memmap
+from numpy import transpose
 from numpy import array
 from numpy import ndarray
 from numpy import fliplr
+from numpy import empty
+from numpy import zeros
+from numpy import full
+from numpy import nan
+from numpy import isnan
+from numpy import where
+from numpy import divide
+from numpy import sqrt
 
 from PyQt5.QtGui import QImage
 
@@ -76,6 +82,8 @@ from Sisyphe.core.sisypheConstants import getNumpyExt
 from Sisyphe.core.sisypheConstants import getLibraryDataType
 from Sisyphe.core.sisypheConstants import getRegularDirections
 from Sisyphe.core.sisypheImage import SisypheImage
+from Sisyphe.core.sisypheImageIO import compressArrayToChunks
+from Sisyphe.core.sisypheImageIO import decompressArrayFromChunks
 from Sisyphe.core.sisypheImageAttributes import SisypheIdentity
 from Sisyphe.core.sisypheImageAttributes import SisypheAcquisition
 from Sisyphe.core.sisypheImageAttributes import SisypheDisplay
@@ -95,6 +103,7 @@ if TYPE_CHECKING:
 
 __all__ = ['SisypheVolume',
            'SisypheVolumeCollection',
+           'SisypheVolumeAccumulator',
            'multiComponentSisypheVolumeFromList']
 
 """
@@ -108,6 +117,7 @@ Class hierarchy
 
     - object -> Sisyphe.core.sisypheImage.SisypheImage -> SisypheVolume
              -> SisypheVolumeCollection
+             -> SisypheVolumeAccumulator
 """
 
 def multiComponentSisypheVolumeFromList(vols: list[SisypheVolume] | SisypheVolumeCollection) -> SisypheVolume:
@@ -208,11 +218,16 @@ class SisypheVolume(SisypheImage):
 
     object -> SisypheImage -> SisypheVolume
 
+    Memory-mapped loading mode (load method, mmap parameter): the xml part is parsed eagerly and the binary part of
+    uncompressed files is exposed as a read-only numpy.memmap view (getNumpy method). SimpleITK, ITK and VTK images
+    are materialised only at first call of getSITKImage, getITKImage or getVTKImage methods.
+
     Creation: 04/02/2021
-    Last revisions: 07/06/2025
+    Last revisions: 16/10/2026
     """
     __slots__ = ['_ID', '_arrayID', '_filename', '_compression', '_identity', '_acquisition',
-                 '_display', '_acpc', '_transforms', '_xdcm', '_slope', '_intercept', '_orientation']
+                 '_display', '_acpc', '_transforms', '_xdcm', '_slope', '_intercept', '_orientation', '_mmap',
+                 '_staleRange']
 
     # Class constants
 
@@ -408,6 +423,61 @@ class SisypheVolume(SisypheImage):
         return XmlVolume(filename)
     # Revision 09/11/2024 >
 
+    # < Revision 16/10/2026
+    # add class methods getVolumeSlice and getVolumeSlab
+    @classmethod
+    def getVolumeSlice(cls, filename: str, index: int, orient: str = 'a', component: int = 0) -> ndarray:
+        """
+        Read a slice of a PySisyphe Volume file (.xvol), without loading the whole binary part when file format
+        allows it (uncompressed or chunked compressed files, see Sisyphe.core.sisypheXml.XmlVolume.readSlab method).
+
+        Parameters
+        ----------
+        filename : str
+            PySisyphe Volume file name
+        index : int
+            slice index
+        orient : str
+            slice orientation ('a' axial, 'c' coronal or 's' sagittal), default 'a'
+        component : int
+            component index of a multicomponent volume (default 0)
+
+        Returns
+        -------
+        numpy.ndarray
+            slice array, numpy shape (y, x) axial, (z, x) coronal, (z, y) sagittal
+        """
+        from Sisyphe.core.sisypheXml import XmlVolume
+        return XmlVolume(filename).readSlice(index, orient, component)
+
+    @classmethod
+    def getVolumeSlab(cls, filename: str, first: int, last: int, orient: str = 'a', component: int = 0) -> ndarray:
+        """
+        Read a slab of a PySisyphe Volume file (.xvol), without loading the whole binary part when file format allows
+        it (uncompressed or chunked compressed files, see Sisyphe.core.sisypheXml.XmlVolume.readSlab method).
+
+        Parameters
+        ----------
+        filename : str
+            PySisyphe Volume file name
+        first : int
+            index of the first slice of the slab
+        last : int
+            index + 1 of the last slice of the slab
+        orient : str
+            slab orientation ('a' axial, 'c' coronal or 's' sagittal), default 'a'
+        component : int
+            component index of a multicomponent volume (default 0)
+
+        Returns
+        -------
+        numpy.ndarray
+            slab array, default numpy shape (z, y, x)
+        """
+        from Sisyphe.core.sisypheXml import XmlVolume
+        return XmlVolume(filename).readSlab(first, last, orient, component)
+    # Revision 16/10/2026 >
+
     # Special methods
 
     """
@@ -424,7 +494,9 @@ class SisypheVolume(SisypheImage):
     _intercept      float
     _orient         int
     _ID             str, space ID (used by geometric transformations), editable, saved
-    _arrayID        str, array ID, not editable, not saved, generated from array (md5, creation and loading)
+    _arrayID        str, array ID, not editable, not saved, generated from array (md5) at each update
+    _mmap           numpy.memmap, read-only view of the binary part, memory-mapped loading mode or component view
+    _staleRange     bool, display range is updated from array at first getDisplay() call
     """
 
     def __init__(self, image: str | listImages2 | SisypheVolume | None = None, **kargs) -> None:
@@ -458,6 +530,8 @@ class SisypheVolume(SisypheImage):
         self._display: SisypheDisplay = SisypheDisplay(parent=self)
         self._acpc: SisypheACPC = SisypheACPC(parent=self)
         self._transforms: SisypheTransforms = SisypheTransforms()
+        self._mmap: memmap | None = None
+        self._staleRange: bool = False
         if isinstance(image, SisypheVolume):
             self._arrayID = image._arrayID
             self._filename = image._filename
@@ -467,7 +541,15 @@ class SisypheVolume(SisypheImage):
             # super().__init__(image, **kargs)
             # < Revision 07/06/2025
             # img = image.copyToSITKImage()
-            super().__init__(image.getSITKImage(), **kargs)
+            # < Revision 16/10/2026
+            # memory-mapped volume copy shares the read-only memory-mapped view, images are materialised at first access
+            # super().__init__(image.getSITKImage(), **kargs)
+            if image.isMemoryMapped():
+                super().__init__(**kargs)
+                self._attr = dict(image._attr)
+                self._mmap = image._mmap
+            else: super().__init__(image.getSITKImage(), **kargs)
+            # Revision 16/10/2026 >
             # Revision 07/06/2025 >
             self.copyAttributesFrom(image)
             # Revision 01/04/2025 >
@@ -492,7 +574,7 @@ class SisypheVolume(SisypheImage):
                                            str(self._slope), str(self._intercept))
         buff += str(self._identity)
         buff += str(self._acquisition)
-        buff += str(self._display)
+        buff += str(self.getDisplay())
         buff += str(self._acpc)
         return buff[:-1]
 
@@ -1113,7 +1195,26 @@ class SisypheVolume(SisypheImage):
     # Private method
 
     def _calcArrayID(self) -> None:
-        if not self.isEmpty():
+        # < Revision 16/10/2026
+        # array ID of a memory-mapped volume is computed at first getArrayID() call, binary part is read-only and
+        # not read at loading, otherwise array ID is computed at each update
+        if self.isMemoryMapped(): self._arrayID = None
+        else: self._computeArrayID()
+
+    def _computeArrayID(self) -> None:
+        # memory-mapped volume, md5 is updated slice by slice in native (z, y, x, n) order
+        # to get the same array ID as a fully loaded volume
+        if self.isMemoryMapped():
+            m = md5()
+            if self._mmap.ndim == 3:
+                for i in range(self._mmap.shape[0]):
+                    m.update(self._mmap[i].tobytes())
+            else:
+                for i in range(self._mmap.shape[1]):
+                    m.update(transpose(self._mmap[:, i], axes=(1, 2, 0)).tobytes())
+            self._arrayID = m.hexdigest()
+        # Revision 16/10/2026 >
+        elif not self.isEmpty():
             m = md5()
             m.update(self._numpy_array.tostring())
             self._arrayID = m.hexdigest()
@@ -1121,8 +1222,13 @@ class SisypheVolume(SisypheImage):
     def _calcID(self) -> None:
         if not self.isEmpty():
             self._calcArrayID()
+            # < Revision 16/10/2026
+            # if self._ID is None: self._ID = self._arrayID
+            # self._transforms.setReferenceID(self._ID)
+            # undefined ID of a memory-mapped volume is replaced by array ID at first getID() call
             if self._ID is None: self._ID = self._arrayID
-            self._transforms.setReferenceID(self._ID)
+            if self._ID is not None: self._transforms.setReferenceID(self._ID)
+            # Revision 16/10/2026 >
 
     def _updateOrientation(self) -> None:
         self._orientation = self._UNSPECIFIED
@@ -1135,6 +1241,13 @@ class SisypheVolume(SisypheImage):
             elif i1 == 1 and i2 == 2 and i3 == 0: self._orientation = self._SAGITTAL
 
     def _updateRange(self) -> None:
+        # < Revision 16/10/2026
+        # range is computed at first getDisplay() call
+        self._staleRange = True
+
+    def _computeRange(self) -> None:
+        self._staleRange = False
+        # Revision 16/10/2026 >
         # bugfix, conversion numpy.float32 to float
         # noinspection PyArgumentList
         vmin = float(str(self.getNumpy().min()))
@@ -1143,10 +1256,14 @@ class SisypheVolume(SisypheImage):
         if vmin != self._display.getRangeMin() or vmax != self._display.getRangeMax():
             self._display.setRange(vmin, vmax)
             self._display.setDefaultWindow()
-        else: self.display.updateVTKLUT()
+        else: self._display.updateVTKLUT()
 
     def _updateImages(self) -> None:
         super()._updateImages()
+        # < Revision 16/10/2026
+        # SimpleITK image replaces memory-mapped binary part
+        self._mmap = None
+        # Revision 16/10/2026 >
         self._updateOrientation()
         self._updateRange()
         self._calcID()
@@ -1160,6 +1277,59 @@ class SisypheVolume(SisypheImage):
         if 'scl_slope' in k: self._slope = self._sitk_image.GetMetaData('scl_slope')
         else: self._slope = 1.0
 
+    # < Revision 16/10/2026
+    # add _sitk_image and _numpy_array properties, _openMemoryMap and _materializeMemoryMap private methods
+    # _sitk_image and _numpy_array properties override SisypheImage slots, images are materialised at first access
+    # in memory-mapped mode, including direct accesses from methods inherited from the SisypheImage class
+    @property
+    def _sitk_image(self) -> sitkImage | None:
+        if self._mmap is not None: self._materializeMemoryMap()
+        return SisypheImage._sitk_image.__get__(self)
+
+    @_sitk_image.setter
+    def _sitk_image(self, img: sitkImage | None) -> None:
+        # SimpleITK image replaces memory-mapped view
+        if img is not None: self._mmap = None
+        SisypheImage._sitk_image.__set__(self, img)
+
+    @property
+    def _numpy_array(self) -> ndarray | None:
+        if self._mmap is not None: self._materializeMemoryMap()
+        return SisypheImage._numpy_array.__get__(self)
+
+    @_numpy_array.setter
+    def _numpy_array(self, img: ndarray | None) -> None:
+        SisypheImage._numpy_array.__set__(self, img)
+
+    def _openMemoryMap(self, filename: str, offset: int = 0) -> None:
+        # default numpy shape (z, y, x) or (n, z, y, x) if multicomponent, same as binary part layout
+        size = self._attr['size']
+        n = self._attr['components']
+        if n == 1: shape = (size[2], size[1], size[0])
+        else: shape = (n, size[2], size[1], size[0])
+        self._sitk_image = None
+        self._itk_image = None
+        self._vtk_image = None
+        self._numpy_array = None
+        self._mmap = memmap(filename, dtype=self._attr['datatype'], mode='r', offset=offset, shape=shape)
+
+    def _materializeMemoryMap(self) -> None:
+        if self._mmap is not None:
+            # memory-mapped view is released before copyFromNumpyArray() call to avoid recursive materialisation
+            view = self._mmap
+            self._mmap = None
+            try:
+                self.copyFromNumpyArray(view,
+                                        spacing=self._attr['spacing'],
+                                        origin=self._attr['origin'],
+                                        direction=self._attr['directions'],
+                                        defaultshape=True)
+            except Exception:
+                self._mmap = view
+                raise
+            if self.isIntegerDatatype(): self.display.convertRangeWindowToInt()
+    # Revision 16/10/2026 >
+
     # Public methods
 
     def copyFromSITKImage(self, img: sitkImage) -> None:
@@ -1253,6 +1423,175 @@ class SisypheVolume(SisypheImage):
         super().setSITKImage(img)
         self._updateRange()
 
+    # < Revision 16/10/2026
+    # add getSITKImage, getITKImage, getVTKImage, getNumpy and isMemoryMapped methods, memory-mapped loading mode
+    def getSITKImage(self) -> sitkImage:
+        """
+        SimpleITK view (pointer) of the current SisypheVolume instance. Image buffer is shared between SimpleITK image
+        and current SisypheVolume instances. SimpleITK image is materialised at first call if the current
+        SisypheVolume instance is memory-mapped.
+
+        Returns
+        -------
+        SimpleITK.Image
+            shallow copy of image
+        """
+        self._materializeMemoryMap()
+        return super().getSITKImage()
+
+    def getITKImage(self) -> itkImage:
+        """
+        ITKImage view (pointer) of the current SisypheVolume instance. Image buffer is shared between ITKImage and
+        current SisypheVolume instances. ITK image is materialised at first call if the current SisypheVolume instance
+        is memory-mapped.
+
+        Returns
+        -------
+        itk.Image
+            shallow copy of image
+        """
+        self._materializeMemoryMap()
+        return super().getITKImage()
+
+    def getVTKImage(self) -> vtkImageData:
+        """
+        VTKImageData view (pointer) of the current SisypheVolume instance. Image buffer is shared between VTKImageData
+        and current SisypheVolume instances. VTK image is materialised at first call if the current SisypheVolume
+        instance is memory-mapped.
+
+        Returns
+        -------
+        vtk.vtkImageData
+            shallow copy of image
+        """
+        self._materializeMemoryMap()
+        return super().getVTKImage()
+
+    def getNumpy(self, defaultshape: bool = True) -> ndarray:
+        """
+        Numpy array view (pointer) of the current SisypheVolume instance. Image buffer is shared between numpy array
+        and current SisypheVolume instances. If the current SisypheVolume instance is memory-mapped, returns a
+        read-only numpy.memmap view of the file binary part.
+
+        Parameters
+        ----------
+        defaultshape : bool
+            - 3D: if True returns (z, y, x) shape, otherwise returns shape (x, y, z)
+            - 4D: if True returns (n, z, y, x) shape, otherwise returns shape (x, y, z, n)
+
+        Returns
+        -------
+        numpy.ndarray
+            shallow copy of image
+        """
+        if self._mmap is not None:
+            if defaultshape: return self._mmap
+            elif self._mmap.ndim == 3: return self._mmap.T
+            else: return transpose(self._mmap, axes=(3, 2, 1, 0))
+        else: return super().getNumpy(defaultshape)
+
+    def isMemoryMapped(self) -> bool:
+        """
+        Check whether the current SisypheVolume instance is memory-mapped, i.e. binary part is a read-only
+        numpy.memmap view of the file (or a component view, see getComponentView method) and SimpleITK, ITK and VTK
+        images are not yet materialised. Images are materialised at first call of getSITKImage, getITKImage or
+        getVTKImage methods.
+
+        Returns
+        -------
+        bool
+            True if memory-mapped
+        """
+        return self._mmap is not None
+
+    def isEmpty(self) -> bool:
+        """
+        Check whether image buffer is allocated. A memory-mapped volume is not empty, its binary part is a
+        memory-mapped view of the file.
+
+        Returns
+        -------
+        bool
+            True if image buffer is not allocated
+        """
+        return SisypheImage._sitk_image.__get__(self) is None and self._mmap is None
+
+    def getSize(self) -> tuple[int, int, int]:
+        """
+        Get image size, i.e. voxel count in each dimension.
+
+        Returns
+        -------
+        tuple[int, int, int]
+            image size in each axis
+        """
+        # memory-mapped volume, size from xml part without materialisation
+        if self._mmap is not None: return tuple(self._attr['size'])
+        else: return super().getSize()
+
+    def getSpacing(self) -> vectorFloat3:
+        """
+        Get voxel size (mm) in each dimension.
+
+        Returns
+        -------
+        tuple[float, float, float]
+            voxel size in each axis
+        """
+        if self._mmap is not None: return tuple(self._attr['spacing'])
+        else: return super().getSpacing()
+
+    def getOrigin(self) -> vectorFloat3:
+        """
+        Get geometrical reference origin coordinates.
+
+        Returns
+        -------
+        tuple[float, float, float]
+            origin coordinates
+        """
+        if self._mmap is not None: return tuple(self._attr['origin'])
+        else: return super().getOrigin()
+
+    def getDirections(self) -> tuple[float, ...]:
+        """
+        Get vectors of image axes in RAS+ coordinates system.
+
+        Returns
+        -------
+        tuple[float, ...]
+            9 floats, first vector (x-axis), second vector (y-axis), third vector (z-axis)
+        """
+        if self._mmap is not None: return tuple(self._attr['directions'])
+        else: return super().getDirections()
+
+    def getDatatype(self) -> str:
+        """
+        Get image datatype as numpy datatype (i.e. 'uint8', 'int8', 'uint16', 'int16', 'int32', 'uint32', 'int64',
+        'uint64', 'float32', 'float62').
+
+        Returns
+        -------
+        str
+            datatype
+        """
+        if self._mmap is not None: return str(self._mmap.dtype)
+        else: return super().getDatatype()
+
+    def getNumberOfComponentsPerPixel(self) -> int:
+        """
+        Get number of components. Array element of single component image is a scalar, array element of multi-component
+        image is a vector. The number of components is the vector element count.
+
+        Returns
+        -------
+        int
+            number of components
+        """
+        if self._mmap is not None: return self._attr['components']
+        else: return super().getNumberOfComponentsPerPixel()
+    # Revision 16/10/2026 >
+
     def getID(self) -> str:
         """
         Get the ID attribute of the current SisypheVolume instance.
@@ -1268,6 +1607,12 @@ class SisypheVolume(SisypheImage):
         str
             ID
         """
+        # < Revision 16/10/2026
+        # undefined ID of a memory-mapped volume is replaced by array ID at first call
+        if self._ID is None and not self.isEmpty():
+            self._ID = self.getArrayID()
+            self._transforms.setReferenceID(self._ID)
+        # Revision 16/10/2026 >
         if self._ID is None: return 'None'
         else: return self._ID
 
@@ -1361,7 +1706,9 @@ class SisypheVolume(SisypheImage):
         if isinstance(ID, SisypheVolume): ID = ID.getID()
         elif isinstance(ID, SisypheROI): ID = ID.getReferenceID()
         elif isinstance(ID, SisypheMesh): ID = ID.getReferenceID()
-        if isinstance(ID, str): return self._ID == ID
+        if isinstance(ID, str):
+            if self._ID is None: self.getID()
+            return self._ID == ID
         else: raise TypeError('parameter type {} is not str, SisypheVolume, SisypheROI or SisypheMesh.'.format(type(ID)))
 
     def getArrayID(self) -> str:
@@ -1379,6 +1726,10 @@ class SisypheVolume(SisypheImage):
         str
             Array ID
         """
+        # < Revision 16/10/2026
+        # array ID of a memory-mapped volume is computed at first call
+        if self._arrayID is None: self._computeArrayID()
+        # Revision 16/10/2026 >
         return self._arrayID
 
     def updateArrayID(self) -> None:
@@ -1457,6 +1808,7 @@ class SisypheVolume(SisypheImage):
         if isinstance(display, SisypheDisplay):
             self._display = display
             self._display.setParent(self)
+            self._staleRange = False
         else: raise TypeError('parameter type {} is not SisypheDisplay.'.format(type(display)))
 
     def removeDisplay(self) -> None:
@@ -1465,6 +1817,7 @@ class SisypheVolume(SisypheImage):
         no windowing.
         """
         self._display = None
+        self._staleRange = False
 
     def getDisplay(self) -> SisypheDisplay:
         """
@@ -1475,6 +1828,10 @@ class SisypheVolume(SisypheImage):
         Sisyphe.core.sisypheImageAttributes.SisypheDisplay
             display attribute
         """
+        # < Revision 16/10/2026
+        # range is updated from array at first call after array modification
+        if self._staleRange: self._computeRange()
+        # Revision 16/10/2026 >
         return self._display
 
     def setACPC(self, acpc: SisypheACPC) -> None:
@@ -1549,6 +1906,60 @@ class SisypheVolume(SisypheImage):
             else: raise TypeError('parameter type {} is not int.'.format(type(c)))
         else: raise ValueError('Image has only one component.')
 
+    # < Revision 16/10/2026
+    # add getComponentView method
+    def getComponentView(self, c: int = 0) -> SisypheVolume:
+        """
+        Get a component of the current SisypheVolume instance as a single-component SisypheVolume without copy. The
+        numpy array of the returned volume (getNumpy method) is a read-only strided view of the buffer of the current
+        SisypheVolume instance. As in memory-mapped loading mode, SimpleITK, ITK and VTK images of the returned volume
+        are materialised at first call of getSITKImage, getITKImage or getVTKImage methods (copy of this component
+        only). Use copyComponent() method to get a writable copy.
+
+        Parameters
+        ----------
+        c : int
+            component index (default 0)
+
+        Returns
+        -------
+        SisypheVolume
+            single-component volume, view of a component
+        """
+        n = self.getNumberOfComponentsPerPixel()
+        if n > 1:
+            if isinstance(c, int):
+                if 0 <= c < n:
+                    img = SisypheVolume()
+                    # same attributes as xml part in memory-mapped loading mode
+                    img._attr = {'size': list(self.getSize()),
+                                 'components': 1,
+                                 'datatype': self.getDatatype(),
+                                 'spacing': list(self.getSpacing()),
+                                 'origin': list(self.getOrigin()),
+                                 'directions': list(self.getDirections())}
+                    view = self.getNumpy()[c]
+                    view.flags.writeable = False
+                    img._mmap = view
+                    # copyAttributesTo() is not used, setOrigin() and setDirections() materialise the view,
+                    # origin and directions are already in _attr
+                    img._identity.copyFrom(self._identity)
+                    img._acquisition.copyFrom(self._acquisition)
+                    img.getDisplay().copyFrom(self.getDisplay())
+                    img._acpc.copyFrom(self._acpc)
+                    img._compression = self._compression
+                    img._orientation = self._orientation
+                    img._slope = self._slope
+                    img._intercept = self._intercept
+                    img.setID(self.getID())
+                    img._transforms = self._transforms.copy()
+                    img._transforms.setReferenceID(img.getID())
+                    return img
+                else: raise IndexError('parameter value {} is out of range.'.format(c))
+            else: raise TypeError('parameter type {} is not int.'.format(type(c)))
+        else: raise ValueError('Image has only one component.')
+    # Revision 16/10/2026 >
+
     def cast(self, datatype: str) -> SisypheVolume:
         """
         SisypheVolume copy of the current SisypheVolume instance with a new datatype.
@@ -1604,7 +2015,7 @@ class SisypheVolume(SisypheImage):
             # Revision 21/02/2025 >
             if identity: img._identity.copyFrom(self._identity)
             if acquisition: img._acquisition.copyFrom(self._acquisition)
-            if display: img._display.copyFrom(self._display)
+            if display: img.getDisplay().copyFrom(self.getDisplay())
             if acpc: img._acpc.copyFrom(self._acpc)
             img._compression = self._compression
             img._orientation = self._orientation
@@ -1645,7 +2056,7 @@ class SisypheVolume(SisypheImage):
             # Revision 21/02/2025 >
             if identity: self._identity.copyFrom(img._identity)
             if acquisition: self._acquisition.copyFrom(img._acquisition)
-            if display: self._display.copyFrom(img._display)
+            if display: self.getDisplay().copyFrom(img.getDisplay())
             if acpc: self._acpc.copyFrom(img._acpc)
             self._compression = img._compression
             self._orientation = img._orientation
@@ -3214,6 +3625,10 @@ class SisypheVolume(SisypheImage):
         SisypheTransforms
             geometric transform collection
         """
+        # < Revision 16/10/2026
+        # reference ID of transforms of a memory-mapped volume is defined at first getID() call
+        if self._ID is None: self.getID()
+        # Revision 16/10/2026 >
         return self._transforms
 
     def hasTransform(self, ID: str | SisypheVolume) -> bool:
@@ -3315,6 +3730,10 @@ class SisypheVolume(SisypheImage):
         with other SisypheVolume instances.
         """
         if self.hasFilename():
+            # < Revision 16/10/2026
+            # reference ID of transforms of a memory-mapped volume is defined at first getID() call
+            if self._ID is None: self.getID()
+            # Revision 16/10/2026 >
             path, ext = splitext(self._filename)
             filename = path + self._transforms.getFileExt()
             if len(self._transforms) > 0:
@@ -3710,7 +4129,7 @@ class SisypheVolume(SisypheImage):
             # Acquisition nodes
             self._acquisition.createXML(doc, root)
             # Display nodes
-            self._display.createXML(doc, root)
+            self.getDisplay().createXML(doc, root)
             # Array
             node = doc.createElement('array')
             root.appendChild(node)
@@ -3739,6 +4158,10 @@ class SisypheVolume(SisypheImage):
             # Acquisition nodes
             self._acquisition.parseXML(doc)
             # Display nodes
+            # < Revision 16/10/2026
+            # parsed display replaces pending range update of the previous array
+            self._staleRange = False
+            # Revision 16/10/2026 >
             self._display.parseXML(doc)
             node = root.firstChild
             while node:
@@ -3828,6 +4251,10 @@ class SisypheVolume(SisypheImage):
             - if True, saved in a single file (xml part + binary part)
             - if False, The xml part is saved in .xvol file and the binary part in .raw file
         """
+        # < Revision 16/10/2026
+        # memory-mapped volume, binary part is loaded before overwriting file
+        self._materializeMemoryMap()
+        # Revision 16/10/2026 >
         if not self.isEmpty():
             if filename != '': self.setFilename(filename)
             if self.hasFilename(): self.saveAs(self._filename, single)
@@ -3855,15 +4282,24 @@ class SisypheVolume(SisypheImage):
                 - 'datatype': str, numpy datatype
                 - 'directions': list[float], direction vectors
                 - 'array': bytes, array image
+                - 'chunks': tuple[int, list[int]], step and offsets of compressed chunks (version 1.2)
         """
         root = doc.documentElement
-        if root.nodeName == self._FILEEXT[1:] and root.getAttribute('version') <= '1.1':
+        # < Revision 16/10/2026
+        # version 1.2, chunked compressed binary part
+        # if root.nodeName == self._FILEEXT[1:] and root.getAttribute('version') <= '1.1':
+        if root.nodeName == self._FILEEXT[1:] and root.getAttribute('version') <= '1.2':
+        # Revision 16/10/2026 >
             attr = dict()
             # Identity nodes
             self._identity.parseXML(doc)
             # Acquisition nodes
             self._acquisition.parseXML(doc)
             # Display nodes
+            # < Revision 16/10/2026
+            # parsed display replaces pending range update of the previous array
+            self._staleRange = False
+            # Revision 16/10/2026 >
             self._display.parseXML(doc)
             # ACPC nodes
             self._acpc.parseXML(doc)
@@ -3876,6 +4312,12 @@ class SisypheVolume(SisypheImage):
                 # Compressed
                 elif node.nodeName == 'compressed':
                     self._compression = node.firstChild.data == 'True'
+                # < Revision 16/10/2026
+                # Chunk offsets of compressed binary part, version 1.2
+                elif node.nodeName == 'chunks':
+                    attr['chunks'] = (int(node.getAttribute('step')),
+                                      [int(i) for i in node.firstChild.data.split(' ')])
+                # Revision 16/10/2026 >
                 # Image attributes nodes
                 elif node.nodeName == 'attributes':
                     childnode = node.firstChild
@@ -3931,7 +4373,7 @@ class SisypheVolume(SisypheImage):
             return attr
         else: raise IOError('XML file format is not supported.')
 
-    def load(self, filename: str = '', binary: bool = True) -> None:
+    def load(self, filename: str = '', binary: bool = True, mmap: bool = False) -> None:
         """
         Load the current SisypheVolume instance from a PySisyphe Volume (.xvol) file.
 
@@ -3943,6 +4385,10 @@ class SisypheVolume(SisypheImage):
         binary : bool
             if False, load only xml part (attributes), not binary part (array), default is True (load xml and binary
             parts)
+        mmap : bool
+            if True, binary part of uncompressed file (single file or .raw file) is not read but exposed as a read-only
+            numpy.memmap view, SimpleITK, ITK and VTK images are materialised at first call of getSITKImage(),
+            getITKImage() or getVTKImage() methods. Ignored if file is compressed. Default is False
         """
         if filename == '' and self.hasFilename(): filename = self._filename
         # Check extension xvol
@@ -3961,7 +4407,18 @@ class SisypheVolume(SisypheImage):
                 # attr = self.parseXML(doc)
                 self._attr = self.parseXML(doc)
                 # Read binary array part
-                if binary:
+                # < Revision 16/10/2026
+                # memory-mapped loading mode, uncompressed binary part
+                if binary and mmap and not self._compression:
+                    rawname = self._attr['array']
+                    if rawname == 'self': self._openMemoryMap(filename, f.tell())
+                    else:
+                        rawname = join(dirname(filename), basename(rawname))
+                        rawname = '{}.raw'.format(splitext(rawname)[0])
+                        if exists(rawname): self._openMemoryMap(rawname)
+                        else: raise IOError('no such file : {}.'.format(rawname))
+                # Revision 16/10/2026 >
+                elif binary:
                     buff = None
                     # rawname = attr['array']
                     rawname = self._attr['array']
@@ -3976,19 +4433,19 @@ class SisypheVolume(SisypheImage):
                     if buff is not None:
                         # < Revision 17/11/2024
                         # replace attr by self._attr
-                        if self._compression: buff = decompress(buff)
-                        # img = frombuffer(buff, dtype=attr['datatype'])
-                        img = frombuffer(buff, dtype=self._attr['datatype'])
-                        # size = attr['size']
+                        # < Revision 16/10/2026
+                        # chunked compressed binary part, version 1.2
                         size = self._attr['size']
-                        # if attr['components'] == 1: img = img.reshape((size[2], size[1], size[0]))
-                        if self._attr['components'] == 1: img = img.reshape((size[2], size[1], size[0]))
-                        # <revision 16/07/2024
                         # bug multicomponent loading, reshape to default order (n, z, y, x) and not native order (z, y, x, n)
-                        # else: img = img.reshape((size[2], size[1], size[0], attr['components']))
-                        # else: img = img.reshape((attr['components'], size[2], size[1], size[0]))
-                        else: img = img.reshape((self._attr['components'], size[2], size[1], size[0]))
-                        # revision 16/07/2024>
+                        if self._attr['components'] == 1: shape = (size[2], size[1], size[0])
+                        else: shape = (self._attr['components'], size[2], size[1], size[0])
+                        if 'chunks' in self._attr:
+                            step, offsets = self._attr['chunks']
+                            img = decompressArrayFromChunks(buff, step, offsets, shape, self._attr['datatype'])
+                        else:
+                            if self._compression: buff = decompress(buff)
+                            img = frombuffer(buff, dtype=self._attr['datatype']).reshape(shape)
+                        # Revision 16/10/2026 >
                         # self.copyFromNumpyArray(img,
                         #                         spacing=attr['spacing'],
                         #                         origin=attr['origin'],
@@ -4010,7 +4467,37 @@ class SisypheVolume(SisypheImage):
             self.getAcquisition().loadLabels()
         else: raise IOError('no such file : {}.'.format(filename))
 
-    def createXML(self, doc: minidom.Document, single: bool = True) -> None:
+    # < Revision 16/10/2026
+    # add loadComponent method
+    def loadComponent(self, filename: str, index: int) -> None:
+        """
+        Load the current SisypheVolume instance from a component of a multicomponent PySisyphe Volume (.xvol) file.
+        Only the binary part of this component is read (see Sisyphe.core.sisypheXml.XmlVolume.readComponent method).
+
+        Parameters
+        ----------
+        filename : str
+            PySisyphe Volume file name
+        index : int
+            component index
+        """
+        from Sisyphe.core.sisypheXml import XmlVolume
+        # xml part
+        self.load(filename, binary=False)
+        img = XmlVolume(self._filename).readComponent(index)
+        self.copyFromNumpyArray(img,
+                                spacing=self._attr['spacing'],
+                                origin=self._attr['origin'],
+                                direction=self._attr['directions'],
+                                defaultshape=True)
+        if self.isIntegerDatatype(): self.display.convertRangeWindowToInt()
+        self._calcArrayID()
+    # Revision 16/10/2026 >
+
+    def createXML(self,
+                  doc: minidom.Document,
+                  single: bool = True,
+                  chunks: tuple[int, list[int]] | None = None) -> None:
         """
         Write the current SisypheVolume instance attributes to xml instance. This method is called by save() and
         saveAs() methods, it is not recommended for use.
@@ -4022,6 +4509,8 @@ class SisypheVolume(SisypheImage):
         single : bool
             - if True, saved in a single file (xml part + binary part)
             - if False, The xml part is saved in .xvol file and the binary part in .raw file
+        chunks : tuple[int, list[int]] | None
+            step (number of slices or components in each chunk) and offsets of compressed chunks, default None
         """
         if isinstance(doc, minidom.Document):
             root = doc.documentElement
@@ -4035,6 +4524,15 @@ class SisypheVolume(SisypheImage):
             root.appendChild(node)
             txt = doc.createTextNode(str(self._compression))
             node.appendChild(txt)
+            # < Revision 16/10/2026
+            # Chunk offsets of compressed binary part
+            if chunks is not None:
+                node = doc.createElement('chunks')
+                node.setAttribute('step', str(chunks[0]))
+                root.appendChild(node)
+                txt = doc.createTextNode(' '.join([str(i) for i in chunks[1]]))
+                node.appendChild(txt)
+            # Revision 16/10/2026 >
             # Image attributes nodes
             volume = doc.createElement('attributes')
             root.appendChild(volume)
@@ -4088,7 +4586,7 @@ class SisypheVolume(SisypheImage):
             # Acquisition nodes
             self._acquisition.createXML(doc, root)
             # Display nodes
-            self._display.createXML(doc, root)
+            self.getDisplay().createXML(doc, root)
             # ACPC nodes
             self._acpc.createXML(doc, root)
             # Array
@@ -4115,6 +4613,10 @@ class SisypheVolume(SisypheImage):
         """
         # single = True, write single hybrid file with XML part followed by binary array part
         # if False, write two files *.xvol for XML part and *.raw for binary array part
+        # < Revision 16/10/2026
+        # memory-mapped volume, binary part is loaded before overwriting file
+        self._materializeMemoryMap()
+        # Revision 16/10/2026 >
         if not self.isEmpty():
             path, ext = splitext(filename)
             if ext.lower() != self._FILEEXT: filename = path + self._FILEEXT
@@ -4123,22 +4625,34 @@ class SisypheVolume(SisypheImage):
             root.setAttribute('version', '1.1')
             doc.appendChild(root)
             self.setFilename(filename)
-            self.createXML(doc, single)
+            # < Revision 16/10/2026
+            # chunked multi-threaded compression, version 1.2
+            # self.createXML(doc, single)
+            # buffxml = doc.toprettyxml().encode()   # Convert utf-8 to binary
+            # buffarray = self.getNumpy().tobytes()  # Default shape (n, z, y, x) if multicomponent
+            # if self._compression: buffarray = compress(buffarray)
+            if self._compression:
+                # Default shape (n, z, y, x) if multicomponent, chunks of z-slabs or components
+                step, offsets, buffarray = compressArrayToChunks(self.getNumpy())
+                root.setAttribute('version', '1.2')
+                self.createXML(doc, single, (step, offsets))
+            else:
+                buffarray = [self.getNumpy().tobytes()]  # Default shape (n, z, y, x) if multicomponent
+                self.createXML(doc, single)
             buffxml = doc.toprettyxml().encode()   # Convert utf-8 to binary
-            buffarray = self.getNumpy().tobytes()  # Default shape (n, z, y, x) if multicomponent
-            if self._compression: buffarray = compress(buffarray)
             with open(filename, 'wb') as f:
                 # Save XML part
                 f.write(buffxml)
                 # Binary array part
                 if single is True:
                     # Write in same file after XML part
-                    f.write(buffarray)
+                    for buff in buffarray: f.write(buff)
                 else:
                     # Write in other file *.raw
                     afilename = '{}.raw'.format(path)
                     with open(afilename, 'wb') as fa:
-                        fa.write(buffarray)
+                        for buff in buffarray: fa.write(buff)
+            # Revision 16/10/2026 >
             # Save Transforms
             self.saveTransforms()
             # Save labels *.labels if LB modality
@@ -4458,7 +4972,7 @@ class SisypheVolumeCollection(object):
     object -> SisypheVolumeCollection
 
     Creation: 04/02/2021
-    Last revision: 06/06/2025
+    Last revision: 16/10/2026
     """
 
     __slots__ = ['_volumes', '_index', '_homogeneous']
@@ -5150,19 +5664,30 @@ class SisypheVolumeCollection(object):
         """
         if not self.isEmpty():
             if self.isHomogeneous():
-                l = list()
-                # < Revision 20/12/2024
-                # add subset selected by indices
-                # for v in self:
-                #    l.append(v.getNumpy())
+                # < Revision 16/10/2026
+                # streaming reduction, volumes are not stacked
+                # l = list()
+                # # < Revision 20/12/2024
+                # # add subset selected by indices
+                # # for v in self:
+                # #    l.append(v.getNumpy())
+                # if c is None: idx = list(range(self.count()))
+                # elif isinstance(c, (list, tuple)): idx = c
+                # elif isinstance(c, slice): idx = list(range(c.start, c.stop, c.step))
+                # else: raise TypeError('invalid parameter type {}, must be list[int], slice or None.')
+                # for i in idx:
+                #     l.append(self._volumes[i].getNumpy())
+                # # Revision 20/12/2024 >
+                # img = nanmean(stack(l), axis=0)
                 if c is None: idx = list(range(self.count()))
                 elif isinstance(c, (list, tuple)): idx = c
                 elif isinstance(c, slice): idx = list(range(c.start, c.stop, c.step))
                 else: raise TypeError('invalid parameter type {}, must be list[int], slice or None.')
+                acc = SisypheVolumeAccumulator()
                 for i in idx:
-                    l.append(self._volumes[i].getNumpy())
-                # Revision 20/12/2024 >
-                img = nanmean(stack(l), axis=0)
+                    acc.append(self._volumes[i])
+                img = acc.getMean()
+                # Revision 16/10/2026 >
                 vol = SisypheVolume(img, spacing=self[0].getSpacing())
                 vol.copyAttributesFrom(self[0])
                 return vol
@@ -5190,19 +5715,30 @@ class SisypheVolumeCollection(object):
         """
         if not self.isEmpty():
             if self.isHomogeneous():
-                l = list()
-                # < Revision 20/12/2024
-                # add subset selected by indices
-                # for v in self:
-                #    l.append(v.getNumpy())
+                # < Revision 16/10/2026
+                # streaming reduction, volumes are not stacked
+                # l = list()
+                # # < Revision 20/12/2024
+                # # add subset selected by indices
+                # # for v in self:
+                # #    l.append(v.getNumpy())
+                # if c is None: idx = list(range(self.count()))
+                # elif isinstance(c, (list, tuple)): idx = c
+                # elif isinstance(c, slice): idx = list(range(c.start, c.stop, c.step))
+                # else: raise TypeError('invalid parameter type {}, must be list[int], slice or None.')
+                # for i in idx:
+                #     l.append(self._volumes[i].getNumpy())
+                # # Revision 20/12/2024 >
+                # img = nanstd(stack(l), axis=0)
                 if c is None: idx = list(range(self.count()))
                 elif isinstance(c, (list, tuple)): idx = c
                 elif isinstance(c, slice): idx = list(range(c.start, c.stop, c.step))
                 else: raise TypeError('invalid parameter type {}, must be list[int], slice or None.')
+                acc = SisypheVolumeAccumulator()
                 for i in idx:
-                    l.append(self._volumes[i].getNumpy())
-                # Revision 20/12/2024 >
-                img = nanstd(stack(l), axis=0)
+                    acc.append(self._volumes[i])
+                img = acc.getStd()
+                # Revision 16/10/2026 >
                 vol = SisypheVolume(img, spacing=self[0].getSpacing())
                 vol.copyAttributesFrom(self[0])
                 return vol
@@ -5230,19 +5766,29 @@ class SisypheVolumeCollection(object):
         """
         if not self.isEmpty():
             if self.isHomogeneous():
-                l = list()
-                # < Revision 20/12/2024
-                # add subset selected by indices
-                # for v in self:
-                #    l.append(v.getNumpy())
+                # < Revision 16/10/2026
+                # exact percentile computed slab by slab, volumes are not stacked
+                # l = list()
+                # # < Revision 20/12/2024
+                # # add subset selected by indices
+                # # for v in self:
+                # #    l.append(v.getNumpy())
+                # if c is None: idx = list(range(self.count()))
+                # elif isinstance(c, (list, tuple)): idx = c
+                # elif isinstance(c, slice): idx = list(range(c.start, c.stop, c.step))
+                # else: raise TypeError('invalid parameter type {}, must be list[int], slice or None.')
+                # for i in idx:
+                #     l.append(self._volumes[i].getNumpy())
+                # # Revision 20/12/2024 >
+                # img = nanmedian(stack(l), axis=0)
                 if c is None: idx = list(range(self.count()))
                 elif isinstance(c, (list, tuple)): idx = c
                 elif isinstance(c, slice): idx = list(range(c.start, c.stop, c.step))
                 else: raise TypeError('invalid parameter type {}, must be list[int], slice or None.')
-                for i in idx:
-                    l.append(self._volumes[i].getNumpy())
-                # Revision 20/12/2024 >
-                img = nanmedian(stack(l), axis=0)
+                img = SisypheVolumeAccumulator.getPercentile([self._volumes[i] for i in idx], 50)
+                # same datatype as numpy nanmedian, float32 if volumes are float32, otherwise float64
+                if self._volumes[idx[0]].getDatatype() == 'float32': img = img.astype('float32')
+                # Revision 16/10/2026 >
                 vol = SisypheVolume(img, spacing=self[0].getSpacing())
                 vol.copyAttributesFrom(self[0])
                 return vol
@@ -5272,19 +5818,27 @@ class SisypheVolumeCollection(object):
         """
         if not self.isEmpty():
             if self.isHomogeneous():
-                l = list()
-                # < Revision 20/12/2024
-                # add subset selected by indices
-                # for v in self:
-                #    l.append(v.getNumpy())
+                # < Revision 16/10/2026
+                # exact percentile computed slab by slab, volumes are not stacked
+                # l = list()
+                # # < Revision 20/12/2024
+                # # add subset selected by indices
+                # # for v in self:
+                # #    l.append(v.getNumpy())
+                # if c is None: idx = list(range(self.count()))
+                # elif isinstance(c, (list, tuple)): idx = c
+                # elif isinstance(c, slice): idx = list(range(c.start, c.stop, c.step))
+                # else: raise TypeError('invalid parameter type {}, must be list[int], slice or None.')
+                # for i in idx:
+                #     l.append(self._volumes[i].getNumpy())
+                # # Revision 20/12/2024 >
+                # img = nanpercentile(stack(l), perc, axis=0)
                 if c is None: idx = list(range(self.count()))
                 elif isinstance(c, (list, tuple)): idx = c
                 elif isinstance(c, slice): idx = list(range(c.start, c.stop, c.step))
                 else: raise TypeError('invalid parameter type {}, must be list[int], slice or None.')
-                for i in idx:
-                    l.append(self._volumes[i].getNumpy())
-                # Revision 20/12/2024 >
-                img = nanpercentile(stack(l), perc, axis=0)
+                img = SisypheVolumeAccumulator.getPercentile([self._volumes[i] for i in idx], perc)
+                # Revision 16/10/2026 >
                 vol = SisypheVolume(img, spacing=self[0].getSpacing())
                 vol.copyAttributesFrom(self[0])
                 return vol
@@ -5312,19 +5866,30 @@ class SisypheVolumeCollection(object):
         """
         if not self.isEmpty():
             if self.isHomogeneous():
-                l = list()
-                # < Revision 20/12/2024
-                # add subset selected by indices
-                # for v in self:
-                #    l.append(v.getNumpy())
+                # < Revision 16/10/2026
+                # streaming reduction, volumes are not stacked
+                # l = list()
+                # # < Revision 20/12/2024
+                # # add subset selected by indices
+                # # for v in self:
+                # #    l.append(v.getNumpy())
+                # if c is None: idx = list(range(self.count()))
+                # elif isinstance(c, (list, tuple)): idx = c
+                # elif isinstance(c, slice): idx = list(range(c.start, c.stop, c.step))
+                # else: raise TypeError('invalid parameter type {}, must be list[int], slice or None.')
+                # for i in idx:
+                #     l.append(self._volumes[i].getNumpy())
+                # # Revision 20/12/2024 >
+                # img = nanmax(stack(l), axis=0)
                 if c is None: idx = list(range(self.count()))
                 elif isinstance(c, (list, tuple)): idx = c
                 elif isinstance(c, slice): idx = list(range(c.start, c.stop, c.step))
                 else: raise TypeError('invalid parameter type {}, must be list[int], slice or None.')
+                acc = SisypheVolumeAccumulator()
                 for i in idx:
-                    l.append(self._volumes[i].getNumpy())
-                # Revision 20/12/2024 >
-                img = nanmax(stack(l), axis=0)
+                    acc.append(self._volumes[i])
+                img = acc.getMax()
+                # Revision 16/10/2026 >
                 vol = SisypheVolume(img, spacing=self[0].getSpacing())
                 vol.copyAttributesFrom(self[0])
                 return vol
@@ -5352,19 +5917,30 @@ class SisypheVolumeCollection(object):
         """
         if not self.isEmpty():
             if self.isHomogeneous():
-                l = list()
-                # < Revision 20/12/2024
-                # add subset selected by indices
-                # for v in self:
-                #    l.append(v.getNumpy())
+                # < Revision 16/10/2026
+                # streaming reduction, volumes are not stacked
+                # l = list()
+                # # < Revision 20/12/2024
+                # # add subset selected by indices
+                # # for v in self:
+                # #    l.append(v.getNumpy())
+                # if c is None: idx = list(range(self.count()))
+                # elif isinstance(c, (list, tuple)): idx = c
+                # elif isinstance(c, slice): idx = list(range(c.start, c.stop, c.step))
+                # else: raise TypeError('invalid parameter type {}, must be list[int], slice or None.')
+                # for i in idx:
+                #     l.append(self._volumes[i].getNumpy())
+                # # Revision 20/12/2024 >
+                # img = nanmin(stack(l), axis=0)
                 if c is None: idx = list(range(self.count()))
                 elif isinstance(c, (list, tuple)): idx = c
                 elif isinstance(c, slice): idx = list(range(c.start, c.stop, c.step))
                 else: raise TypeError('invalid parameter type {}, must be list[int], slice or None.')
+                acc = SisypheVolumeAccumulator()
                 for i in idx:
-                    l.append(self._volumes[i].getNumpy())
-                # Revision 20/12/2024 >
-                img = nanmin(stack(l), axis=0)
+                    acc.append(self._volumes[i])
+                img = acc.getMin()
+                # Revision 16/10/2026 >
                 vol = SisypheVolume(img, spacing=self[0].getSpacing())
                 vol.copyAttributesFrom(self[0])
                 return vol
@@ -5383,10 +5959,18 @@ class SisypheVolumeCollection(object):
         """
         if not self.isEmpty():
             if self.isHomogeneous():
-                l = list()
+                # < Revision 16/10/2026
+                # streaming reduction, volumes are not stacked
+                # l = list()
+                # for v in self:
+                #     l.append(v.getNumpy())
+                # img = nanargmin(stack(l), axis=0)
+                acc = SisypheVolumeAccumulator()
                 for v in self:
-                    l.append(v.getNumpy())
-                img = nanargmin(stack(l), axis=0)
+                    acc.append(v)
+                # same datatype as numpy nanargmin, int64
+                img = acc.getArgmin().astype('int64')
+                # Revision 16/10/2026 >
                 vol = SisypheVolume(img, spacing=self[0].getSpacing())
                 vol.copyAttributesFrom(self[0])
                 return vol
@@ -5405,10 +5989,18 @@ class SisypheVolumeCollection(object):
         """
         if not self.isEmpty():
             if self.isHomogeneous():
-                l = list()
+                # < Revision 16/10/2026
+                # streaming reduction, volumes are not stacked
+                # l = list()
+                # for v in self:
+                #     l.append(v.getNumpy())
+                # img = nanargmax(stack(l), axis=0)
+                acc = SisypheVolumeAccumulator()
                 for v in self:
-                    l.append(v.getNumpy())
-                img = nanargmax(stack(l), axis=0)
+                    acc.append(v)
+                # same datatype as numpy nanargmax, int64
+                img = acc.getArgmax().astype('int64')
+                # Revision 16/10/2026 >
                 vol = SisypheVolume(img, spacing=self[0].getSpacing())
                 vol.copyAttributesFrom(self[0])
                 return vol
@@ -5598,7 +6190,7 @@ class SisypheVolumeCollection(object):
 
     # IO Public methods
 
-    def load(self, filenames: str | list[str]) -> None:
+    def load(self, filenames: str | list[str], mmap: bool = False) -> None:
         """
         Load SisypheVolume elements in the current SisypheVolumeCollection instance container from a list of PySisyphe
         volume (.xvol) file names.
@@ -5607,6 +6199,9 @@ class SisypheVolumeCollection(object):
         ----------
         filenames : str | list[str]
             list of PySisyphe Volume (.xvol) file names
+        mmap : bool
+            if True, binary parts of uncompressed files are memory-mapped (see SisypheVolume.load() method), default is
+            False
         """
         if isinstance(filenames, str): filenames = [filenames]
         if isinstance(filenames, list):
@@ -5614,7 +6209,7 @@ class SisypheVolumeCollection(object):
                 if isinstance(filename, str):
                     if exists(filename):
                         vol = SisypheVolume()
-                        vol.load(filename)
+                        vol.load(filename, mmap=mmap)
                         self.append(vol)
                     else: raise FileNotFoundError('No such file {}.'.format(basename(filename)))
                 else: raise TypeError('parameter type {} is not filepath str'.format(type(filename)))
@@ -5788,3 +6383,394 @@ class SisypheVolumeCollection(object):
                         v.copyAttributesFrom(self[0], id, identity, acquisition, display, acpc, transform, slope)
                 v.saveAs(filename)
             else: raise ValueError('Collection is not homogeneous for field of view or datatype.')
+
+
+class SisypheVolumeAccumulator(object):
+    """
+    Description
+    ~~~~~~~~~~~
+
+    Streaming voxel-wise statistics of a series of SisypheVolume images with the same field of view.
+
+    Volumes are consumed one at a time (SisypheVolume instance, numpy array or PySisyphe volume file name), memory
+    does not depend on the number of volumes:
+
+        - mean and standard deviation, Welford online algorithm
+        - minimum, maximum, argmin and argmax, running reductions
+
+    Volume updates are split into slabs along the first numpy axis (z), processed in parallel threads. NaN values are
+    ignored, as numpy nanmean, nanstd, nanmin, nanmax, nanargmin and nanargmax functions.
+
+    Percentiles are not streamable, getPercentile() class method computes exact percentiles slab by slab, only a slab
+    of each volume is loaded at a time.
+
+    Inheritance
+    ~~~~~~~~~~~
+
+    object -> SisypheVolumeAccumulator
+
+    Creation: 16/10/2026
+    """
+
+    __slots__ = ['_ref', '_dtype', '_count', '_n', '_mean', '_m2', '_min', '_max', '_argmin', '_argmax', '_workers']
+
+    # Class constants
+
+    _SLABSIZE = 16777216  # slab memory budget in bytes, by thread
+
+    # Class methods
+
+    @classmethod
+    def _getSlabs(cls, n: int, nbytes: int, workers: int | None) -> list[tuple[int, int]]:
+        # slab ranges along first axis, nbytes = size of a slice of all sources
+        step = max(1, cls._SLABSIZE // max(1, nbytes))
+        if workers is None: workers = cpu_count()
+        # at least one slab per thread
+        step = max(1, min(step, -(-n // max(1, workers))))
+        return [(i, min(i + step, n)) for i in range(0, n, step)]
+
+    @classmethod
+    def getPercentile(cls,
+                      sources: list[SisypheVolume | ndarray | str] | SisypheVolumeCollection,
+                      perc: float = 50.0,
+                      workers: int | None = None) -> ndarray:
+        """
+        Calculate exact voxel-wise percentile of a series of volumes, slab by slab. Only a slab of each volume is
+        processed at a time, slabs of PySisyphe volume files (.xvol) are read without loading the whole volume (see
+        SisypheVolume.getVolumeSlab class method). NaN values are ignored, as numpy nanpercentile function.
+
+        Parameters
+        ----------
+        sources : list[SisypheVolume | numpy.ndarray | str] | SisypheVolumeCollection
+            volumes, numpy arrays (default numpy shape) or PySisyphe volume file names
+        perc : float
+            percentile value (default 50.0, median)
+        workers : int | None
+            number of threads, processor count if None (default)
+
+        Returns
+        -------
+        numpy.ndarray
+            percentile array, default numpy shape
+        """
+        if len(sources) == 0: raise ValueError('Empty volume list.')
+        shapes = list()
+        for src in sources:
+            if isinstance(src, SisypheVolume): shapes.append(src.getNumpy().shape)
+            elif isinstance(src, ndarray): shapes.append(src.shape)
+            elif isinstance(src, str): shapes.append(SisypheVolume.getXmlVolume(src).getArrayShape())
+            else: raise TypeError('parameter type {} is not SisypheVolume, ndarray or str.'.format(type(src)))
+        if shapes.count(shapes[0]) != len(shapes): raise ValueError('Volumes have not the same shape.')
+        shape = shapes[0]
+        r = empty(shape, dtype='float64')
+
+        def _slab(first: int, last: int) -> None:
+            buff = list()
+            for s in sources:
+                if isinstance(s, SisypheVolume): buff.append(s.getNumpy()[first:last])
+                elif isinstance(s, ndarray): buff.append(s[first:last])
+                # multicomponent file, first axis is component index
+                elif len(shape) == 3: buff.append(SisypheVolume.getVolumeSlab(s, first, last))
+                else: buff.append(array([SisypheVolume.getXmlVolume(s).readComponent(i) for i in range(first, last)]))
+            r[first:last] = nanpercentile(stack(buff), perc, axis=0)
+
+        nbytes = len(sources) * 8
+        for v in shape[1:]: nbytes *= v
+        slabs = cls._getSlabs(shape[0], nbytes, workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda s: _slab(*s), slabs))
+        return r
+
+    # Special methods
+
+    """
+    Private attributes
+
+    _ref        SisypheVolume | None, attributes of the first volume (field of view, acquisition...)
+    _dtype      str, datatype of the first volume
+    _count      int, number of volumes
+    _n          ndarray, voxel-wise count of non NaN values
+    _mean       ndarray, voxel-wise running mean
+    _m2         ndarray, voxel-wise running sum of squared differences from the mean
+    _min        ndarray, voxel-wise running minimum
+    _max        ndarray, voxel-wise running maximum
+    _argmin     ndarray, voxel-wise volume index of the minimum
+    _argmax     ndarray, voxel-wise volume index of the maximum
+    _workers    int | None, number of threads
+    """
+
+    def __init__(self, workers: int | None = None) -> None:
+        """
+        SisypheVolumeAccumulator instance constructor.
+
+        Parameters
+        ----------
+        workers : int | None
+            number of threads used to update slabs, processor count if None (default)
+        """
+        self._workers = workers
+        self.clear()
+
+    def __str__(self) -> str:
+        """
+        Special overloaded method called by the built-in str() python function.
+
+        Returns
+        -------
+        str
+            conversion of SisypheVolumeAccumulator instance to str
+        """
+        buff = 'Volume count: {}\n'.format(self._count)
+        if self._mean is not None: buff += 'Shape: {}\n'.format(self._mean.shape)
+        return buff
+
+    def __repr__(self) -> str:
+        """
+        Special overloaded method called by the built-in repr() python function.
+
+        Returns
+        -------
+        str
+            SisypheVolumeAccumulator instance representation
+        """
+        return 'SisypheVolumeAccumulator instance at <{}>\n'.format(str(id(self))) + self.__str__()
+
+    # Private method
+
+    def _updateSlab(self, img: ndarray, first: int, last: int) -> None:
+        x = img[first:last]
+        xf = x.astype('float64')
+        valid = ~isnan(xf)
+        # Welford online mean and variance
+        n = self._n[first:last]
+        n += valid
+        mean = self._mean[first:last]
+        delta = where(valid, xf - mean, 0.0)
+        mean += divide(delta, n, out=zeros(delta.shape, dtype='float64'), where=n > 0)
+        self._m2[first:last] += delta * where(valid, xf - mean, 0.0)
+        # running min, max, argmin, argmax
+        vmin = self._min[first:last]
+        vmax = self._max[first:last]
+        if x.dtype.kind == 'f':
+            lt = (x < vmin) | (isnan(vmin) & valid)
+            gt = (x > vmax) | (isnan(vmax) & valid)
+        else:
+            lt = x < vmin
+            gt = x > vmax
+        vmin[lt] = x[lt]
+        vmax[gt] = x[gt]
+        self._argmin[first:last][lt] = self._count
+        self._argmax[first:last][gt] = self._count
+
+    # Public methods
+
+    def clear(self) -> None:
+        """
+        Clear the current SisypheVolumeAccumulator instance.
+        """
+        self._ref = None
+        self._dtype = ''
+        self._count = 0
+        self._n = None
+        self._mean = None
+        self._m2 = None
+        self._min = None
+        self._max = None
+        self._argmin = None
+        self._argmax = None
+
+    def count(self) -> int:
+        """
+        Get the number of volumes consumed by the current SisypheVolumeAccumulator instance.
+
+        Returns
+        -------
+        int
+            number of volumes
+        """
+        return self._count
+
+    def isEmpty(self) -> bool:
+        """
+        Check whether the current SisypheVolumeAccumulator instance has consumed volumes.
+
+        Returns
+        -------
+        bool
+            True if no volume
+        """
+        return self._count == 0
+
+    def getReference(self) -> SisypheVolume | None:
+        """
+        Get the reference volume of the current SisypheVolumeAccumulator instance. Attributes of this volume (the
+        first appended) are copied to the volumes returned by the getVolume() method.
+
+        Returns
+        -------
+        SisypheVolume | None
+            reference volume
+        """
+        return self._ref
+
+    def append(self, vol: SisypheVolume | ndarray | str) -> None:
+        """
+        Update the statistics of the current SisypheVolumeAccumulator instance with a volume. A volume given as file
+        name is only loaded during the update.
+
+        Parameters
+        ----------
+        vol : SisypheVolume | numpy.ndarray | str
+            volume, numpy array (default numpy shape) or PySisyphe volume file name (.xvol)
+        """
+        ref = None
+        if isinstance(vol, SisypheVolume):
+            ref = vol
+            img = vol.getNumpy()
+        elif isinstance(vol, ndarray): img = vol
+        elif isinstance(vol, str):
+            if self._ref is None:
+                # xml part only, attributes
+                ref = SisypheVolume()
+                ref.load(vol, binary=False)
+            img = SisypheVolume.getXmlVolume(vol).readArray()
+        else: raise TypeError('parameter type {} is not SisypheVolume, ndarray or str.'.format(type(vol)))
+        if self._count == 0:
+            self._ref = ref
+            self._dtype = str(img.dtype)
+            self._n = zeros(img.shape, dtype='int32')
+            self._mean = zeros(img.shape, dtype='float64')
+            self._m2 = zeros(img.shape, dtype='float64')
+            self._min = img.copy()
+            self._max = img.copy()
+            self._argmin = zeros(img.shape, dtype='int32')
+            self._argmax = zeros(img.shape, dtype='int32')
+        elif img.shape != self._mean.shape:
+            raise ValueError('Volume shape {} is not {}.'.format(img.shape, self._mean.shape))
+        # about 8 float64 temporary arrays by slab
+        nbytes = 64
+        for v in img.shape[1:]: nbytes *= v
+        slabs = self._getSlabs(img.shape[0], nbytes, self._workers)
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            list(executor.map(lambda s: self._updateSlab(img, *s), slabs))
+        self._count += 1
+
+    def getMean(self) -> ndarray:
+        """
+        Get the voxel-wise mean of the volumes consumed by the current SisypheVolumeAccumulator instance.
+
+        Returns
+        -------
+        numpy.ndarray
+            mean array, float32 if volumes are float32, float64 otherwise
+        """
+        if self._count > 0:
+            r = divide(self._mean, 1, out=full(self._mean.shape, nan), where=self._n > 0)
+            if self._dtype == 'float32': r = r.astype('float32')
+            return r
+        else: raise ValueError('{} is empty.'.format(self.__class__.__name__))
+
+    def getVariance(self) -> ndarray:
+        """
+        Get the voxel-wise variance of the volumes consumed by the current SisypheVolumeAccumulator instance.
+
+        Returns
+        -------
+        numpy.ndarray
+            variance array (population variance, as numpy nanvar), float32 if volumes are float32, float64 otherwise
+        """
+        if self._count > 0:
+            r = divide(self._m2, self._n, out=full(self._m2.shape, nan), where=self._n > 0)
+            if self._dtype == 'float32': r = r.astype('float32')
+            return r
+        else: raise ValueError('{} is empty.'.format(self.__class__.__name__))
+
+    def getStd(self) -> ndarray:
+        """
+        Get the voxel-wise standard deviation of the volumes consumed by the current SisypheVolumeAccumulator instance.
+
+        Returns
+        -------
+        numpy.ndarray
+            standard deviation array (as numpy nanstd), float32 if volumes are float32, float64 otherwise
+        """
+        return sqrt(self.getVariance())
+
+    def getMin(self) -> ndarray:
+        """
+        Get the voxel-wise minimum of the volumes consumed by the current SisypheVolumeAccumulator instance.
+
+        Returns
+        -------
+        numpy.ndarray
+            minimum array, volume datatype
+        """
+        if self._count > 0: return self._min
+        else: raise ValueError('{} is empty.'.format(self.__class__.__name__))
+
+    def getMax(self) -> ndarray:
+        """
+        Get the voxel-wise maximum of the volumes consumed by the current SisypheVolumeAccumulator instance.
+
+        Returns
+        -------
+        numpy.ndarray
+            maximum array, volume datatype
+        """
+        if self._count > 0: return self._max
+        else: raise ValueError('{} is empty.'.format(self.__class__.__name__))
+
+    def getArgmin(self) -> ndarray:
+        """
+        Get the voxel-wise index of the volume with the minimum value, in the order of consumption.
+
+        Returns
+        -------
+        numpy.ndarray
+            argmin array, int32
+        """
+        if self._count > 0: return self._argmin
+        else: raise ValueError('{} is empty.'.format(self.__class__.__name__))
+
+    def getArgmax(self) -> ndarray:
+        """
+        Get the voxel-wise index of the volume with the maximum value, in the order of consumption.
+
+        Returns
+        -------
+        numpy.ndarray
+            argmax array, int32
+        """
+        if self._count > 0: return self._argmax
+        else: raise ValueError('{} is empty.'.format(self.__class__.__name__))
+
+    def getVolume(self, stat: str = 'mean') -> SisypheVolume:
+        """
+        Get a voxel-wise statistic of the current SisypheVolumeAccumulator instance as SisypheVolume. Attributes
+        are copied from the reference volume (see getReference() method).
+
+        Parameters
+        ----------
+        stat : str
+            'mean', 'std', 'variance', 'min', 'max', 'argmin' or 'argmax'
+
+        Returns
+        -------
+        SisypheVolume
+            statistic volume
+        """
+        stats = {'mean': self.getMean,
+                 'std': self.getStd,
+                 'variance': self.getVariance,
+                 'min': self.getMin,
+                 'max': self.getMax,
+                 'argmin': self.getArgmin,
+                 'argmax': self.getArgmax}
+        if stat in stats:
+            img = stats[stat]()
+            if self._ref is not None:
+                vol = SisypheVolume(img, spacing=self._ref.getSpacing())
+                vol.copyAttributesFrom(self._ref)
+            else: vol = SisypheVolume(img)
+            return vol
+        else: raise ValueError('invalid stat parameter {}.'.format(stat))
@@ -9,6 +9,10 @@ External packages/modules
 from os.path import exists
 from os.path import splitext
 from os.path import basename
+from os.path import dirname
+from os.path import join
+
+from zlib import decompressobj
 
 from datetime import date
 from datetime import datetime
@@ -20,9 +24,13 @@ from PyQt5.QtGui import QColor
 
 from numpy import array
 from numpy import ndarray
+from numpy import memmap
+from numpy import dtype
+from numpy import frombuffer
 
 from Sisyphe.core.sisypheROI import SisypheROI
 from Sisyphe.core.sisypheVolume import SisypheVolume
+from Sisyphe.core.sisypheImageIO import decompressArrayFromChunks
 from Sisyphe.core.sisypheTracts import SisypheStreamlines
 
 __all__ = ['AbstractXml',
@@ -56,7 +64,7 @@ class AbstractXml(object):
     Creation: 08/09/2022
     Last revision: 16/12/2023
     """
-    __slots__ = ['_doc', '_filename']
+    __slots__ = ['_doc', '_filename', '_offset']
 
     # Class method
 
@@ -71,6 +79,7 @@ class AbstractXml(object):
 
     _doc        minidom.Document
     _filename   str
+    _offset     int, offset of the binary part (end of the xml part)
     """
 
     def __init__(self, filename: str) -> None:
@@ -93,6 +102,7 @@ class AbstractXml(object):
                 while line != end:
                     line = f.readline().decode()  # Convert binary to utf-8
                     strdoc += line
+                self._offset = f.tell()
             self._doc = minidom.parseString(strdoc)
         else: raise FileNotFoundError('No such file {}.'.format(filename))
 
@@ -277,7 +287,7 @@ class XmlVolume(AbstractXml):
     object -> AbstractXml -> XmlVolume
 
     Creation: 08/09/2022
-    Last revision: 16/12/2023
+    Last revision: 16/10/2026
     """
 
     # Class method
@@ -659,6 +669,208 @@ class XmlVolume(AbstractXml):
         """
         return self.getFieldValues('array')
 
+    # < Revision 16/10/2026
+    # add binary part random access methods (slice, slab, component)
+    def isCompressed(self) -> bool:
+        """
+        Check whether the binary part of the current XmlVolume instance is compressed.
+
+        Returns
+        -------
+        bool
+            True if compressed
+        """
+        return self.getFieldValues('compressed') == 'True'
+
+    def getChunks(self) -> tuple[int, list[int]] | None:
+        """
+        Get chunks of the compressed binary part of the current XmlVolume instance (version 1.2).
+
+        Returns
+        -------
+        tuple[int, list[int]] | None
+            step (number of slices or components in each chunk) and offsets of compressed chunks, None if binary part
+            is not chunked
+        """
+        nodes = self.getFieldNodes('chunks')
+        if nodes.length > 0:
+            node = nodes[0]
+            return int(node.getAttribute('step')), [int(i) for i in node.firstChild.data.split(' ')]
+        else: return None
+
+    def getBinaryFilename(self) -> tuple[str, int]:
+        """
+        Get the file name and the offset of the binary part of the current XmlVolume instance.
+
+        Returns
+        -------
+        tuple[str, int]
+            file name (.xvol file if single format or .raw file) and offset of the binary part in this file
+        """
+        rawname = self.getRawName()
+        if rawname == 'self': return self._filename, self._offset
+        else:
+            rawname = join(dirname(self._filename), basename(rawname))
+            rawname = '{}.raw'.format(splitext(rawname)[0])
+            if exists(rawname): return rawname, 0
+            else: raise FileNotFoundError('No such file {}.'.format(rawname))
+
+    def getArrayShape(self) -> tuple[int, ...]:
+        """
+        Get the numpy shape of the binary part of the current XmlVolume instance.
+
+        Returns
+        -------
+        tuple[int, ...]
+            default numpy shape (z, y, x) or (n, z, y, x) if multicomponent
+        """
+        size = self.getSize()
+        n = self.getComponents()
+        if n == 1: return size[2], size[1], size[0]
+        else: return n, size[2], size[1], size[0]
+
+    def readArray(self, first: int = 0, last: int | None = None) -> ndarray:
+        """
+        Read a range of the first axis of the binary part of the current XmlVolume instance (axial slab of a single
+        component volume, components of a multicomponent volume), without loading the whole binary part.
+
+            - uncompressed: only the range is read (offset arithmetic)
+            - chunked compressed (version 1.2): only the chunks overlapping the range are read and decompressed
+            - compressed (version <= 1.1): stream is decompressed up to the end of the range
+
+        Parameters
+        ----------
+        first : int
+            index of the first element of the first axis (default 0)
+        last : int | None
+            index + 1 of the last element of the first axis, default None (last element)
+
+        Returns
+        -------
+        numpy.ndarray
+            array, default numpy shape (last - first, ...)
+        """
+        shape = self.getArrayShape()
+        datatype = self.getDatatype()
+        if last is None: last = shape[0]
+        if 0 <= first < last <= shape[0]:
+            filename, offset = self.getBinaryFilename()
+            if not self.isCompressed():
+                return array(memmap(filename, dtype=datatype, mode='r', offset=offset, shape=shape)[first:last])
+            chunks = self.getChunks()
+            if chunks is not None:
+                step, offsets = chunks
+                c0 = first // step
+                c1 = (last - 1) // step + 1
+                with open(filename, 'rb') as f:
+                    f.seek(offset + offsets[c0])
+                    buff = f.read(offsets[c1] - offsets[c0])
+                return decompressArrayFromChunks(buff, step, offsets, shape, datatype, first, last)
+            else:
+                # single zlib stream, decompression stops at the end of the range
+                nbytes = dtype(datatype).itemsize
+                for i in shape[1:]: nbytes *= i
+                size = last * nbytes
+                d = decompressobj()
+                buff = bytearray()
+                with open(filename, 'rb') as f:
+                    f.seek(offset)
+                    while len(buff) < size and not d.eof:
+                        data = f.read(1048576)
+                        if not data: break
+                        buff += d.decompress(data, size - len(buff))
+                        # unconsumed_tail is not empty if max_length is reached
+                        while len(buff) < size and d.unconsumed_tail:
+                            buff += d.decompress(d.unconsumed_tail, size - len(buff))
+                if len(buff) < size: raise IOError('{} binary part is truncated.'.format(basename(self._filename)))
+                r = frombuffer(bytes(buff[first * nbytes:size]), dtype=datatype)
+                return r.reshape((last - first,) + tuple(shape[1:]))
+        else: raise ValueError('invalid range [{}, {}[.'.format(first, last))
+
+    def readSlab(self, first: int, last: int, orient: str = 'a', component: int = 0) -> ndarray:
+        """
+        Read a slab of the current XmlVolume instance, without loading the whole binary part when file format allows
+        it (axial slab or component, see readArray method).
+
+        Parameters
+        ----------
+        first : int
+            index of the first slice of the slab
+        last : int
+            index + 1 of the last slice of the slab
+        orient : str
+            slab orientation ('a' axial, 'c' coronal or 's' sagittal), default 'a'
+        component : int
+            component index of a multicomponent volume (default 0)
+
+        Returns
+        -------
+        numpy.ndarray
+            slab array, default numpy shape (z, y, x)
+        """
+        orient = orient[0]
+        if orient not in ('a', 'c', 's'):
+            raise ValueError('\'{}\' is not a valid orientation parameter (\'a\', \'c\' or \'s\').'.format(orient))
+        n = self.getComponents()
+        if not 0 <= component < n: raise ValueError('invalid component index {}.'.format(component))
+        if not self.isCompressed():
+            filename, offset = self.getBinaryFilename()
+            img = memmap(filename, dtype=self.getDatatype(), mode='r', offset=offset, shape=self.getArrayShape())
+            if n > 1: img = img[component]
+        elif n > 1: img = self.readArray(component, component + 1)[0]
+        elif orient == 'a': return self.readArray(first, last)
+        else: img = self.readArray()
+        if orient == 'a': img = img[first:last]
+        elif orient == 'c': img = img[:, first:last]
+        else: img = img[:, :, first:last]
+        return array(img)
+
+    def readSlice(self, index: int, orient: str = 'a', component: int = 0) -> ndarray:
+        """
+        Read a slice of the current XmlVolume instance, without loading the whole binary part when file format
+        allows it (see readSlab method).
+
+        Parameters
+        ----------
+        index : int
+            slice index
+        orient : str
+            slice orientation ('a' axial, 'c' coronal or 's' sagittal), default 'a'
+        component : int
+            component index of a multicomponent volume (default 0)
+
+        Returns
+        -------
+        numpy.ndarray
+            slice array, numpy shape (y, x) axial, (z, x) coronal, (z, y) sagittal
+        """
+        img = self.readSlab(index, index + 1, orient, component)
+        orient = orient[0]
+        if orient == 'a': return img[0]
+        elif orient == 'c': return img[:, 0]
+        else: return img[:, :, 0]
+
+    def readComponent(self, index: int) -> ndarray:
+        """
+        Read a component of the current XmlVolume instance, without loading the whole binary part (see readArray
+        method).
+
+        Parameters
+        ----------
+        index : int
+            component index
+
+        Returns
+        -------
+        numpy.ndarray
+            component array, default numpy shape (z, y, x)
+        """
+        if self.getComponents() == 1:
+            if index == 0: return self.readArray()
+            else: raise ValueError('invalid component index {}.'.format(index))
+        else: return self.readArray(index, index + 1)[0]
+    # Revision 16/10/2026 >
+
 
 class XmlROI(AbstractXml):
     """
@@ -431,7 +431,11 @@ class DialogDiffusionPreprocessing(QDialog):
                 denoise['ncoils'] = self._preproc.getParameterValue('ReceiverArray')
                 denoise['nphase'] = self._preproc.getParameterValue('PhaseArray')
         else: denoise = None
-        try: dwiPreprocessing(vols, prefix, suffix, gtable, brainseg, gibbs, denoise, save=True, wait=wait)
+        # < Revision 16/10/2026
+        # PCA denoising, one process per core
+        # try: dwiPreprocessing(vols, prefix, suffix, gtable, brainseg, gibbs, denoise, save=True, wait=wait)
+        try: dwiPreprocessing(vols, prefix, suffix, gtable, brainseg, gibbs, denoise, save=True, workers=0, wait=wait)
+        # Revision 16/10/2026 >
         except Exception as err:
             wait.hide()
             messageBox(self,
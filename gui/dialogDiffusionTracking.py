@@ -257,6 +257,10 @@ class DialogDiffusionTracking(QDialog):
             track.setRelativeThresholdOfPeaks(self._track.getParameterValue('RelativePeakThreshold'))
             track.setMinSeparationAngleOfPeaks(self._track.getParameterValue('MinSeparationAngle'))
             track.setMinLength(self._track.getParameterValue('MinimalLength'))
+            # < Revision 16/10/2026
+            # seed batches dispatched to one worker process per core
+            track.setNumberOfWorkers(0)
+            # Revision 16/10/2026 >
             # Algorithm
             if self._combo1.currentText() == 'Deterministic':
                 ch = self._track.getParameterWidget('DeterministicAlgorithm').currentText()
@@ -52,7 +52,7 @@ from PyQt5.QtWidgets import QApplication
 from Sisyphe.core.sisypheSheet import SisypheSheet
 from Sisyphe.core.sisypheVolume import SisypheVolume
 from Sisyphe.core.sisypheROI import SisypheROICollection
-from Sisyphe.core.sisypheROI import SisypheROIDraw
+from Sisyphe.core.sisypheROI import SisypheLabelStatistics
 from Sisyphe.core.sisypheROI import SisypheROIFeatures
 from Sisyphe.widgets.basicWidgets import messageBox
 
@@ -75,7 +75,7 @@ class DialogROIStatistics(QDialog):
 
     QWidget - > QDialog -> DialogROIStatistics
 
-    Last revision: 21/03/2025
+    Last revision: 16/10/2026
     """
     _DEFAULTBINS = 1
 
@@ -738,8 +738,11 @@ class DialogROIStatistics(QDialog):
             if self.hasVolume:
                 if len(rois) > 0:
                     # Descriptive statistics
-                    flt = SisypheROIDraw()
-                    flt.setVolume(self._volume)
+                    # < Revision 16/10/2026
+                    # statistics of all ROIs are calculated in a single pass
+                    # flt = SisypheROIDraw()
+                    # flt.setVolume(self._volume)
+                    # Revision 16/10/2026 >
                     self._stats = dict()
                     self._rois = SisypheROICollection()
                     self._rois.setReferenceID(self._volume)
@@ -755,10 +758,15 @@ class DialogROIStatistics(QDialog):
                                        text='ROI {} array is empty.'.format(roi.getName()))
                             continue
                         else: self._rois.append(roi)
-                        flt.setROI(roi)
-                        self._stats[roi.getName()] = flt.getIntensityStatistics()
+                        # < Revision 16/10/2026
+                        # flt.setROI(roi)
+                        # self._stats[roi.getName()] = flt.getIntensityStatistics()
+                        # Revision 16/10/2026 >
                     # Shape statistics
                     if len(self._rois) > 0:
+                        # < Revision 16/10/2026
+                        self._stats = SisypheLabelStatistics(self._rois).getIntensityStatistics(self._volume)
+                        # Revision 16/10/2026 >
                         flt = SisypheROIFeatures()
                         flt.setVolume(self._volume)
                         flt.setROICollection(self._rois)
@@ -547,6 +547,12 @@ class DialogSettings(QDialog):
                     if v is not None: window.setViewportsOrientationMarkerVisibility(v)
                     v = widget.getParameterValue('Align')
                     if v is not None: window.setViewportsAlign(v)
+                # < Revision 16/10/2026
+                # add WorkerPool section
+                elif c == 'WorkerPool':
+                    from Sisyphe.processing.capturedStdoutProcessing import updateWorkerPool
+                    updateWorkerPool(widget.getParameterValue('Enabled'), widget.getParameterValue('NumberOfWorkers'))
+                # Revision 16/10/2026 >
         self._apply.setEnabled(False)
 
     def accept(self):
@@ -43,13 +43,6 @@ from zipfile import is_zipfile
 
 from matplotlib import font_manager
 
-from numpy import stack
-from numpy import nanmean
-from numpy import nanmedian
-from numpy import nanstd
-from numpy import nanmax
-from numpy import nanmin
-
 from PyQt5.QtCore import Qt
 from PyQt5.QtCore import QSize
 from PyQt5.QtGui import QFont
@@ -76,6 +69,7 @@ from Sisyphe import version
 from Sisyphe.widgets.basicWidgets import messageBox
 from Sisyphe.core.sisypheConstants import removeAllPrefixesFromFilename
 from Sisyphe.core.sisypheVolume import SisypheVolume
+from Sisyphe.core.sisypheVolume import SisypheVolumeAccumulator
 from Sisyphe.core.sisypheVolume import multiComponentSisypheVolumeFromList
 from Sisyphe.core.sisypheImageAttributes import SisypheAcquisition
 from Sisyphe.core.sisypheRecent import SisypheRecent
@@ -3601,14 +3595,23 @@ class WindowSisyphe(QMainWindow):
                 wait.setInformationText(title)
                 QApplication.processEvents()
                 try:
-                    l = list()
-                    v = None
+                    # < Revision 16/10/2026
+                    # streaming reduction from file names, volumes are loaded one at a time
+                    # l = list()
+                    # v = None
+                    # for filename in filenames:
+                    #     v = SisypheVolume()
+                    #     v.load(filename)
+                    #     l.append(v.copyToNumpyArray())
+                    # a = stack(l)
+                    # r = nanmean(a, axis=0)
+                    acc = SisypheVolumeAccumulator()
                     for filename in filenames:
-                        v = SisypheVolume()
-                        v.load(filename)
-                        l.append(v.copyToNumpyArray())
-                    a = stack(l)
-                    r = nanmean(a, axis=0)
+                        acc.append(filename)
+                    r = acc.getMean()
+                    # attributes of the first volume
+                    v = acc.getReference()
+                    # Revision 16/10/2026 >
                     m = SisypheVolume()
                     m.copyFromNumpyArray(r, spacing=v.getSpacing())
                     m.copyAttributesFrom(v, display=False)
@@ -3653,14 +3656,23 @@ class WindowSisyphe(QMainWindow):
                 wait.setInformationText(title)
                 QApplication.processEvents()
                 try:
-                    l = list()
-                    v = None
-                    for filename in filenames:
-                        v = SisypheVolume()
-                        v.load(filename)
-                        l.append(v.copyToNumpyArray())
-                    a = stack(l)
-                    r = nanmedian(a, axis=0)
+                    # < Revision 16/10/2026
+                    # exact median computed slab by slab from file names, volumes are not loaded
+                    # l = list()
+                    # v = None
+                    # for filename in filenames:
+                    #     v = SisypheVolume()
+                    #     v.load(filename)
+                    #     l.append(v.copyToNumpyArray())
+                    # a = stack(l)
+                    # r = nanmedian(a, axis=0)
+                    r = SisypheVolumeAccumulator.getPercentile(filenames, 50)
+                    # same datatype as numpy nanmedian, float32 if volumes are float32, otherwise float64
+                    if SisypheVolume.getXmlVolume(filenames[0]).getDatatype() == 'float32': r = r.astype('float32')
+                    # xml part only, attributes of the first volume
+                    v = SisypheVolume()
+                    v.load(filenames[0], binary=False)
+                    # Revision 16/10/2026 >
                     m = SisypheVolume()
                     m.copyFromNumpyArray(r, spacing=v.getSpacing())
                     m.copyAttributesFrom(v, display=False)
@@ -3705,14 +3717,23 @@ class WindowSisyphe(QMainWindow):
                 wait.setInformationText(title)
                 QApplication.processEvents()
                 try:
-                    l = list()
-                    v = None
+                    # < Revision 16/10/2026
+                    # streaming reduction from file names, volumes are loaded one at a time
+                    # l = list()
+                    # v = None
+                    # for filename in filenames:
+                    #     v = SisypheVolume()
+                    #     v.load(filename)
+                    #     l.append(v.copyToNumpyArray())
+                    # a = stack(l)
+                    # r = nanstd(a, axis=0)
+                    acc = SisypheVolumeAccumulator()
                     for filename in filenames:
-                        v = SisypheVolume()
-                        v.load(filename)
-                        l.append(v.copyToNumpyArray())
-                    a = stack(l)
-                    r = nanstd(a, axis=0)
+                        acc.append(filename)
+                    r = acc.getStd()
+                    # attributes of the first volume
+                    v = acc.getReference()
+                    # Revision 16/10/2026 >
                     m = SisypheVolume()
                     m.copyFromNumpyArray(r, spacing=v.getSpacing())
                     m.copyAttributesFrom(v, display=False)
@@ -3757,14 +3778,23 @@ class WindowSisyphe(QMainWindow):
                 wait.setInformationText(title)
                 QApplication.processEvents()
                 try:
-                    l = list()
-                    v = None
+                    # < Revision 16/10/2026
+                    # streaming reduction from file names, volumes are loaded one at a time
+                    # l = list()
+                    # v = None
+                    # for filename in filenames:
+                    #     v = SisypheVolume()
+                    #     v.load(filename)
+                    #     l.append(v.copyToNumpyArray())
+                    # a = stack(l)
+                    # r = nanmin(a, axis=0)
+                    acc = SisypheVolumeAccumulator()
                     for filename in filenames:
-                        v = SisypheVolume()
-                        v.load(filename)
-                        l.append(v.copyToNumpyArray())
-                    a = stack(l)
-                    r = nanmin(a, axis=0)
+                        acc.append(filename)
+                    r = acc.getMin()
+                    # attributes of the first volume
+                    v = acc.getReference()
+                    # Revision 16/10/2026 >
                     m = SisypheVolume()
                     m.copyFromNumpyArray(r, spacing=v.getSpacing())
                     m.copyAttributesFrom(v, display=False)
@@ -3807,14 +3837,23 @@ class WindowSisyphe(QMainWindow):
                 wait.setInformationText(title)
                 QApplication.processEvents()
                 try:
-                    l = list()
-                    v = None
+                    # < Revision 16/10/2026
+                    # streaming reduction from file names, volumes are loaded one at a time
+                    # l = list()
+                    # v = None
+                    # for filename in filenames:
+                    #     v = SisypheVolume()
+                    #     v.load(filename)
+                    #     l.append(v.copyToNumpyArray())
+                    # a = stack(l)
+                    # r = nanmax(a, axis=0)
+                    acc = SisypheVolumeAccumulator()
                     for filename in filenames:
-                        v = SisypheVolume()
-                        v.load(filename)
-                        l.append(v.copyToNumpyArray())
-                    a = stack(l)
-                    r = nanmax(a, axis=0)
+                        acc.append(filename)
+                    r = acc.getMax()
+                    # attributes of the first volume
+                    v = acc.getReference()
+                    # Revision 16/10/2026 >
                     m = SisypheVolume()
                     m.copyFromNumpyArray(r, spacing=v.getSpacing())
                     m.copyAttributesFrom(v, display=False)
@@ -5378,6 +5417,11 @@ class WindowSisyphe(QMainWindow):
             self._compview.finalize()
             self._tabROITools.finalize()
         # Revision 10/03/2025 >
+        # < Revision 16/10/2026
+        # stop warm worker processes
+        from Sisyphe.processing.capturedStdoutProcessing import shutdownWorkerPool
+        shutdownWorkerPool()
+        # Revision 16/10/2026 >
         super().closeEvent(a0)
 
     def keyPressEvent(self, a0: QKeyEvent) -> None:
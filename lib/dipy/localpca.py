@@ -2,14 +2,21 @@ import copy
 from warnings import warn
 
 import numpy as np
-from scipy.linalg import eigh
-from scipy.linalg.lapack import dgesvd as svd
 
 from dipy.denoise.pca_noise_estimate import pca_noise_estimate
 from dipy.testing.decorators import warning_for_keywords
 
 from datetime import datetime
 
+from os import cpu_count
+
+from multiprocessing import Pool
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from sys import platform
+from sys import version_info
+
 # noinspection PyProtectedMember
 from multiprocessing.managers import DictProxy
 
@@ -184,6 +191,105 @@ def compute_suggested_patch_radius(arr, patch_size):
     return int((root - 1) / 2)
 
 
+# < Revision 16/10/2026
+# parallel blockwise genpca
+
+# worker process arrays (shared memory views), attached once per worker
+_worker = dict()
+# number of patches of a batched eigendecomposition
+_BATCHSIZE = 512
+
+
+def _genpcaSlab(arrays, slab, patch_radius_arr, is_svd, tau_factor, estimate_sigma):
+    """Denoise voxels of a z-slab, patch estimates are accumulated in
+    arrays['theta'] and arrays['thetax'] (equations 1 to 3 in Manjon 2013)."""
+    arr = arrays['arr']
+    theta = arrays['theta']
+    thetax = arrays['thetax']
+    varacc = arrays['varacc']
+    thetavar = arrays['thetavar']
+    pr = np.asarray(patch_radius_arr, dtype=int)
+    ps = 2 * pr + 1
+    num_samples = int(np.prod(ps))
+    dim = arr.shape[-1]
+    # patch offsets, same sample order as arr[ix1:ix2, jx1:jx2, kx1:kx2].reshape(num_samples, dim)
+    offsets = np.stack(np.meshgrid(np.arange(ps[0]), np.arange(ps[1]), np.arange(ps[2]), indexing="ij"),
+                       axis=-1).reshape(num_samples, 3) - pr
+    sub = arrays['mask'][pr[0]:arr.shape[0] - pr[0], pr[1]:arr.shape[1] - pr[1], slab[0]:slab[1]]
+    centers = np.argwhere(sub) + np.array([pr[0], pr[1], slab[0]])
+    for b in range(0, centers.shape[0], _BATCHSIZE):
+        c = centers[b:b + _BATCHSIZE]
+        idx = c[:, None, :] + offsets[None, :, :]
+        X = arr[idx[..., 0], idx[..., 1], idx[..., 2]]
+        M = np.mean(X, axis=1, keepdims=True)
+        X = X - M
+        if is_svd:
+            # singular values in descending order, eigenvalues in ascending order
+            S, Vt = np.linalg.svd(X, full_matrices=False)[1:]
+            d = S[:, ::-1] ** 2 / num_samples
+            W = np.transpose(Vt[:, ::-1, :], (0, 2, 1))
+        else:
+            C = np.matmul(np.transpose(X, (0, 2, 1)), X) / num_samples
+            d, W = np.linalg.eigh(C)
+        if estimate_sigma:
+            # Random matrix theory
+            this_var = np.array([_pca_classifier(L, num_samples)[0] for L in d])
+        else: this_var = arrays['var'][c[:, 0], c[:, 1], c[:, 2]]
+        tau = tau_factor**2 * this_var
+        ncomps = np.sum(d < tau[:, None], axis=1)
+        W = W * (np.arange(W.shape[2])[None, :] >= ncomps[:, None])[:, None, :]
+        Xest = np.matmul(np.matmul(X, W), np.transpose(W, (0, 2, 1))) + M
+        this_theta = 1.0 / (1.0 + dim - ncomps)
+        # patch centers are distinct, voxels of the same patch offset are distinct
+        for s in range(num_samples):
+            i, j, k = (c + offsets[s]).T
+            theta[i, j, k] += this_theta
+            thetax[i, j, k] += Xest[:, s, :] * this_theta[:, None]
+            if varacc is not None:
+                varacc[i, j, k] += this_var * this_theta
+                thetavar[i, j, k] += this_theta
+
+
+def _initGenpcaWorker(shared, params):
+    _worker['shm'] = list()
+    _worker['arrays'] = dict()
+    for k, v in shared.items():
+        if v is None: _worker['arrays'][k] = None
+        else:
+            if version_info >= (3, 13): shm = SharedMemory(name=v[0], track=False)
+            else:
+                # untracked attachment, the parent process unlinks shared memory
+                # noinspection PyProtectedMember
+                owned = platform != 'win32' and resource_tracker._resource_tracker._fd is None
+                shm = SharedMemory(name=v[0])
+                # noinspection PyProtectedMember
+                if owned: resource_tracker.unregister(shm._name, 'shared_memory')
+            _worker['shm'].append(shm)
+            _worker['arrays'][k] = np.ndarray(v[1], dtype=v[2], buffer=shm.buf)
+    _worker['params'] = params
+
+
+def _genpcaSlabWorker(slab):
+    _genpcaSlab(_worker['arrays'], slab, *_worker['params'])
+    return slab
+
+
+def _genpcaProgress(wait, t, i, n):
+    if wait is not None:
+        delta = (datetime.now() - t) * ((n - i) / i)
+        m = delta.seconds // 60
+        s = delta.seconds - (m * 60)
+        if m == 0: msg = 'Estimated time remaining {} s.'.format(s)
+        else: msg = 'Estimated time remaining {} min {} s.'.format(m, s)
+        if isinstance(wait, DialogWait):
+            wait.addInformationText(msg)
+            wait.setCurrentProgressValue(i)
+        elif isinstance(wait, DictProxy):
+            wait['amsg'] = msg
+            wait['value'] = i
+# Revision 16/10/2026 >
+
+
 @warning_for_keywords()
 def genpca(
     arr,
@@ -196,7 +302,8 @@ def genpca(
     return_sigma=False,
     out_dtype=None,
     suppress_warning=False,
-    wait: DialogWait | DictProxy | None = None
+    wait: DialogWait | DictProxy | None = None,
+    workers: int = 1
 ):
     r"""General function to perform PCA-based denoising of diffusion datasets.
 
@@ -242,6 +349,9 @@ def genpca(
         the input.
     suppress_warning : bool, optional
         If true, suppress warning caused by patch_size < arr.shape[-1].
+    workers : int, optional
+        Number of processes, z-slabs of the volume are denoised in parallel.
+        Default: 1, denoising in the current process. 0, number of cores.
 
     Returns
     -------
@@ -314,120 +424,80 @@ def genpca(
     if tau_factor is None:
         tau_factor = 1 + np.sqrt(dim / num_samples)
 
-    theta = np.zeros(arr.shape, dtype=calc_dtype)
-    thetax = np.zeros(arr.shape, dtype=calc_dtype)
-
-    if return_sigma is True and sigma is None:
-        var = np.zeros(arr.shape[:-1], dtype=calc_dtype)
-        thetavar = np.zeros(arr.shape[:-1], dtype=calc_dtype)
-
-    # < Revision 18/06/2024 from original dipy
-    t = datetime.now()
+    # < Revision 16/10/2026
+    # parallel blockwise processing, z-slabs are processed in a process pool, arrays are in shared memory,
+    # eigendecompositions are batched within a slab
+    if workers <= 0: workers = cpu_count()
+    kmin = int(patch_radius_arr[2])
+    kmax = int(arr.shape[2] - patch_radius_arr[2])
+    # slab thickness >= 2 x patch radius, slabs of same parity do not overlap and are processed concurrently
+    thickness = max(2 * int(patch_radius_arr[2]), 1, (kmax - kmin) // (2 * workers))
+    slabs = [(k, min(k + thickness, kmax)) for k in range(kmin, kmax, thickness)]
+    n = len(slabs)
+    # theta is the same for all directions, 3D array
+    arrays = {'arr': arr,
+              'mask': np.asarray(mask, dtype=bool),
+              'var': None,
+              'theta': np.zeros(arr.shape[:-1], dtype=calc_dtype),
+              'thetax': np.zeros(arr.shape, dtype=calc_dtype),
+              'varacc': None,
+              'thetavar': None}
+    if sigma is not None: arrays['var'] = np.asarray(var, dtype=calc_dtype)
+    elif return_sigma is True:
+        arrays['varacc'] = np.zeros(arr.shape[:-1], dtype=calc_dtype)
+        arrays['thetavar'] = np.zeros(arr.shape[:-1], dtype=calc_dtype)
+    params = (patch_radius_arr, is_svd, tau_factor, sigma is None)
     if wait is not None:
         if isinstance(wait, DialogWait):
-            wait.setProgressRange(0, arr.shape[2])
+            wait.setProgressRange(0, n)
             wait.setCurrentProgressValue(0)
             wait.progressVisibilityOn()
-        elif isinstance(wait, DictProxy): wait['max'] = arr.shape[2]
-    # Revision 18/06/2024 from original dipy >
-
-    # loop around and find the 3D patch for each direction at each pixel
-    for k in range(patch_radius_arr[2], arr.shape[2] - patch_radius_arr[2]):
-        # < Revision 18/06/2024 from original dipy
-        if wait is not None and k > patch_radius_arr[2]:
-            now = datetime.now()
-            delta = now - t
-            t = now
-            delta *= arr.shape[2] - k
-            m = delta.seconds // 60
-            s = delta.seconds - (m * 60)
-            if m == 0:
-                if isinstance(wait, DialogWait): wait.addInformationText('Estimated time remaining {} s.'.format(s))
-                elif isinstance(wait, DictProxy): wait['amsg'] = 'Estimated time remaining {} s.'.format(s)
-            else:
-                if isinstance(wait, DialogWait): wait.addInformationText('Estimated time remaining {} min {} s.'.format(m, s))
-                elif isinstance(wait, DictProxy): wait['amsg'] = 'Estimated time remaining {} min {} s.'.format(m, s)
-        # Revision 18/06/2024 from original dipy >
-        for j in range(patch_radius_arr[1], arr.shape[1] - patch_radius_arr[1]):
-            for i in range(patch_radius_arr[0], arr.shape[0] - patch_radius_arr[0]):
-                # Shorthand for indexing variables:
-                if not mask[i, j, k]:
-                    continue
-                ix1 = i - patch_radius_arr[0]
-                ix2 = i + patch_radius_arr[0] + 1
-                jx1 = j - patch_radius_arr[1]
-                jx2 = j + patch_radius_arr[1] + 1
-                kx1 = k - patch_radius_arr[2]
-                kx2 = k + patch_radius_arr[2] + 1
-
-                X = arr[ix1:ix2, jx1:jx2, kx1:kx2].reshape(num_samples, dim)
-                # compute the mean
-                M = np.mean(X, axis=0)
-                # Upcast the dtype for precision in the SVD
-                X = X - M
-
-                if is_svd:
-                    # PCA using an SVD
-                    svd_args = [1, 0]
-                    U, S, Vt = svd(X, *svd_args)[:3]
-                    # Items in S are the eigenvalues, but in ascending order
-                    # We invert the order (=> descending), square and normalize
-                    # \lambda_i = s_i^2 / n
-                    d = S[::-1] ** 2 / X.shape[0]
-                    # Rows of Vt are eigenvectors, but also in ascending
-                    # eigenvalue order:
-                    W = Vt[::-1].T
-
-                else:
-                    # PCA using an Eigenvalue decomposition
-                    C = np.transpose(X).dot(X)
-                    C = C / X.shape[0]
-                    [d, W] = eigh(C)
-
-                if sigma is None:
-                    # Random matrix theory
-                    this_var, _ = _pca_classifier(d, num_samples)
+        elif isinstance(wait, DictProxy): wait['max'] = n
+    t = datetime.now()
+    shms = list()
+    try:
+        if workers == 1 or n < 2:
+            for i, slab in enumerate(slabs):
+                _genpcaSlab(arrays, slab, *params)
+                _genpcaProgress(wait, t, i + 1, n)
+        else:
+            shared = dict()
+            for k, v in arrays.items():
+                if v is None: shared[k] = None
                 else:
-                    # Predefined variance
-                    this_var = var[i, j, k]
-
-                # Threshold by tau:
-                tau = tau_factor**2 * this_var
-
-                # Update ncomps according to tau_factor
-                ncomps = np.sum(d < tau)
-                W[:, :ncomps] = 0
-
-                # This is equations 1 and 2 in Manjon 2013:
-                Xest = X.dot(W).dot(W.T) + M
-                Xest = Xest.reshape(patch_size[0], patch_size[1], patch_size[2], dim)
-                # This is equation 3 in Manjon 2013:
-                this_theta = 1.0 / (1.0 + dim - ncomps)
-                theta[ix1:ix2, jx1:jx2, kx1:kx2] += this_theta
-                thetax[ix1:ix2, jx1:jx2, kx1:kx2] += Xest * this_theta
-                if return_sigma is True and sigma is None:
-                    var[ix1:ix2, jx1:jx2, kx1:kx2] += this_var * this_theta
-                    thetavar[ix1:ix2, jx1:jx2, kx1:kx2] += this_theta
-        # < Revision 18/06/2024 from original dipy
+                    shm = SharedMemory(create=True, size=max(v.nbytes, 1))
+                    shms.append(shm)
+                    buff = np.ndarray(v.shape, dtype=v.dtype, buffer=shm.buf)
+                    buff[...] = v
+                    arrays[k] = buff
+                    shared[k] = (shm.name, v.shape, v.dtype.str)
+            with Pool(processes=min(workers, (n + 1) // 2),
+                      initializer=_initGenpcaWorker,
+                      initargs=(shared, params)) as pool:
+                i = 0
+                # even slabs, then odd slabs
+                for phase in (slabs[0::2], slabs[1::2]):
+                    for _ in pool.imap_unordered(_genpcaSlabWorker, phase):
+                        i += 1
+                        _genpcaProgress(wait, t, i, n)
         if wait is not None:
-            if isinstance(wait, DialogWait): wait.setCurrentProgressValue(int(k - patch_radius_arr[2] + 1))
-            elif isinstance(wait, DictProxy): wait['value'] = int(k - patch_radius_arr[2] + 1)
-        # Revision 18/06/2024 from original dipy >
-    # < Revision 18/06/2024 from original dipy
-    if wait is not None:
-        if isinstance(wait, DialogWait): wait.progressVisibilityOff()
-        elif isinstance(wait, DictProxy): wait['max'] = 0
-    # Revision 18/06/2024 from original dipy >
-    denoised_arr = thetax / theta
-    denoised_arr.clip(min=0, out=denoised_arr)
-    denoised_arr[mask == 0] = 0
-    if return_sigma is True:
-        if sigma is None:
-            var = var / thetavar
+            if isinstance(wait, DialogWait): wait.progressVisibilityOff()
+            elif isinstance(wait, DictProxy): wait['max'] = 0
+        denoised_arr = arrays['thetax'] / arrays['theta'][..., None]
+        denoised_arr.clip(min=0, out=denoised_arr)
+        denoised_arr[mask == 0] = 0
+        if return_sigma is True and sigma is None:
+            var = arrays['varacc'] / arrays['thetavar']
             var[mask == 0] = 0
-            return denoised_arr.astype(out_dtype), np.sqrt(var)
+    finally:
+        for shm in shms:
+            shm.close()
+            shm.unlink()
+    if return_sigma is True:
+        if sigma is None: return denoised_arr.astype(out_dtype), np.sqrt(var)
         else: return denoised_arr.astype(out_dtype), sigma
     else: return denoised_arr.astype(out_dtype)
+    # Revision 16/10/2026 >
 
 
 @warning_for_keywords()
@@ -445,7 +515,8 @@ def localpca(
     correct_bias=True,
     out_dtype=None,
     suppress_warning=False,
-    wait: DialogWait | DictProxy | None = None
+    wait: DialogWait | DictProxy | None = None,
+    workers: int = 1
 ):
     r"""Performs local PCA denoising.
 
@@ -503,6 +574,9 @@ def localpca(
         the input.
     suppress_warning : bool, optional
         If true, suppress warning caused by patch_size < arr.shape[-1].
+    workers : int, optional
+        Number of processes, z-slabs of the volume are denoised in parallel.
+        Default: 1, denoising in the current process. 0, number of cores.
     wait : DialogWait | multiprocessing.managers.DictProxy | None
         optional progress dialog or multiprocessing shared dict (DictProxy)
 
@@ -542,7 +616,8 @@ def localpca(
         return_sigma=return_sigma,
         out_dtype=out_dtype,
         suppress_warning=suppress_warning,
-        wait=wait
+        wait=wait,
+        workers=workers
     )
     # Revision 18/06/2025 from original dipy >
 
@@ -557,7 +632,8 @@ def mppca(
     return_sigma=False,
     out_dtype=None,
     suppress_warning=False,
-    wait: DialogWait | DictProxy | None = None
+    wait: DialogWait | DictProxy | None = None,
+    workers: int = 1
 ):
     r"""Performs PCA-based denoising using the Marcenko-Pastur
     distribution.
@@ -589,6 +665,9 @@ def mppca(
         the input.
     suppress_warning : bool, optional
         If true, suppress warning caused by patch_size < arr.shape[-1].
+    workers : int, optional
+        Number of processes, z-slabs of the volume are denoised in parallel.
+        Default: 1, denoising in the current process. 0, number of cores.
     wait : DialogWait | multiprocessing.managers.DictProxy | None
         optional progress dialog or multiprocessing shared dict (DictProxy)
 
@@ -616,6 +695,7 @@ def mppca(
         return_sigma=return_sigma,
         out_dtype=out_dtype,
         suppress_warning=suppress_warning,
-        wait=wait
+        wait=wait,
+        workers=workers
     )
     # Revision 18/06/2025 from original dipy >
@@ -11,13 +11,36 @@ from os import dup
 from os import dup2
 from os import remove
 from os import close
+from os import getpid
 
 from os.path import exists
 from os.path import join
 from os.path import basename
 from os.path import splitext
 
+from multiprocessing import Pipe
 from multiprocessing import Process
+from multiprocessing import current_process
+from multiprocessing.queues import Queue as QueueClass
+from multiprocessing.connection import wait
+
+from threading import Lock
+from threading import Thread
+
+from collections import deque
+
+from time import sleep
+from time import time
+
+from atexit import register
+
+from pickle import dumps
+from pickle import loads
+from pickle import HIGHEST_PROTOCOL
+
+from importlib import import_module
+
+from traceback import print_exc
 
 from numpy import array
 
@@ -40,9 +63,15 @@ from Sisyphe.core.sisypheROI import SisypheROI
 from Sisyphe.core.sisypheROI import SisypheROICollection
 from Sisyphe.core.sisypheVolume import SisypheVolume
 from Sisyphe.core.sisypheVolume import SisypheVolumeCollection
+from Sisyphe.core.sisypheSettings import SisypheSettings
 from Sisyphe.processing.dipyFunctions import dwiPreprocessing
 
 __all__ = ['CapturedStdout',
+           'ProcessWorkerPool',
+           'getWorkerPool',
+           'updateWorkerPool',
+           'shutdownWorkerPool',
+           'AbstractProcessJob',
            'ProcessSkullStrip',
            'ProcessRegistration',
            'ProcessRealignment',
@@ -64,27 +93,33 @@ Class hierarchy
 ~~~~~~~~~~~~~~~
 
     - CapturedStdout
-    - Process -> ProcessSkullStrip
-              -> ProcessRegistration
-              -> ProcessRealignment
-              -> ProcessAtropos
-              -> ProcessCorticalThickness
-              -> ProcessDeepTumorSegmentation
-              -> ProcessDeepHippocampusSegmentation
-              -> ProcessDeepMedialTemporalSegmentation
-              -> ProcessDeepLesionSegmentation
-              -> ProcessDeepWhiteMatterHyperIntensitiesSegmentation
-              -> ProcessDeepTOFVesselSegmentation
-              -> ProcessDeepTissueSegmentation
-              -> ProcessDiffusionPreprocessing
-              -> ProcessDiffusionModel
-              -> ProcessDiffusionTracking
+    - ProcessWorkerPool
+    - Process -> AbstractProcessJob -> ProcessSkullStrip
+                                    -> ProcessRegistration
+                                    -> ProcessRealignment
+                                    -> ProcessAtropos
+                                    -> ProcessCorticalThickness
+                                    -> ProcessDeepTumorSegmentation
+                                    -> ProcessDeepHippocampusSegmentation
+                                    -> ProcessDeepMedialTemporalSegmentation
+                                    -> ProcessDeepLesionSegmentation
+                                    -> ProcessDeepWhiteMatterHyperIntensitiesSegmentation
+                                    -> ProcessDeepTOFVesselSegmentation
+                                    -> ProcessDeepTissueSegmentation
+                                    -> ProcessDiffusionPreprocessing
+                                    -> ProcessDiffusionModel
+                                    -> ProcessDiffusionTracking
 
 When QApplication is imported into a module, calling from_numpy method of the antspy library in this module raises an 
 exception in win32 platform. Processing with stdout capture is isolated in the current module to avoid conflict with 
 QApplication module.
 
+Processing classes are jobs (AbstractProcessJob subclasses) run by a pool of long-lived worker processes
+(ProcessWorkerPool), heavy libraries (ants, antspynet, tensorflow, dipy) are imported once by each worker. If the
+worker pool is disabled in settings, each job is run in a new process.
+
 Creation: 17/04/2025
+Last revision: 16/10/2026
 """
 
 class CapturedStdout:
@@ -178,7 +213,504 @@ class CapturedStdout:
             close(self._original_stdout_fd)
 
 
-class ProcessSkullStrip(Process):
+# < Revision 16/10/2026
+# warm worker pool
+
+# worker to main process messages
+_READY, _STARTED, _DATA, _DONE = 0, 1, 2, 3
+# heavy libraries imported once by each pool worker, before the first job
+_WARMMODULES = ('ants.registration', 'antspynet.utilities', 'tensorflow')
+# delay (s) given to a job that has already returned results to finish before being killed by terminate()
+_GRACE = 2.0
+# maximum delay (s) given to caller queue feeder threads to write the results of a done job
+_FLUSH = 1.0
+
+_POOL = None
+
+
+class _JobTerminated(Exception):
+    pass
+
+
+# stands in for the result queue of a job in a pool worker, results are forwarded to the caller queue
+class _JobResult(object):
+
+    def __init__(self, jobid, name, results):
+        self._jobid = jobid
+        self._name = name
+        self._results = results
+
+    def put(self, obj):
+        self._results.send((self._jobid, _DATA, (self._name, obj)))
+
+
+def _poolWorker(jobs, results):
+    # jobs and results are pipe connections owned by this worker, no lock shared with other workers
+    for module in _WARMMODULES:
+        try: import_module(module)
+        except Exception: pass
+    results.send((None, _READY, getpid()))
+    while True:
+        try: payload = jobs.recv_bytes()
+        except EOFError: break
+        # empty payload, stop worker
+        if len(payload) == 0: break
+        jobid, cls, attrs, queues = loads(payload)
+        results.send((jobid, _STARTED, None))
+        try:
+            job = cls.__new__(cls)
+            job.__dict__.update(attrs)
+            for name in queues:
+                setattr(job, name, _JobResult(jobid, name, results))
+            job._pooled = True
+            job.run()
+        except _JobTerminated: pass
+        # traceback to stderr, as a failed Process
+        except Exception: print_exc()
+        finally:
+            # release keras models and graphs of the job, tensorflow itself stays loaded
+            if 'tensorflow' in sys.modules:
+                try: sys.modules['tensorflow'].keras.backend.clear_session()
+                except Exception: pass
+        results.send((jobid, _DONE, None))
+
+
+class ProcessWorkerPool(object):
+    """
+    ProcessWorkerPool
+
+    Description
+    ~~~~~~~~~~~
+
+    Pool of long-lived worker processes used to run AbstractProcessJob instances (ants registration, atropos,
+    antspynet deep learning segmentation, diffusion models and tracking...). Each worker imports heavy libraries
+    (ants, antspynet, tensorflow, dipy) once, then processes jobs one at a time.
+
+    Jobs are queued in the main process and sent by a dispatcher thread to idle workers, through a pipe owned by
+    each worker. Results put by a job in its result queue are forwarded by the dispatcher to the caller queue.
+    A worker running a terminated job is killed and replaced by a new one, idle workers are never killed.
+
+    The pool is created at the first job submission (see getWorkerPool function), enabled and sized from
+    the WorkerPool section of the settings (Enabled and NumberOfWorkers fields).
+
+    Inheritance
+    ~~~~~~~~~~~
+
+    object -> ProcessWorkerPool
+
+    Creation: 16/10/2026
+    """
+
+    # Special method
+
+    """
+    Private attributes
+
+    _pending    deque[tuple[int, bytes]], queued jobs (job ID, pickled job)
+    _records    dict[int, dict], submitted jobs (caller queues, state, worker pid, result count, cancel flag,
+                caller queues not yet written by their feeder thread, flush deadline of a done job)
+    _workers    dict[int, dict], workers (process, job and result pipe connections, ready flag, current job ID),
+                pid keys, only used by the dispatcher thread
+    _nworkers   int, number of worker processes
+    _count      int, last job ID
+    _lock       Lock, _pending, _records and _nworkers access
+    _dispatcher Thread, dispatcher of jobs and worker messages
+    _closed     bool
+    """
+
+    def __init__(self, workers=1):
+        """
+        ProcessWorkerPool instance constructor.
+
+        Parameters
+        ----------
+        workers : int
+            number of worker processes (default 1)
+        """
+        self._pending = deque()
+        self._records = dict()
+        self._workers = dict()
+        self._nworkers = max(1, workers)
+        self._count = 0
+        self._lock = Lock()
+        self._closed = False
+        self._dispatcher = Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+
+    # Private methods
+
+    def _startWorker(self):
+        jobs, wjobs = Pipe(duplex=False)
+        wresults, results = Pipe(duplex=False)
+        # not daemonic, jobs may use their own process pool (tracking, local PCA)
+        p = Process(target=_poolWorker, args=(jobs, results), name='SisypheWorker')
+        p.start()
+        # worker ends are only used by the worker, closed in main process to detect worker exit
+        jobs.close()
+        results.close()
+        self._workers[p.pid] = {'process': p, 'jobs': wjobs, 'results': wresults, 'ready': False, 'jobid': None}
+
+    def _stopWorker(self, pid, kill=False):
+        w = self._workers.pop(pid)
+        if kill:
+            w['process'].terminate()
+            w['process'].join()
+        else:
+            try: w['jobs'].send_bytes(b'')
+            except OSError: pass
+        w['jobs'].close()
+        w['results'].close()
+        if w['jobid'] is not None:
+            with self._lock: self._records.pop(w['jobid'], None)
+
+    def _message(self, pid, msg):
+        w = self._workers[pid]
+        jobid, code, data = msg
+        if code == _READY:
+            w['ready'] = True
+            return
+        with self._lock: r = self._records.get(jobid)
+        if r is None: return
+        if code == _STARTED:
+            with self._lock: r['state'] = 'running'
+        elif code == _DATA:
+            name, obj = data
+            r['queues'][name].put(obj)
+            # put() returns before the queue feeder thread has written obj, checked by isJobAlive()
+            with self._lock:
+                r['data'] += 1
+                r['unflushed'].add(name)
+        else:
+            # worker is idle, job is alive until its results are readable by the caller (see isJobAlive)
+            w['jobid'] = None
+            with self._lock:
+                r['state'] = 'done'
+                r['deadline'] = time() + _FLUSH
+
+    def _schedule(self):
+        with self._lock: nworkers = self._nworkers
+        # start missing workers, stop extra idle workers
+        while len(self._workers) < nworkers: self._startWorker()
+        idle = [pid for pid, w in self._workers.items() if w['ready'] and w['jobid'] is None]
+        while len(self._workers) > nworkers and len(idle) > 0: self._stopWorker(idle.pop())
+        # send queued jobs to idle workers, cancelled queued jobs are skipped
+        for pid in idle:
+            item = None
+            with self._lock:
+                while len(self._pending) > 0:
+                    jobid, payload = self._pending.popleft()
+                    r = self._records.get(jobid)
+                    if r is not None and not r['cancel']:
+                        r['state'] = 'sent'
+                        r['pid'] = pid
+                        item = jobid, payload
+                        break
+                    self._records.pop(jobid, None)
+            if item is None: break
+            w = self._workers[pid]
+            w['jobid'] = item[0]
+            try: w['jobs'].send_bytes(item[1])
+            except OSError: self._stopWorker(pid, kill=True)
+
+    def _cancel(self):
+        # only workers whose job has started and is not done are killed
+        with self._lock:
+            pids = [r['pid'] for r in self._records.values() if r['cancel'] and r['state'] == 'running']
+        for pid in pids:
+            if pid in self._workers: self._stopWorker(pid, kill=True)
+
+    def _dispatch(self):
+        while not self._closed:
+            self._schedule()
+            conns = {w['results']: pid for pid, w in self._workers.items()}
+            for conn in wait(list(conns.keys()), timeout=0.05):
+                pid = conns[conn]
+                try:
+                    # read all available messages, job done message is read before the cancel check
+                    while pid in self._workers and conn.poll():
+                        self._message(pid, conn.recv())
+                # worker exit, its running job is done
+                except (EOFError, OSError):
+                    if pid in self._workers: self._stopWorker(pid, kill=True)
+            self._cancel()
+
+    # Public methods
+
+    def getNumberOfWorkers(self):
+        """
+        Get the number of worker processes.
+
+        Returns
+        -------
+        int
+            number of worker processes
+        """
+        return self._nworkers
+
+    def setNumberOfWorkers(self, workers):
+        """
+        Set the number of worker processes. New workers are started, extra workers stop when idle.
+
+        Parameters
+        ----------
+        workers : int
+            number of worker processes
+        """
+        with self._lock: self._nworkers = max(1, workers)
+
+    def submit(self, job):
+        """
+        Submit a job to the worker pool.
+
+        Parameters
+        ----------
+        job : AbstractProcessJob
+            job to run
+
+        Returns
+        -------
+        int | None
+            job ID, None if job can't be sent to a worker (closed pool, attributes shared only through inheritance
+            such as multiprocessing.Value), job must be run in a new process
+        """
+        if self._closed: return None
+        # noinspection PyProtectedMember
+        attrs, queues = job._getJobAttributes()
+        with self._lock:
+            self._count += 1
+            jobid = self._count
+        try: payload = dumps((jobid, type(job), attrs, list(queues.keys())), protocol=HIGHEST_PROTOCOL)
+        except Exception: return None
+        with self._lock:
+            self._records[jobid] = {'queues': queues, 'state': 'queued', 'pid': None, 'data': 0, 'cancel': False,
+                                    'unflushed': set(), 'deadline': None}
+            self._pending.append((jobid, payload))
+        return jobid
+
+    def isJobAlive(self, jobid):
+        """
+        Check whether a job is queued or running. A done job is alive until the results forwarded to the caller
+        queues are readable.
+
+        Parameters
+        ----------
+        jobid : int
+            job ID
+
+        Returns
+        -------
+        bool
+            True if job is queued or running
+        """
+        with self._lock:
+            r = self._records.get(jobid)
+            if r is None: return False
+            if r['state'] == 'done':
+                # caller queues are written by their feeder threads after put() returns
+                r['unflushed'] = {name for name in r['unflushed'] if r['queues'][name].empty()}
+                if not r['cancel'] and len(r['unflushed']) > 0 and time() < r['deadline']: return True
+                self._records.pop(jobid)
+                return False
+            return not r['cancel']
+
+    def waitJob(self, jobid, timeout=None):
+        """
+        Wait for the end of a job.
+
+        Parameters
+        ----------
+        jobid : int
+            job ID
+        timeout : float | None
+            maximum waiting time in seconds (default None, no limit)
+        """
+        t = 0.0
+        while self.isJobAlive(jobid):
+            if timeout is not None and t >= timeout: break
+            sleep(0.01)
+            t += 0.01
+
+    def cancelJob(self, jobid):
+        """
+        Cancel a job. A queued job is skipped, the worker of a running job is killed and replaced. A running job
+        that has already returned results is given a short delay to finish before being killed.
+
+        Parameters
+        ----------
+        jobid : int
+            job ID
+        """
+        with self._lock:
+            r = self._records.get(jobid)
+            if r is None: return
+            state = r['state']
+            data = r['data']
+        if state == 'running' and data > 0:
+            self.waitJob(jobid, _GRACE)
+        with self._lock:
+            r = self._records.get(jobid)
+            # worker is killed by the dispatcher thread, only if job is started and not done
+            if r is not None: r['cancel'] = True
+
+    def shutdown(self):
+        """
+        Stop worker processes. Queued jobs are not processed, running jobs are killed.
+        """
+        if not self._closed:
+            self._closed = True
+            self._dispatcher.join()
+            with self._lock:
+                self._pending.clear()
+                self._records.clear()
+            for pid in list(self._workers.keys()):
+                w = self._workers[pid]
+                p = w['process']
+                # idle workers stop, workers running a job are killed
+                self._stopWorker(pid, kill=w['jobid'] is not None)
+                p.join(0.5)
+                if p.is_alive():
+                    p.terminate()
+                    p.join()
+
+
+def _getWorkerPoolSettings():
+    settings = SisypheSettings()
+    enabled = settings.getFieldValue('WorkerPool', 'Enabled')
+    workers = settings.getFieldValue('WorkerPool', 'NumberOfWorkers')
+    if enabled is None: enabled = True
+    if workers is None: workers = 1
+    return enabled, workers
+
+
+def getWorkerPool():
+    """
+    Get the warm worker pool, created at the first call if enabled in settings (WorkerPool section).
+
+    Returns
+    -------
+    ProcessWorkerPool | None
+        None if worker pool is disabled in settings
+    """
+    global _POOL
+    # jobs run in pool workers or child processes never use a pool
+    if _POOL is None and current_process().name == 'MainProcess':
+        enabled, workers = _getWorkerPoolSettings()
+        if enabled:
+            _POOL = ProcessWorkerPool(workers)
+            register(shutdownWorkerPool)
+    return _POOL
+
+
+def updateWorkerPool(enabled=None, workers=None):
+    """
+    Update the warm worker pool. Pool is stopped if disabled, or resized.
+
+    Parameters
+    ----------
+    enabled : bool | None
+        worker pool enabled (default None, WorkerPool/Enabled settings field)
+    workers : int | None
+        number of worker processes (default None, WorkerPool/NumberOfWorkers settings field)
+    """
+    global _POOL
+    if _POOL is not None:
+        if enabled is None or workers is None:
+            r = _getWorkerPoolSettings()
+            if enabled is None: enabled = r[0]
+            if workers is None: workers = r[1]
+        if enabled: _POOL.setNumberOfWorkers(workers)
+        else: shutdownWorkerPool()
+
+
+def shutdownWorkerPool():
+    """
+    Stop the warm worker pool. A new pool is created at the next job submission if enabled in settings.
+    """
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown()
+        _POOL = None
+
+
+class AbstractProcessJob(Process):
+    """
+    AbstractProcessJob
+
+    Description
+    ~~~~~~~~~~~
+
+    Ancestor of processing job classes. The processing is defined in the run() method. The start() method submits the
+    job to the warm worker pool (see ProcessWorkerPool class), or runs it in a new process if the pool is disabled.
+    The is_alive(), join() and terminate() methods have the multiprocessing Process behavior in both cases.
+
+    Inheritance
+    ~~~~~~~~~~~
+
+    Process -> AbstractProcessJob
+
+    Creation: 16/10/2026
+    """
+
+    # Special method
+
+    """
+    Private attributes
+
+    _jobid          int | None, job ID in the worker pool, None if job is run in a new process
+    _pool           ProcessWorkerPool | None
+    _pooled         bool, True if job is run by a pool worker
+    _processattrs   set[str], Process attributes, not sent to pool workers
+    """
+
+    def __init__(self):
+        Process.__init__(self)
+        self._jobid = None
+        self._pool = None
+        self._pooled = False
+        self._processattrs = set(self.__dict__.keys()) | {'_processattrs'}
+
+    # Private method
+
+    def _getJobAttributes(self):
+        attrs = dict()
+        queues = dict()
+        for k, v in self.__dict__.items():
+            if k not in self._processattrs:
+                if isinstance(v, QueueClass): queues[k] = v
+                else: attrs[k] = v
+        return attrs, queues
+
+    # Public methods
+
+    def start(self):
+        pool = getWorkerPool()
+        if pool is not None: self._jobid = pool.submit(self)
+        if self._jobid is None: Process.start(self)
+        else: self._pool = pool
+
+    def is_alive(self):
+        if self._jobid is None: return Process.is_alive(self)
+        else: return self._pool.isJobAlive(self._jobid)
+
+    def join(self, timeout=None):
+        if self._jobid is None: Process.join(self, timeout)
+        else: self._pool.waitJob(self._jobid, timeout)
+
+    def terminate(self):
+        # called by run() in a pool worker, stop the job
+        if self._pooled: raise _JobTerminated()
+        elif self._jobid is None: Process.terminate(self)
+        else: self._pool.cancelJob(self._jobid)
+
+    def run(self):
+        """
+        Abstract method, must be implemented in the derived classes. Job processing.
+        """
+        raise NotImplementedError
+# Revision 16/10/2026 >
+
+
+class ProcessSkullStrip(AbstractProcessJob):
     """
     ProcessSkullStrip
 
@@ -190,7 +722,7 @@ class ProcessSkullStrip(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessSkullStrip
+    Process -> AbstractProcessJob -> ProcessSkullStrip
     """
     # Special method
 
@@ -203,7 +735,7 @@ class ProcessSkullStrip(Process):
     """
 
     def __init__(self, img, modality, cache, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._img = img.getNumpy(defaultshape=False).astype('float32')
         self._modality = modality
         self._cache = cache
@@ -222,7 +754,7 @@ class ProcessSkullStrip(Process):
         self._result.put(r.numpy())
 
 
-class ProcessRegistration(Process):
+class ProcessRegistration(AbstractProcessJob):
     """
     ProcessRegistration
 
@@ -234,7 +766,7 @@ class ProcessRegistration(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessRegistration
+    Process -> AbstractProcessJob -> ProcessRegistration
     """
     # Special method
 
@@ -256,7 +788,7 @@ class ProcessRegistration(Process):
     """
 
     def __init__(self, fixed, moving, mask, maskallstages, trf, regtype, metric, sampling, stdout, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._fixed = fixed.getNumpy(defaultshape=False).astype('float32')
         self._moving = moving.getNumpy(defaultshape=False).astype('float32')
         if mask is not None: self._mask = mask.getNumpy(defaultshape=False)
@@ -336,7 +868,7 @@ class ProcessRegistration(Process):
                     remove(r['invtransforms'][0])
 
 
-class ProcessRealignment(Process):
+class ProcessRealignment(AbstractProcessJob):
     """
     ProcessRealignment
 
@@ -348,7 +880,7 @@ class ProcessRealignment(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessRealignmentn
+    Process -> AbstractProcessJob -> ProcessRealignmentn
     """
 
     # Special method
@@ -365,7 +897,7 @@ class ProcessRealignment(Process):
     """
 
     def __init__(self, vols, mask, metric, sampling, progress, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._vols = vols.copyToNumpyArray(defaultshape=False)
         self._mask = mask.copyToNumpyArray(defaultshape=False)
         self._spacing = vols[0].getSpacing()
@@ -404,7 +936,7 @@ class ProcessRealignment(Process):
                 self._progress.value += 1
 
 
-class ProcessAtropos(Process):
+class ProcessAtropos(AbstractProcessJob):
     """
     ProcessAtropos class
 
@@ -416,7 +948,7 @@ class ProcessAtropos(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessAtropos
+    Process -> AbstractProcessJob -> ProcessAtropos
     """
 
     # Special method
@@ -429,7 +961,7 @@ class ProcessAtropos(Process):
     """
 
     def __init__(self, volume, mask, init, mrf, conv, weight, stdout, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._volume = volume.getNumpy(defaultshape=False).astype('float32')
         if mask is not None: self._mask = mask.getNumpy(defaultshape=False)
         else: self._mask = None
@@ -464,7 +996,7 @@ class ProcessAtropos(Process):
             self._result.put(r[i])
 
 
-class ProcessCorticalThickness(Process):
+class ProcessCorticalThickness(AbstractProcessJob):
     """
     ProcessCorticalThickness class
 
@@ -476,7 +1008,7 @@ class ProcessCorticalThickness(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessAtropos
+    Process -> AbstractProcessJob -> ProcessAtropos
     """
 
     # Special method
@@ -489,7 +1021,7 @@ class ProcessCorticalThickness(Process):
     """
 
     def __init__(self, seg, gm, wm, iters, grdstep, grdsmooth, stdout, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._seg = seg.getNumpy(defaultshape=False).astype('float32')
         self._gm = gm.getNumpy(defaultshape=False).astype('float32')
         self._wm = wm.getNumpy(defaultshape=False).astype('float32')
@@ -521,7 +1053,7 @@ class ProcessCorticalThickness(Process):
         self._result.put(r.numpy())
 
 
-class ProcessDeepTumorSegmentation(Process):
+class ProcessDeepTumorSegmentation(AbstractProcessJob):
     """
     ProcessDeepTumorSegmentation
 
@@ -533,7 +1065,7 @@ class ProcessDeepTumorSegmentation(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessDeepTumorSegmentation
+    Process -> AbstractProcessJob -> ProcessDeepTumorSegmentation
     """
     # Special method
 
@@ -543,7 +1075,7 @@ class ProcessDeepTumorSegmentation(Process):
     """
 
     def __init__(self, flair, t1, t1ce, t2, cache, stdout, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._flair = flair.getNumpy(defaultshape=False).astype('float32')
         self._t1 = t1.getNumpy(defaultshape=False).astype('float32')
         self._t1ce = t1ce.getNumpy(defaultshape=False).astype('float32')
@@ -584,7 +1116,7 @@ class ProcessDeepTumorSegmentation(Process):
         self._result.put(r2)
 
 
-class ProcessDeepHippocampusSegmentation(Process):
+class ProcessDeepHippocampusSegmentation(AbstractProcessJob):
     """
     ProcessDeepHippocampusSegmentation
 
@@ -596,7 +1128,7 @@ class ProcessDeepHippocampusSegmentation(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessDeepHippocampusSegmentation
+    Process -> AbstractProcessJob -> ProcessDeepHippocampusSegmentation
     """
     # Special method
 
@@ -606,7 +1138,7 @@ class ProcessDeepHippocampusSegmentation(Process):
     """
 
     def __init__(self, t1, cache, stdout, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._t1 = t1.getNumpy(defaultshape=False).astype('float32')
         self._cache = cache
         self._spacing = t1.getSpacing()
@@ -632,7 +1164,7 @@ class ProcessDeepHippocampusSegmentation(Process):
         self._result.put(r.numpy())
 
 
-class ProcessDeepMedialTemporalSegmentation(Process):
+class ProcessDeepMedialTemporalSegmentation(AbstractProcessJob):
     """
     ProcessDeepMedialTemporalSegmentation
 
@@ -644,7 +1176,7 @@ class ProcessDeepMedialTemporalSegmentation(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessDeepMedialTemporalSegmentation
+    Process -> AbstractProcessJob -> ProcessDeepMedialTemporalSegmentation
     """
     # Special method
 
@@ -654,7 +1186,7 @@ class ProcessDeepMedialTemporalSegmentation(Process):
     """
 
     def __init__(self, t1, t2, model, cache, stdout, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._t1 = t1.getNumpy(defaultshape=False).astype('float32')
         if t2 is not None: self._t2 = t2.getNumpy(defaultshape=False).astype('float32')
         else: self._t2 = None
@@ -698,7 +1230,7 @@ class ProcessDeepMedialTemporalSegmentation(Process):
         self._result.put(r2)
 
 
-class ProcessDeepLesionSegmentation(Process):
+class ProcessDeepLesionSegmentation(AbstractProcessJob):
     """
     ProcessDeepLesionSegmentation
 
@@ -710,7 +1242,7 @@ class ProcessDeepLesionSegmentation(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessDeepLesionSegmentation
+    Process -> AbstractProcessJob -> ProcessDeepLesionSegmentation
     """
     # Special method
 
@@ -720,7 +1252,7 @@ class ProcessDeepLesionSegmentation(Process):
     """
 
     def __init__(self, t1, cache, stdout, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._t1 = t1.getNumpy(defaultshape=False).astype('float32')
         self._cache = cache
         self._spacing = t1.getSpacing()
@@ -746,7 +1278,7 @@ class ProcessDeepLesionSegmentation(Process):
         self._result.put(r.numpy())
 
 
-class ProcessDeepWhiteMatterHyperIntensitiesSegmentation(Process):
+class ProcessDeepWhiteMatterHyperIntensitiesSegmentation(AbstractProcessJob):
     """
     ProcessDeepWhiteMatterHyperIntensitiesSegmentation
 
@@ -758,7 +1290,7 @@ class ProcessDeepWhiteMatterHyperIntensitiesSegmentation(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessDeepWhiteMatterHyperIntensitiesSegmentation
+    Process -> AbstractProcessJob -> ProcessDeepWhiteMatterHyperIntensitiesSegmentation
     """
     # Special method
 
@@ -768,7 +1300,7 @@ class ProcessDeepWhiteMatterHyperIntensitiesSegmentation(Process):
     """
 
     def __init__(self, flair, t1, mask, model, cache, stdout, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._flair = flair.getNumpy(defaultshape=False).astype('float32')
         if t1 is not None: self._t1 = t1.getNumpy(defaultshape=False).astype('float32')
         else: self._t1 = None
@@ -817,7 +1349,7 @@ class ProcessDeepWhiteMatterHyperIntensitiesSegmentation(Process):
         self._result.put(r.numpy())
 
 
-class ProcessDeepTOFVesselSegmentation(Process):
+class ProcessDeepTOFVesselSegmentation(AbstractProcessJob):
     """
     ProcessDeepTOFVesselSegmentation
 
@@ -829,7 +1361,7 @@ class ProcessDeepTOFVesselSegmentation(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessDeepTOFVesselSegmentation
+    Process -> AbstractProcessJob -> ProcessDeepTOFVesselSegmentation
     """
     # Special method
 
@@ -839,7 +1371,7 @@ class ProcessDeepTOFVesselSegmentation(Process):
     """
 
     def __init__(self, tof, cache, stdout, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._tof = tof.getNumpy(defaultshape=False).astype('float32')
         self._cache = cache
         self._spacing = tof.getSpacing()
@@ -865,7 +1397,7 @@ class ProcessDeepTOFVesselSegmentation(Process):
         self._result.put(r.numpy())
 
 
-class ProcessDeepTissueSegmentation(Process):
+class ProcessDeepTissueSegmentation(AbstractProcessJob):
     """
     ProcessDeepTissueSegmentation
 
@@ -878,7 +1410,7 @@ class ProcessDeepTissueSegmentation(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessDeepTissueSegmentation
+    Process -> AbstractProcessJob -> ProcessDeepTissueSegmentation
     """
     # Special method
 
@@ -888,7 +1420,7 @@ class ProcessDeepTissueSegmentation(Process):
     """
 
     def __init__(self, t1, cache, stdout, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._t1 = t1.getNumpy(defaultshape=False).astype('float32')
         self._cache = cache
         self._spacing = t1.getSpacing()
@@ -920,7 +1452,7 @@ class ProcessDeepTissueSegmentation(Process):
         self._result.put(r2)
 
 
-class ProcessDiffusionPreprocessing(Process):
+class ProcessDiffusionPreprocessing(AbstractProcessJob):
     """
     ProcessDiffusionPreprocessing
 
@@ -932,7 +1464,7 @@ class ProcessDiffusionPreprocessing(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessDiffusionPreprocessing
+    Process -> AbstractProcessJob -> ProcessDiffusionPreprocessing
     """
     # Special method
 
@@ -942,7 +1474,7 @@ class ProcessDiffusionPreprocessing(Process):
     """
 
     def __init__(self, bval, bvec, bseg, gibbs, denoise, prefix, suffix, mng, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._fbval = bval
         self._fbvec = bvec
         self._brainseg = bseg
@@ -998,6 +1530,7 @@ class ProcessDiffusionPreprocessing(Process):
                              self._gibbs,
                              self._denoise,
                              save=True,
+                             workers=0,
                              wait=self._mng)
         except Exception as err:
             self._result.put('Diffusion preprocessing failed.\n{}\n{}.'.format(type(err), str(err)))
@@ -1005,7 +1538,7 @@ class ProcessDiffusionPreprocessing(Process):
         self._result.put('terminate')
 
 
-class ProcessDiffusionModel(Process):
+class ProcessDiffusionModel(AbstractProcessJob):
     """
     ProcessDiffusionModel
 
@@ -1017,7 +1550,7 @@ class ProcessDiffusionModel(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessDiffusionModel
+    Process -> AbstractProcessJob -> ProcessDiffusionModel
     """
     # Special method
 
@@ -1027,7 +1560,7 @@ class ProcessDiffusionModel(Process):
     """
 
     def __init__(self, bval, bvec, model, method, order, maps, corr, algo, niter, size, save, mng, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._fbval = bval
         self._fbvec = bvec
         self._model = model
@@ -1223,7 +1756,7 @@ class ProcessDiffusionModel(Process):
         self._result.put('terminate')
 
 
-class ProcessDiffusionTracking(Process):
+class ProcessDiffusionTracking(AbstractProcessJob):
     """
     ProcessDiffusionModel
 
@@ -1235,7 +1768,7 @@ class ProcessDiffusionTracking(Process):
     Inheritance
     ~~~~~~~~~~~
 
-    Process -> ProcessDiffusionTracking
+    Process -> AbstractProcessJob -> ProcessDiffusionTracking
     """
     # Special method
 
@@ -1246,7 +1779,7 @@ class ProcessDiffusionTracking(Process):
 
     def __init__(self, model, seedcount, stepsize, maxangle, npeaks, peakthreshold,
                  minangle, minlength, alg, method, seed, stopping, mng, queue):
-        Process.__init__(self)
+        AbstractProcessJob.__init__(self)
         self._model = model
         self._seedcount = seedcount
         self._stepsize = stepsize
@@ -1279,6 +1812,8 @@ class ProcessDiffusionTracking(Process):
         track.setRelativeThresholdOfPeaks(self._peakthreshold)
         track.setMinSeparationAngleOfPeaks(self._minangle)
         track.setMinLength(self._minlength)
+        # seed batches dispatched to one worker process per core
+        track.setNumberOfWorkers(0)
         if self._alg == 'Deterministic':
             if self._method == 'Euler EuDX':
                 track.setTrackingAlgorithmToDeterministicEulerIntegration()
@@ -191,6 +191,7 @@ def dwiPreprocessing(vols: SisypheVolumeCollection,
                      gibbs: dict[str, int] | None = None,
                      denoise: dict[str, int | str] | None = None,
                      save: bool = False,
+                     workers: int = 1,
                      wait: DialogWait | DictProxy | None = None) -> tuple[SisypheVolumeCollection, SisypheROI | None] | None:
     """
     Parameters
@@ -216,6 +217,8 @@ def dwiPreprocessing(vols: SisypheVolumeCollection,
         {'algo': 'Adaptive soft coefficient matching', 'noisealgo': str, 'rec': str, 'ncoils': int, 'nphase': int}
     save : bool
         save if true
+    workers : int
+        number of processes used by PCA denoising algorithms (default 1, current process, 0 number of cores)
     wait : DialogWait | multiprocessing.managers.DictProxy | None
         optional progress dialog or multiprocessing shared dict (DictProxy)
 
@@ -344,7 +347,7 @@ def dwiPreprocessing(vols: SisypheVolumeCollection,
             if wait is not None:
                 if isinstance(wait, DialogWait): wait.setInformationText('Local PCA denoising...')
                 elif isinstance(wait, DictProxy): wait['msg'] = 'Local PCA denoising...'
-            imgs = localpca(imgs, sigma=sigma, mask=mask, patch_radius=radius, pca_method=method, tau_factor=2.3, wait=wait)
+            imgs = localpca(imgs, sigma=sigma, mask=mask, patch_radius=radius, pca_method=method, tau_factor=2.3, workers=workers, wait=wait)
         # General function PCA denoising
         elif denoise['algo'] == _DENOISE[1]:
             if 'smooth' in denoise: smooth = denoise['smooth']
@@ -370,7 +373,7 @@ def dwiPreprocessing(vols: SisypheVolumeCollection,
             if wait is not None:
                 if isinstance(wait, DialogWait): wait.setInformationText('General function PCA denoising...')
                 elif isinstance(wait, DictProxy): wait['msg'] = 'General function PCA denoising...'
-            imgs = genpca(imgs, sigma=sigma, mask=mask, patch_radius=radius, pca_method=method, tau_factor=2.3, wait=wait)
+            imgs = genpca(imgs, sigma=sigma, mask=mask, patch_radius=radius, pca_method=method, tau_factor=2.3, workers=workers, wait=wait)
         # Marcenko-Pastur PCA denoising
         elif denoise['algo'] == _DENOISE[2]:
             """
@@ -388,7 +391,7 @@ def dwiPreprocessing(vols: SisypheVolumeCollection,
             if wait is not None:
                 if isinstance(wait, DialogWait): wait.setInformationText('Marcenko-Pastur PCA denoising...')
                 elif isinstance(wait, DictProxy): wait['msg'] = 'Marcenko-Pastur PCA denoising...'
-            imgs = mppca(imgs, mask=mask, patch_radius=radius, pca_method=method, wait=wait)
+            imgs = mppca(imgs, mask=mask, patch_radius=radius, pca_method=method, workers=workers, wait=wait)
         # Non-local means denoising
         elif denoise['algo'] == _DENOISE[3]:
             if wait is not None:
@@ -12,32 +12,37 @@ import cython
 
 from datetime import datetime
 
+from concurrent.futures import ThreadPoolExecutor
+
 from numpy import e
 from numpy import abs
 from numpy import log
 from numpy import exp
+from numpy import ones
 from numpy import zeros
 from numpy import sort
 from numpy import mean
-from numpy import max
 from numpy import array
 from numpy import arange
 from numpy import argmin
 from numpy import argmax
 from numpy import argsort
 from numpy import where
-from numpy import shape
 from numpy import sum
-from numpy import transpose
 from numpy import power
 from numpy import amax
 from numpy import multiply
 from numpy import divide
 from numpy import trapz
-from numpy import convolve
 from numpy import unravel_index
 from numpy import nan_to_num
 from numpy import ndarray
+from numpy import newaxis
+from numpy import isnan
+from numpy import indices
+from numpy import asarray
+from numpy import atleast_2d
+from numpy import concatenate
 from numpy.linalg import svd
 
 from typing import Union
@@ -56,6 +61,7 @@ __all__ = ['getArterialInputVoxels',
            'gammaVariateFitting',
            'signalToContrastConcentration',
            'deconvolveContrastConcentration',
+           'batchDeconvolveContrastConcentration',
            'signalRecoveryMaps',
            'dscMaps']
 
@@ -69,6 +75,7 @@ functions
     - signalToContrastConcentration
     - leakageCorrection
     - deconvolveContrastConcentration
+    - batchDeconvolveContrastConcentration
     - signalRecoveryMaps
     - dscMaps
 """
@@ -359,29 +366,55 @@ def deconvolveContrastConcentration(aif: ndarray, cc: ndarray, tr: float) -> nda
     numpy.ndarray
         impulse response function
     """
-    # Discretize AIF
-    # noinspection PyUnresolvedReferences
-    nt: cython.int = shape(cc)[0]
-    amtx = zeros([nt, nt])
-    # noinspection PyUnresolvedReferences
-    i: cython.int
+    return batchDeconvolveContrastConcentration(aif, cc[newaxis, :], tr)[0]
+
+
+def batchDeconvolveContrastConcentration(aif: ndarray,
+                                         cc: ndarray,
+                                         tr: float,
+                                         chunksize: int = 1024,
+                                         workers: int | None = None) -> ndarray:
+    """
+    Batch deconvolution of voxel contrast concentration time series with arterial input function.
+
+    Same algorithm as deconvolveContrastConcentration (truncated singular value decomposition with L-curve criterion
+    regularization), but the AIF matrix and its singular value decomposition are computed only once. Time series are
+    projected together and the L-curve regularization parameter is selected for each voxel with array operations.
+    Voxels are processed in chunks, chunks are dispatched to a thread pool.
+
+    Parameters
+    ----------
+    aif : numpy.ndarray
+        arterial input function (as signal, not contrast concentration)
+    cc : numpy.ndarray
+        voxel contrast concentration time series, shape (voxel count, time points)
+    tr : float
+        repetition time (TR) in s
+    chunksize : int
+        number of voxels processed in each chunk (default 1024)
+    workers : int | None
+        number of threads, default None (min(32, os.cpu_count() + 4))
+
+    Returns
+    -------
+    numpy.ndarray
+        impulse response functions, shape (voxel count, time points)
+    """
+    cc = atleast_2d(cc)
     # noinspection PyUnresolvedReferences
-    j: cython.int
-    for i in range(nt):
-        for j in range(nt):
-            if j == 0 and i != 0: amtx[i, j] = (2 * aif[i] + aif[i - 1]) / 6.0
-            elif i == j: amtx[i, j] = (2 * aif[0] + aif[1]) / 6.0
-            elif 0 < j < i:
-                amtx[i, j] = ((2 * aif[i - j] + aif[i - j - 1]) / 6.0) + \
-                             ((2 * aif[i - j] + aif[i - j + 1]) / 6.0)
-            else: amtx[i, j] = 0.0
-    # SVD without regularization
+    nt: cython.int = cc.shape[1]
+    # Discretize AIF
+    aif = asarray(aif, dtype='float64')
+    c = zeros(nt)
+    c[0] = (2 * aif[0] + aif[1]) / 6.0
+    c[1:nt - 1] = (4 * aif[1:nt - 1] + aif[0:nt - 2] + aif[2:nt]) / 6.0
+    i, j = indices((nt, nt))
+    amtx = where(i >= j, c[i - j], 0.0)
+    amtx[1:, 0] = (2 * aif[1:nt] + aif[0:nt - 1]) / 6.0
+    # SVD without regularization, computed once for all voxels
     amtx = tr * amtx
-    B0 = cc
     U, S, V = svd(amtx)
-    # S_d = diag(S)
-    B = transpose(U) @ B0
-    # L-curve regularization
+    # L-curve terms, independent of voxel
     # noinspection PyUnresolvedReferences
     umax: cython.double = 10.0
     # noinspection PyUnresolvedReferences
@@ -391,63 +424,46 @@ def deconvolveContrastConcentration(aif: ndarray, cc: ndarray, tr: float) -> nda
     k = arange(nu)
     # noinspection PyTypeChecker
     u = amax(S) * umin * power((umax / umin), ((k - 1) / (nu - 1)))
-    l0 = zeros([nu, amtx[:, 0].size])
-    l1 = zeros([nu, amtx[:, 0].size])
-    l2 = zeros([nu, amtx[:, 0].size])
-    L = zeros([nu, amtx[:, 0].size, 3])
-    # noinspection PyUnresolvedReferences
-    x: cython.int
-    # noinspection PyUnresolvedReferences
-    y: cython.int
-    for x in range(nu):
-        for y in range(amtx[:, 0].size):
-            l0[x, y] = power((power(u[x], 2) / (power(S[y], 2) + power(u[x], 2))), 2)
-            l1[x, y] = power((S[y] / (power(S[y], 2) + power(u[x], 2))), 2)
-            l2[x, y] = ((-4) * u[x] * power(S[y], 2)) / power((power(S[y], 2) + power(u[x], 2)), 3)
-    L[:, :, 0] = l0
-    L[:, :, 1] = l1
-    L[:, :, 2] = l2
-    # Optimize
-    k = (nu - 1) - 1
-    m = zeros([nu, 3])
-    product = zeros(amtx[:, 0].size)
-    lcurve = zeros(nu)
-    # noinspection PyUnresolvedReferences
-    x: cython.int
-    for x in range(amtx[:, 0].size):
-        Ui = U[:, x]
-        product[x] = power((transpose(Ui) @ B), 2)
-    # noinspection PyUnresolvedReferences
-    x: cython.int
-    for x in range(3):
-        ltmp = L[:, :, x]
-        # noinspection PyTypeChecker
-        m[:, x] = sum(ltmp, axis=1) * sum(product)
-    # noinspection PyUnresolvedReferences
-    x: cython.int
-    for x in range(nu):
-        lcurve[x] = 2 * (m[x, 1] * m[x, 0] / m[x, 2]) * \
-                    ((power(u[x], 2) * m[x, 2] * m[x, 0] + 2 * u[x] * m[x, 1] * m[x, 0] +
-                      power(u[x], 4) * m[x, 1] * m[x, 2]) /
-                     power((power(u[x], 4) * power(m[x, 1], 2) + power(m[x, 0], 2)), (3 / 2)))
-    # noinspection PyUnresolvedReferences
-    Lm1: cython.double = lcurve[k - 2]
-    # noinspection PyUnresolvedReferences
-    L0: cython.double = lcurve[k - 1]
-    # noinspection PyUnresolvedReferences
-    L1: cython.double = lcurve[k]
-    # noinspection PyUnresolvedReferences
-    mu: cython.double = u[k - 1]
-    while L0 >= Lm1 or L0 >= L1:
-        k -= 1
-        L1 = L0
-        L0 = Lm1
-        Lm1 = lcurve[k - 1]
-        mu = u[k - 1]
-    Bpi = multiply(B, divide(S, (power(S, 2) + power(mu, 2))))
-    Rf = transpose(V) @ Bpi
-    # return Rf, mu, B, S
-    return Rf
+    s2 = power(S, 2)
+    u2 = power(u, 2)[:, newaxis]
+    l0 = sum(power(u2 / (s2 + u2), 2), axis=1)
+    l1 = sum(power(S / (s2 + u2), 2), axis=1)
+    l2 = sum((-4) * u[:, newaxis] * s2 / power(s2 + u2, 3), axis=1)
+    u2 = u2[:, 0]
+    u4 = power(u, 4)
+    # L-curve centre indices in the search order of the former serial loop, nu - 5 down to 1, then
+    # circularly (negative indexes) 0, nu - 1 down to 1 if there is no local minimum
+    ks = arange(nu - 5, -nu, -1)
+
+    def _deconvolve(b0: ndarray) -> ndarray:
+        B = b0 @ U
+        p = sum(power(B @ U, 2), axis=1)[:, newaxis]
+        m0 = l0 * p
+        m1 = l1 * p
+        m2 = l2 * p
+        lcurve = 2 * (m1 * m0 / m2) * \
+                 ((u2 * m2 * m0 + 2 * u * m1 * m0 + u4 * m1 * m2) /
+                  power((u4 * power(m1, 2) + power(m0, 2)), (3 / 2)))
+        # Optimize, last local minimum of the L-curve, same search as the former serial loop:
+        # - centre nu - 3, mu = u[nu - 3]
+        # - centre nu - 4, compared to itself by the serial loop, stops only if NaN, mu = u[nu - 4]
+        # - centre k in ks, mu = u[k - 1], first k such as lcurve[k] < lcurve[k - 1] and lcurve[k] < lcurve[k + 1]
+        # - no stop (constant L-curve), the serial loop raises IndexError, mu = u[0]
+        stop = ~((lcurve[:, ks] >= lcurve[:, ks - 1]) | (lcurve[:, ks] >= lcurve[:, ks + 1]))
+        kopt = where(stop.any(axis=1), ks[stop.argmax(axis=1)] - 1, 0)
+        kopt = where(isnan(lcurve[:, nu - 4]), nu - 4, kopt)
+        kopt = where(~((lcurve[:, nu - 3] >= lcurve[:, nu - 4]) | (lcurve[:, nu - 3] >= lcurve[:, nu - 2])),
+                     nu - 3, kopt)
+        mu = u[kopt][:, newaxis]
+        Bpi = multiply(B, divide(S, (s2 + power(mu, 2))))
+        return Bpi @ V
+
+    n = cc.shape[0]
+    if n <= chunksize: return _deconvolve(cc)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            r = list(executor.map(_deconvolve, [cc[i:i + chunksize] for i in range(0, n, chunksize)]))
+        return concatenate(r, axis=0)
 
 
 def signalRecoveryMaps(vols: SisypheVolume,
@@ -651,81 +667,100 @@ def dscMaps(vols: SisypheVolume,
     if dsc:
         # DSC maps processing
         cc = cc_vols.getNumpy(defaultshape=False)
-        # noinspection PyUnresolvedReferences
-        i: cython.int
-        # noinspection PyUnresolvedReferences
-        j: cython.int
-        # noinspection PyUnresolvedReferences
-        k: cython.int
+        msk = mask.getNumpy(defaultshape=False) > 0
         cbf = zeros(shape=cc.shape[:3])
         cbv = zeros(shape=cc.shape[:3])
         mtt = zeros(shape=cc.shape[:3])
         ttp = zeros(shape=cc.shape[:3])
         lkv = zeros(shape=cc.shape[:3])
-        if wait is not None:
-            wait.setInformationText('DSC maps processing...')
-            wait.setProgressVisibility(True)
-            wait.setProgressRange(0, cc.shape[2])
-            wait.buttonVisibilityOn()
-        t = datetime.now()
-        for k in range(cc.shape[2]):
-            if wait is not None: wait.setCurrentProgressValue(k)
-            if k > 0:
-                now = datetime.now()
-                delta = now - t
-                t = now
-                delta *= cc.shape[2] - k
-                m = delta.seconds // 60
-                s = delta.seconds - (m * 60)
-                if m == 0:
-                    wait.setInformationText('DSC maps processing...\n'
-                                            'Estimated time remaining {} s.'.format(s))
-                else:
-                    wait.setInformationText('DSC maps processing...\n'
-                                            'Estimated time remaining {} min {} s.'.format(m, s))
-            for j in range(cc.shape[1]):
-                for i in range(cc.shape[0]):
+        # masked voxel time series, shape (voxel count, time points)
+        ccm = cc[msk].astype('float64')
+        # noinspection PyUnresolvedReferences
+        n: cython.int = ccm.shape[0]
+        vcbf = zeros(n)
+        vcbv = zeros(n)
+        vmtt = zeros(n)
+        vttp = zeros(n)
+        vlkv = zeros(n)
+        valid = ones(n, dtype=bool)
+        if smooth:
+            # [0.25, 0.5, 0.25] kernel, same size as time series
+            sccm = 0.5 * ccm
+            sccm[:, 1:] += 0.25 * ccm[:, :-1]
+            sccm[:, :-1] += 0.25 * ccm[:, 1:]
+            ccm = sccm
+        if fit:
+            if wait is not None:
+                wait.setInformationText('DSC maps processing...')
+                wait.setProgressVisibility(True)
+                wait.setProgressRange(0, n)
+                wait.buttonVisibilityOn()
+            # noinspection PyUnresolvedReferences
+            step: cython.int = n // 100 + 1
+            t = datetime.now()
+            # noinspection PyUnresolvedReferences
+            i: cython.int
+            for i in range(n):
+                if i % step == 0:
                     QApplication.processEvents()
-                    if wait is not None and wait.getStopped(): return r
-                    if mask[i, j, k] > 0:
-                        if smooth:
-                            cc[i, j, k, :] = convolve(cc[i, j, k, :], [0.25, 0.5, 0.25])
-                        if fit:
-                            p = gammaVariateFitting(cc[i, j, k, :], leakage=leakage)
-                            if p is not None:
-                                ccc = p['cc']
-                                # cerebral blood volume in ml / 100 g (* 100, g to 100 g)
-                                cbv[i, j, k] = (p['ccintgrl'] / aif_intgrl) * 100.0
-                                if cbv[i, j, k] > 100.0: cbv[i, j, k] = 100.0
-                                # mean transit time in s (* tr, index to s)
-                                mtt[i, j, k] = p['mtt'] * tr
-                                # time to pic in s (* tr, index to s)
-                                ttp[i, j, k] = p['ttp'] * tr
-                                if leakage:
-                                    # leakage in ml / 100 g (* 100, g to 100 g)
-                                    lkv[i, j, k] = (p['rintgrl'] / aif_intgrl) * 100.0
-                            else: continue
-                        else: ccc = cc[i, j, k, :]
-                        if deconvolve:
-                            rf = deconvolveContrastConcentration(aif, ccc, tr)
-                            # cerebral blood flow in ml / min / 100 g (* 100, g to 100 g)
-                            cbf[i, j, k] = max(rf) * 100.0 * (60.0 / tr)
-                            # cerebral blood volume in ml / 100 g (* 100, g to 100 g)
-                            if cbv[i, j, k] == 0.0: cbv[i, j, k] = trapz(rf) * 100
-                            # mean transit time in s (* 60, min to s)
-                            mtt[i, j, k] = (cbv[i, j, k] / cbf[i, j, k]) * 60.0
-                        else:
-                            if cbv[i, j, k] == 0.0:
-                                # cerebral blood flow in ml / min / 100 g (* 100, g to 100 g)
-                                cbv[i, j, k] = (trapz(ccc) / aif_intgrl) * 100.0
-                                if cbv[i, j, k] > 100.0: cbv[i, j, k] = 100.0
-                            if mtt[i, j, k] != 0.0:
-                                # cerebral blood flow in ml / min / 100 g, * 60 (s to min)
-                                cbf[i, j, k] = (cbv[i, j, k] / mtt[i, j, k]) * 60.0
-                        if ttp[i, j, k] == 0.0:
-                            # noinspection PyTypeChecker
-                            ttp[i, j, k] = ccc.argmax() * tr
-        wait.setCurrentProgressValue(cc.shape[2])
+                    if wait is not None:
+                        if wait.getStopped(): return r
+                        wait.setCurrentProgressValue(i)
+                        if i > 0:
+                            delta = (datetime.now() - t) * ((n - i) / i)
+                            mn = delta.seconds // 60
+                            s = delta.seconds - (mn * 60)
+                            if mn == 0:
+                                wait.setInformationText('DSC maps processing...\n'
+                                                        'Estimated time remaining {} s.'.format(s))
+                            else:
+                                wait.setInformationText('DSC maps processing...\n'
+                                                        'Estimated time remaining {} min {} s.'.format(mn, s))
+                p = gammaVariateFitting(ccm[i], leakage=leakage)
+                if p is not None:
+                    ccm[i] = p['cc']
+                    # cerebral blood volume in ml / 100 g (* 100, g to 100 g)
+                    vcbv[i] = (p['ccintgrl'] / aif_intgrl) * 100.0
+                    # mean transit time in s (* tr, index to s)
+                    vmtt[i] = p['mtt'] * tr
+                    # time to pic in s (* tr, index to s)
+                    vttp[i] = p['ttp'] * tr
+                    if leakage:
+                        # leakage in ml / 100 g (* 100, g to 100 g)
+                        vlkv[i] = (p['rintgrl'] / aif_intgrl) * 100.0
+                else: valid[i] = False
+            if wait is not None: wait.setCurrentProgressValue(n)
+            vcbv = where(vcbv > 100.0, 100.0, vcbv)
+        if deconvolve:
+            if wait is not None:
+                wait.setInformationText('DSC deconvolution...')
+                QApplication.processEvents()
+            # one AIF matrix factorization for all voxels
+            rf = batchDeconvolveContrastConcentration(aif, ccm[valid], tr)
+            # cerebral blood flow in ml / min / 100 g (* 100, g to 100 g)
+            vcbf[valid] = rf.max(axis=1) * 100.0 * (60.0 / tr)
+            # cerebral blood volume in ml / 100 g (* 100, g to 100 g)
+            v = vcbv[valid]
+            vcbv[valid] = where(v == 0.0, trapz(rf, axis=1) * 100, v)
+            # mean transit time in s (* 60, min to s)
+            vmtt[valid] = (vcbv[valid] / vcbf[valid]) * 60.0
+        else:
+            # cerebral blood volume, without unit
+            v = vcbv[valid]
+            vi = (trapz(ccm[valid], axis=1) / aif_intgrl) * 100.0
+            vcbv[valid] = where(v == 0.0, where(vi > 100.0, 100.0, vi), v)
+            # cerebral blood flow, without unit, * 60 (s to min)
+            v = valid & (vmtt != 0.0)
+            vcbf[v] = (vcbv[v] / vmtt[v]) * 60.0
+        # time to pic in s (* tr, index to s)
+        v = vttp[valid]
+        # noinspection PyTypeChecker
+        vttp[valid] = where(v == 0.0, ccm[valid].argmax(axis=1) * tr, v)
+        cbf[msk] = vcbf
+        cbv[msk] = vcbv
+        mtt[msk] = vmtt
+        ttp[msk] = vttp
+        lkv[msk] = vlkv
         cbv = nan_to_num(cbv, nan=0.0, posinf=0.0, neginf=0.0)
         cbf = nan_to_num(cbf, nan=0.0, posinf=0.0, neginf=0.0)
         mtt = nan_to_num(mtt, nan=0.0, posinf=0.0, neginf=0.0)
@@ -7,13 +7,26 @@ External packages/modules
     - scikit-learn, data analysis, https://scikit-learn.org/stable/
 """
 
-from os import getcwd
+from os import mkdir
+from os import remove
+from os import replace
+from os import utime
+from os import walk
 
 from os.path import join
 from os.path import exists
+from os.path import isdir
+from os.path import splitext
+from os.path import getmtime
+from os.path import getsize
 
 from shutil import rmtree
 
+from hashlib import md5
+
+from pickle import dump
+from pickle import load
+
 from nilearn.maskers import NiftiMasker
 from nilearn.maskers import NiftiLabelsMasker
 from nilearn.decomposition import CanICA
@@ -24,6 +37,7 @@ from numpy import abs
 from numpy import argmax
 from numpy import arctanh
 from numpy import ndarray
+from numpy import ascontiguousarray
 from numpy.random import RandomState
 
 from sklearn.decomposition import PCA
@@ -31,6 +45,7 @@ from sklearn.decomposition import FastICA
 from sklearn.covariance import GraphicalLassoCV
 
 from Sisyphe.core.sisypheROI import SisypheROI
+from Sisyphe.core.sisypheSettings import getUserPySisyphePath
 from Sisyphe.core.sisypheVolume import SisypheVolume
 from Sisyphe.core.sisypheVolume import SisypheVolumeCollection
 from Sisyphe.gui.dialogWait import DialogWait
@@ -40,7 +55,9 @@ __all__ = ['seriesPreprocessing',
            'seriesPCA',
            'seriesFastICA',
            'seriesConnectivityMatrix',
-           'seriesGroupICA']
+           'seriesGroupICA',
+           'getSeriesCachePath',
+           'clearSeriesCache']
 """
 Functions
 ~~~~~~~~~
@@ -51,10 +68,107 @@ Functions
     - seriesFastICA
     - seriesConnectivityMatrix
     - seriesGroupICA
-    
-Last revision: 12/06/2025
+    - getSeriesCachePath
+    - clearSeriesCache
+
+Masker outputs (fitted masker and cleaned time series) are saved in a persistent cache in the PySisyphe user path.
+Cache entries are keyed on the array ID of the time series and on the masker parameters, least recently used entries
+are removed when the cache size exceeds 2 GB.
+
+Last revision: 16/10/2026
 """
 
+# < Revision 16/10/2026
+# persistent masker cache
+_CACHESIZE = 2147483648  # cache size in bytes (2 GB)
+
+
+def getSeriesCachePath() -> str:
+    """
+    Get the path of the time series cache (nilearn_cache subdirectory of the PySisyphe user path).
+
+    Returns
+    -------
+    str
+        cache path
+    """
+    path = join(getUserPySisyphePath(), 'nilearn_cache')
+    if not exists(path): mkdir(path)
+    return path
+
+
+def clearSeriesCache() -> None:
+    """
+    Remove all entries of the time series cache.
+    """
+    path = join(getUserPySisyphePath(), 'nilearn_cache')
+    if exists(path): rmtree(path, ignore_errors=True)
+
+
+def _getCacheKey(vols: SisypheVolume, masker: NiftiMasker | NiftiLabelsMasker, confmat: ndarray | None,
+                 extra: str = '') -> str:
+    m = md5()
+    m.update(vols.getArrayID().encode())
+    m.update(str((vols.getSpacing(), vols.getOrigin(), vols.getDirections())).encode())
+    m.update(type(masker).__name__.encode())
+    params = masker.get_params()
+    for k in sorted(params):
+        # labels image is hashed by caller (extra parameter)
+        if k not in ('memory', 'memory_level', 'verbose', 'labels_img'):
+            m.update('{}={}'.format(k, params[k]).encode())
+    if confmat is not None:
+        m.update(str(confmat.shape).encode())
+        m.update(ascontiguousarray(confmat).tobytes())
+    m.update(extra.encode())
+    return m.hexdigest()
+
+
+def _evictCache() -> None:
+    path = getSeriesCachePath()
+    entries = list()
+    for root, dirs, files in walk(path):
+        if root == path:
+            for f in files:
+                if splitext(f)[1] == '.pkl':
+                    f = join(root, f)
+                    entries.append((getmtime(f), getsize(f), f))
+        elif 'output.pkl' in files:
+            # joblib cache entry (nilearn decomposition)
+            entries.append((getmtime(join(root, 'output.pkl')), sum([getsize(join(root, f)) for f in files]), root))
+    total = sum([e[1] for e in entries])
+    if total > _CACHESIZE:
+        # least recently used entries first
+        entries.sort()
+        for t, size, f in entries:
+            if isdir(f): rmtree(f, ignore_errors=True)
+            else: remove(f)
+            total -= size
+            if total <= _CACHESIZE: break
+
+
+def _cachedFitTransform(masker: NiftiMasker | NiftiLabelsMasker,
+                        vols: SisypheVolume,
+                        confmat: ndarray | None = None,
+                        extra: str = '') -> tuple[NiftiMasker | NiftiLabelsMasker, ndarray]:
+    filename = join(getSeriesCachePath(), _getCacheKey(vols, masker, confmat, extra) + '.pkl')
+    if exists(filename):
+        try:
+            with open(filename, 'rb') as f:
+                r = load(f)
+            # update modification time, used by least recently used eviction
+            utime(filename)
+            return r
+        except Exception: remove(filename)
+    series = masker.fit_transform(vols.copyToNibabelImage(), confounds=confmat)
+    # atomic write, cache may be shared by several processes
+    tmp = filename + '.tmp'
+    with open(tmp, 'wb') as f:
+        dump((masker, series), f)
+    replace(tmp, filename)
+    _evictCache()
+    return masker, series
+# Revision 16/10/2026 >
+
 def seriesPreprocessing(vols: list[SisypheVolume] | SisypheVolumeCollection | SisypheVolume,
                         confmat: ndarray | None = None,
                         fwhm: float | None = None,
@@ -126,10 +240,11 @@ def seriesPreprocessing(vols: list[SisypheVolume] | SisypheVolumeCollection | Si
                                  low_pass=lowpass,
                                  high_pass=highpass,
                                  t_r=tr,
-                                 mask_strategy='epi',
-                                 memory="nilearn_cache",
-                                 memory_level=1)
-            series = masker.fit_transform(vols.copyToNibabelImage(), confounds=confmat)
+                                 mask_strategy='epi')
+            # < Revision 16/10/2026
+            # series = masker.fit_transform(vols.copyToNibabelImage(), confounds=confmat)
+            masker, series = _cachedFitTransform(masker, vols, confmat)
+            # Revision 16/10/2026 >
             # < Revision 12/06/2025
             # img = masker.inverse_transform(series.T)
             img = masker.inverse_transform(series)
@@ -147,8 +262,8 @@ def seriesPreprocessing(vols: list[SisypheVolume] | SisypheVolumeCollection | Si
             r.copyAttributesFrom(vols, display=False, slope=False)
             # < Revision 12/06/2025
             # remove nilearn cache
-            cache = join(getcwd(), 'nilearn_cache')
-            if exists(cache): rmtree(cache)
+            # cache = join(getcwd(), 'nilearn_cache')
+            # if exists(cache): rmtree(cache)
             # Revision 12/06/2025 >
             return r
         else: raise AttributeError('Parameter is not a multi-component image.')
@@ -223,10 +338,11 @@ def seriesSeedToVoxel(vols: list[SisypheVolume] | SisypheVolumeCollection | Sisy
                                  low_pass=lowpass,
                                  high_pass=highpass,
                                  t_r=tr,
-                                 mask_strategy='epi',
-                                 memory="nilearn_cache",
-                                 memory_level=1)
-            series = masker.fit_transform(vols.copyToNibabelImage(), confounds=confmat)
+                                 mask_strategy='epi')
+            # < Revision 16/10/2026
+            # series = masker.fit_transform(vols.copyToNibabelImage(), confounds=confmat)
+            masker, series = _cachedFitTransform(masker, vols, confmat)
+            # Revision 16/10/2026 >
             if wait is not None:
                 wait.setInformationText('{}\nSeed signal extraction...'.format(vols.getBasename()))
             smasker = NiftiLabelsMasker(labels_img=roi.copyToNibabelImage(),
@@ -236,10 +352,12 @@ def seriesSeedToVoxel(vols: list[SisypheVolume] | SisypheVolumeCollection | Sisy
                                         detrend=detrend,
                                         low_pass=lowpass,
                                         high_pass=highpass,
-                                        t_r=tr,
-                                        memory="nilearn_cache",
-                                        memory_level=1)
-            seed = smasker.fit_transform(vols.copyToNibabelImage(), confounds=confmat)
+                                        t_r=tr)
+            # < Revision 16/10/2026
+            # seed = smasker.fit_transform(vols.copyToNibabelImage(), confounds=confmat)
+            m = md5(ascontiguousarray(roi.getNumpy()).tobytes())
+            smasker, seed = _cachedFitTransform(smasker, vols, confmat, m.hexdigest())
+            # Revision 16/10/2026 >
             if wait is not None:
                 wait.setInformationText('{}\nCorrelation processing...'.format(vols.getBasename()))
             cc = dot(series.T, seed) / seed.shape[0]
@@ -276,8 +394,8 @@ def seriesSeedToVoxel(vols: list[SisypheVolume] | SisypheVolumeCollection | Sisy
             r['z'].setFilenameSuffix('seed_zmap')
             # < Revision 12/06/2025
             # remove nilearn cache
-            cache = join(getcwd(), 'nilearn_cache')
-            if exists(cache): rmtree(cache)
+            # cache = join(getcwd(), 'nilearn_cache')
+            # if exists(cache): rmtree(cache)
             # Revision 12/06/2025 >
             return r
         else: raise AttributeError('Parameter is not a multi-component image.')
@@ -326,11 +444,12 @@ def seriesPCA(vols: list[SisypheVolume] | SisypheVolumeCollection | SisypheVolum
         if vols.getNumberOfComponentsPerPixel() > 1:
             if wait is not None:
                 wait.setInformationText('{}\nPCA preprocessing...'.format(vols.getBasename()))
-            masker = NiftiMasker(memory='nilearn_cache',
-                                 memory_level=1,
-                                 mask_strategy='epi',
+            masker = NiftiMasker(mask_strategy='epi',
                                  standardize='zscore_sample')
-            series = masker.fit_transform(vols.copyToNibabelImage())
+            # < Revision 16/10/2026
+            # series = masker.fit_transform(vols.copyToNibabelImage())
+            masker, series = _cachedFitTransform(masker, vols)
+            # Revision 16/10/2026 >
             if wait is not None:
                 wait.setInformationText('{}\nPCA processing...'.format(vols.getBasename()))
             rng = RandomState(42)
@@ -356,8 +475,8 @@ def seriesPCA(vols: list[SisypheVolume] | SisypheVolumeCollection | SisypheVolum
             r.copyAttributesFrom(vols, display=False, slope=False)
             # < Revision 12/06/2025
             # remove nilearn cache
-            cache = join(getcwd(), 'nilearn_cache')
-            if exists(cache): rmtree(cache)
+            # cache = join(getcwd(), 'nilearn_cache')
+            # if exists(cache): rmtree(cache)
             # Revision 12/06/2025 >
             return r
         else: raise AttributeError('Parameter is not a multi-component image.')
@@ -435,10 +554,11 @@ def seriesFastICA(vols: list[SisypheVolume] | SisypheVolumeCollection | SisypheV
                                  low_pass=lowpass,
                                  high_pass=highpass,
                                  t_r=tr,
-                                 mask_strategy='epi',
-                                 memory="nilearn_cache",
-                                 memory_level=1)
-            series = masker.fit_transform(vols.copyToNibabelImage(), confounds=confmat)
+                                 mask_strategy='epi')
+            # < Revision 16/10/2026
+            # series = masker.fit_transform(vols.copyToNibabelImage(), confounds=confmat)
+            masker, series = _cachedFitTransform(masker, vols, confmat)
+            # Revision 16/10/2026 >
             if wait is not None:
                 wait.setInformationText('{}\nSingle-subject ICA processing...'.format(vols.getBasename()))
             rng = RandomState(42)
@@ -463,8 +583,8 @@ def seriesFastICA(vols: list[SisypheVolume] | SisypheVolumeCollection | SisypheV
             r.setFilenameSuffix('ica')
             # < Revision 12/06/2025
             # remove nilearn cache
-            cache = join(getcwd(), 'nilearn_cache')
-            if exists(cache): rmtree(cache)
+            # cache = join(getcwd(), 'nilearn_cache')
+            # if exists(cache): rmtree(cache)
             # Revision 12/06/2025 >
             return r
         else: raise AttributeError('Parameter is not a multi-component image.')
@@ -539,18 +659,19 @@ def seriesConnectivityMatrix(vols: list[SisypheVolume] | SisypheVolumeCollection
                                        detrend=detrend,
                                        low_pass=lowpass,
                                        high_pass=highpass,
-                                       t_r=tr,
-                                       memory="nilearn_cache",
-                                       memory_level=1)
-            series = masker.fit_transform(vols.copyToNibabelImage(), confounds=confmat)
+                                       t_r=tr)
+            # < Revision 16/10/2026
+            # series = masker.fit_transform(vols.copyToNibabelImage(), confounds=confmat)
+            masker, series = _cachedFitTransform(masker, vols, confmat, lbls.getArrayID())
+            # Revision 16/10/2026 >
             if wait is not None:
                 wait.setInformationText('{}\nConnectome processing...'.format(vols.getBasename()))
             estimator = GraphicalLassoCV()
             estimator.fit(series)
             # < Revision 12/06/2025
             # remove nilearn cache
-            cache = join(getcwd(), 'nilearn_cache')
-            if exists(cache): rmtree(cache)
+            # cache = join(getcwd(), 'nilearn_cache')
+            # if exists(cache): rmtree(cache)
             # Revision 12/06/2025 >
             return estimator.covariance_
         else: raise ValueError('Parameter volume is single component volume.'.format())
@@ -616,11 +737,17 @@ def seriesGroupICA(vols: list[SisypheVolume],
                 f = func(n_components=ncomp,
                          smoothing_fwhm=None,
                          standardize_confounds=False,
-                         memory='nilearn_cache',
+                         # < Revision 16/10/2026
+                         # memory='nilearn_cache',
+                         memory=join(getSeriesCachePath(), 'joblib'),
+                         # Revision 16/10/2026 >
                          memory_level=2,
                          standardize='zscore_sample',
                          n_jobs=2)
                 f.fit(data)
+                # < Revision 16/10/2026
+                _evictCache()
+                # Revision 16/10/2026 >
                 comp = f.components_img_
                 r = SisypheVolume()
                 r.copyFromNibabelImage(comp)
@@ -0,0 +1,839 @@
+"""
+External packages/modules
+-------------------------
+
+    - ANTs, image registration, http://stnava.github.io/ANTs/
+    - Numpy, scientific computing, https://numpy.org/
+    - pyradiomics, radiomics features, https://pyradiomics.readthedocs.io/en/latest/
+    - SimpleITK, Medical image processing, https://simpleitk.org/
+"""
+
+from os import remove
+from os import cpu_count
+
+from os.path import exists
+from os.path import dirname
+from os.path import splitext
+from os.path import basename
+from os.path import join
+from os.path import abspath
+
+from queue import Queue
+
+from tempfile import TemporaryDirectory
+
+from multiprocessing import Pool
+
+from xml.dom import minidom
+
+from numpy import mean
+from numpy import uint8
+from numpy import dtype
+
+from ants.core import read_transform
+
+from SimpleITK import Cast
+from SimpleITK import sitkUInt8
+from SimpleITK import sitkFloat32
+from SimpleITK import AffineTransform
+from SimpleITK import CenteredTransformInitializerFilter
+from SimpleITK import BinaryDilate
+from SimpleITK import BinaryFillhole
+from SimpleITK import Flip as sitkFlip
+from SimpleITK import PermuteAxes as sitkPermuteAxes
+
+from Sisyphe.core.sisypheVolume import SisypheVolume
+from Sisyphe.core.sisypheTransform import SisypheTransform
+from Sisyphe.core.sisypheTransform import SisypheApplyTransform
+from Sisyphe.core.sisypheSettings import SisypheFunctionsSettings
+from Sisyphe.core.sisypheConstants import getATROPOSPath
+from Sisyphe.core.sisypheConstants import getICBM152Path
+from Sisyphe.core.sisypheConstants import addPrefixToFilename
+from Sisyphe.core.sisypheConstants import addSuffixToFilename
+from Sisyphe.processing.capturedStdoutProcessing import ProcessRegistration
+from Sisyphe.processing.capturedStdoutProcessing import ProcessSkullStrip
+from Sisyphe.processing.capturedStdoutProcessing import ProcessAtropos
+from Sisyphe.processing.simpleItkFilters import meanFilter
+from Sisyphe.processing.simpleItkFilters import medianFilter
+from Sisyphe.processing.simpleItkFilters import gaussianFilter
+from Sisyphe.processing.simpleItkFilters import recursiveGaussianFilter
+from Sisyphe.processing.simpleItkFilters import gradientMagnitudeFilter
+from Sisyphe.processing.simpleItkFilters import gradientMagnitudeRecursiveFilter
+from Sisyphe.processing.simpleItkFilters import laplacianFilter
+from Sisyphe.processing.simpleItkFilters import laplacianRecursiveFilter
+from Sisyphe.processing.simpleItkFilters import gradientAnisotropicDiffusionFilter
+from Sisyphe.processing.simpleItkFilters import curvatureAnisotropicDiffusionFilter
+from Sisyphe.processing.simpleItkFilters import minMaxCurvatureFlowFilter
+from Sisyphe.processing.simpleItkFilters import curvatureFlowFilter
+from Sisyphe.processing.simpleItkFilters import biasFieldCorrection
+from Sisyphe.processing.simpleItkFilters import histogramIntensityMatching
+from Sisyphe.processing.simpleItkFilters import regressionIntensityMatching
+from Sisyphe.processing.segmentation import probabilityTissueMapsToLabelMap
+from Sisyphe.processing.segmentation import brainMaskFromProbabilityTissueMaps
+from Sisyphe.gui.dialogWait import DialogWait
+
+__all__ = ['readWorkflow',
+           'getWorkflowSupportedStages',
+           'executeWorkflow',
+           'batchWorkflow']
+
+"""
+Functions
+~~~~~~~~~
+
+    - readWorkflow
+    - getWorkflowSupportedStages
+    - executeWorkflow
+    - batchWorkflow
+
+Headless execution of PySisyphe workflows (.xwflow files saved by Sisyphe.gui.dialogWorkflow.DialogWorkflow).
+Intermediate volumes are passed between stages in memory, only requested outputs are saved. Subjects are processed
+in parallel by a process pool, completed subjects are appended to an optional checkpoint file to resume an
+interrupted batch. Registration, segmentation and skull stripping jobs are run in the current process (pool workers
+are daemonic processes, they can't start child processes).
+
+Creation: 16/10/2026
+"""
+
+# stage name -> functions.xml section, stage output count
+_STAGES = {'flip': ('', 1),
+           'swap': ('', 1),
+           'remove': ('RemoveNeckSlices', 1),
+           'mean': ('MeanImageFilter', 1),
+           'median': ('MedianImageFilter', 1),
+           'gaussian': ('GaussianImageFilter', 1),
+           'gradient': ('GradientMagnitudeImageFilter', 1),
+           'laplacian': ('LaplacianImageFilter', 1),
+           'anisotropic': ('AnisotropicDiffusionImageFilter', 1),
+           'bias': ('BiasFieldCorrectionImageFilter', 2),
+           'histogram': ('HistogramIntensityMatchingImageFilter', 1),
+           'regression': ('RegressionIntensityMatchingImageFilter', 1),
+           'signal': ('IntensityNormalizationImageFilter', 1)}
+
+# registration stage name -> Registration field of the registration algorithm
+_REGISTRATIONS = {'rigid': 'Rigid',
+                  'affine': 'Affine',
+                  'displacement': 'DisplacementField',
+                  'spatial': 'Transform'}
+
+# registration algorithm -> ants registration type, same as Sisyphe.gui.dialogRegistration.DialogRegistration
+_REGTYPES = {'Translation': 'Translation',
+             'FastRigid': 'QuickRigid',
+             'DenseRigid': 'DenseRigid',
+             'AntsRigid': 'antsRegistrationSyN[r]',
+             'AntsFastRigid': 'antsRegistrationSyNQuick[r]',
+             'BoldRigid': 'BOLDRigid',
+             'Similarity': 'Similarity',
+             'Affine': 'Affine',
+             'FastAffine': 'AffineFast',
+             'DenseAffine': 'TRSAA',
+             'AntsAffine': 'antsRegistrationSyN[a]',
+             'AntsFastAffine': 'antsRegistrationSyNQuick[a]',
+             'BoldAffine': 'BOLDAffine',
+             'Elastic': 'ElasticSyN',
+             'DenseDiffeomorphic': 'SyNAggro',
+             'CCDiffeomorphic': 'SyNCC',
+             'BoldDiffeomorphic': 'SyNBold',
+             'AntsSplineDiffeomorphic': 'antsRegistrationSyN[b]',
+             'AntsDiffeomorphic': 'antsRegistrationSyN[s]',
+             'AntsFastSplineDiffeomorphic': 'antsRegistrationSyNQuick[b]',
+             'AntsFastDiffeomorphic': 'antsRegistrationSyNQuick[s]',
+             'AntsRigidSplineDiffeomorphic': 'antsRegistrationSyN[br]',
+             'AntsRigidDiffeomorphic': 'antsRegistrationSyN[sr]',
+             'AntsFastRigidSplineDiffeomorphic': 'antsRegistrationSyNQuick[br]',
+             'AntsFastRigidDiffeomorphic': 'antsRegistrationSyNQuick[sr]',
+             'AntsSplineDiffeomorphicOnly': 'antsRegistrationSyN[bo]',
+             'AntsDiffeomorphicOnly': 'antsRegistrationSyN[so]',
+             'AntsFastSplineDiffeomorphicOnly': 'antsRegistrationSyNQuick[bo]',
+             'AntsFastDiffeomorphicOnly': 'antsRegistrationSyNQuick[so]'}
+
+# default ants registration type of each transform
+_DEFAULTREGTYPES = {'Rigid': 'antsRegistrationSyNQuick[r]',
+                    'Affine': 'antsRegistrationSyN[a]',
+                    'DisplacementField': 'antsRegistrationSyNQuick[b]'}
+
+# skull stripping training data -> antspynet brain extraction modality
+_SKULLMODALITIES = {'T1': 't1',
+                    'T2': 't2',
+                    'FLAIR': 'flair',
+                    'T2*': 't2star',
+                    'EPI': 'bold',
+                    'FA': 'fa',
+                    'TOF': 'mra'}
+
+# parameter group of nested stage parameters -> functions.xml section
+_SECTIONS = {'registration': 'Registration',
+             'resample': 'Resample',
+             'segmentation': 'PriorBasedSegmentation',
+             'filter': 'AnisotropicDiffusionImageFilter',
+             'biasfield': 'BiasFieldCorrectionImageFilter'}
+
+
+def _convertFields(section: str, params: dict) -> dict:
+    settings = SisypheFunctionsSettings()
+    r = settings.fieldsToDict(section)
+    for k in params:
+        if k in r:
+            v = params[k]
+            vartype = settings.getFieldVartype(section, k)
+            if vartype == 'int': r[k] = int(v)
+            elif vartype in ('float', 'percent'): r[k] = float(v)
+            elif vartype in ('bool', 'visibility'): r[k] = v == 'True'
+            # only the current item of list parameters is saved in workflow file
+            elif vartype == 'lstr': r[k] = [v]
+            else: r[k] = v
+    return r
+
+
+def _convertParameters(name: str, params: dict) -> dict:
+    if name in _STAGES:
+        section = _STAGES[name][0]
+        if section == '':
+            # flip and swap dialog parameters
+            r = dict()
+            for k in params:
+                if k[:4] == 'Flip': r[k] = params[k] == 'True'
+                else: r[k] = params[k]
+            return r
+        else: return _convertFields(section, params)
+    elif name == 'skull': return _convertFields('SkullStripping', params)
+    elif name == 'texture':
+        # texture dialog parameters, features are saved in {feature class: {feature name: 'True'}} dicts
+        settings = SisypheFunctionsSettings()
+        r = {'Radius': settings.getFieldValue('TextureImageFilter', 'KernelRadius'),
+             'Batch': settings.getFieldValue('TextureImageFilter', 'VoxelBatch'),
+             'Features': dict()}
+        for k in params:
+            if isinstance(params[k], dict):
+                features = [f for f in params[k] if params[k][f] == 'True']
+                if len(features) > 0: r['Features'][k] = features
+            elif k in ('Radius', 'Batch'): r[k] = int(params[k])
+        return r
+    else:
+        # registration and prior based segmentation dialog parameters
+        if name == 'prior': groups = ('segmentation', 'filter', 'biasfield', 'resample')
+        else: groups = ('registration', 'resample')
+        r = dict()
+        for k in groups:
+            if k in params and isinstance(params[k], dict): r[k] = _convertFields(_SECTIONS[k], params[k])
+            else: r[k] = _convertFields(_SECTIONS[k], dict())
+        return r
+
+
+def readWorkflow(filename: str) -> list[dict]:
+    """
+    Read a PySisyphe workflow file (.xwflow).
+
+    Parameters
+    ----------
+    filename : str
+        workflow file name
+
+    Returns
+    -------
+    list[dict]
+        one dict for each stage, with keys:
+
+            - 'name': str, stage name ('load', 'algebra', 'mean', 'bias'...)
+            - 'edit': str, file name of the load stage or formula of the algebra stage
+            - 'input1', 'input2': int, input volume indices (img0 is the workflow input volume)
+            - 'params': dict, stage parameters
+    """
+    if exists(filename):
+        doc = minidom.parse(filename)
+        root = doc.documentElement
+        if root.nodeName == 'xwflow' and root.getAttribute('version') == '1.0':
+            r = list()
+            for node in root.childNodes:
+                if node.nodeType == node.ELEMENT_NODE:
+                    stage = {'name': node.nodeName, 'edit': '', 'input1': 0, 'input2': 0, 'params': dict()}
+                    if node.nodeName in ['load', 'algebra']:
+                        if node.firstChild is not None: stage['edit'] = node.firstChild.data.strip()
+                    else:
+                        childnode = node.firstChild
+                        while childnode:
+                            if childnode.nodeType == node.ELEMENT_NODE and childnode.hasChildNodes():
+                                if len(childnode.childNodes) > 1:
+                                    stage['params'][childnode.nodeName] = dict()
+                                    childnode2 = childnode.firstChild
+                                    while childnode2:
+                                        if childnode2.nodeType == node.ELEMENT_NODE and childnode2.hasChildNodes():
+                                            if childnode2.firstChild.nodeType == node.TEXT_NODE:
+                                                stage['params'][childnode.nodeName][childnode2.nodeName] = \
+                                                    childnode2.firstChild.data
+                                        childnode2 = childnode2.nextSibling
+                                elif childnode.firstChild.nodeType == node.TEXT_NODE:
+                                    stage['params'][childnode.nodeName] = childnode.firstChild.data
+                            childnode = childnode.nextSibling
+                        if node.hasAttribute('input1'): stage['input1'] = int(node.getAttribute('input1'))
+                        if node.hasAttribute('input2'): stage['input2'] = int(node.getAttribute('input2'))
+                    r.append(stage)
+            return r
+        else: raise IOError('XML file format is not supported.')
+    else: raise FileNotFoundError('No such file {}.'.format(filename))
+
+
+def getWorkflowSupportedStages() -> list[str]:
+    """
+    Get the list of stage names supported by headless workflow execution. Interactive options of the GUI dialogs
+    (manual registration, registration check, save dialog) are ignored, and only the stage outputs listed by
+    Sisyphe.gui.dialogWorkflow.DialogWorkflow are returned (displacement fields, brain masks and probability maps
+    are not saved).
+
+    Returns
+    -------
+    list[str]
+        supported stage names
+    """
+    return ['load', 'algebra'] + list(_STAGES.keys()) + list(_REGISTRATIONS.keys()) + ['skull', 'prior', 'texture']
+
+
+def _initialTransform(fvol: SisypheVolume, mvol: SisypheVolume, estimation: str) -> SisypheTransform:
+    # estimating translations, 'F' FOV center alignment, 'C' center of mass alignment, 'N' no estimation
+    trf = SisypheTransform()
+    trf.setIdentity()
+    if estimation == 'F':
+        if not fvol.hasSameFieldOfView(mvol):
+            f = CenteredTransformInitializerFilter()
+            f.GeometryOn()
+            img1 = Cast(fvol.getSITKImage(), sitkFloat32)
+            img2 = Cast(mvol.getSITKImage(), sitkFloat32)
+            trf.setSITKTransform(AffineTransform(f.Execute(img1, img2, trf.getSITKTransform())))
+    elif estimation == 'C':
+        f = CenteredTransformInitializerFilter()
+        f.MomentsOn()
+        img1 = Cast(fvol.getSITKImage(), sitkFloat32)
+        img2 = Cast(mvol.getSITKImage(), sitkFloat32)
+        trf.setSITKTransform(AffineTransform(f.Execute(img1, img2, trf.getSITKTransform())))
+    # Set center of rotation to fixed image center
+    trf.setCenter(fvol.getCenter())
+    return trf
+
+
+def _removeTemporaryFiles(queue: Queue) -> None:
+    while not queue.empty():
+        f = queue.get()
+        if f is not None and exists(f): remove(f)
+
+
+def _registration(name: str, moving: SisypheVolume, fixed: SisypheVolume, p: dict) -> SisypheVolume:
+    # headless version of Sisyphe.gui.dialogRegistration.DialogRegistration.execute
+    preg = p['registration']
+    algo = preg[_REGISTRATIONS[name]][0]
+    if name == 'spatial':
+        if algo in ('AntsAffine', 'AntsFastAffine'): reg = 'Affine'
+        else: reg = 'DisplacementField'
+    else: reg = _REGISTRATIONS[name]
+    if algo in _REGTYPES: regtype = _REGTYPES[algo]
+    else: regtype = _DEFAULTREGTYPES[reg]
+    metric = list()
+    m = preg['LinearMetric'][0]
+    if m == 'CC': metric.append('CC')
+    elif m == 'MS': metric.append('meansquares')
+    else: metric.append('mattes')
+    m = preg['NonLinearMetric'][0]
+    if m == 'CC': metric.append('CC')
+    elif m == 'MS': metric.append('meansquares')
+    elif m == 'DEMONS': metric.append('demons')
+    else: metric.append('mattes')
+    with TemporaryDirectory() as tmp:
+        # registration job writes its temporary files in the moving volume directory
+        fvol = fixed.copy()
+        mvol = moving.copy()
+        fvol.setFilename(join(tmp, 'fixed.xvol'))
+        mvol.setFilename(join(tmp, 'moving.xvol'))
+        forigin = fvol.getOrigin()
+        fdirections = fvol.getDirections()
+        # registration with default origins and directions
+        fvol.setDefaultOrigin()
+        mvol.setDefaultOrigin()
+        fvol.setDefaultDirections()
+        mvol.setDefaultDirections()
+        if preg['FixedMask']:
+            img = fvol.getSITKImage() >= mean(fvol.getNumpy().flatten())
+            img = BinaryFillhole(BinaryDilate(img, [4, 4, 4]))
+            mask = SisypheVolume()
+            mask.setSITKImage(img)
+        else: mask = None
+        trf = _initialTransform(fvol, mvol, preg['Estimation'][0][0])
+        queue = Queue()
+        job = ProcessRegistration(fvol, mvol, mask, False, trf, regtype, metric, preg['SamplingRate'],
+                                  join(tmp, 'stdout.log'), queue)
+        job.run()
+        if queue.empty(): raise RuntimeError('{} registration failed.'.format(reg))
+        f = queue.get()
+        trf.setAttributesFromFixedVolume(fvol)
+        trf.setANTSTransform(read_transform(f))
+        # Set center of rotation to default (0.0, 0.0, 0.0)
+        trf = trf.getEquivalentTransformWithNewCenterOfRotation([0.0, 0.0, 0.0])
+        if exists(f): remove(f)
+        if reg == 'DisplacementField' and not queue.empty():
+            # final displacement field = affine + diffeomorphic displacement fields
+            f = queue.get()
+            if f is not None and exists(f):
+                field = SisypheVolume()
+                field.loadFromNIFTI(f, reorient=False)
+                field = field.cast('float64')
+                field.acquisition.setSequenceToDisplacementField()
+                if not trf.isIdentity():
+                    trf.affineToDisplacementField(inverse=False)
+                    field = trf.getDisplacementField() + field
+                    field.acquisition.setSequenceToDisplacementField()
+                trf.copyFromDisplacementFieldImage(field)
+                trf.setID(fvol)
+                remove(f)
+        _removeTemporaryFiles(queue)
+    # resample moving volume, SisypheApplyTransform uses forward geometric transform
+    f = SisypheApplyTransform()
+    f.setMoving(mvol)
+    if trf.isAffine(): f.setTransform(trf.getInverseTransform())
+    else: f.setTransform(trf)
+    interpol = p['resample']['Interpolator'][0].lower()
+    if interpol == 'nearestneighbor': interpol = 'nearest'
+    f.setInterpolator(interpol)
+    r = f.execute(fixed=fvol, save=False)
+    # restore fixed volume origin and directions
+    r.setOrigin(forigin)
+    r.setDirections(fdirections)
+    return r
+
+
+def _skullStripping(vol: SisypheVolume, p: dict) -> SisypheVolume:
+    # headless version of Sisyphe.gui.dialogSkullStripping.DialogSkullStripping.function
+    if p['Model'][0][0] == 'D':
+        # DeepBrain U-net, shape x, y, z after transpose
+        from Sisyphe.lib.db.extractor import Extractor
+        rimg = Extractor().run(vol.getNumpy()).T
+    else:
+        # ANTs U-net
+        data = p['TrainingData'][0]
+        if data in _SKULLMODALITIES: modality = _SKULLMODALITIES[data]
+        else: raise ValueError('Invalid TrainingData parameter {}.'.format(data))
+        import Sisyphe
+        cache = join(dirname(abspath(Sisyphe.__file__)), 'templates', 'ANTSPYNET')
+        queue = Queue()
+        ProcessSkullStrip(vol, modality, cache, queue).run()
+        rimg = queue.get()
+    mask = (rimg > 0.5).astype(uint8)
+    # shape x, y, z
+    rimg = vol.getNumpy(defaultshape=False) * mask
+    rimg = rimg.astype(dtype(vol.getDatatype()))
+    r = SisypheVolume()
+    r.copyFromNumpyArray(rimg, spacing=vol.getSpacing(), origin=vol.getOrigin(), direction=vol.getDirections(),
+                         defaultshape=False)
+    r.copyAttributesFrom(vol)
+    return r
+
+
+def _priorBasedSegmentation(vol: SisypheVolume, p: dict) -> list[SisypheVolume]:
+    # headless version of Sisyphe.gui.dialogSegmentation.DialogPriorBasedSegmentation.execute
+    pseg = p['segmentation']
+    nclass = int(pseg['NumberOfPriors'][0])
+    # First stage - Anisotropic diffusion filtering
+    if pseg['AnisotropicDiffusionFilter']:
+        pflt = p['filter']
+        algo = pflt['Algorithm'][0][0]
+        niter = pflt['NumberOfIterations']
+        if algo == 'G':
+            fltvol = gradientAnisotropicDiffusionFilter(vol, pflt['GradientTimeStep'], pflt['Conductance'], niter)
+        elif algo == 'C':
+            fltvol = curvatureAnisotropicDiffusionFilter(vol, pflt['CurvatureTimeStep'], pflt['Conductance'], niter)
+        elif algo == 'M':
+            fltvol = minMaxCurvatureFlowFilter(vol, pflt['MinMaxCurvatureTimeStep'], pflt['Radius'], niter)
+        else: fltvol = curvatureFlowFilter(vol, pflt['FlowTimeStep'], niter)
+    else: fltvol = vol.copy()
+    # Second stage - Bias field correction
+    if pseg['BiasFieldCorrection']:
+        pbias = p['biasfield']
+        fltvol = biasFieldCorrection(fltvol, pbias['ShrinkFactor'], pbias['NumberOfHistogramBins'],
+                                     pbias['BiasFieldFullWidthAtHalfMaximum'], pbias['ConvergenceThreshold'],
+                                     pbias['NumberOfFittingLevels'], pbias['SplineOrder'], pbias['WienerFilterNoise'],
+                                     pbias['NumberOfControlPoints'], pbias['NumberOfIteration'], pbias['UseMask'])[0]
+    # Third stage - Priors registration
+    priors = pseg['Priors'][0]
+    if priors == 'ICBM152':
+        path = getICBM152Path()
+        ft1 = join(path, 'icbm152_sym_template_t1.xvol')
+        fmask = join(path, 'icbm152_sym_template_mask.xvol')
+        fgm = join(path, 'icbm152_sym_template_gm.xvol')
+        fcgm = join(path, 'icbm152_sym_template_cortical_gm.xvol')
+        fscgm = join(path, 'icbm152_sym_template_subcortical_gm.xvol')
+        fwm = join(path, 'icbm152_sym_template_wm.xvol')
+        fcsf = join(path, 'icbm152_sym_template_csf.xvol')
+        fbstem = join(path, 'icbm152_sym_template_brainstem.xvol')
+        fcereb = join(path, 'icbm152_sym_template_cerebellum.xvol')
+    elif priors == 'ATROPOS':
+        path = getATROPOSPath()
+        ft1 = join(path, 'atropos_template_t1.xvol')
+        fmask = join(path, 'atropos_template_brain_mask.xvol')
+        fgm = join(path, 'atropos_template_prior_gm.xvol')
+        fcgm = join(path, 'atropos_template_prior_cortical_gm.xvol')
+        fscgm = join(path, 'atropos_template_prior_subcortical_gm.xvol')
+        fwm = join(path, 'atropos_template_prior_wm.xvol')
+        fcsf = join(path, 'atropos_template_prior_csf.xvol')
+        fbstem = join(path, 'atropos_template_prior_brainstem.xvol')
+        fcereb = join(path, 'atropos_template_prior_cerebellum.xvol')
+    elif priors == 'CUSTOM':
+        ft1 = pseg['T1']
+        fmask = pseg['Mask']
+        fgm = pseg['GMPrior']
+        fcgm = pseg['CGMPrior']
+        fscgm = pseg['SCGMPrior']
+        fwm = pseg['WMPrior']
+        fcsf = pseg['CSFPrior']
+        fbstem = pseg['BrainstemPrior']
+        fcereb = pseg['CerebellumPrior']
+    else:
+        # KMEANS
+        ft1 = fmask = fgm = fcgm = fscgm = fwm = fcsf = fbstem = fcereb = ''
+    # priors order: cerebro-spinal fluid, grey matter, white matter, subcortical grey matter, brainstem, cerebellum
+    if nclass > 4: fgm = fcgm
+    files = [fcsf, fgm, fwm]
+    if nclass >= 4: files.append(fscgm)
+    if nclass == 6: files.extend([fbstem, fcereb])
+    init = 'Kmeans[3]'
+    mask = None
+    queue = Queue()
+    with TemporaryDirectory() as tmp:
+        if ft1 is not None and exists(ft1) and all([f is not None and exists(f) for f in files]):
+            if pseg['PriorsRegistration'][0][0] == 'A': trftype = 'antsRegistrationSyN[a]'
+            else: trftype = 'antsRegistrationSyNQuick[s]'
+            mvol = SisypheVolume()
+            mvol.load(ft1)
+            # registration job writes its temporary files in the moving volume directory
+            mvol.setFilename(join(tmp, basename(ft1)))
+            fltvol.setDefaultOrigin()
+            fltvol.setDefaultDirections()
+            mvol.setDefaultOrigin()
+            mvol.setDefaultDirections()
+            trf = _initialTransform(fltvol, mvol, pseg['PriorsRegistrationEstimation'][0][0])
+            regmask = fltvol.getMask(morpho='dilate', kernel=4)
+            job = ProcessRegistration(fltvol, mvol, regmask, False, trf, trftype,
+                                      ['mattes', 'mattes'], 0.5, join(tmp, 'stdout.log'), queue)
+            job.run()
+            if queue.empty(): raise RuntimeError('Priors registration failed.')
+            f = queue.get()
+            rtrf = SisypheTransform()
+            rtrf.setANTSTransform(read_transform(f))
+            rtrf.setAttributesFromFixedVolume(fltvol)
+            rtrf = rtrf.getEquivalentTransformWithNewCenterOfRotation([0.0, 0.0, 0.0])
+            if exists(f): remove(f)
+            _removeTemporaryFiles(queue)
+            # Priors resampling
+            f = SisypheApplyTransform()
+            f.setTransform(rtrf.getInverseTransform())
+            interpol = p['resample']['Interpolator'][0].lower()
+            if interpol == 'nearestneighbor': interpol = 'nearest'
+            f.setInterpolator(interpol)
+            init = list()
+            for filename in files:
+                v = SisypheVolume()
+                v.load(filename)
+                f.setMoving(v)
+                r = f.execute(save=False)
+                if pseg['PriorSmoothing'] > 0.0: r = gaussianFilter(r, pseg['PriorSmoothing'], None)
+                r.copyPropertiesFrom(v, acpc=False)
+                init.append(r)
+            if fmask is not None and fmask != '' and exists(fmask):
+                v = SisypheVolume()
+                v.load(fmask)
+                f.setMoving(v)
+                mask = f.execute(save=False)
+        # Fourth stage - Finite mixture modeling
+        if mask is None:
+            if isinstance(init, list): mask = (init[1] + init[2]) > 0.5
+            else: mask = fltvol.getMask()
+        radius = pseg['PriorMaskRadius']
+        if radius > 0:
+            img = Cast(mask.getSITKImage() >= 1, sitkUInt8)
+            img = BinaryDilate(img, kernelRadius=[radius] * 3)
+            mask.setSITKImage(img)
+        niter = pseg['NumberOfIterations']
+        conv = pseg['Convergence'][0]
+        if conv[0] == 'N': conv = '[{},0]'.format(niter)
+        else: conv = '[{},{}]'.format(niter, float(conv))
+        radius = pseg['Radius']
+        mrf = '[{},{}x{}x{}]'.format(pseg['Smoothing'], radius, radius, radius)
+        ProcessAtropos(fltvol, mask, init, mrf, conv, pseg['PriorWeight'], join(tmp, 'stdout.log'), queue).run()
+    # tissue probability maps
+    vols = list()
+    while not queue.empty():
+        filename = queue.get()
+        if exists(filename):
+            v = SisypheVolume()
+            v.loadFromNIFTI(filename, reorient=False)
+            remove(filename)
+            v.copyAttributesFrom(vol)
+            v.acquisition.setModalityToOT()
+            if isinstance(init, str): v.acquisition.setSequence('TISSUE CLASS {}'.format(len(vols) + 1))
+            else: v.acquisition.setSequence(init[len(vols)].acquisition.getSequence())
+            v.acquisition.setUnitToPercent()
+            vols.append(v)
+    if len(vols) == 0: raise RuntimeError('Prior based segmentation failed.')
+    radius = pseg['BrainMaskRadius']
+    if radius > 0:
+        try: mask = brainMaskFromProbabilityTissueMaps(vols, radius).cast('float32')
+        except: radius = 0
+    if radius > 0:
+        for j in range(len(vols)):
+            if not vols[j].acquisition.isCerebroSpinalFluidMap():
+                v = vols[j] * mask
+                v.acquisition.setSequence(vols[j].acquisition.getSequence())
+                v.acquisition.setUnitToPercent()
+                vols[j] = v
+    # label tissue map
+    lb = probabilityTissueMapsToLabelMap(vols)
+    lb.copyAttributesFrom(vol)
+    lb.acquisition.setModalityToLB()
+    # DialogWorkflow output order: gm, scgm, wm, csf, bstem, crbl, label map
+    if isinstance(init, list): vols = [vols[j] for j in (1, 3, 2, 0, 4, 5) if j < len(vols)]
+    return vols + [lb]
+
+
+def _textureMaps(vol: SisypheVolume, p: dict) -> list[SisypheVolume]:
+    # headless version of Sisyphe.gui.dialogTexture.DialogTexture.execute
+    from radiomics import featureextractor
+    extractor = featureextractor.RadiomicsFeatureExtractor()
+    extractor.settings['kernelRadius'] = p['Radius']
+    # Voxel batch used to avoid memory errors
+    extractor.settings['voxelBatch'] = p['Batch']
+    img = vol.getSITKImage()
+    mask = img > mean(vol.getNumpy())
+    r = list()
+    for k1 in p['Features']:
+        for k2 in p['Features'][k1]:
+            extractor.disableAllFeatures()
+            extractor.enableFeaturesByName(**{k1: [k2]})
+            result = extractor.execute(img, mask, voxelBased=True)
+            m = SisypheVolume()
+            m.copyFromSITKImage(result[list(result.keys())[-1]])
+            m.copyAttributesFrom(vol, display=False)
+            m.updateArrayID()
+            m.acquisition.setModalityToOT()
+            m.acquisition.setSequence('{} {}'.format(k1, k2))
+            r.append(m)
+    return r
+
+
+def _executeStage(stage: dict, img: list[SisypheVolume], filename: str) -> list[SisypheVolume]:
+    name = stage['name']
+    if name == 'load':
+        v = SisypheVolume()
+        f = stage['edit']
+        if not exists(f): f = join(dirname(filename), basename(f))
+        v.load(f)
+        return [v]
+    elif name == 'algebra':
+        f = stage['edit']
+        arrays = dict()
+        for sub in f.translate({91: None, 93: 32}).split(' '):
+            n = sub.find('img')
+            if n > -1:
+                vi = int(sub[n + 3:])
+                arrays[vi] = img[vi].copyToNumpyArray()
+        if len(arrays) > 0:
+            ref = img[min(arrays.keys())]
+            d = {'img': arrays}
+            exec('import numpy as np\nr = ' + f, d)
+            v = SisypheVolume()
+            v.copyFromNumpyArray(d['r'], spacing=ref.getSpacing(), origin=ref.getOrigin(),
+                                 direction=ref.getDirections())
+            v.copyAttributesFrom(ref, display=False)
+            return [v]
+        else: raise ValueError('No img in algebra formula.')
+    elif name in _STAGES:
+        p = _convertParameters(name, stage['params'])
+        v = img[stage['input1']]
+        ref = img[stage['input2']]
+        if name == 'flip':
+            r = v.copy()
+            r.setSITKImage(sitkFlip(v.getSITKImage(), [p['FlipX'], p['FlipY'], p['FlipZ']]))
+        elif name == 'swap':
+            r = v.copy()
+            r.setSITKImage(sitkPermuteAxes(v.getSITKImage(), [ord(i) - 120 for i in p['SwapOrder'].split(',')]))
+        elif name == 'remove': r = v.removeNeckSlices(p['ExtentFactor'])
+        elif name == 'mean': r = meanFilter(v, p['KernelRadius'], p['Fast'])
+        elif name == 'median': r = medianFilter(v, p['KernelRadius'])
+        elif name == 'gaussian':
+            if p['Algorithm'][0] == 'Convolve': r = gaussianFilter(v, p['Fwhm'])
+            else: r = recursiveGaussianFilter(v, p['Fwhm'])
+        elif name == 'gradient':
+            if p['Algorithm'][0] == 'Recursive': r = gradientMagnitudeRecursiveFilter(v, p['Sigma'])
+            else: r = gradientMagnitudeFilter(v)
+        elif name == 'laplacian':
+            if p['Algorithm'][0] == 'Discrete': r = laplacianFilter(v)
+            else: r = laplacianRecursiveFilter(v, p['Sigma'])
+        elif name == 'anisotropic':
+            algo = p['Algorithm'][0]
+            if algo == 'Gradient':
+                r = gradientAnisotropicDiffusionFilter(v, p['GradientTimeStep'], p['Conductance'],
+                                                       p['NumberOfIterations'])
+            elif algo == 'Curvature':
+                r = curvatureAnisotropicDiffusionFilter(v, p['CurvatureTimeStep'], p['Conductance'],
+                                                        p['NumberOfIterations'])
+            elif algo == 'MinMaxCurvature':
+                r = minMaxCurvatureFlowFilter(v, p['MinMaxCurvatureTimeStep'], p['Radius'], p['NumberOfIterations'])
+            else: r = curvatureFlowFilter(v, p['FlowTimeStep'], p['NumberOfIterations'])
+        elif name == 'bias':
+            return list(biasFieldCorrection(v, p['ShrinkFactor'], p['NumberOfHistogramBins'],
+                                            p['BiasFieldFullWidthAtHalfMaximum'], p['ConvergenceThreshold'],
+                                            p['NumberOfFittingLevels'], p['SplineOrder'], p['WienerFilterNoise'],
+                                            p['NumberOfControlPoints'], p['NumberOfIteration'], p['UseMask']))
+        elif name == 'histogram':
+            r = histogramIntensityMatching(v, ref, p['NumberOfHistogramBins'], p['NumberOfMatchPoints'],
+                                           p['ExcludeBackground'])
+        elif name == 'regression':
+            if p['ExcludeBackground']: mask = ref.getMask(fill='2D')
+            else: mask = None
+            r = regressionIntensityMatching(v, ref, mask, p['Order'], p['Truncate'])
+        else:
+            # signal normalization
+            if p['Truncate'] != 0: r = v.getTruncateIntensity(p['Truncate'])
+            else: r = v
+            if p['Method'][0][0] == 'z': r = r.getStandardizeIntensity('norm')
+            else: r = r.getStandardizeIntensity('rescale')
+        return [r]
+    elif name in _REGISTRATIONS:
+        # input1 moving volume, input2 fixed volume
+        return [_registration(name, img[stage['input1']], img[stage['input2']],
+                              _convertParameters(name, stage['params']))]
+    elif name == 'skull': return [_skullStripping(img[stage['input1']], _convertParameters(name, stage['params']))]
+    elif name == 'prior':
+        return _priorBasedSegmentation(img[stage['input1']], _convertParameters(name, stage['params']))
+    elif name == 'texture': return _textureMaps(img[stage['input1']], _convertParameters(name, stage['params']))
+    else: raise ValueError('{} stage is not supported by headless workflow execution.'.format(name))
+
+
+def executeWorkflow(stages: list[dict] | str,
+                    filename: str,
+                    outputs: list[int] | None = None,
+                    name: str = 'workflow') -> list[str]:
+    """
+    Execute a workflow on a volume. Intermediate volumes are kept in memory and only requested outputs are saved.
+
+    Parameters
+    ----------
+    stages : list[dict] | str
+        workflow stages (see readWorkflow function) or workflow file name (.xwflow)
+    filename : str
+        input volume file name (img0)
+    outputs : list[int] | None
+        indices of the volumes to save (default None, first output of the last stage). The first output of the last
+        stage is saved with the workflow name as prefix, other volumes are saved with '#index' suffix (same file
+        names as DialogWorkflow)
+    name : str
+        workflow name, used as prefix of the first output file name of the last stage (default 'workflow')
+
+    Returns
+    -------
+    list[str]
+        saved file names
+    """
+    if isinstance(stages, str):
+        name = splitext(basename(stages))[0]
+        stages = readWorkflow(stages)
+    for stage in stages:
+        if stage['name'] not in getWorkflowSupportedStages():
+            raise ValueError('{} stage is not supported by headless workflow execution.'.format(stage['name']))
+    v = SisypheVolume()
+    v.load(filename)
+    img = [v]
+    first = 0
+    for i, stage in enumerate(stages):
+        # index of the first output of the stage
+        first = len(img)
+        try: img.extend(_executeStage(stage, img, filename))
+        except Exception as err: raise RuntimeError('{} stage#{} error.\n{}'.format(stage['name'], i, err))
+    if outputs is None: outputs = [first]
+    # load and algebra outputs are always saved with '#index' suffix
+    if len(stages) == 0 or stages[-1]['name'] in ['load', 'algebra']: first = -1
+    r = list()
+    for i in outputs:
+        if i == first: dst = addPrefixToFilename(filename, name)
+        else: dst = addSuffixToFilename(filename, '#{}'.format(i))
+        img[i].saveAs(dst)
+        r.append(dst)
+    return r
+
+
+def _initWorkflowWorker(threads: int) -> None:
+    # share cores between processes, each process uses its own ITK thread pool
+    from SimpleITK import ProcessObject
+    ProcessObject.SetGlobalDefaultNumberOfThreads(threads)
+
+
+def _workflowWorker(args: tuple) -> tuple[str, str]:
+    stages, filename, outputs, name = args
+    try:
+        executeWorkflow(stages, filename, outputs, name)
+        return filename, ''
+    except Exception as err: return filename, str(err)
+
+
+def batchWorkflow(workflow: str,
+                  filenames: list[str],
+                  outputs: list[int] | None = None,
+                  checkpoint: str = '',
+                  workers: int = 0,
+                  wait: DialogWait | None = None) -> dict[str, str]:
+    """
+    Execute a workflow on a list of volumes. Subjects are processed in parallel by a process pool.
+
+    Parameters
+    ----------
+    workflow : str
+        workflow file name (.xwflow)
+    filenames : list[str]
+        input volume file names, one for each subject
+    outputs : list[int] | None
+        indices of the volumes to save (default None, first output of the last stage, see executeWorkflow function)
+    checkpoint : str
+        checkpoint file name (default '', no checkpoint). File names of completed subjects are appended to this
+        text file. If this file exists, its subjects are skipped (resume an interrupted batch)
+    workers : int
+        number of processes (default 0, number of cores)
+    wait : Sisyphe.gui.dialogWait.DialogWait | None
+        progress bar dialog (default None)
+
+    Returns
+    -------
+    dict[str, str]
+        errors, keys are file names of failed subjects, values are error messages
+    """
+    name = splitext(basename(workflow))[0]
+    stages = readWorkflow(workflow)
+    filenames = [abspath(f) for f in filenames]
+    if checkpoint != '' and exists(checkpoint):
+        with open(checkpoint, 'r') as f:
+            done = set([line.strip() for line in f])
+        filenames = [f for f in filenames if f not in done]
+    r = dict()
+    n = len(filenames)
+    if n > 0:
+        ncores = cpu_count()
+        if workers <= 0: workers = ncores
+        workers = min(workers, n)
+        if wait is not None:
+            wait.setInformationText('{} workflow processing...'.format(name))
+            wait.setProgressRange(0, n)
+            wait.setCurrentProgressValue(0)
+            wait.setProgressVisibility(True)
+        tasks = [(stages, f, outputs, name) for f in filenames]
+        if checkpoint != '': fcheck = open(checkpoint, 'a')
+        else: fcheck = None
+        try:
+            with Pool(workers, initializer=_initWorkflowWorker, initargs=(max(1, ncores // workers),)) as pool:
+                for filename, err in pool.imap_unordered(_workflowWorker, tasks):
+                    if err == '':
+                        if fcheck is not None:
+                            fcheck.write(filename + '\n')
+                            fcheck.flush()
+                    else: r[filename] = err
+                    if wait is not None:
+                        wait.incCurrentProgressValue()
+                        if wait.getStopped():
+                            pool.terminate()
+                            break
+        finally:
+            if fcheck is not None: fcheck.close()
+    return r
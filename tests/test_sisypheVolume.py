@@ -0,0 +1,41 @@
+"""
+Tests of Sisyphe.core.sisypheVolume
+"""
+
+import pytest
+
+from numpy import array_equal
+from numpy import shares_memory
+from numpy.random import default_rng
+
+sisypheVolume = pytest.importorskip('Sisyphe.core.sisypheVolume')
+SimpleITK = pytest.importorskip('SimpleITK')
+
+
+@pytest.fixture
+def volume():
+    img = default_rng(0).random((5, 12, 13, 14)).astype('float32')
+    vol = sisypheVolume.SisypheVolume()
+    vol.copyFromNumpyArray(img, spacing=(1.5, 2.0, 3.0), origin=(4.0, 5.0, 6.0), defaultshape=True)
+    return vol
+
+
+def test_getComponentView_shares_memory(volume):
+    view = volume.getComponentView(2)
+    assert view.getNumberOfComponentsPerPixel() == 1
+    assert shares_memory(view.getNumpy(), volume.getNumpy())
+
+
+def test_getComponentView_is_read_only(volume):
+    view = volume.getComponentView(2)
+    with pytest.raises(ValueError):
+        view.getNumpy()[0, 0, 0] = 1.0
+
+
+def test_getComponentView_sitk_image(volume):
+    view = volume.getComponentView(2)
+    copy = volume.copyComponent(2)
+    assert array_equal(SimpleITK.GetArrayFromImage(view.getSITKImage()),
+                       SimpleITK.GetArrayFromImage(copy.getSITKImage()))
+    assert view.getSpacing() == copy.getSpacing()
+    assert view.getOrigin() == copy.getOrigin()
@@ -79,7 +79,7 @@ class MultiComponentViewWidget(MultiViewWidget):
     QWidget -> MultiViewWidget -> GridViewWidget -> MultiComponentViewWidget
 
     Creation: 10/12/2024
-    Last revision: 29/04/2025
+    Last revision: 16/10/2026
     """
 
     # Special method
@@ -299,7 +299,11 @@ class MultiComponentViewWidget(MultiViewWidget):
             first, last = self._first, min(self._first + 9, n)
             for i in range(first, last):
                 c = i - first
-                component = self._multi.copyComponent(i)
+                # < Revision 16/10/2026
+                # component view, 4D buffer is not copied
+                # component = self._multi.copyComponent(i)
+                component = self._multi.getComponentView(i)
+                # Revision 16/10/2026 >
                 view = self[c // 3, c % 3]
                 title = 'component#{}'.format(i)
                 view.setName(title)
@@ -319,7 +323,11 @@ class MultiComponentViewWidget(MultiViewWidget):
             else: first, last = self._first, min(self._first + 9, n)
             for i in range(first, last):
                 c = i - first
-                component = volume.copyComponent(i)
+                # < Revision 16/10/2026
+                # component view, 4D buffer is not copied
+                # component = volume.copyComponent(i)
+                component = volume.getComponentView(i)
+                # Revision 16/10/2026 >
                 view = self[c // 3, c % 3]
                 title = 'component#{}'.format(i)
                 view.setName(title)
@@ -391,7 +399,10 @@ class MultiComponentViewWidget(MultiViewWidget):
         n = self._multi.getNumberOfComponentsPerPixel()
         xdata = list(range(n))
         ydata = list()
-        v = self._multi.copyComponent(0)
+        # < Revision 16/10/2026
+        # v = self._multi.copyComponent(0)
+        v = self._multi.getComponentView(0)
+        # Revision 16/10/2026 >
         mask = v.getMask2()
         for i in range(n):
             ydata.append(self._multi.getMean(mask, i))
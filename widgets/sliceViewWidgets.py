@@ -3942,7 +3942,7 @@ class SliceROIViewWidget(SliceOverlayViewWidget):
     QWidget -> AbstractViewWidget -> SliceViewWidget -> SliceOverlayViewWidget -> SliceROIViewWidget
 
     Creation: 12/04/2022
-    Last revision: 02/11/2024
+    Last revision: 16/10/2026
     """
 
     # Custom Qt signals
@@ -3970,6 +3970,8 @@ class SliceROIViewWidget(SliceOverlayViewWidget):
     _brush          vtkActor, circle brush representation
     _brushFlag      bool, brush flag (active/inactive) for mouse event
     _fsettings      SisypheSettings
+    _dirty          list[int] | None, bounding box of the roi voxels modified by the last operation
+    _rendertimer    QTimer, single shot timer, coalesces renders at display refresh rate
     """
 
     def __init__(self, overlays=None, rois=None, draw=None, meshes=None, parent=None):
@@ -4452,8 +4454,43 @@ class SliceROIViewWidget(SliceOverlayViewWidget):
         # noinspection PyUnresolvedReferences
         self._timer.timeout.connect(self._onTimer)
 
+        # < Revision 16/10/2026
+        # Render timer, renders requested during a display frame are coalesced
+        self._dirty = None
+        screen = QApplication.primaryScreen()
+        if screen is not None and screen.refreshRate() > 0: rate = screen.refreshRate()
+        else: rate = 60.0
+        self._rendertimer = QTimer()
+        self._rendertimer.setSingleShot(True)
+        self._rendertimer.setInterval(max(1, int(1000.0 / rate)))
+        # noinspection PyUnresolvedReferences
+        self._rendertimer.timeout.connect(self._onRenderTimer)
+        # Revision 16/10/2026 >
+
     # Private methods
 
+    # < Revision 16/10/2026
+    # add _requestRender, _onRenderTimer, _updateModifiedROI and _isSliceInDirtyRegion private methods
+    def _requestRender(self):
+        if not self._rendertimer.isActive(): self._rendertimer.start()
+
+    def _onRenderTimer(self):
+        self._renderwindow.Render()
+
+    def _updateModifiedROI(self):
+        self._dirty = self._draw.popDirtyBoundingBox()
+        if self._dirty is not None:
+            self._roimapper.GetInput().Modified()
+            # noinspection PyUnresolvedReferences
+            self.ROIModified.emit(self)
+        self._requestRender()
+
+    def _isSliceInDirtyRegion(self, bbox):
+        if bbox is None: return True
+        d = 2 - self._orient
+        return bbox[2 * d] <= self.getSliceIndex() < bbox[2 * d + 1]
+    # Revision 16/10/2026 >
+
     def _initBrushActor(self):
         r = self._draw.getBrushRadius()  # + 0.5
         self._circle = vtkRegularPolygonSource()
@@ -4653,7 +4690,13 @@ class SliceROIViewWidget(SliceOverlayViewWidget):
 
     def synchroniseROIModified(self, obj):
         if obj != self and self.hasVolume():
-            self.updateROIDisplay()
+            # < Revision 16/10/2026
+            # self.updateROIDisplay()
+            # render only if displayed slice intersects the dirty region of the modified roi
+            if self._isSliceInDirtyRegion(obj.getDirtyBoundingBox()):
+                if self._roimapper is not None: self._roimapper.GetInput().Modified()
+                self._requestRender()
+            # Revision 16/10/2026 >
 
     def synchroniseBrushRadiusChanged(self, obj, radius):
         if obj != self and self.hasVolume():
@@ -4667,6 +4710,12 @@ class SliceROIViewWidget(SliceOverlayViewWidget):
 
     # Public methods
 
+    # < Revision 16/10/2026
+    # add getDirtyBoundingBox method
+    def getDirtyBoundingBox(self):
+        return self._dirty
+    # Revision 16/10/2026 >
+
     def getSliceIndex(self):
         f = self._renderer.GetActiveCamera().GetFocalPoint()
         d = 2 - self._orient
@@ -5354,22 +5403,20 @@ class SliceROIViewWidget(SliceOverlayViewWidget):
 
     def undo(self):
         self._draw.popUndoLIFO()
-        self._roimapper.GetInput().Modified()
-        self._renderwindow.Render()
-        # noinspection PyUnresolvedReferences
-        self.ROIModified.emit(self)
+        self._updateModifiedROI()
 
     def redo(self):
         self._draw.popRedoLIFO()
-        self._roimapper.GetInput().Modified()
-        self._renderwindow.Render()
-        # noinspection PyUnresolvedReferences
-        self.ROIModified.emit(self)
+        self._updateModifiedROI()
 
     def updateROIDisplay(self, signal=False):
         if self._volume is not None:
             if self._roimapper is not None:  self._roimapper.GetInput().Modified()
             if signal:
+                # < Revision 16/10/2026
+                # whole roi may be modified
+                self._dirty = None
+                # Revision 16/10/2026 >
                 # noinspection PyUnresolvedReferences
                 self.ROIModified.emit(self)
             self._renderwindow.Render()
@@ -5405,157 +5452,103 @@ class SliceROIViewWidget(SliceOverlayViewWidget):
         if self.hasROI() and self.getROIVisibility():
             index = self.getSliceIndex()
             self._draw.flipSlice(index, self._orient, flipx, flipy)
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def sliceMove(self, movex, movey):
         if self.hasROI() and self.getROIVisibility():
             index = self.getSliceIndex()
             self._draw.shiftSlice(index, self._orient, movex, movey)
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def sliceDilate(self):
         if self.hasROI() and self.getROIVisibility():
             index = self.getSliceIndex()
             self._draw.morphoSliceDilate(index, self._orient)
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def sliceErode(self):
         if self.hasROI() and self.getROIVisibility():
             index = self.getSliceIndex()
             self._draw.morphoSliceErode(index, self._orient)
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def sliceOpen(self):
         if self.hasROI() and self.getROIVisibility():
             index = self.getSliceIndex()
             self._draw.morphoSliceOpening(index, self._orient)
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def sliceClose(self):
         if self.hasROI() and self.getROIVisibility():
             index = self.getSliceIndex()
             self._draw.morphoSliceClosing(index, self._orient)
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def sliceBackground(self):
         if self.hasROI() and self.getROIVisibility():
             index = self.getSliceIndex()
             self._draw.backgroundSegmentSlice(index, self._orient)
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def sliceObject(self):
         if self.hasROI() and self.getROIVisibility():
             index = self.getSliceIndex()
             self._draw.objectSegmentSlice(index, self._orient)
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def sliceInvert(self):
         if self.hasROI() and self.getROIVisibility():
             index = self.getSliceIndex()
             self._draw.binaryNotSlice(index, self._orient)
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def sliceClear(self):
         if self.hasROI() and self.getROIVisibility():
             index = self.getSliceIndex()
             self._draw.clearSlice(index, self._orient)
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     # 3D ROI functions
 
     def roiDilate(self):
         if self.hasROI() and self.getROIVisibility():
             self._draw.morphoDilate()
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def roiErode(self):
         if self.hasROI() and self.getROIVisibility():
             self._draw.morphoErode()
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def roiOpen(self):
         if self.hasROI() and self.getROIVisibility():
             self._draw.morphoOpening()
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def roiClose(self):
         if self.hasROI() and self.getROIVisibility():
             self._draw.morphoClosing()
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def roiBackground(self):
         if self.hasROI() and self.getROIVisibility():
             self._draw.backgroundSegment()
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def roiObject(self):
         if self.hasROI() and self.getROIVisibility():
             self._draw.objectSegment()
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def roiInvert(self):
         if self.hasROI() and self.getROIVisibility():
             self._draw.binaryNOT()
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def roiClear(self):
         if self.hasROI() and self.getROIVisibility():
             self._draw.clear()
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
 
     def updateRender(self):
         self._roimapper.GetInput().Modified()
@@ -5614,10 +5607,15 @@ class SliceROIViewWidget(SliceOverlayViewWidget):
                         self._draw.brush(p[0], p[1], p[2], self._orient)
                     elif self._window.GetInteractorStyle().GetButton() == 3:
                         self._draw.erase(p[0], p[1], p[2], self._orient)
-                    self._roimapper.GetInput().Modified()
-                    # noinspection PyUnresolvedReferences
-                    self.ROIModified.emit(self)
-                self._renderwindow.Render()
+                    # < Revision 16/10/2026
+                    # self._roimapper.GetInput().Modified()
+                    # self.ROIModified.emit(self)
+                    self._updateModifiedROI()
+                    # Revision 16/10/2026 >
+                # < Revision 16/10/2026
+                # self._renderwindow.Render()
+                self._requestRender()
+                # Revision 16/10/2026 >
         else: super()._onMouseMoveEvent(obj, evt_name)
 
     def _onLeftPressEvent(self, obj, evt_name):
@@ -5832,10 +5830,7 @@ class SliceROIViewWidget(SliceOverlayViewWidget):
                     self._draw.activeContourSegmentation(p[0], p[1], p[2])
                     # Revision 25/03/2025 >
                     wait.close()
-                self._roimapper.GetInput().Modified()
-                self._renderwindow.Render()
-                # noinspection PyUnresolvedReferences
-                self.ROIModified.emit(self)
+                self._updateModifiedROI()
         else: super()._onLeftPressEvent(obj, evt_name)
 
     def _onLeftReleaseEvent(self,  obj, evt_name):
@@ -5847,10 +5842,7 @@ class SliceROIViewWidget(SliceOverlayViewWidget):
                 index = self.getSliceIndex()
                 self._draw.fillHolesSlice(index, self._orient, False)
                 if self.getUndo(): self._draw.appendSliceToLIFO(index, self._orient)
-                self._roimapper.GetInput().Modified()
-                self._renderwindow.Render()
-                # noinspection PyUnresolvedReferences
-                self.ROIModified.emit(self)
+                self._updateModifiedROI()
             elif self.getUndo():
                 if self.get2DBrushFlag():
                     index = self.getSliceIndex()
@@ -5873,10 +5865,7 @@ class SliceROIViewWidget(SliceOverlayViewWidget):
             p[d] = f[d]
             p = self._getWorldToMatrixCoordinate(p)
             self._draw.erase(p[0], p[1], p[2], self._orient)
-            self._roimapper.GetInput().Modified()
-            self._renderwindow.Render()
-            # noinspection PyUnresolvedReferences
-            self.ROIModified.emit(self)
+            self._updateModifiedROI()
         else:
             self._brush.SetVisibility(False)
             self._renderwindow.Render()
@@ -33,6 +33,7 @@ from skimage.io import imsave
 from vtk import vtkCursor3D
 from vtk import vtkPolyDataMapper
 from vtk import vtkProp
+from vtk import vtkCellPicker
 from vtk import vtkActor
 from vtk import vtkVolume
 from vtk import vtkSphereSource
@@ -99,7 +100,7 @@ class VolumeViewWidget(AbstractViewWidget):
 
     QWidget -> AbstractViewWidget -> VolumeViewWidget
 
-    Last revision: 27/03/2025
+    Last revision: 16/10/2026
     """
 
     _CODETOBLEND = {0: 'composite', 1: 'MaximumIntensity', 2: 'MinimumIntensity',
@@ -150,6 +151,7 @@ class VolumeViewWidget(AbstractViewWidget):
     _selectedslice  int, number of the selected slice
     _slprop         vtkProp, selected streamline
     _slid           int, current point of the selected streamline
+    _slrange        (int, int), first point and number of points of the selected streamline
     _action         QAction
     _popup          QMenu, popup menu
     _menuVisibility QMenu, popup submenu for actors visibility (slices, texture, mesh)
@@ -180,6 +182,7 @@ class VolumeViewWidget(AbstractViewWidget):
         self._selectedSlice = 0                 # number of the selected slice
         self._slprop: vtkProp | None = None     # selected streamline
         self._slid: int = 0                     # current point of the selected streamline
+        self._slrange: tuple[int, int] = (0, 0)  # first point and number of points of the selected streamline
 
         # Init popup menu
 
@@ -1266,10 +1269,15 @@ class VolumeViewWidget(AbstractViewWidget):
             elif self._selectedSlice:
                 self.slicePlus()
             elif self._slprop is not None:
-                # noinspection PyUnresolvedReferences
-                n = self._slprop.GetMapper().GetInput().GetPoints().GetNumberOfPoints()
+                # < Revision 16/10/2026
+                # stepping restricted to the selected streamline (batched bundle)
+                # n = self._slprop.GetMapper().GetInput().GetPoints().GetNumberOfPoints()
+                # self._slid += 2
+                # if self._slid > n - 1: self._slid = 0
+                first, n = self._slrange
                 self._slid += 2
-                if self._slid > n - 1: self._slid = 0
+                if self._slid > first + n - 1: self._slid = first
+                # Revision 16/10/2026 >
                 # noinspection PyUnresolvedReferences
                 p = self._slprop.GetMapper().GetInput().GetPoints().GetPoint(self._slid)
                 self.setCursorWorldPosition(p[0], p[1], p[2], True)
@@ -1281,11 +1289,16 @@ class VolumeViewWidget(AbstractViewWidget):
             elif self._selectedSlice:
                 self.sliceMinus()
             elif self._slprop is not None:
+                # < Revision 16/10/2026
+                # stepping restricted to the selected streamline (batched bundle)
+                # self._slid -= 2
+                # if self._slid < 0:
+                #     n = self._slprop.GetMapper().GetInput().GetPoints().GetNumberOfPoints()
+                #     self._slid = n - 1
+                first, n = self._slrange
                 self._slid -= 2
-                if self._slid < 0:
-                    # noinspection PyUnresolvedReferences
-                    n = self._slprop.GetMapper().GetInput().GetPoints().GetNumberOfPoints()
-                    self._slid = n - 1
+                if self._slid < first: self._slid = first + n - 1
+                # Revision 16/10/2026 >
                 # noinspection PyUnresolvedReferences
                 p = self._slprop.GetMapper().GetInput().GetPoints().GetPoint(self._slid)
                 self.setCursorWorldPosition(p[0], p[1], p[2], True)
@@ -1310,6 +1323,10 @@ class VolumeViewWidget(AbstractViewWidget):
             # Camera movement
             else:
                 self._campos0 = self._renderer.GetActiveCamera().GetPosition()
+                # < Revision 16/10/2026
+                # subsampled bundles during camera movement
+                if self.hasTracts(): self._tract.levelOfDetailOn()
+                # Revision 16/10/2026 >
             # Always test slice selection
             x, y = self._window.GetInteractorStyle().GetLastPos()
             picker = self._interactor.GetPicker()
@@ -1330,7 +1347,23 @@ class VolumeViewWidget(AbstractViewWidget):
                 elif cname == 'streamline':
                     self._slid = 0
                     self._slprop = prop
-                    p = prop.GetMapper().GetInput().GetPoints().GetPoint(0)
+                    # < Revision 16/10/2026
+                    # p = prop.GetMapper().GetInput().GetPoints().GetPoint(0)
+                    # batched bundle, single actor for all streamlines, cursor at the picked point of the picked
+                    # streamline, cell id = streamline index, points of a streamline are contiguous
+                    polydata = prop.GetMapper().GetInput()
+                    self._slrange = (0, polydata.GetNumberOfPoints())
+                    if polydata.GetNumberOfLines() > 1:
+                        cpicker = vtkCellPicker()
+                        cpicker.PickFromListOn()
+                        cpicker.AddPickList(prop)
+                        if cpicker.Pick(x, y, 0, self._renderer) and cpicker.GetCellId() >= 0:
+                            ids = polydata.GetCell(cpicker.GetCellId()).GetPointIds()
+                            first, n = ids.GetId(0), ids.GetNumberOfIds()
+                            self._slrange = (first, n)
+                            self._slid = min(max(cpicker.GetPointId(), first), first + n - 1)
+                    p = polydata.GetPoints().GetPoint(self._slid)
+                    # Revision 16/10/2026 >
                     self.setCursorWorldPosition(p[0], p[1], p[2], True)
 
     def _onLeftReleaseEvent(self,  obj, evt_name):
@@ -1343,6 +1376,12 @@ class VolumeViewWidget(AbstractViewWidget):
                 self._renderwindow.Render()
             elif k == 'Shift_L' or self.getLevelFlag() is True:
                 self._interactor.SetKeySym('')
+            # < Revision 16/10/2026
+            # full bundles at the end of camera movement
+            elif self.hasTracts():
+                self._tract.levelOfDetailOff()
+                self._renderwindow.Render()
+            # Revision 16/10/2026 >
 
     def _onMiddlePressEvent(self, obj, evt_name):
         pass